@@ -53,6 +53,9 @@ class CmdlineParser(argparse.ArgumentParser):
                           required=False,
                           help="Try to automatically set config / logs / data dir permissions, "
                                "useful for Docker containers.")
+        self.add_argument("--lazy-decryption",
+                          action="store_true",
+                          help="Decrypt the secrets of a connector only when the connector is first used.")
 
 
 def autofix_permissions(user_group_spec: str):
@@ -82,7 +85,7 @@ async def quick_start(args: argparse.Namespace, secrets_manager: BaseSecretsMana
     if args.auto_set_permissions is not None:
         autofix_permissions(args.auto_set_permissions)
 
-    if not Security.login(secrets_manager):
+    if not Security.login(secrets_manager, lazy_decryption=args.lazy_decryption):
         logging.getLogger().error("Invalid password.")
         return
 
@@ -3,12 +3,13 @@ import threading
 import time
 from datetime import datetime
 from decimal import Decimal
-from typing import TYPE_CHECKING, List, Optional, Set, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple
 
 import pandas as pd
 
 from hummingbot.client.command.gateway_command import GatewayCommand
 from hummingbot.client.performance import PerformanceMetrics
+from hummingbot.client.performance_accumulator import MarketTradeStats
 from hummingbot.client.settings import MAXIMUM_TRADE_FILLS_DISPLAY_OUTPUT, AllConnectorSettings
 from hummingbot.client.ui.interface_utils import format_df_for_printout
 from hummingbot.core.utils.async_utils import safe_ensure_future
@@ -41,23 +42,63 @@ class HistoryCommand:
             self.notify("\n  Please first import a strategy config file of which to show historical performance.")
             return
         start_time = get_timestamp(days) if days > 0 else self.init_time
+        safe_ensure_future(self._history(start_time, verbose, precision))
+
+    async def _history(self,  # type: HummingbotApplication
+                       start_time: float,
+                       verbose: bool,
+                       precision: Optional[int]):
+        await self.wait_for_recorded_trades()
+        trade_stats = self.get_trade_stats(start_time)
+        if trade_stats is not None:
+            if not trade_stats:
+                self.notify("\n  No past trades to report.")
+                return
+            if verbose:
+                self.list_trades(start_time)
+            await self.history_report(start_time, None, precision, trade_stats=trade_stats)
+            return
         with self.trade_fill_db.get_new_session() as session:
             trades: List[TradeFill] = self._get_trades_from_session(
                 int(start_time * 1e3),
                 session=session,
                 config_file_path=self.strategy_file_name)
-            if not trades:
-                self.notify("\n  No past trades to report.")
-                return
-            if verbose:
-                self.list_trades(start_time)
-            safe_ensure_future(self.history_report(start_time, trades, precision))
+        if not trades:
+            self.notify("\n  No past trades to report.")
+            return
+        if verbose:
+            self.list_trades(start_time)
+        await self.history_report(start_time, trades, precision)
+
+    async def wait_for_recorded_trades(self,  # type: HummingbotApplication
+                                       ):
+        """
+        Waits until the markets recorder writes the trade fills received so far, so the trades read from the database
+        include them. The trade fills are written by the recorder from its writer thread.
+        """
+        if self.markets_recorder is not None:
+            await self.markets_recorder.wait_for_pending_writes()
+
+    def get_trade_stats(self,  # type: HummingbotApplication
+                        start_time: float) -> Optional[Dict[Tuple[str, str], MarketTradeStats]]:
+        """
+        Returns the running trade stats by market and trading pair kept by the markets recorder, if they are for the
+        trades of the strategy config since start_time. Otherwise the trades have to be loaded from the database.
+        """
+        if self.markets_recorder is None or self.markets_recorder.performance_accumulator is None:
+            return None
+        accumulator = self.markets_recorder.performance_accumulator
+        if not accumulator.covers(self.strategy_file_name, int(start_time * 1e3)):
+            return None
+        return dict(accumulator.trade_stats)
 
     def get_history_trades_json(self,  # type: HummingbotApplication
                                 days: float = 0):
         if self.strategy_file_name is None:
             return
         start_time = get_timestamp(days) if days > 0 else self.init_time
+        if self.markets_recorder is not None:
+            self.markets_recorder.flush_before_read()
         with self.trade_fill_db.get_new_session() as session:
             trades: List[TradeFill] = self._get_trades_from_session(
                 int(start_time * 1e3),
@@ -67,15 +108,19 @@ class HistoryCommand:
 
     async def history_report(self,  # type: HummingbotApplication
                              start_time: float,
-                             trades: List[TradeFill],
+                             trades: Optional[List[TradeFill]],
                              precision: Optional[int] = None,
-                             display_report: bool = True) -> Decimal:
-        market_info: Set[Tuple[str, str]] = set((t.market, t.symbol) for t in trades)
+                             display_report: bool = True,
+                             trade_stats: Optional[Dict[Tuple[str, str], MarketTradeStats]] = None) -> Decimal:
+        """
+        Reports the performance of each market from either the trades or the running trade stats of the markets.
+        """
+        market_info: Set[Tuple[str, str]] = (set(trade_stats.keys()) if trade_stats is not None
+                                             else set((t.market, t.symbol) for t in trades))
         if display_report:
             self.report_header(start_time)
         return_pcts = []
         for market, symbol in market_info:
-            cur_trades = [t for t in trades if t.market == market and t.symbol == symbol]
             network_timeout = float(self.client_config_map.commands_timeout.other_commands_timeout)
             try:
                 cur_balances = await asyncio.wait_for(self.get_current_balances(market), network_timeout)
@@ -84,7 +129,16 @@ class HistoryCommand:
                     "\nA network error prevented the balances retrieval to complete. See logs for more details."
                 )
                 raise
-            perf = await PerformanceMetrics.create(symbol, cur_trades, cur_balances)
+            if trade_stats is not None and not trade_stats[(market, symbol)].are_derivatives:
+                perf = await PerformanceMetrics.create_from_trade_stats(
+                    symbol, trade_stats[(market, symbol)], cur_balances)
+            else:
+                if trades is None:
+                    # The trade P&L of derivatives pairs the open and close orders, which requires the trades
+                    await self.wait_for_recorded_trades()
+                    trades = self._get_trades_for_performance(start_time)
+                cur_trades = [t for t in trades if t.market == market and t.symbol == symbol]
+                perf = await PerformanceMetrics.create(symbol, cur_trades, cur_balances)
             if display_report:
                 self.report_performance_by_market(market, symbol, perf, precision)
             return_pcts.append(perf.return_pct)
@@ -208,6 +262,10 @@ class HistoryCommand:
 
         start_time = self.init_time
 
+        trade_stats = self.get_trade_stats(start_time)
+        if trade_stats is not None:
+            return await self.history_report(start_time, None, display_report=False, trade_stats=trade_stats)
+        await self.wait_for_recorded_trades()
         with self.trade_fill_db.get_new_session() as session:
             trades: List[TradeFill] = self._get_trades_from_session(
                 int(start_time * 1e3),
@@ -216,6 +274,14 @@ class HistoryCommand:
             avg_return = await self.history_report(start_time, trades, display_report=False)
         return avg_return
 
+    def _get_trades_for_performance(self,  # type: HummingbotApplication
+                                    start_time: float) -> List[TradeFill]:
+        with self.trade_fill_db.get_new_session() as session:
+            return self._get_trades_from_session(
+                int(start_time * 1e3),
+                session=session,
+                config_file_path=self.strategy_file_name)
+
     def list_trades(self,  # type: HummingbotApplication
                     start_time: float):
         if threading.current_thread() != threading.main_thread():
@@ -47,9 +47,10 @@ class OrderBookCommand:
             trading_pair, order_book = next(iter(market_connector.order_books.items()))
 
         def get_order_book(lines):
-            bids = order_book.snapshot[0][['price', 'amount']].head(lines)
+            bids, asks = order_book.get_snapshot(lines)
+            bids = bids[['price', 'amount']]
             bids.rename(columns={'price': 'bid_price', 'amount': 'bid_volume'}, inplace=True)
-            asks = order_book.snapshot[1][['price', 'amount']].head(lines)
+            asks = asks[['price', 'amount']]
             asks.rename(columns={'price': 'ask_price', 'amount': 'ask_volume'}, inplace=True)
             joined_df = pd.concat([bids, asks], axis=1)
             text_lines = [
@@ -141,6 +141,11 @@ class MQTTBridgeConfigMap(BaseClientModel):
         title = "mqtt_bridge"
 
 
+class MarketDataCollectionStorageEnum(str, ClientConfigEnum):
+    sql = "sql"
+    columnar = "columnar"
+
+
 class MarketDataCollectionConfigMap(BaseClientModel):
     market_data_collection_enabled: bool = Field(
         default=False,
@@ -168,10 +173,26 @@ class MarketDataCollectionConfigMap(BaseClientModel):
             ),
         ),
     )
+    market_data_collection_storage: MarketDataCollectionStorageEnum = Field(
+        default=MarketDataCollectionStorageEnum.sql,
+        description="Where to store the market data: the MarketData table of the database (sql), or columnar files "
+                    "under data/market_data that can be loaded for backtesting (columnar)",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                f"Where do you want to store the market data? ({'/'.join(list(MarketDataCollectionStorageEnum))})"
+            ),
+        ),
+    )
 
     class Config:
         title = "market_data_collection"
 
+    @validator("market_data_collection_storage", pre=True)
+    def validate_market_data_collection_storage(cls, v: Union[str, MarketDataCollectionStorageEnum]):
+        if isinstance(v, str) and v not in MarketDataCollectionStorageEnum.__members__:
+            raise ValueError(f"The value must be one of {', '.join(list(MarketDataCollectionStorageEnum))}.")
+        return v
+
 
 class ColorConfigMap(BaseClientModel):
     top_pane: str = Field(
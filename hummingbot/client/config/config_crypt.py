@@ -1,6 +1,10 @@
 import binascii
+import hmac
 import json
+import threading
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Optional, Tuple
 
 from eth_account import Account
 from eth_keyfile.keyfile import (
@@ -11,11 +15,14 @@ from eth_keyfile.keyfile import (
     _pbkdf2_hash,
     _scrypt_hash,
     big_endian_to_int,
+    decode_hex,
+    decrypt_aes_ctr,
     encode_hex_no_prefix,
     encrypt_aes_ctr,
     get_default_work_factor_for_kdf,
     int_to_big_endian,
     keccak,
+    normalize_keys,
 )
 from pydantic import SecretStr
 
@@ -41,14 +48,85 @@ class BaseSecretsManager(ABC):
     def decrypt_secret_value(self, attr: str, value: str) -> str:
         pass
 
+    def prepare_decryption(self, values: Iterable[str]):
+        """
+        Called with the encrypted values about to be decrypted, so that the secrets manager can do the expensive part
+        of the decryption ahead of time, for all the values at once.
+        """
+        pass
+
+
+class DerivedKeyCache:
+    """
+    Keys derived from a password, indexed by key derivation function and parameters (salt included).
+
+    The key derivation is deliberately slow. The cache makes the values encrypted with the same parameters go
+    through it only once, and lets the keys of different parameters be derived in parallel threads.
+    """
+
+    def __init__(self, password: bytes):
+        self._password = password
+        self._keys: Dict[Tuple[str, str], bytes] = {}
+        self._locks: Dict[Tuple[str, str], threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def derived_key(self, kdf: str, kdfparams: Dict[str, Any]) -> bytes:
+        cache_key = self._cache_key(kdf, kdfparams)
+        with self._lock:
+            key_lock = self._locks.setdefault(cache_key, threading.Lock())
+        # Threads asking for the same key wait for the first one to derive it
+        with key_lock:
+            derived_key = self._keys.get(cache_key)
+            if derived_key is None:
+                derived_key = _derive_key(kdf, kdfparams, self._password)
+                self._keys[cache_key] = derived_key
+        return derived_key
+
+    def derive_keys(self, kdf_settings: Iterable[Tuple[str, Dict[str, Any]]], max_workers: Optional[int] = None):
+        """
+        Derives the keys of all the key derivation settings in parallel (the hash functions release the GIL).
+        """
+        kdf_settings = list({self._cache_key(kdf, kdfparams): (kdf, kdfparams)
+                             for kdf, kdfparams in kdf_settings}.values())
+        if len(kdf_settings) < 2:
+            for kdf, kdfparams in kdf_settings:
+                self.derived_key(kdf, kdfparams)
+            return
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(lambda kdf_setting: self.derived_key(*kdf_setting), kdf_settings))
+
+    @staticmethod
+    def _cache_key(kdf: str, kdfparams: Dict[str, Any]) -> Tuple[str, str]:
+        return kdf, json.dumps(kdfparams, sort_keys=True)
+
 
 class ETHKeyFileSecretManger(BaseSecretsManager):
+    """
+    Encrypts the secrets as Ethereum V3 key files.
+
+    The key is derived from the password once per session: the secrets encrypted by the same secrets manager share
+    the salt of the key derivation (each one with its own random IV), and the keys derived to decrypt secrets are
+    cached.
+    """
+
+    def __init__(self, password: str):
+        super().__init__(password)
+        self._salt: bytes = Random.get_random_bytes(16)
+        self._derived_keys: Optional[DerivedKeyCache] = (
+            None if password is None else DerivedKeyCache(password.encode())
+        )
+
     def encrypt_secret_value(self, attr: str, value: str):
         if self._password is None:
             raise ValueError(f"Could not encrypt secret attribute {attr} because no password was provided.")
         password_bytes = self._password.encode()
         value_bytes = value.encode()
-        keyfile_json = _create_v3_keyfile_json(value_bytes, password_bytes)
+        keyfile_json = _create_v3_keyfile_json(
+            value_bytes, password_bytes, salt=self._salt, derived_keys=self._derived_keys
+        )
         json_str = json.dumps(keyfile_json)
         encrypted_value = binascii.hexlify(json_str.encode()).decode()
         return encrypted_value
@@ -56,10 +134,26 @@ class ETHKeyFileSecretManger(BaseSecretsManager):
     def decrypt_secret_value(self, attr: str, value: str) -> str:
         if self._password is None:
             raise ValueError(f"Could not decrypt secret attribute {attr} because no password was provided.")
-        value = binascii.unhexlify(value)
-        decrypted_value = Account.decrypt(value.decode(), self._password).decode()
+        keyfile_json = _keyfile_json_from_encrypted_value(value)
+        if keyfile_json is None or keyfile_json.get("version") != 3:
+            value = binascii.unhexlify(value)
+            decrypted_value = Account.decrypt(value.decode(), self._password).decode()
+        else:
+            crypto = keyfile_json["crypto"]
+            derived_key = self._derived_keys.derived_key(crypto["kdf"], crypto["kdfparams"])
+            decrypted_value = _decode_v3_keyfile_json(keyfile_json, derived_key).decode()
         return decrypted_value
 
+    def prepare_decryption(self, values: Iterable[str]):
+        if self._password is None:
+            return
+        kdf_settings = []
+        for value in values:
+            keyfile_json = _keyfile_json_from_encrypted_value(value)
+            if keyfile_json is not None and keyfile_json.get("version") == 3:
+                kdf_settings.append((keyfile_json["crypto"]["kdf"], keyfile_json["crypto"]["kdfparams"]))
+        self._derived_keys.derive_keys(kdf_settings)
+
 
 def store_password_verification(secrets_manager: BaseSecretsManager):
     encrypted_word = secrets_manager.encrypt_secret_value(PASSWORD_VERIFICATION_WORD, PASSWORD_VERIFICATION_WORD)
@@ -80,24 +174,26 @@ def validate_password(secrets_manager: BaseSecretsManager) -> bool:
     return valid
 
 
-def _create_v3_keyfile_json(message_to_encrypt, password, kdf="pbkdf2", work_factor=None):
+def _create_v3_keyfile_json(
+    message_to_encrypt,
+    password,
+    kdf="pbkdf2",
+    work_factor=None,
+    salt: Optional[bytes] = None,
+    derived_keys: Optional[DerivedKeyCache] = None,
+):
     """
     Encrypt message by a given password.
     Most of this code is copied from eth_key_file.key_file, removed address and is from json result.
+    The salt and the cache of the derived keys can be provided to derive the key once for several messages.
     """
-    salt = Random.get_random_bytes(16)
+    if salt is None:
+        salt = Random.get_random_bytes(16)
 
     if work_factor is None:
         work_factor = get_default_work_factor_for_kdf(kdf)
 
     if kdf == 'pbkdf2':
-        derived_key = _pbkdf2_hash(
-            password,
-            hash_name='sha256',
-            salt=salt,
-            iterations=work_factor,
-            dklen=DKLEN,
-        )
         kdfparams = {
             'c': work_factor,
             'dklen': DKLEN,
@@ -105,14 +201,6 @@ def _create_v3_keyfile_json(message_to_encrypt, password, kdf="pbkdf2", work_fac
             'salt': encode_hex_no_prefix(salt),
         }
     elif kdf == 'scrypt':
-        derived_key = _scrypt_hash(
-            password,
-            salt=salt,
-            buflen=DKLEN,
-            r=SCRYPT_R,
-            p=SCRYPT_P,
-            n=work_factor,
-        )
         kdfparams = {
             'dklen': DKLEN,
             'n': work_factor,
@@ -123,6 +211,11 @@ def _create_v3_keyfile_json(message_to_encrypt, password, kdf="pbkdf2", work_fac
     else:
         raise NotImplementedError("KDF not implemented: {0}".format(kdf))
 
+    if derived_keys is None:
+        derived_key = _derive_key(kdf, kdfparams, password)
+    else:
+        derived_key = derived_keys.derived_key(kdf, kdfparams)
+
     iv = big_endian_to_int(Random.get_random_bytes(16))
     encrypt_key = derived_key[:16]
     ciphertext = encrypt_aes_ctr(message_to_encrypt, encrypt_key, iv)
@@ -142,3 +235,58 @@ def _create_v3_keyfile_json(message_to_encrypt, password, kdf="pbkdf2", work_fac
         'version': 3,
         'alias': '',  # Add this line to include the 'alias' field with an empty string value
     }
+
+
+def _derive_key(kdf: str, kdfparams: Dict[str, Any], password: bytes) -> bytes:
+    """
+    Derive the key of a V3 key file from its KDF parameters, as eth_keyfile.keyfile does when decoding.
+    """
+    salt = decode_hex(kdfparams['salt'])
+    if kdf == 'pbkdf2':
+        should_be_hmac, _, hash_name = kdfparams['prf'].partition('-')
+        if should_be_hmac != 'hmac':
+            raise ValueError(f"Unsupported pseudo random function: {kdfparams['prf']}")
+        return _pbkdf2_hash(
+            password,
+            hash_name=hash_name,
+            salt=salt,
+            iterations=kdfparams['c'],
+            dklen=kdfparams['dklen'],
+        )
+    elif kdf == 'scrypt':
+        return _scrypt_hash(
+            password,
+            salt=salt,
+            buflen=kdfparams['dklen'],
+            r=kdfparams['r'],
+            p=kdfparams['p'],
+            n=kdfparams['n'],
+        )
+    raise TypeError(f"Unsupported key derivation function: {kdf}")
+
+
+def _decode_v3_keyfile_json(keyfile_json: Dict[str, Any], derived_key: bytes) -> bytes:
+    """
+    Decrypt the message of a V3 key file with the key derived from the password.
+    This code is copied from eth_key_file.key_file, without the key derivation.
+    """
+    crypto = keyfile_json["crypto"]
+    ciphertext = decode_hex(crypto["ciphertext"])
+    mac = keccak(derived_key[16:32] + ciphertext)
+    expected_mac = decode_hex(crypto["mac"])
+    if not hmac.compare_digest(mac, expected_mac):
+        raise ValueError("MAC mismatch")
+
+    encrypt_key = derived_key[:16]
+    iv = big_endian_to_int(decode_hex(crypto["cipherparams"]["iv"]))
+    return decrypt_aes_ctr(ciphertext, encrypt_key, iv)
+
+
+def _keyfile_json_from_encrypted_value(value: str) -> Optional[Dict[str, Any]]:
+    try:
+        keyfile_json = normalize_keys(json.loads(binascii.unhexlify(value).decode()))
+    except (ValueError, TypeError, AttributeError):
+        return None
+    if not isinstance(keyfile_json, dict) or not isinstance(keyfile_json.get("crypto"), dict):
+        return None
+    return keyfile_json
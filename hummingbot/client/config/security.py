@@ -1,7 +1,7 @@
 import asyncio
 import logging
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 from hummingbot.client.config.config_crypt import PASSWORD_VERIFICATION_PATH, BaseSecretsManager, validate_password
 from hummingbot.client.config.config_helpers import (
@@ -11,6 +11,7 @@ from hummingbot.client.config.config_helpers import (
     get_connector_config_yml_path,
     list_connector_configs,
     load_connector_config_map_from_file,
+    read_yml_file,
     reset_connector_hb_config,
     save_to_yml,
     update_connector_hb_config,
@@ -24,6 +25,8 @@ class Security:
     __instance = None
     secrets_manager: Optional[BaseSecretsManager] = None
     _secure_configs = {}
+    # Config files of the connectors whose secrets are decrypted on first use, in lazy decryption mode
+    _pending_config_files: Dict[str, Path] = {}
     _decryption_done = asyncio.Event()
 
     _logger: Optional[HummingbotLogger] = None
@@ -40,7 +43,7 @@ class Security:
 
     @classmethod
     def any_secure_configs(cls):
-        return len(cls._secure_configs) > 0
+        return len(cls._secure_configs) > 0 or len(cls._pending_config_files) > 0
 
     @staticmethod
     def connector_config_file_exists(connector_name: str) -> bool:
@@ -48,21 +51,29 @@ class Security:
         return connector_configs_path.exists()
 
     @classmethod
-    def login(cls, secrets_manager: BaseSecretsManager) -> bool:
+    def login(cls, secrets_manager: BaseSecretsManager, lazy_decryption: bool = False) -> bool:
         if not validate_password(secrets_manager):
             return False
         cls.secrets_manager = secrets_manager
-        coro = AsyncCallScheduler.shared_instance().call_async(cls.decrypt_all, timeout_seconds=30)
+        coro = AsyncCallScheduler.shared_instance().call_async(cls.decrypt_all, lazy_decryption, timeout_seconds=30)
         safe_ensure_future(coro)
         return True
 
     @classmethod
-    def decrypt_all(cls):
+    def decrypt_all(cls, lazy: bool = False):
+        """
+        Decrypts the config files of all the connectors. In lazy mode, the config files are only listed, and the
+        secrets of a connector are decrypted the first time its config is requested.
+        """
         cls._secure_configs.clear()
+        cls._pending_config_files.clear()
         cls._decryption_done.clear()
         encrypted_files = list_connector_configs()
-        for file in encrypted_files:
-            cls.decrypt_connector_config(file)
+        if lazy:
+            for file in encrypted_files:
+                cls._pending_config_files[connector_name_from_file(file)] = file
+        else:
+            cls._decrypt_connector_configs(encrypted_files)
         cls._decryption_done.set()
 
     @classmethod
@@ -76,6 +87,7 @@ class Security:
         file_path = get_connector_config_yml_path(connector_name)
         save_to_yml(file_path, connector_config)
         update_connector_hb_config(connector_config)
+        cls._pending_config_files.pop(connector_name, None)
         cls._secure_configs[connector_name] = connector_config
 
     @classmethod
@@ -83,7 +95,8 @@ class Security:
         file_path = get_connector_config_yml_path(connector_name)
         file_path.unlink(missing_ok=True)
         reset_connector_hb_config(connector_name)
-        cls._secure_configs.pop(connector_name)
+        if cls._pending_config_files.pop(connector_name, None) is None:
+            cls._secure_configs.pop(connector_name)
 
     @classmethod
     def is_decryption_done(cls):
@@ -91,10 +104,17 @@ class Security:
 
     @classmethod
     def decrypted_value(cls, key: str) -> Optional[ClientConfigAdapter]:
+        pending_config_file = cls._pending_config_files.pop(key, None)
+        if pending_config_file is not None:
+            cls.decrypt_connector_config(pending_config_file)
         return cls._secure_configs.get(key, None)
 
     @classmethod
     def all_decrypted_values(cls) -> Dict[str, ClientConfigAdapter]:
+        if cls._pending_config_files:
+            pending_config_files = list(cls._pending_config_files.values())
+            cls._pending_config_files.clear()
+            cls._decrypt_connector_configs(pending_config_files)
         return cls._secure_configs.copy()
 
     @classmethod
@@ -110,3 +130,24 @@ class Security:
             else {}
         )
         return keys
+
+    @classmethod
+    def _decrypt_connector_configs(cls, file_paths: List[Path]):
+        # The keys to decrypt all the secrets are derived at once, in parallel, before loading the configs one by one
+        if cls.secrets_manager is not None:
+            cls.secrets_manager.prepare_decryption(
+                value for file_path in file_paths for value in cls._config_string_values(read_yml_file(file_path))
+            )
+        for file_path in file_paths:
+            cls.decrypt_connector_config(file_path)
+
+    @classmethod
+    def _config_string_values(cls, config_data: Any) -> Iterable[str]:
+        if isinstance(config_data, str):
+            yield config_data
+        elif isinstance(config_data, dict):
+            for value in config_data.values():
+                yield from cls._config_string_values(value)
+        elif isinstance(config_data, list):
+            for value in config_data:
+                yield from cls._config_string_values(value)
@@ -0,0 +1,111 @@
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from hummingbot import data_path
+from hummingbot.logger import HummingbotLogger
+
+CONNECTOR_MANIFEST_FILE_NAME = "connector_manifest.json"
+CONNECTOR_MANIFEST_VERSION = 1
+
+
+def default_connector_manifest_path() -> Path:
+    return Path(data_path()) / CONNECTOR_MANIFEST_FILE_NAME
+
+
+def source_tree_hash(root: Path) -> str:
+    """
+    Returns the hash of the relative path and content of every Python file under the root directory.
+    """
+    tree_hash = hashlib.sha256()
+    for dir_path, dir_names, file_names in os.walk(root):
+        dir_names[:] = sorted(name for name in dir_names if name != "__pycache__")
+        for file_name in sorted(file_names):
+            if not file_name.endswith(".py"):
+                continue
+            file_path = os.path.join(dir_path, file_name)
+            tree_hash.update(os.path.relpath(file_path, root).encode())
+            with open(file_path, "rb") as fd:
+                tree_hash.update(fd.read())
+    return tree_hash.hexdigest()
+
+
+class ConnectorManifest:
+    """
+    Cache of the metadata the connectors define in their `*_utils` modules (fees, example pair, other domains...), so
+    that the connector settings can be created without importing the connectors and the SDKs they depend on.
+
+    A manifest is only valid for the source tree it was generated from: it is discarded when the hash of the
+    connectors source tree changes. Entries are plain JSON objects indexed by connector name.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self, path: Path, tree_hash: str, entries: Optional[Dict[str, Dict[str, Any]]] = None):
+        self._path = path
+        self._tree_hash = tree_hash
+        self._entries: Dict[str, Dict[str, Any]] = entries or {}
+        self._dirty = False
+
+    @classmethod
+    def load(cls, path: Path, tree_hash: str) -> "ConnectorManifest":
+        """
+        Loads the manifest saved in the path, or returns an empty manifest if the file does not exist, can not be
+        read or was generated from a different source tree.
+        """
+        entries = None
+        try:
+            with open(path) as fd:
+                data = json.load(fd)
+            if data.get("version") == CONNECTOR_MANIFEST_VERSION and data.get("source_tree_hash") == tree_hash:
+                entries = data["connectors"]
+        except FileNotFoundError:
+            pass
+        except Exception:
+            cls.logger().warning(f"Could not read the connector manifest {path}. It will be generated again.",
+                                 exc_info=True)
+        return cls(path=path, tree_hash=tree_hash, entries=entries)
+
+    @property
+    def tree_hash(self) -> str:
+        return self._tree_hash
+
+    @property
+    def dirty(self) -> bool:
+        """
+        Whether entries were added since the manifest was loaded or saved.
+        """
+        return self._dirty
+
+    def get(self, connector_name: str) -> Optional[Dict[str, Any]]:
+        return self._entries.get(connector_name)
+
+    def add(self, connector_name: str, entry: Dict[str, Any]):
+        self._entries[connector_name] = entry
+        self._dirty = True
+
+    def save(self):
+        """
+        Writes the manifest atomically, so that concurrent processes never read a partially written file. A failure
+        to write the manifest is only logged, since the manifest is a cache.
+        """
+        temp_path = self._path.with_name(f"{self._path.name}.{os.getpid()}.tmp")
+        try:
+            with open(temp_path, "w") as fd:
+                json.dump({
+                    "version": CONNECTOR_MANIFEST_VERSION,
+                    "source_tree_hash": self._tree_hash,
+                    "connectors": self._entries,
+                }, fd)
+            os.replace(temp_path, self._path)
+            self._dirty = False
+        except OSError:
+            self.logger().warning(f"Could not save the connector manifest {self._path}.", exc_info=True)
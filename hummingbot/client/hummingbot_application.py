@@ -326,6 +326,7 @@ class HummingbotApplication(*commands):
             self.strategy_file_name,
             self.strategy_name,
             self.client_config_map.market_data_collection,
+            performance_start_time=self.init_time,
         )
         self.markets_recorder.start()
         if self._mqtt is not None:
@@ -4,6 +4,7 @@ from dataclasses import dataclass
 from decimal import Decimal
 from typing import Any, Dict, List, Optional, Tuple
 
+from hummingbot.client.performance_accumulator import MarketTradeStats
 from hummingbot.connector.utils import combine_to_hb_trading_pair, split_hb_trading_pair
 from hummingbot.core.data_type.common import PositionAction, TradeType
 from hummingbot.core.data_type.trade_fee import DeductedFromReturnsTradeFee, TokenAmount
@@ -71,6 +72,19 @@ class PerformanceMetrics:
         await performance._initialize_metrics(trading_pair, trades, current_balances)
         return performance
 
+    @classmethod
+    async def create_from_trade_stats(cls,
+                                      trading_pair: str,
+                                      trade_stats: MarketTradeStats,
+                                      current_balances: Dict[str, Decimal]) -> 'PerformanceMetrics':
+        """
+        Creates the performance metrics from the running trade stats of the market instead of its trades.
+        The trade P&L of derivatives requires the trades, so the stats must not be for derivatives.
+        """
+        performance = PerformanceMetrics()
+        await performance._initialize_metrics_from_trade_stats(trading_pair, trade_stats, current_balances)
+        return performance
+
     @staticmethod
     def position_order(open: list, close: list) -> Tuple[Any, Any]:
         """
@@ -196,6 +210,11 @@ class PerformanceMetrics:
 
             self.s_vol_quote += self._process_deducted_fees_impact_in_quote_vol(trade)
 
+        self._calculate_volume_totals()
+
+        return buys, sells
+
+    def _calculate_volume_totals(self):
         self.tot_vol_base = self.b_vol_base + self.s_vol_base
         self.tot_vol_quote = self.b_vol_quote + self.s_vol_quote
 
@@ -206,8 +225,6 @@ class PerformanceMetrics:
         self.avg_b_price = abs(self.avg_b_price)
         self.avg_s_price = abs(self.avg_s_price)
 
-        return buys, sells
-
     def _process_deducted_fees_impact_in_quote_vol(self, trade):
         fee_percent = None
         fee_type = ""
@@ -248,6 +265,9 @@ class PerformanceMetrics:
             for flat_fee in flat_fees:
                 self.fees[flat_fee.token] += flat_fee.amount
 
+        await self._calculate_fee_in_quote(quote)
+
+    async def _calculate_fee_in_quote(self, quote: str):
         for fee_token, fee_amount in self.fees.items():
             if fee_token == quote:
                 self.fee_in_quote += fee_amount
@@ -302,15 +322,67 @@ class PerformanceMetrics:
         self.num_sells = len(sells)
         self.num_trades = self.num_buys + self.num_sells
 
+        await self._calculate_balances_and_values(trading_pair,
+                                                  current_balances,
+                                                  Decimal(str(trades[0].price)),
+                                                  Decimal(str(trades[-1].price)))
+        self._calculate_trade_pnl(buys, sells)
+
+        await self._calculate_fees(quote, trades)
+
+        self.total_pnl = self.trade_pnl - self.fee_in_quote
+        self.return_pct = self.divide(self.total_pnl, self.hold_value)
+
+    async def _initialize_metrics_from_trade_stats(self,
+                                                   trading_pair: str,
+                                                   trade_stats: MarketTradeStats,
+                                                   current_balances: Dict[str, Decimal]):
+        """
+        Calculates PnL, fees, Return % and etc... from the running trade stats of the market
+        :param trading_pair: the trading market to get performance metrics
+        :param trade_stats: the trade stats of the market
+        :param current_balances: current user account balance
+        """
+        quote = split_hb_trading_pair(trading_pair)[1]
+
+        self.num_buys = trade_stats.num_buys
+        self.num_sells = trade_stats.num_sells
+        self.num_trades = trade_stats.num_trades
+        self.b_vol_base = trade_stats.b_vol_base
+        self.s_vol_base = trade_stats.s_vol_base
+        self.b_vol_quote = trade_stats.b_vol_quote
+        self.s_vol_quote = trade_stats.s_vol_quote
+        self._calculate_volume_totals()
+
+        await self._calculate_balances_and_values(trading_pair,
+                                                  current_balances,
+                                                  trade_stats.start_price,
+                                                  trade_stats.last_price)
+        self.trade_pnl = self.cur_value - self.hold_value
+
+        for fee_token, fee_amount in trade_stats.fees.items():
+            self.fees[fee_token] += fee_amount
+        await self._calculate_fee_in_quote(quote)
+
+        self.total_pnl = self.trade_pnl - self.fee_in_quote
+        self.return_pct = self.divide(self.total_pnl, self.hold_value)
+
+    async def _calculate_balances_and_values(self,
+                                             trading_pair: str,
+                                             current_balances: Dict[str, Decimal],
+                                             start_price: Decimal,
+                                             last_trade_price: Decimal):
+        base, quote = split_hb_trading_pair(trading_pair)
+
         self.cur_base_bal = current_balances.get(base, s_decimal_0)
         self.cur_quote_bal = current_balances.get(quote, s_decimal_0)
         self.start_base_bal = self.cur_base_bal - self.tot_vol_base
         self.start_quote_bal = self.cur_quote_bal - self.tot_vol_quote
 
-        self.start_price = Decimal(str(trades[0].price))
+        self.start_price = start_price
         self.cur_price = await RateOracle.get_instance().stored_or_live_rate(trading_pair)
         if self.cur_price is None:
-            self.cur_price = Decimal(str(trades[-1].price))
+            self.cur_price = last_trade_price
         self.start_base_ratio_pct = self.divide(self.start_base_bal * self.start_price,
                                                 (self.start_base_bal * self.start_price) + self.start_quote_bal)
         self.cur_base_ratio_pct = self.divide(self.cur_base_bal * self.cur_price,
@@ -318,9 +390,3 @@ class PerformanceMetrics:
 
         self.hold_value = (self.start_base_bal * self.cur_price) + self.start_quote_bal
         self.cur_value = (self.cur_base_bal * self.cur_price) + self.cur_quote_bal
-        self._calculate_trade_pnl(buys, sells)
-
-        await self._calculate_fees(quote, trades)
-
-        self.total_pnl = self.trade_pnl - self.fee_in_quote
-        self.return_pct = self.divide(self.total_pnl, self.hold_value)
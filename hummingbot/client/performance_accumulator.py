@@ -0,0 +1,206 @@
+import json
+from collections import defaultdict
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from hummingbot.core.data_type.common import PositionAction, TradeType
+from hummingbot.core.data_type.trade_fee import DeductedFromReturnsTradeFee
+from hummingbot.model.trade_fill import TradeFill
+
+s_decimal_0 = Decimal("0")
+
+
+@dataclass
+class MarketTradeStats:
+    """
+    Running totals of the trade fills of a market, from which the performance metrics of the market can be calculated
+    without going through its fills again.
+    """
+    quote: str
+    num_buys: int = 0
+    num_sells: int = 0
+    num_nil_positions: int = 0
+    b_vol_base: Decimal = s_decimal_0
+    s_vol_base: Decimal = s_decimal_0
+    b_vol_quote: Decimal = s_decimal_0
+    s_vol_quote: Decimal = s_decimal_0
+    start_price: Optional[Decimal] = None
+    last_price: Optional[Decimal] = None
+    # Timestamps of the fills of start_price and last_price, the fills can be added in any order
+    start_price_timestamp: Optional[int] = None
+    last_price_timestamp: Optional[int] = None
+    # fees is a dictionary of token and total fee amount paid in that token.
+    fees: Dict[str, Decimal] = field(default_factory=lambda: defaultdict(lambda: s_decimal_0))
+
+    @property
+    def num_trades(self) -> int:
+        return self.num_buys + self.num_sells
+
+    @property
+    def are_derivatives(self) -> bool:
+        # Same rule as PerformanceMetrics: all the fills of derivative markets open or close a position
+        return self.num_trades > 0 and self.num_nil_positions == 0
+
+    def add_trade_fill(self, trade: TradeFill):
+        price = Decimal(str(trade.price))
+        amount = Decimal(str(trade.amount))
+        if trade.trade_type.upper() == TradeType.BUY.name.upper():
+            self.num_buys += 1
+            self.b_vol_base += amount
+            self.b_vol_quote += amount * price * Decimal("-1")
+        elif trade.trade_type.upper() == TradeType.SELL.name.upper():
+            self.num_sells += 1
+            self.s_vol_base += amount * Decimal("-1")
+            self.s_vol_quote += amount * price
+        if trade.position == PositionAction.NIL.value:
+            self.num_nil_positions += 1
+        if self.start_price_timestamp is None or trade.timestamp < self.start_price_timestamp:
+            self.start_price = price
+            self.start_price_timestamp = trade.timestamp
+        if self.last_price_timestamp is None or trade.timestamp >= self.last_price_timestamp:
+            self.last_price = price
+            self.last_price_timestamp = trade.timestamp
+
+        fee_percent = trade.trade_fee.get("percent")
+        if fee_percent is not None:
+            if trade.trade_fee.get("fee_type") == DeductedFromReturnsTradeFee.type_descriptor_for_json():
+                self.s_vol_quote += amount * price * Decimal(fee_percent) * Decimal("-1")
+            self.fees[self.quote] += price * amount * Decimal(str(fee_percent))
+        for flat_fee in trade.trade_fee.get("flat_fees", []):
+            self.fees[flat_fee["token"]] += Decimal(flat_fee["amount"])
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "quote": self.quote,
+            "num_buys": self.num_buys,
+            "num_sells": self.num_sells,
+            "num_nil_positions": self.num_nil_positions,
+            "b_vol_base": str(self.b_vol_base),
+            "s_vol_base": str(self.s_vol_base),
+            "b_vol_quote": str(self.b_vol_quote),
+            "s_vol_quote": str(self.s_vol_quote),
+            "start_price": None if self.start_price is None else str(self.start_price),
+            "last_price": None if self.last_price is None else str(self.last_price),
+            "start_price_timestamp": self.start_price_timestamp,
+            "last_price_timestamp": self.last_price_timestamp,
+            "fees": {token: str(amount) for token, amount in self.fees.items()},
+        }
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "MarketTradeStats":
+        stats = MarketTradeStats(
+            quote=data["quote"],
+            num_buys=data["num_buys"],
+            num_sells=data["num_sells"],
+            num_nil_positions=data["num_nil_positions"],
+            b_vol_base=Decimal(data["b_vol_base"]),
+            s_vol_base=Decimal(data["s_vol_base"]),
+            b_vol_quote=Decimal(data["b_vol_quote"]),
+            s_vol_quote=Decimal(data["s_vol_quote"]),
+            start_price=None if data["start_price"] is None else Decimal(data["start_price"]),
+            last_price=None if data["last_price"] is None else Decimal(data["last_price"]),
+            start_price_timestamp=data["start_price_timestamp"],
+            last_price_timestamp=data["last_price_timestamp"],
+        )
+        for token, amount in data["fees"].items():
+            stats.fees[token] = Decimal(amount)
+        return stats
+
+
+class PerformanceAccumulator:
+    """
+    Keeps the running trade stats of each market (market name and trading pair) for the fills of a config file
+    since a start timestamp (in milliseconds).
+
+    The fills can be added in any order. The accumulator remembers the ids of the fills it counted, so that a fill can
+    be added again without being counted twice, for instance when catching up with the database.
+    """
+
+    def __init__(self, config_file_path: str, start_timestamp: int):
+        self._config_file_path: str = config_file_path
+        self._start_timestamp: int = start_timestamp
+        self._trade_stats: Dict[Tuple[str, str], MarketTradeStats] = {}
+        self._last_timestamp: Optional[int] = None
+        self._fill_ids: Set[Tuple[str, str, str]] = set()
+        self._dirty: bool = False
+
+    @property
+    def config_file_path(self) -> str:
+        return self._config_file_path
+
+    @property
+    def start_timestamp(self) -> int:
+        return self._start_timestamp
+
+    @property
+    def last_timestamp(self) -> Optional[int]:
+        return self._last_timestamp
+
+    @property
+    def fill_ids(self) -> Set[Tuple[str, str, str]]:
+        """
+        The market, order id and exchange trade id of the fills counted by the accumulator.
+        """
+        return self._fill_ids
+
+    @property
+    def trade_stats(self) -> Dict[Tuple[str, str], MarketTradeStats]:
+        return self._trade_stats
+
+    @property
+    def num_trades(self) -> int:
+        return sum(stats.num_trades for stats in self._trade_stats.values())
+
+    @property
+    def dirty(self) -> bool:
+        """
+        Whether fills were added since the accumulator was last serialized.
+        """
+        return self._dirty
+
+    def covers(self, config_file_path: str, start_timestamp: int) -> bool:
+        return config_file_path == self._config_file_path and start_timestamp == self._start_timestamp
+
+    def add_trade_fill(self, trade: TradeFill):
+        if trade.timestamp < self._start_timestamp or trade.config_file_path != self._config_file_path:
+            return
+        fill_id = (trade.market, trade.order_id, trade.exchange_trade_id)
+        if fill_id in self._fill_ids:
+            return
+        self._fill_ids.add(fill_id)
+        if self._last_timestamp is None or trade.timestamp > self._last_timestamp:
+            self._last_timestamp = trade.timestamp
+
+        stats = self._trade_stats.get((trade.market, trade.symbol))
+        if stats is None:
+            stats = MarketTradeStats(quote=trade.quote_asset)
+            self._trade_stats[(trade.market, trade.symbol)] = stats
+        stats.add_trade_fill(trade)
+        self._dirty = True
+
+    def add_trade_fills(self, trades: Iterable[TradeFill]):
+        for trade in trades:
+            self.add_trade_fill(trade)
+
+    def to_json(self) -> str:
+        self._dirty = False
+        return json.dumps({
+            "config_file_path": self._config_file_path,
+            "start_timestamp": self._start_timestamp,
+            "last_timestamp": self._last_timestamp,
+            "fill_ids": [list(fill_id) for fill_id in self._fill_ids],
+            "markets": [[market, symbol, stats.to_json()]
+                        for (market, symbol), stats in self._trade_stats.items()],
+        })
+
+    @classmethod
+    def from_json(cls, serialized: str) -> "PerformanceAccumulator":
+        data = json.loads(serialized)
+        accumulator = PerformanceAccumulator(data["config_file_path"], data["start_timestamp"])
+        accumulator._last_timestamp = data["last_timestamp"]
+        accumulator._fill_ids = set(tuple(fill_id) for fill_id in data["fill_ids"])
+        markets: List[List[Any]] = data["markets"]
+        for market, symbol, stats in markets:
+            accumulator._trade_stats[(market, symbol)] = MarketTradeStats.from_json(stats)
+        return accumulator
@@ -10,6 +10,7 @@ from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Set, Un
 from pydantic import SecretStr
 
 from hummingbot import get_strategy_list, root_path
+from hummingbot.client.connector_manifest import ConnectorManifest, default_connector_manifest_path, source_tree_hash
 from hummingbot.core.data_type.trade_fee import TradeFeeSchema
 
 if TYPE_CHECKING:
@@ -159,22 +160,49 @@ class GatewayConnectionSetting:
         GatewayConnectionSetting.save(connectors_conf)
 
 
-class ConnectorSetting(NamedTuple):
+class LazyConnectorConfigKeys(NamedTuple):
+    """
+    Reference to the config keys a connector defines in its utils module, which is only imported when the config keys
+    are used.
+    """
+    utils_module: str
+    domain: Optional[str] = None
+
+    def load(self) -> Optional["BaseConnectorConfigMap"]:
+        util_module = importlib.import_module(self.utils_module)
+        if self.domain is None:
+            return getattr(util_module, "KEYS", None)
+        return getattr(util_module, "OTHER_DOMAINS_KEYS")[self.domain]
+
+
+class _ConnectorSettingFields(NamedTuple):
     name: str
     type: ConnectorType
     example_pair: str
     centralised: bool
     use_ethereum_wallet: bool
     trade_fee_schema: TradeFeeSchema
-    config_keys: Optional["BaseConnectorConfigMap"]
+    config_keys: Optional[Union["BaseConnectorConfigMap", LazyConnectorConfigKeys]]
     is_sub_domain: bool
     parent_name: Optional[str]
     domain_parameter: Optional[str]
     use_eth_gas_lookup: bool
+
+
+class ConnectorSetting(_ConnectorSettingFields):
     """
     This class has metadata data about Exchange connections. The name of the connection and the file path location of
     the connector file.
     """
+    __slots__ = ()
+
+    @property
+    def config_keys(self) -> Optional["BaseConnectorConfigMap"]:
+        # The config keys of the connectors created from the manifest are loaded from their utils module on first use
+        config_keys = super().config_keys
+        if isinstance(config_keys, LazyConnectorConfigKeys):
+            config_keys = config_keys.load()
+        return config_keys
 
     def uses_gateway_generic_connector(self) -> bool:
         non_gateway_connectors_types = [ConnectorType.Exchange, ConnectorType.Derivative, ConnectorType.Connector]
@@ -353,13 +381,20 @@ class AllConnectorSettings:
     def create_connector_settings(cls):
         """
         Iterate over files in specific Python directories to create a dictionary of exchange names to ConnectorSetting.
+
+        The metadata of the connectors is read from the connector manifest, and the utils module of a connector is
+        only imported if the connector is not in the manifest yet. The manifest is regenerated when the connectors
+        source tree changes.
         """
         cls.all_connector_settings = {}  # reset
         connector_exceptions = ["mock_paper_exchange", "mock_pure_python_paper_exchange", "paper_trade"]
         # connector_exceptions = ["mock_paper_exchange", "mock_pure_python_paper_exchange", "paper_trade", "injective_v2", "injective_v2_perpetual"]
 
+        connector_root = root_path() / "hummingbot" / "connector"
+        manifest = ConnectorManifest.load(default_connector_manifest_path(), source_tree_hash(connector_root))
+
         type_dirs: List[DirEntry] = [
-            cast(DirEntry, f) for f in scandir(f"{root_path() / 'hummingbot' / 'connector'}")
+            cast(DirEntry, f) for f in scandir(f"{connector_root}")
             if f.is_dir() and f.name not in CONNECTOR_SUBMODULES_THAT_ARE_NOT_CEX_TYPES
         ]
         for type_dir in type_dirs:
@@ -374,48 +409,22 @@ class AllConnectorSettings:
                     continue
                 if connector_dir.name in cls.all_connector_settings:
                     raise Exception(f"Multiple connectors with the same {connector_dir.name} name.")
-                try:
-                    util_module_path: str = f"hummingbot.connector.{type_dir.name}." \
-                                            f"{connector_dir.name}.{connector_dir.name}_utils"
-                    util_module = importlib.import_module(util_module_path)
-                except ModuleNotFoundError:
-                    continue
-                trade_fee_settings: List[float] = getattr(util_module, "DEFAULT_FEES", None)
-                trade_fee_schema: TradeFeeSchema = cls._validate_trade_fee_schema(
-                    connector_dir.name, trade_fee_settings
-                )
-                cls.all_connector_settings[connector_dir.name] = ConnectorSetting(
-                    name=connector_dir.name,
-                    type=ConnectorType[type_dir.name.capitalize()],
-                    centralised=getattr(util_module, "CENTRALIZED", True),
-                    example_pair=getattr(util_module, "EXAMPLE_PAIR", ""),
-                    use_ethereum_wallet=getattr(util_module, "USE_ETHEREUM_WALLET", False),
-                    trade_fee_schema=trade_fee_schema,
-                    config_keys=getattr(util_module, "KEYS", None),
-                    is_sub_domain=False,
-                    parent_name=None,
-                    domain_parameter=None,
-                    use_eth_gas_lookup=getattr(util_module, "USE_ETH_GAS_LOOKUP", False),
-                )
-                # Adds other domains of connector
-                other_domains = getattr(util_module, "OTHER_DOMAINS", [])
-                for domain in other_domains:
-                    trade_fee_settings = getattr(util_module, "OTHER_DOMAINS_DEFAULT_FEES")[domain]
-                    trade_fee_schema = cls._validate_trade_fee_schema(domain, trade_fee_settings)
-                    parent = cls.all_connector_settings[connector_dir.name]
-                    cls.all_connector_settings[domain] = ConnectorSetting(
-                        name=domain,
-                        type=parent.type,
-                        centralised=parent.centralised,
-                        example_pair=getattr(util_module, "OTHER_DOMAINS_EXAMPLE_PAIR")[domain],
-                        use_ethereum_wallet=parent.use_ethereum_wallet,
-                        trade_fee_schema=trade_fee_schema,
-                        config_keys=getattr(util_module, "OTHER_DOMAINS_KEYS")[domain],
-                        is_sub_domain=True,
-                        parent_name=parent.name,
-                        domain_parameter=getattr(util_module, "OTHER_DOMAINS_PARAMETER")[domain],
-                        use_eth_gas_lookup=parent.use_eth_gas_lookup,
+                manifest_entry = manifest.get(connector_dir.name)
+                if manifest_entry is None:
+                    try:
+                        util_module_path: str = f"hummingbot.connector.{type_dir.name}." \
+                                                f"{connector_dir.name}.{connector_dir.name}_utils"
+                        util_module = importlib.import_module(util_module_path)
+                    except ModuleNotFoundError:
+                        continue
+                    manifest_entry = cls._connector_manifest_entry(
+                        connector_dir.name, type_dir.name, util_module_path, util_module
                     )
+                    manifest.add(connector_dir.name, manifest_entry)
+                cls._add_connector_settings_from_manifest_entry(connector_dir.name, manifest_entry)
+
+        if manifest.dirty:
+            manifest.save()
 
         # add gateway connectors
         gateway_connections_conf: List[Dict[str, str]] = GatewayConnectionSetting.load()
@@ -440,24 +449,80 @@ class AllConnectorSettings:
 
         return cls.all_connector_settings
 
+    @classmethod
+    def _connector_manifest_entry(
+        cls, connector_name: str, type_name: str, util_module_path: str, util_module: ModuleType
+    ) -> Dict[str, Any]:
+        trade_fee_schema: TradeFeeSchema = cls._validate_trade_fee_schema(
+            connector_name, getattr(util_module, "DEFAULT_FEES", None)
+        )
+        other_domains = []
+        for domain in getattr(util_module, "OTHER_DOMAINS", []):
+            domain_trade_fee_schema = cls._validate_trade_fee_schema(
+                domain, getattr(util_module, "OTHER_DOMAINS_DEFAULT_FEES")[domain]
+            )
+            other_domains.append({
+                "name": domain,
+                "example_pair": getattr(util_module, "OTHER_DOMAINS_EXAMPLE_PAIR")[domain],
+                "trade_fee_schema": domain_trade_fee_schema.to_json(),
+                "domain_parameter": getattr(util_module, "OTHER_DOMAINS_PARAMETER")[domain],
+            })
+        return {
+            "type": type_name,
+            "utils_module": util_module_path,
+            "centralised": getattr(util_module, "CENTRALIZED", True),
+            "example_pair": getattr(util_module, "EXAMPLE_PAIR", ""),
+            "use_ethereum_wallet": getattr(util_module, "USE_ETHEREUM_WALLET", False),
+            "trade_fee_schema": trade_fee_schema.to_json(),
+            "use_eth_gas_lookup": getattr(util_module, "USE_ETH_GAS_LOOKUP", False),
+            "other_domains": other_domains,
+        }
+
+    @classmethod
+    def _add_connector_settings_from_manifest_entry(cls, connector_name: str, manifest_entry: Dict[str, Any]):
+        parent = ConnectorSetting(
+            name=connector_name,
+            type=ConnectorType[manifest_entry["type"].capitalize()],
+            centralised=manifest_entry["centralised"],
+            example_pair=manifest_entry["example_pair"],
+            use_ethereum_wallet=manifest_entry["use_ethereum_wallet"],
+            trade_fee_schema=TradeFeeSchema.from_json(manifest_entry["trade_fee_schema"]),
+            config_keys=LazyConnectorConfigKeys(utils_module=manifest_entry["utils_module"]),
+            is_sub_domain=False,
+            parent_name=None,
+            domain_parameter=None,
+            use_eth_gas_lookup=manifest_entry["use_eth_gas_lookup"],
+        )
+        cls.all_connector_settings[connector_name] = parent
+        # Adds other domains of connector
+        for domain_entry in manifest_entry["other_domains"]:
+            domain = domain_entry["name"]
+            cls.all_connector_settings[domain] = ConnectorSetting(
+                name=domain,
+                type=parent.type,
+                centralised=parent.centralised,
+                example_pair=domain_entry["example_pair"],
+                use_ethereum_wallet=parent.use_ethereum_wallet,
+                trade_fee_schema=TradeFeeSchema.from_json(domain_entry["trade_fee_schema"]),
+                config_keys=LazyConnectorConfigKeys(utils_module=manifest_entry["utils_module"], domain=domain),
+                is_sub_domain=True,
+                parent_name=parent.name,
+                domain_parameter=domain_entry["domain_parameter"],
+                use_eth_gas_lookup=parent.use_eth_gas_lookup,
+            )
+
     @classmethod
     def initialize_paper_trade_settings(cls, paper_trade_exchanges: List[str]):
         cls.paper_trade_connectors_names = paper_trade_exchanges
         for e in paper_trade_exchanges:
             base_connector_settings: Optional[ConnectorSetting] = cls.all_connector_settings.get(e, None)
             if base_connector_settings:
-                paper_trade_settings = ConnectorSetting(
+                # _replace keeps the config keys of the base connector unloaded
+                paper_trade_settings = base_connector_settings._replace(
                     name=f"{e}_paper_trade",
-                    type=base_connector_settings.type,
-                    centralised=base_connector_settings.centralised,
-                    example_pair=base_connector_settings.example_pair,
-                    use_ethereum_wallet=base_connector_settings.use_ethereum_wallet,
-                    trade_fee_schema=base_connector_settings.trade_fee_schema,
-                    config_keys=base_connector_settings.config_keys,
                     is_sub_domain=False,
                     parent_name=base_connector_settings.name,
                     domain_parameter=None,
-                    use_eth_gas_lookup=base_connector_settings.use_eth_gas_lookup,
                 )
                 cls.all_connector_settings.update({f"{e}_paper_trade": paper_trade_settings})
 
@@ -55,9 +55,10 @@ class OrderBookTab(TabBase):
             trading_pair, order_book = next(iter(market_connector.order_books.items()))
 
         def get_order_book_text(no_lines: int):
-            bids = order_book.snapshot[0][['price', 'amount']].head(no_lines)
+            bids, asks = order_book.get_snapshot(no_lines)
+            bids = bids[['price', 'amount']]
             bids.rename(columns={'price': 'bid_price', 'amount': 'bid_volume'}, inplace=True)
-            asks = order_book.snapshot[1][['price', 'amount']].head(no_lines)
+            asks = asks[['price', 'amount']]
             asks.rename(columns={'price': 'ask_price', 'amount': 'ask_volume'}, inplace=True)
             joined_df = pd.concat([bids, asks], axis=1)
             text_lines = ["" + line for line in joined_df.to_string(index=False).split("\n")]
@@ -66,29 +66,40 @@ async def start_trade_monitor(trade_monitor):
         try:
             if hb.strategy_task is not None and not hb.strategy_task.done():
                 if all(market.ready for market in hb.markets.values()):
-                    with hb.trade_fill_db.get_new_session() as session:
-                        trades: List[TradeFill] = hb._get_trades_from_session(
-                            int(hb.init_time * 1e3),
-                            session=session,
-                            config_file_path=hb.strategy_file_name)
-                        if len(trades) > 0:
-                            market_info: Set[Tuple[str, str]] = set((t.market, t.symbol) for t in trades)
-                            for market, symbol in market_info:
-                                cur_trades = [t for t in trades if t.market == market and t.symbol == symbol]
+                    trade_stats = hb.get_trade_stats(hb.init_time)
+                    if trade_stats is not None and not any(stats.are_derivatives for stats in trade_stats.values()):
+                        # The running trade stats of the markets spare loading all the trades every time
+                        if len(trade_stats) > 0:
+                            for (market, symbol), stats in trade_stats.items():
                                 cur_balances = await hb.get_current_balances(market)
-                                perf = await PerformanceMetrics.create(symbol, cur_trades, cur_balances)
+                                perf = await PerformanceMetrics.create_from_trade_stats(symbol, stats, cur_balances)
                                 return_pcts.append(perf.return_pct)
                                 pnls.append(perf.total_pnl)
-                            avg_return = sum(return_pcts) / len(return_pcts) if len(return_pcts) > 0 else s_decimal_0
-                            quote_assets = set(t.symbol.split("-")[1] for t in trades)
-                            if len(quote_assets) == 1:
-                                total_pnls = f"{PerformanceMetrics.smart_round(sum(pnls))} {list(quote_assets)[0]}"
-                            else:
-                                total_pnls = "N/A"
-                            trade_monitor.log(f"Trades: {len(trades)}, Total P&L: {total_pnls}, "
-                                              f"Return %: {avg_return:.2%}")
+                            num_trades = sum(stats.num_trades for stats in trade_stats.values())
+                            quote_assets = set(symbol.split("-")[1] for _, symbol in trade_stats.keys())
+                            trade_monitor.log(_format_trade_monitor_line(num_trades, return_pcts, pnls, quote_assets))
                             return_pcts.clear()
                             pnls.clear()
+                    else:
+                        await hb.wait_for_recorded_trades()
+                        with hb.trade_fill_db.get_new_session() as session:
+                            trades: List[TradeFill] = hb._get_trades_from_session(
+                                int(hb.init_time * 1e3),
+                                session=session,
+                                config_file_path=hb.strategy_file_name)
+                            if len(trades) > 0:
+                                market_info: Set[Tuple[str, str]] = set((t.market, t.symbol) for t in trades)
+                                for market, symbol in market_info:
+                                    cur_trades = [t for t in trades if t.market == market and t.symbol == symbol]
+                                    cur_balances = await hb.get_current_balances(market)
+                                    perf = await PerformanceMetrics.create(symbol, cur_trades, cur_balances)
+                                    return_pcts.append(perf.return_pct)
+                                    pnls.append(perf.total_pnl)
+                                quote_assets = set(t.symbol.split("-")[1] for t in trades)
+                                trade_monitor.log(
+                                    _format_trade_monitor_line(len(trades), return_pcts, pnls, quote_assets))
+                                return_pcts.clear()
+                                pnls.clear()
             await _sleep(2)  # sleeping for longer to manage resources
         except asyncio.CancelledError:
             raise
@@ -96,6 +107,18 @@ async def start_trade_monitor(trade_monitor):
             hb.logger().exception("start_trade_monitor failed.")
 
 
+def _format_trade_monitor_line(num_trades: int,
+                               return_pcts: List[Decimal],
+                               pnls: List[Decimal],
+                               quote_assets: Set[str]) -> str:
+    avg_return = sum(return_pcts) / len(return_pcts) if len(return_pcts) > 0 else s_decimal_0
+    if len(quote_assets) == 1:
+        total_pnls = f"{PerformanceMetrics.smart_round(sum(pnls))} {list(quote_assets)[0]}"
+    else:
+        total_pnls = "N/A"
+    return f"Trades: {num_trades}, Total P&L: {total_pnls}, Return %: {avg_return:.2%}"
+
+
 def format_df_for_printout(
     df: pd.DataFrame, table_format: ClientConfigEnum, max_col_width: Optional[int] = None, index: bool = False
 ) -> str:
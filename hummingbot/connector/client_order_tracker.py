@@ -2,8 +2,7 @@ import asyncio
 import logging
 from collections import defaultdict
 from decimal import Decimal
-from itertools import chain
-from typing import TYPE_CHECKING, Callable, Dict, Optional
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, Mapping, Optional, Tuple
 
 from cachetools import TTLCache
 
@@ -29,6 +28,45 @@ if TYPE_CHECKING:
 cot_logger = None
 
 
+class OrdersByExchangeOrderId(Mapping):
+    """
+    Read-only view of some of the order collections of a ClientOrderTracker (e.g. active and lost orders), mapped by
+    exchange order ID. Lookups use the exchange order ID index of the tracker instead of going through the orders.
+    """
+
+    def __init__(self, tracker: "ClientOrderTracker", collections: Tuple[Mapping[str, InFlightOrder], ...]):
+        self._tracker = tracker
+        self._collections = collections
+
+    def __getitem__(self, exchange_order_id: str) -> InFlightOrder:
+        order = self._tracker._order_by_exchange_order_id(exchange_order_id, self._collections)
+        if order is None:
+            raise KeyError(exchange_order_id)
+        return order
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._as_dict())
+
+    def __len__(self) -> int:
+        return len(self._as_dict())
+
+    def keys(self):
+        return self._as_dict().keys()
+
+    def values(self):
+        return self._as_dict().values()
+
+    def items(self):
+        return self._as_dict().items()
+
+    def _as_dict(self) -> Dict[str, InFlightOrder]:
+        return {
+            order.exchange_order_id: order
+            for collection in self._collections
+            for order in list(collection.values())
+        }
+
+
 class ClientOrderTracker:
 
     MAX_CACHE_SIZE = 1000
@@ -57,6 +95,10 @@ class ClientOrderTracker:
         self._in_flight_orders: Dict[str, InFlightOrder] = {}
         self._cached_orders: TTLCache = TTLCache(maxsize=self.MAX_CACHE_SIZE, ttl=self.CACHED_ORDER_TTL)
         self._lost_orders: Dict[str, InFlightOrder] = {}
+        # Index of the orders of all the collections by exchange order id. The orders tracked before knowing their
+        # exchange order id wait in a separate map until they get one.
+        self._orders_by_exchange_order_id: Dict[str, InFlightOrder] = {}
+        self._orders_without_exchange_order_id: Dict[str, InFlightOrder] = {}
 
         self._order_tracking_task: Optional[asyncio.Task] = None
         self._last_poll_timestamp: int = -1
@@ -91,15 +133,11 @@ class ClientOrderTracker:
         return {**self.active_orders, **self.cached_orders, **self.lost_orders}
 
     @property
-    def all_fillable_orders_by_exchange_order_id(self) -> Dict[str, InFlightOrder]:
+    def all_fillable_orders_by_exchange_order_id(self) -> Mapping[str, InFlightOrder]:
         """
         Same as `all_fillable_orders`, but the orders are mapped by exchange order ID.
         """
-        orders_map = {
-            order.exchange_order_id: order
-            for order in chain(self.active_orders.values(), self.cached_orders.values(), self.lost_orders.values())
-        }
-        return orders_map
+        return OrdersByExchangeOrderId(self, (self._in_flight_orders, self._cached_orders, self._lost_orders))
 
     @property
     def all_updatable_orders(self) -> Dict[str, InFlightOrder]:
@@ -109,14 +147,11 @@ class ClientOrderTracker:
         return {**self.active_orders, **self.lost_orders}
 
     @property
-    def all_updatable_orders_by_exchange_order_id(self) -> Dict[str, InFlightOrder]:
+    def all_updatable_orders_by_exchange_order_id(self) -> Mapping[str, InFlightOrder]:
         """
         Same as `all_updatable_orders`, but the orders are mapped by exchange order ID.
         """
-        orders_map = {
-            order.exchange_order_id: order for order in chain(self.active_orders.values(), self.lost_orders.values())
-        }
-        return orders_map
+        return OrdersByExchangeOrderId(self, (self._in_flight_orders, self._lost_orders))
 
     @property
     def current_timestamp(self) -> int:
@@ -142,6 +177,7 @@ class ClientOrderTracker:
 
     def start_tracking_order(self, order: InFlightOrder):
         self._in_flight_orders[order.client_order_id] = order
+        self._index_order(order)
 
     def stop_tracking_order(self, client_order_id: str):
         if client_order_id in self._in_flight_orders:
@@ -149,6 +185,16 @@ class ClientOrderTracker:
             del self._in_flight_orders[client_order_id]
             if client_order_id in self._order_not_found_records:
                 del self._order_not_found_records[client_order_id]
+            self._prune_exchange_order_id_index()
+
+    def update_exchange_order_id(self, client_order_id: str, exchange_order_id: str):
+        """
+        Sets the exchange order id of a tracked, cached or lost order, and indexes the order with it.
+        """
+        order = self._fetch_fillable_order(client_order_id)
+        if order is not None:
+            order.update_exchange_order_id(exchange_order_id)
+            self._index_order(order)
 
     def restore_tracking_states(self, tracking_states: Dict[str, any]):
         """
@@ -162,6 +208,7 @@ class ClientOrderTracker:
             elif order.is_failure:
                 # If the order is marked as failed but is still in the tracking states, it was a lost order
                 self._lost_orders[order.client_order_id] = order
+                self._index_order(order)
 
     def fetch_tracked_order(self, client_order_id: str) -> Optional[InFlightOrder]:
         return self._in_flight_orders.get(client_order_id, None)
@@ -172,28 +219,21 @@ class ClientOrderTracker:
     def fetch_order(
         self, client_order_id: Optional[str] = None, exchange_order_id: Optional[str] = None
     ) -> Optional[InFlightOrder]:
-        found_order = None
+        found_order = self._cached_orders.get(client_order_id) or self._in_flight_orders.get(client_order_id)
 
-        if client_order_id in self.all_orders:
-            found_order = self.all_orders[client_order_id]
-        elif exchange_order_id is not None:
-            found_order = next(
-                (order for order in self.all_orders.values() if order.exchange_order_id == exchange_order_id), None
-            )
+        if found_order is None and exchange_order_id is not None:
+            found_order = self._order_by_exchange_order_id(
+                exchange_order_id, (self._in_flight_orders, self._cached_orders))
 
         return found_order
 
     def fetch_lost_order(
         self, client_order_id: Optional[str] = None, exchange_order_id: Optional[str] = None
     ) -> Optional[InFlightOrder]:
-        found_order = None
+        found_order = self._lost_orders.get(client_order_id)
 
-        if client_order_id in self._lost_orders:
-            found_order = self._lost_orders[client_order_id]
-        elif exchange_order_id is not None:
-            found_order = next(
-                (order for order in self._lost_orders.values() if order.exchange_order_id == exchange_order_id),
-                None)
+        if found_order is None and exchange_order_id is not None:
+            found_order = self._order_by_exchange_order_id(exchange_order_id, (self._lost_orders,))
 
         return found_order
 
@@ -203,7 +243,7 @@ class ClientOrderTracker:
     def process_trade_update(self, trade_update: TradeUpdate):
         client_order_id: str = trade_update.client_order_id
 
-        tracked_order: Optional[InFlightOrder] = self.all_fillable_orders.get(client_order_id)
+        tracked_order: Optional[InFlightOrder] = self._fetch_fillable_order(client_order_id)
 
         if tracked_order:
             previous_executed_amount_base: Decimal = tracked_order.executed_amount_base
@@ -249,6 +289,7 @@ class ClientOrderTracker:
                     await self._process_order_update(order_update)
                     del self._cached_orders[client_order_id]
                     self._lost_orders[tracked_order.client_order_id] = tracked_order
+                    self._index_order(tracked_order)
         else:
             lost_order = self._lost_orders.get(client_order_id)
             if lost_order is not None:
@@ -266,6 +307,56 @@ class ClientOrderTracker:
             else:
                 self.logger().debug(f"Order is not/no longer being tracked ({client_order_id})")
 
+    def _fetch_fillable_order(self, client_order_id: Optional[str]) -> Optional[InFlightOrder]:
+        return (self._lost_orders.get(client_order_id)
+                or self._cached_orders.get(client_order_id)
+                or self._in_flight_orders.get(client_order_id))
+
+    def _index_order(self, order: InFlightOrder):
+        if order.exchange_order_id is None:
+            self._orders_without_exchange_order_id[order.client_order_id] = order
+        else:
+            self._orders_without_exchange_order_id.pop(order.client_order_id, None)
+            self._orders_by_exchange_order_id[order.exchange_order_id] = order
+
+    def _index_orders_without_exchange_order_id(self):
+        # The connectors can set the exchange order id on the orders directly, so the orders tracked without it are
+        # indexed once they have it
+        for order in list(self._orders_without_exchange_order_id.values()):
+            if order.exchange_order_id is not None:
+                self._index_order(order)
+            elif not self._is_order_in_collections(order, (self._in_flight_orders, self._cached_orders,
+                                                           self._lost_orders)):
+                del self._orders_without_exchange_order_id[order.client_order_id]
+
+    def _order_by_exchange_order_id(
+        self, exchange_order_id: str, collections: Tuple[Mapping[str, InFlightOrder], ...]
+    ) -> Optional[InFlightOrder]:
+        order = self._orders_by_exchange_order_id.get(exchange_order_id)
+        if order is None or order.exchange_order_id != exchange_order_id:
+            self._index_orders_without_exchange_order_id()
+            order = self._orders_by_exchange_order_id.get(exchange_order_id)
+            if order is None or order.exchange_order_id != exchange_order_id:
+                return None
+        if not self._is_order_in_collections(order, collections):
+            return None
+        return order
+
+    @staticmethod
+    def _is_order_in_collections(order: InFlightOrder, collections: Tuple[Mapping[str, InFlightOrder], ...]) -> bool:
+        return any(collection.get(order.client_order_id) is order for collection in collections)
+
+    def _prune_exchange_order_id_index(self):
+        # The cached orders expire from the cache without notice, so the index is cleaned up when it has grown
+        # to twice the number of orders still held by the tracker
+        collections = (self._in_flight_orders, self._cached_orders, self._lost_orders)
+        if len(self._orders_by_exchange_order_id) > 2 * sum(len(collection) for collection in collections):
+            self._orders_by_exchange_order_id = {
+                exchange_order_id: order
+                for exchange_order_id, order in self._orders_by_exchange_order_id.items()
+                if order.exchange_order_id == exchange_order_id and self._is_order_in_collections(order, collections)
+            }
+
     async def _process_order_update(self, order_update: OrderUpdate):
         if not order_update.client_order_id and not order_update.exchange_order_id:
             self.logger().error("OrderUpdate does not contain any client_order_id or exchange_order_id", exc_info=True)
@@ -290,6 +381,8 @@ class ClientOrderTracker:
             previous_state: OrderState = tracked_order.current_state
 
             updated: bool = tracked_order.update_with_order_update(order_update)
+            if tracked_order.client_order_id in self._orders_without_exchange_order_id:
+                self._index_order(tracked_order)
             if updated:
                 self._trigger_order_creation(tracked_order, previous_state, order_update.new_state)
                 self._trigger_order_completion(tracked_order, order_update)
@@ -335,6 +335,7 @@ class BinancePerpetualDerivative(PerpetualDerivativePyBase):
             is_auth_required=True)
         if "code" in order_update:
             if self._is_request_exception_related_to_time_synchronizer(request_exception=order_update):
+                self._time_synchronizer.request_update()
                 _order_update = OrderUpdate(
                     trading_pair=tracked_order.trading_pair,
                     update_timestamp=self.current_timestamp,
@@ -296,6 +296,7 @@ class BitmartPerpetualDerivative(PerpetualDerivativePyBase):
             is_auth_required=True)
         if order_update["code"] != 1000:
             if self._is_request_exception_related_to_time_synchronizer(request_exception=order_update):
+                self._time_synchronizer.request_update()
                 _order_update = OrderUpdate(
                     trading_pair=tracked_order.trading_pair,
                     update_timestamp=self.current_timestamp,
@@ -113,6 +113,10 @@ class BinanceExchange(ExchangePyBase):
     def is_trading_required(self) -> bool:
         return self._trading_required
 
+    @property
+    def is_bulk_order_status_update_supported(self) -> bool:
+        return True
+
     def supported_order_types(self):
         return [OrderType.LIMIT, OrderType.LIMIT_MAKER, OrderType.MARKET]
 
@@ -510,6 +514,71 @@ class BinanceExchange(ExchangePyBase):
 
         return order_update
 
+    async def _request_open_order_updates(self, trading_pairs: List[str]) -> List[OrderUpdate]:
+        order_updates = []
+
+        for trading_pair in trading_pairs:
+            symbol = await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
+            open_orders = await self._api_get(
+                path_url=CONSTANTS.OPEN_ORDERS_PATH_URL,
+                params={"symbol": symbol},
+                is_auth_required=True)
+
+            for order_data in open_orders:
+                order_update = OrderUpdate(
+                    client_order_id=order_data["clientOrderId"],
+                    exchange_order_id=str(order_data["orderId"]),
+                    trading_pair=trading_pair,
+                    update_timestamp=order_data["updateTime"] * 1e-3,
+                    new_state=CONSTANTS.ORDER_STATE[order_data["status"]],
+                )
+                order_updates.append(order_update)
+
+        return order_updates
+
+    async def _request_recent_trade_updates(
+        self, trading_pairs: List[str], start_timestamp: float
+    ) -> List[TradeUpdate]:
+        trade_updates = []
+
+        for trading_pair in trading_pairs:
+            symbol = await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
+            # Binance limits a startTime query to the following 24 hours, so the most recent fills are requested
+            # instead. The orders no longer open are updated one by one anyway.
+            fills = await self._api_get(
+                path_url=CONSTANTS.MY_TRADES_PATH_URL,
+                params={
+                    "symbol": symbol,
+                    "limit": CONSTANTS.MY_TRADES_MAX_LIMIT
+                },
+                is_auth_required=True,
+                limit_id=CONSTANTS.MY_TRADES_PATH_URL)
+
+            for trade in fills:
+                if trade["time"] * 1e-3 < start_timestamp:
+                    continue
+                trade_type = TradeType.BUY if trade["isBuyer"] else TradeType.SELL
+                fee = TradeFeeBase.new_spot_fee(
+                    fee_schema=self.trade_fee_schema(),
+                    trade_type=trade_type,
+                    percent_token=trade["commissionAsset"],
+                    flat_fees=[TokenAmount(amount=Decimal(trade["commission"]), token=trade["commissionAsset"])]
+                )
+                trade_update = TradeUpdate(
+                    trade_id=str(trade["id"]),
+                    client_order_id=None,
+                    exchange_order_id=str(trade["orderId"]),
+                    trading_pair=trading_pair,
+                    fee=fee,
+                    fill_base_amount=Decimal(trade["qty"]),
+                    fill_quote_amount=Decimal(trade["quoteQty"]),
+                    fill_price=Decimal(trade["price"]),
+                    fill_timestamp=trade["time"] * 1e-3,
+                )
+                trade_updates.append(trade_update)
+
+        return trade_updates
+
     async def _update_balances(self):
         local_asset_names = set(self._account_balances.keys())
         remote_asset_names = set()
@@ -4,7 +4,7 @@ import logging
 import math
 from abc import ABC, abstractmethod
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, AsyncIterable, Callable, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, AsyncIterable, Awaitable, Callable, Dict, List, Optional, Tuple
 
 from async_timeout import timeout
 
@@ -15,7 +15,9 @@ from hummingbot.connector.time_synchronizer import TimeSynchronizer
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
 from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.api_throttler.request_priority import RequestPriority, request_priority
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
@@ -45,6 +47,8 @@ class ExchangePyBase(ExchangeBase, ABC):
     TRADING_RULES_INTERVAL = 30 * MINUTE
     TRADING_FEES_INTERVAL = TWELVE_HOURS
     TICK_INTERVAL_LIMIT = 60.0
+    # Maximum number of orders whose status or fills are requested concurrently when the orders are updated one by one
+    ORDER_STATUS_UPDATE_MAX_CONCURRENCY = 1
 
     def __init__(self, client_config_map: "ClientConfigAdapter"):
         super().__init__(client_config_map)
@@ -62,9 +66,7 @@ class ExchangePyBase(ExchangeBase, ABC):
         self._lost_orders_update_task: Optional[asyncio.Task] = None
 
         self._time_synchronizer = TimeSynchronizer()
-        self._throttler = AsyncThrottler(
-            rate_limits=self.rate_limits_rules,
-            limits_share_percentage=client_config_map.rate_limits_share_pct)
+        self._throttler: AsyncThrottlerBase = self._create_throttler(client_config_map=client_config_map)
         self._poll_notifier = asyncio.Event()
 
         # init Auth and Api factory
@@ -149,6 +151,16 @@ class ExchangePyBase(ExchangeBase, ABC):
     def is_trading_required(self) -> bool:
         raise NotImplementedError
 
+    @property
+    def is_bulk_order_status_update_supported(self) -> bool:
+        """
+        Connectors that can request all their open orders and their recent fills in a few requests return True, and
+        implement `_request_open_order_updates` and `_request_recent_trade_updates`. When there are more tracked orders
+        than trading pairs, the status polling then reconciles the tracked orders in bulk, and only requests the status
+        of the orders missing from the open orders.
+        """
+        return False
+
     @property
     def order_books(self) -> Dict[str, OrderBook]:
         return self.order_book_tracker.order_books
@@ -280,14 +292,15 @@ class ExchangePyBase(ExchangeBase, ABC):
             hbot_order_id_prefix=self.client_order_id_prefix,
             max_id_len=self.client_order_id_max_length
         )
-        safe_ensure_future(self._create_order(
-            trade_type=TradeType.BUY,
-            order_id=order_id,
-            trading_pair=trading_pair,
-            amount=amount,
-            order_type=order_type,
-            price=price,
-            **kwargs))
+        with request_priority(RequestPriority.ORDER_CRITICAL):
+            safe_ensure_future(self._create_order(
+                trade_type=TradeType.BUY,
+                order_id=order_id,
+                trading_pair=trading_pair,
+                amount=amount,
+                order_type=order_type,
+                price=price,
+                **kwargs))
         return order_id
 
     def sell(self,
@@ -310,14 +323,15 @@ class ExchangePyBase(ExchangeBase, ABC):
             hbot_order_id_prefix=self.client_order_id_prefix,
             max_id_len=self.client_order_id_max_length
         )
-        safe_ensure_future(self._create_order(
-            trade_type=TradeType.SELL,
-            order_id=order_id,
-            trading_pair=trading_pair,
-            amount=amount,
-            order_type=order_type,
-            price=price,
-            **kwargs))
+        with request_priority(RequestPriority.ORDER_CRITICAL):
+            safe_ensure_future(self._create_order(
+                trade_type=TradeType.SELL,
+                order_id=order_id,
+                trading_pair=trading_pair,
+                amount=amount,
+                order_type=order_type,
+                price=price,
+                **kwargs))
         return order_id
 
     def get_fee(self,
@@ -354,7 +368,8 @@ class ExchangePyBase(ExchangeBase, ABC):
 
         :return: the client id of the order to cancel
         """
-        safe_ensure_future(self._execute_cancel(trading_pair, client_order_id))
+        with request_priority(RequestPriority.ORDER_CRITICAL):
+            safe_ensure_future(self._execute_cancel(trading_pair, client_order_id))
         return client_order_id
 
     async def cancel_all(self, timeout_seconds: float) -> List[CancellationResult]:
@@ -372,7 +387,8 @@ class ExchangePyBase(ExchangeBase, ABC):
 
         try:
             async with timeout(timeout_seconds):
-                cancellation_results = await safe_gather(*tasks, return_exceptions=True)
+                with request_priority(RequestPriority.ORDER_CRITICAL):
+                    cancellation_results = await safe_gather(*tasks, return_exceptions=True)
                 for cr in cancellation_results:
                     if isinstance(cr, Exception):
                         continue
@@ -729,7 +745,8 @@ class ExchangePyBase(ExchangeBase, ABC):
         """
         while True:
             try:
-                await safe_gather(self._update_trading_rules())
+                with request_priority(RequestPriority.BACKGROUND):
+                    await safe_gather(self._update_trading_rules())
                 await self._sleep(self.TRADING_RULES_INTERVAL)
             except NotImplementedError:
                 raise
@@ -749,7 +766,8 @@ class ExchangePyBase(ExchangeBase, ABC):
         """
         while True:
             try:
-                await safe_gather(self._update_trading_fees())
+                with request_priority(RequestPriority.BACKGROUND):
+                    await safe_gather(self._update_trading_fees())
                 await self._sleep(self.TRADING_FEES_INTERVAL)
             except NotImplementedError:
                 raise
@@ -767,17 +785,19 @@ class ExchangePyBase(ExchangeBase, ABC):
         Performs all required operation to keep the connector updated and synchronized with the exchange.
         It contains the backup logic to update status using API requests in case the main update source
         (the user stream data source websocket) fails.
-        It also updates the time synchronizer. This is necessary because the exchange requires
-        the time of the client to be the same as the time in the exchange.
+        It also updates the time synchronizer when its offset is outdated. This is necessary because the exchange
+        requires the time of the client to be the same as the time in the exchange.
         Executes when the _poll_notifier event is enabled by the `tick` function.
         """
         while True:
             try:
                 await self._poll_notifier.wait()
-                await self._update_time_synchronizer()
+                with request_priority(RequestPriority.USER_STREAM_FALLBACK):
+                    if self._time_synchronizer.is_update_required():
+                        await self._update_time_synchronizer()
 
-                # the following method is implementation-specific
-                await self._status_polling_loop_fetch_updates()
+                    # the following method is implementation-specific
+                    await self._status_polling_loop_fetch_updates()
 
                 self._last_poll_timestamp = self.current_timestamp
                 self._poll_notifier = asyncio.Event()
@@ -816,7 +836,8 @@ class ExchangePyBase(ExchangeBase, ABC):
         while True:
             try:
                 await self._cancel_lost_orders()
-                await self._update_lost_orders_status()
+                with request_priority(RequestPriority.BACKGROUND):
+                    await self._update_lost_orders_status()
                 await self._sleep(self.SHORT_POLL_INTERVAL)
             except NotImplementedError:
                 raise
@@ -950,18 +971,39 @@ class ExchangePyBase(ExchangeBase, ABC):
             )
 
     async def _update_orders_fills(self, orders: List[InFlightOrder]):
-        for order in orders:
-            try:
-                trade_updates = await self._all_trade_updates_for_order(order=order)
-                for trade_update in trade_updates:
-                    self._order_tracker.process_trade_update(trade_update)
-            except asyncio.CancelledError:
-                raise
-            except Exception as request_error:
-                self.logger().warning(
-                    f"Failed to fetch trade updates for order {order.client_order_id}. Error: {request_error}",
-                    exc_info=request_error,
-                )
+        await self._process_orders_with_bounded_concurrency(orders=orders, process_order=self._update_order_fills)
+
+    async def _update_order_fills(self, order: InFlightOrder):
+        try:
+            trade_updates = await self._all_trade_updates_for_order(order=order)
+            for trade_update in trade_updates:
+                self._order_tracker.process_trade_update(trade_update)
+        except asyncio.CancelledError:
+            raise
+        except Exception as request_error:
+            self.logger().warning(
+                f"Failed to fetch trade updates for order {order.client_order_id}. Error: {request_error}",
+                exc_info=request_error,
+            )
+
+    async def _process_orders_with_bounded_concurrency(
+        self, orders: List[InFlightOrder], process_order: Callable[[InFlightOrder], Awaitable]
+    ):
+        """
+        Processes the orders one by one, or up to ORDER_STATUS_UPDATE_MAX_CONCURRENCY orders at a time for the
+        connectors that increase it. The requests are still subject to the throttler rate limits.
+        """
+        if self.ORDER_STATUS_UPDATE_MAX_CONCURRENCY <= 1:
+            for order in orders:
+                await process_order(order)
+        else:
+            semaphore = asyncio.Semaphore(self.ORDER_STATUS_UPDATE_MAX_CONCURRENCY)
+
+            async def process_order_with_semaphore(order: InFlightOrder):
+                async with semaphore:
+                    await process_order(order)
+
+            await safe_gather(*[process_order_with_semaphore(order) for order in orders])
 
     async def _handle_update_error_for_active_order(self, order: InFlightOrder, error: Exception):
         try:
@@ -990,7 +1032,7 @@ class ExchangePyBase(ExchangeBase, ABC):
             self.logger().warning(f"Error fetching status update for the lost order {order.client_order_id}: {error}.")
 
     async def _update_orders_with_error_handler(self, orders: List[InFlightOrder], error_handler: Callable):
-        for order in orders:
+        async def update_order(order: InFlightOrder):
             try:
                 order_update = await self._request_order_status(tracked_order=order)
                 self._order_tracker.process_order_update(order_update)
@@ -999,6 +1041,8 @@ class ExchangePyBase(ExchangeBase, ABC):
             except Exception as request_error:
                 await error_handler(order, request_error)
 
+        await self._process_orders_with_bounded_concurrency(orders=orders, process_order=update_order)
+
     async def _update_orders(self):
         orders_to_update = self.in_flight_orders.copy()
         await self._update_orders_with_error_handler(
@@ -1012,8 +1056,77 @@ class ExchangePyBase(ExchangeBase, ABC):
         )
 
     async def _update_order_status(self):
-        await self._update_orders_fills(orders=list(self._order_tracker.all_fillable_orders.values()))
-        await self._update_orders()
+        fillable_orders = list(self._order_tracker.all_fillable_orders.values())
+        # The bulk requests are done per trading pair, they only save requests with several orders per trading pair
+        if (self.is_bulk_order_status_update_supported
+                and len(fillable_orders) > len({order.trading_pair for order in fillable_orders})):
+            await self._update_orders_in_bulk()
+        else:
+            await self._update_orders_fills(orders=fillable_orders)
+            await self._update_orders()
+
+    async def _update_orders_in_bulk(self):
+        """
+        Reconciles the tracked orders with the open orders and the recent fills of the exchange. The orders missing
+        from the open orders (because they were filled, canceled or are unknown to the exchange) are then updated one
+        by one, to get their final status and all their fills.
+        """
+        fillable_orders_by_client_order_id = self._order_tracker.all_fillable_orders
+        fillable_orders = list(fillable_orders_by_client_order_id.values())
+        active_orders = list(self.in_flight_orders.values())
+        if len(fillable_orders) == 0:
+            return
+        trading_pairs = sorted({order.trading_pair for order in fillable_orders})
+
+        try:
+            trade_updates = await self._request_recent_trade_updates(
+                trading_pairs=trading_pairs,
+                start_timestamp=min(order.creation_timestamp for order in fillable_orders),
+            )
+            open_order_updates = await self._request_open_order_updates(trading_pairs=trading_pairs)
+        except asyncio.CancelledError:
+            raise
+        except Exception as request_error:
+            self.logger().warning(
+                f"Failed to fetch the open orders and recent fills in bulk. Updating orders one by one. "
+                f"Error: {request_error}",
+                exc_info=request_error,
+            )
+            await self._update_orders_fills(orders=fillable_orders)
+            await self._update_orders()
+            return
+
+        orders_by_exchange_order_id = self._order_tracker.all_fillable_orders_by_exchange_order_id
+        for trade_update in trade_updates:
+            tracked_order = (fillable_orders_by_client_order_id.get(trade_update.client_order_id)
+                             or orders_by_exchange_order_id.get(trade_update.exchange_order_id))
+            # Account-wide fills can belong to orders not created by this connector
+            if tracked_order is not None:
+                self._order_tracker.process_trade_update(
+                    trade_update._replace(client_order_id=tracked_order.client_order_id))
+
+        open_orders_by_client_order_id = {}
+        open_orders_by_exchange_order_id = {}
+        for order_update in open_order_updates:
+            if order_update.client_order_id is not None:
+                open_orders_by_client_order_id[order_update.client_order_id] = order_update
+            if order_update.exchange_order_id is not None:
+                open_orders_by_exchange_order_id[order_update.exchange_order_id] = order_update
+
+        missing_orders = []
+        for order in active_orders:
+            order_update = (open_orders_by_client_order_id.get(order.client_order_id)
+                            or open_orders_by_exchange_order_id.get(order.exchange_order_id))
+            if order_update is None:
+                missing_orders.append(order)
+            else:
+                self._order_tracker.process_order_update(
+                    order_update._replace(client_order_id=order.client_order_id))
+
+        await self._update_orders_fills(orders=missing_orders)
+        await self._update_orders_with_error_handler(
+            orders=missing_orders, error_handler=self._handle_update_error_for_active_order
+        )
 
     async def _update_lost_orders_status(self):
         await self._update_orders_fills(orders=list(self._order_tracker.lost_orders.values()))
@@ -1049,6 +1162,33 @@ class ExchangePyBase(ExchangeBase, ABC):
     async def _request_order_status(self, tracked_order: InFlightOrder) -> OrderUpdate:
         raise NotImplementedError
 
+    async def _request_open_order_updates(self, trading_pairs: List[str]) -> List[OrderUpdate]:
+        """
+        Requests the open orders of the account for the trading pairs, per trading pair or account-wide.
+        Only required for the connectors that support bulk order status updates.
+
+        :param trading_pairs: the trading pairs of the tracked orders
+
+        :return: an order update for each open order, with at least its exchange order id or its client order id
+        """
+        raise NotImplementedError
+
+    async def _request_recent_trade_updates(
+        self, trading_pairs: List[str], start_timestamp: float
+    ) -> List[TradeUpdate]:
+        """
+        Requests the fills of the account for the trading pairs since the timestamp (in seconds), per trading pair or
+        account-wide. Exchanges limiting the number of fills returned can return only the most recent ones, since the
+        orders no longer open are then updated one by one.
+        Only required for the connectors that support bulk order status updates.
+
+        :param trading_pairs: the trading pairs of the tracked orders
+        :param start_timestamp: the creation timestamp of the oldest tracked order
+
+        :return: a trade update for each fill, with at least its exchange order id or its client order id
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def _create_web_assistants_factory(self) -> WebAssistantsFactory:
         raise NotImplementedError
@@ -1068,6 +1208,15 @@ class ExchangePyBase(ExchangeBase, ABC):
     def _create_order_tracker(self) -> ClientOrderTracker:
         return ClientOrderTracker(connector=self)
 
+    def _create_throttler(self, client_config_map: "ClientConfigAdapter") -> AsyncThrottlerBase:
+        """
+        Connectors can override this method to use a different throttler implementation
+        (e.g. AsyncSlidingWindowThrottler).
+        """
+        return AsyncThrottler(
+            rate_limits=self.rate_limits_rules,
+            limits_share_percentage=client_config_map.rate_limits_share_pct)
+
     async def _initialize_trading_pair_symbol_map(self):
         try:
             exchange_info = await self._make_trading_pairs_request()
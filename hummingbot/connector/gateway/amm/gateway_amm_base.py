@@ -181,10 +181,8 @@ class GatewayAMMBase(ConnectorBase):
         }
 
     def restore_tracking_states(self, saved_states: Dict[str, any]):
-        self._order_tracker._in_flight_orders.update({
-            key: GatewayInFlightOrder.from_json(value)
-            for key, value in saved_states.items()
-        })
+        for value in saved_states.values():
+            self._order_tracker.start_tracking_order(GatewayInFlightOrder.from_json(value))
 
     @staticmethod
     def create_market_order_id(side: TradeType, trading_pair: str) -> str:
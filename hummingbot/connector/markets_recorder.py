@@ -5,17 +5,19 @@ import os.path
 import threading
 import time
 from decimal import Decimal
-from shutil import move
-from typing import Dict, List, Optional, Tuple, Union
+from itertools import islice
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import pandas as pd
 from sqlalchemy.orm import Query, Session
 
 from hummingbot import data_path
-from hummingbot.client.config.client_config_map import MarketDataCollectionConfigMap
+from hummingbot.client.config.client_config_map import MarketDataCollectionConfigMap, MarketDataCollectionStorageEnum
+from hummingbot.client.performance_accumulator import PerformanceAccumulator
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.connector.utils import TradeFillOrderDetails
 from hummingbot.core.data_type.common import PriceType
+from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
 from hummingbot.core.event.events import (
     BuyOrderCompletedEvent,
@@ -23,6 +25,8 @@ from hummingbot.core.event.events import (
     FundingPaymentCompletedEvent,
     MarketEvent,
     MarketOrderFailureEvent,
+    OrderBookEvent,
+    OrderBookTradeEvent,
     OrderCancelledEvent,
     OrderExpiredEvent,
     OrderFilledEvent,
@@ -34,18 +38,23 @@ from hummingbot.core.event.events import (
     SellOrderCompletedEvent,
     SellOrderCreatedEvent,
 )
+from hummingbot.core.utils.csv_appender import CSVAppender
+from hummingbot.data_feed.columnar_market_data import ColumnarMarketDataWriter
 from hummingbot.logger import HummingbotLogger
 from hummingbot.model.controllers import Controllers
 from hummingbot.model.executors import Executors
 from hummingbot.model.funding_payment import FundingPayment
 from hummingbot.model.market_data import MarketData
+from hummingbot.model.market_order_state import MarketOrderState
 from hummingbot.model.market_state import MarketState
+from hummingbot.model.metadata import Metadata
 from hummingbot.model.order import Order
 from hummingbot.model.order_status import OrderStatus
 from hummingbot.model.position import Position
 from hummingbot.model.range_position_collected_fees import RangePositionCollectedFees
 from hummingbot.model.range_position_update import RangePositionUpdate
 from hummingbot.model.sql_connection_manager import SQLConnectionManager
+from hummingbot.model.sql_write_behind_queue import SQLWriteBehindQueue
 from hummingbot.model.trade_fill import TradeFill
 from hummingbot.strategy_v2.controllers.controller_base import ControllerConfigBase
 from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
@@ -58,6 +67,8 @@ class MarketsRecorder:
         event_obj.value: event_obj
         for event_obj in MarketEvent.__members__.values()
     }
+    # Max time the reads wait for the pending writes of the writer thread
+    READ_FLUSH_TIMEOUT = 2.0
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -76,7 +87,11 @@ class MarketsRecorder:
                  markets: List[ConnectorBase],
                  config_file_path: str,
                  strategy_name: str,
-                 market_data_collection: MarketDataCollectionConfigMap):
+                 market_data_collection: MarketDataCollectionConfigMap,
+                 market_states_checkpoint_interval: float = 5.0,
+                 trades_csv_max_file_size: Optional[int] = None,
+                 trades_csv_rotate_daily: bool = False,
+                 performance_start_time: Optional[float] = None):
         if threading.current_thread() != threading.main_thread():
             raise EnvironmentError("MarketsRecorded can only be initialized from the main thread.")
 
@@ -87,6 +102,28 @@ class MarketsRecorder:
         self._strategy_name: str = strategy_name
         self._market_data_collection_config: MarketDataCollectionConfigMap = market_data_collection
         self._market_data_collection_task: Optional[asyncio.Task] = None
+        self._market_data_writer: Optional[ColumnarMarketDataWriter] = None
+        if (market_data_collection.market_data_collection_enabled
+                and market_data_collection.market_data_collection_storage == MarketDataCollectionStorageEnum.columnar):
+            self._market_data_writer = ColumnarMarketDataWriter(
+                depth=market_data_collection.market_data_collection_depth)
+        self._order_books_recording_trades: Dict[int, Tuple[str, OrderBook]] = {}
+        # The trades CSV files are kept open while the recorder runs, one appender per file
+        self._csv_appenders: Dict[str, CSVAppender] = {}
+        self._trades_csv_max_file_size: Optional[int] = trades_csv_max_file_size
+        self._trades_csv_rotate_daily: bool = trades_csv_rotate_daily
+        # The records of the market events are written from a dedicated thread once the recorder is started
+        self._write_queue: SQLWriteBehindQueue = SQLWriteBehindQueue(self._sql_manager)
+        # The tracking states of the markets are checkpointed at most once per interval, writing only the changes
+        self._market_states_checkpoint_interval: float = market_states_checkpoint_interval
+        self._last_market_states_checkpoint: float = float("-inf")
+        self._market_states_checkpoint_handle: Optional[asyncio.TimerHandle] = None
+        self._dirty_markets: Dict[str, ConnectorBase] = {}
+        self._checkpointed_market_states: Dict[str, Dict[str, Any]] = {}
+        # The running trade stats of the fills since the performance start time, checkpointed with the market states
+        self._performance_accumulator: Optional[PerformanceAccumulator] = None
+        if performance_start_time is not None:
+            self._performance_accumulator = self._load_performance_accumulator(int(performance_start_time * 1e3))
         # Internal collection of trade fills in connector will be used for remote/local history reconciliation
         for market in self._markets:
             trade_fills = self.get_trades_for_config(self._config_file_path, 2000)
@@ -109,6 +146,8 @@ class MarketsRecorder:
             self._did_update_range_position)
         self._close_range_position_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(
             self._did_close_position)
+        self._order_book_trade_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(
+            self._did_trade_on_order_book)
 
         self._event_pairs: List[Tuple[MarketEvent, SourceInfoEventForwarder]] = [
             (MarketEvent.BuyOrderCreated, self._create_order_forwarder),
@@ -134,28 +173,10 @@ class MarketsRecorder:
         while True:
             try:
                 if all(ex.ready for ex in self._markets):
-                    with self._sql_manager.get_new_session() as session:
-                        with session.begin():
-                            for market in self._markets:
-                                exchange = market.display_name
-                                for trading_pair in market.trading_pairs:
-                                    mid_price = market.get_price_by_type(trading_pair, PriceType.MidPrice)
-                                    best_bid = market.get_price_by_type(trading_pair, PriceType.BestBid)
-                                    best_ask = market.get_price_by_type(trading_pair, PriceType.BestAsk)
-                                    order_book = market.get_order_book(trading_pair)
-                                    depth = self._market_data_collection_config.market_data_collection_depth + 1
-                                    market_data = MarketData(
-                                        timestamp=self.db_timestamp,
-                                        exchange=exchange,
-                                        trading_pair=trading_pair,
-                                        mid_price=mid_price,
-                                        best_bid=best_bid,
-                                        best_ask=best_ask,
-                                        order_book={
-                                            "bid": list(order_book.bid_entries())[:depth],
-                                            "ask": list(order_book.ask_entries())[:depth]}
-                                    )
-                                    session.add(market_data)
+                    if self._market_data_writer is not None:
+                        self._record_market_data_snapshots()
+                    else:
+                        self._queue_market_data_records()
             except asyncio.CancelledError:
                 raise
             except Exception as e:
@@ -163,6 +184,71 @@ class MarketsRecorder:
             finally:
                 await self._sleep(self._market_data_collection_config.market_data_collection_interval)
 
+    def _queue_market_data_records(self):
+        market_data_records = []
+        for market in self._markets:
+            exchange = market.display_name
+            for trading_pair in market.trading_pairs:
+                mid_price = market.get_price_by_type(trading_pair, PriceType.MidPrice)
+                best_bid = market.get_price_by_type(trading_pair, PriceType.BestBid)
+                best_ask = market.get_price_by_type(trading_pair, PriceType.BestAsk)
+                order_book = market.get_order_book(trading_pair)
+                depth = self._market_data_collection_config.market_data_collection_depth + 1
+                market_data = MarketData(
+                    timestamp=self.db_timestamp,
+                    exchange=exchange,
+                    trading_pair=trading_pair,
+                    mid_price=mid_price,
+                    best_bid=best_bid,
+                    best_ask=best_ask,
+                    order_book={
+                        "bid": list(islice(order_book.bid_entries(), depth)),
+                        "ask": list(islice(order_book.ask_entries(), depth))}
+                )
+                market_data_records.append(market_data)
+        self._write_queue.put(lambda session, records=market_data_records: session.add_all(records))
+
+    def _record_market_data_snapshots(self):
+        timestamp = time.time()
+        for market in self._markets:
+            exchange = market.display_name
+            for trading_pair in market.trading_pairs:
+                order_book = market.get_order_book(trading_pair)
+                self._start_recording_trades(exchange, order_book)
+                bids_array, asks_array = order_book.to_numpy(self._market_data_writer.depth)
+                self._market_data_writer.append_snapshot(
+                    connector_name=exchange,
+                    trading_pair=trading_pair,
+                    timestamp=timestamp,
+                    mid_price=market.get_price_by_type(trading_pair, PriceType.MidPrice),
+                    best_bid=market.get_price_by_type(trading_pair, PriceType.BestBid),
+                    best_ask=market.get_price_by_type(trading_pair, PriceType.BestAsk),
+                    bids=bids_array,
+                    asks=asks_array,
+                )
+
+    def _start_recording_trades(self, exchange: str, order_book: OrderBook):
+        if id(order_book) not in self._order_books_recording_trades:
+            self._order_books_recording_trades[id(order_book)] = (exchange, order_book)
+            order_book.add_listener(OrderBookEvent.TradeEvent, self._order_book_trade_forwarder)
+
+    def _stop_recording_trades(self):
+        for _, order_book in self._order_books_recording_trades.values():
+            order_book.remove_listener(OrderBookEvent.TradeEvent, self._order_book_trade_forwarder)
+        self._order_books_recording_trades.clear()
+
+    def _did_trade_on_order_book(self, event_tag: int, order_book: OrderBook, evt: OrderBookTradeEvent):
+        exchange, _ = self._order_books_recording_trades.get(id(order_book), (None, None))
+        if exchange is not None:
+            self._market_data_writer.append_trade(
+                connector_name=exchange,
+                trading_pair=evt.trading_pair,
+                timestamp=evt.timestamp,
+                price=evt.price,
+                amount=evt.amount,
+                trade_type=evt.type,
+            )
+
     @property
     def sql_manager(self) -> SQLConnectionManager:
         return self._sql_manager
@@ -179,7 +265,16 @@ class MarketsRecorder:
     def db_timestamp(self) -> int:
         return int(time.time() * 1e3)
 
+    @property
+    def performance_accumulator(self) -> Optional[PerformanceAccumulator]:
+        return self._performance_accumulator
+
+    @property
+    def pending_writes(self) -> int:
+        return self._write_queue.pending_operations
+
     def start(self):
+        self._write_queue.start()
         for market in self._markets:
             for event_pair in self._event_pairs:
                 market.add_listener(event_pair[0], event_pair[1])
@@ -192,6 +287,55 @@ class MarketsRecorder:
                 market.remove_listener(event_pair[0], event_pair[1])
         if self._market_data_collection_task is not None:
             self._market_data_collection_task.cancel()
+        if self._market_data_writer is not None:
+            self._stop_recording_trades()
+            self._market_data_writer.close()
+        # Write all the pending records before stopping
+        self.checkpoint_market_states()
+        self._write_queue.stop()
+        self._close_csv_appenders()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Waits until all the records of the events received so far are written to the database.
+
+        :return: False if the records were not written before the timeout
+        """
+        return self._write_queue.flush(timeout)
+
+    async def wait_for_pending_writes(self):
+        """
+        Waits until the records of the events received so far are written to the database (up to READ_FLUSH_TIMEOUT
+        seconds), without blocking the event loop. The callers reading the records from the event loop wait for it
+        before reading, so the records read include all the events received before the read.
+        """
+        flushed = await asyncio.get_running_loop().run_in_executor(None, self.flush, self.READ_FLUSH_TIMEOUT)
+        if not flushed:
+            self._log_read_flush_timeout()
+
+    def flush_before_read(self):
+        """
+        Waits until the records of the events received so far are written to the database before a read (up to
+        READ_FLUSH_TIMEOUT seconds), so the records read include all the events received before the read.
+        When called from the event loop it does not wait for the writer thread, to not block the loop, so async callers
+        have to wait_for_pending_writes before the read.
+        """
+        if self._is_event_loop_running():
+            return
+        if not self.flush(timeout=self.READ_FLUSH_TIMEOUT):
+            self._log_read_flush_timeout()
+
+    def _log_read_flush_timeout(self):
+        self.logger().warning(f"The pending database writes were not completed in {self.READ_FLUSH_TIMEOUT} "
+                              f"seconds. The records read may not include the latest events.")
+
+    @staticmethod
+    def _is_event_loop_running() -> bool:
+        try:
+            asyncio.get_running_loop()
+            return True
+        except RuntimeError:
+            return False
 
     def store_or_update_executor(self, executor):
         with self._sql_manager.get_new_session() as session:
@@ -242,6 +386,7 @@ class MarketsRecorder:
     def get_orders_for_config_and_market(self, config_file_path: str, market: ConnectorBase,
                                          with_exchange_order_id_present: Optional[bool] = False,
                                          number_of_rows: Optional[int] = None) -> List[Order]:
+        self.flush_before_read()
         with self._sql_manager.get_new_session() as session:
             filters = [Order.config_file_path == config_file_path,
                        Order.market == market.display_name]
@@ -257,6 +402,7 @@ class MarketsRecorder:
                 return query.limit(number_of_rows).all()
 
     def get_trades_for_config(self, config_file_path: str, number_of_rows: Optional[int] = None) -> List[TradeFill]:
+        self.flush_before_read()
         with self._sql_manager.get_new_session() as session:
             query: Query = (session
                             .query(TradeFill)
@@ -268,25 +414,165 @@ class MarketsRecorder:
                 return query.limit(number_of_rows).all()
 
     def save_market_states(self, config_file_path: str, market: ConnectorBase, session: Session):
-        market_states: Optional[MarketState] = self.get_market_states(config_file_path, market, session=session)
-        timestamp: int = self.db_timestamp
+        saved_states = market.tracking_states
+        self._write_market_states_changes(session, config_file_path, market.display_name, saved_states, [],
+                                          self.db_timestamp, replace=True)
+        if config_file_path == self._config_file_path:
+            self._checkpointed_market_states[market.display_name] = saved_states
 
+    def checkpoint_market_states(self):
+        """
+        Saves the changes in the tracking states of the markets that had order events since the last checkpoint.
+        """
+        if self._market_states_checkpoint_handle is not None:
+            self._market_states_checkpoint_handle.cancel()
+            self._market_states_checkpoint_handle = None
+        self._last_market_states_checkpoint = self._ev_loop.time()
+        dirty_markets = list(self._dirty_markets.values())
+        self._dirty_markets.clear()
+        for market in dirty_markets:
+            self._queue_market_states_checkpoint(market)
+        self._queue_performance_checkpoint()
+
+    def _mark_market_states_dirty(self, market: ConnectorBase):
+        self._dirty_markets[market.display_name] = market
+        if self._market_states_checkpoint_handle is None:
+            delay = (self._last_market_states_checkpoint + self._market_states_checkpoint_interval
+                     - self._ev_loop.time())
+            if delay <= 0:
+                self.checkpoint_market_states()
+            else:
+                self._market_states_checkpoint_handle = self._ev_loop.call_later(delay, self.checkpoint_market_states)
+
+    def _load_performance_accumulator(self, start_timestamp: int) -> PerformanceAccumulator:
+        """
+        Restores the trade stats checkpointed for the same config file and start time, if any, and adds the fills
+        the checkpoint does not include. Otherwise the stats are built from the fills since the start time.
+        """
+        accumulator: Optional[PerformanceAccumulator] = None
+        with self._sql_manager.get_new_session() as session:
+            checkpoint: Optional[Metadata] = (session
+                                              .query(Metadata)
+                                              .filter(Metadata.key == self._performance_checkpoint_key())
+                                              .one_or_none())
+            if checkpoint is not None:
+                try:
+                    accumulator = PerformanceAccumulator.from_json(checkpoint.value)
+                except Exception:
+                    self.logger().warning("The checkpoint of the performance metrics could not be read, "
+                                          "the metrics will be calculated from the trade fills.", exc_info=True)
+            if accumulator is None or not accumulator.covers(self._config_file_path, start_timestamp):
+                accumulator = PerformanceAccumulator(self._config_file_path, start_timestamp)
+            # Fills can be recorded out of timestamp order, so the fills missing from the checkpoint are found by id
+            fill_ids = (session
+                        .query(TradeFill.market, TradeFill.order_id, TradeFill.exchange_trade_id)
+                        .filter(TradeFill.config_file_path == self._config_file_path,
+                                TradeFill.timestamp >= start_timestamp)
+                        .all())
+            missing_fill_ids = [tuple(fill_id) for fill_id in fill_ids
+                                if tuple(fill_id) not in accumulator.fill_ids]
+            accumulator.add_trade_fills(session.get(TradeFill, fill_id) for fill_id in missing_fill_ids)
+        return accumulator
+
+    def _performance_checkpoint_key(self) -> str:
+        return f"performance_accumulator:{self._config_file_path}"
+
+    def _queue_performance_checkpoint(self):
+        if self._performance_accumulator is None or not self._performance_accumulator.dirty:
+            return
+        checkpoint_key = self._performance_checkpoint_key()
+        checkpoint = Metadata(key=checkpoint_key, value=self._performance_accumulator.to_json())
+        self._write_queue.put(lambda session: session.merge(checkpoint), coalesce_key=checkpoint_key)
+
+    def _queue_market_states_checkpoint(self, market: ConnectorBase):
+        market_name = market.display_name
+        saved_states = market.tracking_states
+        previous_states = self._checkpointed_market_states.get(market_name)
+        if previous_states is None:
+            # The first checkpoint of the market replaces everything saved by previous runs
+            changed_states = saved_states
+            removed_keys = []
+        else:
+            changed_states = {key: value for key, value in saved_states.items() if previous_states.get(key) != value}
+            removed_keys = [key for key in previous_states if key not in saved_states]
+            if len(changed_states) == 0 and len(removed_keys) == 0:
+                return
+        self._checkpointed_market_states[market_name] = saved_states
+
+        config_file_path = self._config_file_path
+        timestamp = self.db_timestamp
+        replace = previous_states is None
+        self._write_queue.put(lambda session: self._write_market_states_changes(
+            session, config_file_path, market_name, changed_states, removed_keys, timestamp, replace=replace))
+
+    @staticmethod
+    def _write_market_states_changes(session: Session,
+                                     config_file_path: str,
+                                     market_name: str,
+                                     changed_states: Dict[str, Any],
+                                     removed_keys: List[str],
+                                     timestamp: int,
+                                     replace: bool = False):
+        market_states: Optional[MarketState] = (session
+                                                .query(MarketState)
+                                                .filter(MarketState.config_file_path == config_file_path,
+                                                        MarketState.market == market_name)
+                                                .one_or_none())
         if market_states is not None:
-            market_states.saved_state = market.tracking_states
             market_states.timestamp = timestamp
+            if replace:
+                # The states of each order are saved in MarketOrderState
+                market_states.saved_state = {}
         else:
             market_states = MarketState(config_file_path=config_file_path,
-                                        market=market.display_name,
+                                        market=market_name,
                                         timestamp=timestamp,
-                                        saved_state=market.tracking_states)
+                                        saved_state={})
             session.add(market_states)
 
+        order_states_query: Query = (session
+                                     .query(MarketOrderState)
+                                     .filter(MarketOrderState.config_file_path == config_file_path,
+                                             MarketOrderState.market == market_name))
+        if replace:
+            order_states_query.delete(synchronize_session=False)
+            existing_order_states = {}
+        else:
+            if len(removed_keys) > 0:
+                (order_states_query
+                 .filter(MarketOrderState.state_key.in_(removed_keys))
+                 .delete(synchronize_session=False))
+            existing_order_states = {
+                order_state.state_key: order_state
+                for order_state in order_states_query.filter(MarketOrderState.state_key.in_(list(changed_states)))
+            }
+        for key, saved_state in changed_states.items():
+            order_state: Optional[MarketOrderState] = existing_order_states.get(key)
+            if order_state is not None:
+                order_state.saved_state = saved_state
+                order_state.timestamp = timestamp
+            else:
+                session.add(MarketOrderState(config_file_path=config_file_path,
+                                             market=market_name,
+                                             state_key=key,
+                                             timestamp=timestamp,
+                                             saved_state=saved_state))
+
     def restore_market_states(self, config_file_path: str, market: ConnectorBase):
+        self.flush_before_read()
         with self._sql_manager.get_new_session() as session:
             market_states: Optional[MarketState] = self.get_market_states(config_file_path, market, session=session)
 
             if market_states is not None:
-                market.restore_tracking_states(market_states.saved_state)
+                # Tracking states saved as a single blob by previous versions are restored as well
+                saved_states = dict(market_states.saved_state)
+                order_states: List[MarketOrderState] = (session
+                                                        .query(MarketOrderState)
+                                                        .filter(MarketOrderState.config_file_path == config_file_path,
+                                                                MarketOrderState.market == market.display_name)
+                                                        .all())
+                saved_states.update({order_state.state_key: order_state.saved_state for order_state in order_states})
+                market.restore_tracking_states(saved_states)
 
     def get_market_states(self,
                           config_file_path: str,
@@ -311,31 +597,33 @@ class MarketsRecorder:
         timestamp = int(evt.creation_timestamp * 1e3)
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                order_record: Order = Order(id=evt.order_id,
-                                            config_file_path=self._config_file_path,
-                                            strategy=self._strategy_name,
-                                            market=market.display_name,
-                                            symbol=evt.trading_pair,
-                                            base_asset=base_asset,
-                                            quote_asset=quote_asset,
-                                            creation_timestamp=timestamp,
-                                            order_type=evt.type.name,
-                                            amount=Decimal(evt.amount),
-                                            leverage=evt.leverage if evt.leverage else 1,
-                                            price=Decimal(evt.price) if evt.price == evt.price else Decimal(0),
-                                            position=evt.position if evt.position else PositionAction.NIL.value,
-                                            last_status=event_type.name,
-                                            last_update_timestamp=timestamp,
-                                            exchange_order_id=evt.exchange_order_id)
-                order_status: OrderStatus = OrderStatus(order=order_record,
-                                                        timestamp=timestamp,
-                                                        status=event_type.name)
-                session.add(order_record)
-                session.add(order_status)
-                market.add_exchange_order_ids_from_market_recorder({evt.exchange_order_id: evt.order_id})
-                self.save_market_states(self._config_file_path, market, session=session)
+        order_record: Order = Order(id=evt.order_id,
+                                    config_file_path=self._config_file_path,
+                                    strategy=self._strategy_name,
+                                    market=market.display_name,
+                                    symbol=evt.trading_pair,
+                                    base_asset=base_asset,
+                                    quote_asset=quote_asset,
+                                    creation_timestamp=timestamp,
+                                    order_type=evt.type.name,
+                                    amount=Decimal(evt.amount),
+                                    leverage=evt.leverage if evt.leverage else 1,
+                                    price=Decimal(evt.price) if evt.price == evt.price else Decimal(0),
+                                    position=evt.position if evt.position else PositionAction.NIL.value,
+                                    last_status=event_type.name,
+                                    last_update_timestamp=timestamp,
+                                    exchange_order_id=evt.exchange_order_id)
+        order_status: OrderStatus = OrderStatus(order=order_record,
+                                                timestamp=timestamp,
+                                                status=event_type.name)
+
+        def write_order(session: Session):
+            session.add(order_record)
+            session.add(order_status)
+
+        self._write_queue.put(write_order)
+        market.add_exchange_order_ids_from_market_recorder({evt.exchange_order_id: evt.order_id})
+        self._mark_market_states_dirty(market)
 
     def _did_fill_order(self,
                         event_tag: int,
@@ -350,56 +638,59 @@ class MarketsRecorder:
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                # Try to find the order record, and update it if necessary.
-                order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
-                if order_record is not None:
-                    order_record.last_status = event_type.name
-                    order_record.last_update_timestamp = timestamp
-
-                # Order status and trade fill record should be added even if the order record is not found, because it's
-                # possible for fill event to come in before the order created event for market orders.
-                order_status: OrderStatus = OrderStatus(order_id=order_id,
-                                                        timestamp=timestamp,
-                                                        status=event_type.name)
-                try:
-                    fee_in_quote = evt.trade_fee.fee_amount_in_token(
-                        trading_pair=evt.trading_pair,
-                        price=evt.price,
-                        order_amount=evt.amount,
-                        token=quote_asset,
-                        exchange=market
-                    )
-                except Exception as e:
-                    self.logger().error(f"Error calculating fee in quote: {e}, will be stored in the DB as 0.")
-                    fee_in_quote = 0
-                trade_fill_record: TradeFill = TradeFill(
-                    config_file_path=self.config_file_path,
-                    strategy=self.strategy_name,
-                    market=market.display_name,
-                    symbol=evt.trading_pair,
-                    base_asset=base_asset,
-                    quote_asset=quote_asset,
-                    timestamp=timestamp,
-                    order_id=order_id,
-                    trade_type=evt.trade_type.name,
-                    order_type=evt.order_type.name,
-                    price=evt.price,
-                    amount=evt.amount,
-                    leverage=evt.leverage if evt.leverage else 1,
-                    trade_fee=evt.trade_fee.to_json(),
-                    trade_fee_in_quote=fee_in_quote,
-                    exchange_trade_id=evt.exchange_trade_id,
-                    position=evt.position if evt.position else PositionAction.NIL.value,
-                )
-                session.add(order_status)
-                session.add(trade_fill_record)
-                self.save_market_states(self._config_file_path, market, session=session)
-
-                market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(trade_fill_record.market,
-                                                                                   trade_fill_record.exchange_trade_id,
-                                                                                   trade_fill_record.symbol)})
+        # Order status and trade fill record should be added even if the order record is not found, because it's
+        # possible for fill event to come in before the order created event for market orders.
+        order_status: OrderStatus = OrderStatus(order_id=order_id,
+                                                timestamp=timestamp,
+                                                status=event_type.name)
+        try:
+            fee_in_quote = evt.trade_fee.fee_amount_in_token(
+                trading_pair=evt.trading_pair,
+                price=evt.price,
+                order_amount=evt.amount,
+                token=quote_asset,
+                exchange=market
+            )
+        except Exception as e:
+            self.logger().error(f"Error calculating fee in quote: {e}, will be stored in the DB as 0.")
+            fee_in_quote = 0
+        trade_fill_record: TradeFill = TradeFill(
+            config_file_path=self.config_file_path,
+            strategy=self.strategy_name,
+            market=market.display_name,
+            symbol=evt.trading_pair,
+            base_asset=base_asset,
+            quote_asset=quote_asset,
+            timestamp=timestamp,
+            order_id=order_id,
+            trade_type=evt.trade_type.name,
+            order_type=evt.order_type.name,
+            price=evt.price,
+            amount=evt.amount,
+            leverage=evt.leverage if evt.leverage else 1,
+            trade_fee=evt.trade_fee.to_json(),
+            trade_fee_in_quote=fee_in_quote,
+            exchange_trade_id=evt.exchange_trade_id,
+            position=evt.position if evt.position else PositionAction.NIL.value,
+        )
+
+        def write_fill(session: Session):
+            # Try to find the order record, and update it if necessary.
+            order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+            if order_record is not None:
+                order_record.last_status = event_type.name
+                order_record.last_update_timestamp = timestamp
+            session.add(order_status)
+            session.add(trade_fill_record)
+
+        market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(market.display_name,
+                                                                           evt.exchange_trade_id,
+                                                                           evt.trading_pair)})
+        if self._performance_accumulator is not None:
+            self._performance_accumulator.add_trade_fill(trade_fill_record)
+        # The records are owned by the writer once queued, and expire when its transaction is committed
+        self._write_queue.put(write_fill)
+        self._mark_market_states_dirty(market)
 
     def _did_complete_funding_payment(self,
                                       event_tag: int,
@@ -411,24 +702,21 @@ class MarketsRecorder:
 
         timestamp: float = evt.timestamp
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                # Try to find the funding payment has been recorded already.
-                payment_record: Optional[FundingPayment] = session.query(FundingPayment).filter(
-                    FundingPayment.timestamp == timestamp).one_or_none()
-                if payment_record is None:
-                    funding_payment_record: FundingPayment = FundingPayment(timestamp=timestamp,
-                                                                            config_file_path=self.config_file_path,
-                                                                            market=market.display_name,
-                                                                            rate=evt.funding_rate,
-                                                                            symbol=evt.trading_pair,
-                                                                            amount=float(evt.amount))
-                    session.add(funding_payment_record)
+        funding_payment_record: FundingPayment = FundingPayment(timestamp=timestamp,
+                                                                config_file_path=self.config_file_path,
+                                                                market=market.display_name,
+                                                                rate=evt.funding_rate,
+                                                                symbol=evt.trading_pair,
+                                                                amount=float(evt.amount))
 
-    @staticmethod
-    def _csv_matches_header(file_path: str, header: tuple) -> bool:
-        df = pd.read_csv(file_path, header=None)
-        return tuple(df.iloc[0].values) == header
+        def write_funding_payment(session: Session):
+            # Try to find the funding payment has been recorded already.
+            payment_record: Optional[FundingPayment] = session.query(FundingPayment).filter(
+                FundingPayment.timestamp == timestamp).one_or_none()
+            if payment_record is None:
+                session.add(funding_payment_record)
+
+        self._write_queue.put(write_funding_payment)
 
     def append_to_csv(self, trade: TradeFill):
         csv_filename = "trades_" + trade.config_file_path[:-4] + ".csv"
@@ -444,14 +732,24 @@ class MarketsRecorder:
         field_names += ("age",)
         field_data += (age,)
 
-        if (os.path.exists(csv_path) and (not self._csv_matches_header(csv_path, field_names))):
-            move(csv_path, csv_path[:-4] + '_old_' + pd.Timestamp.utcnow().strftime("%Y%m%d-%H%M%S") + ".csv")
-
-        if not os.path.exists(csv_path):
-            df_header = pd.DataFrame([field_names])
-            df_header.to_csv(csv_path, mode='a', header=False, index=False)
-        df = pd.DataFrame([field_data])
-        df.to_csv(csv_path, mode='a', header=False, index=False)
+        self._get_csv_appender(csv_path, field_names).append(field_data)
+
+    def _get_csv_appender(self, csv_path: str, header: Tuple[str, ...]) -> CSVAppender:
+        csv_appender = self._csv_appenders.get(csv_path)
+        if csv_appender is None or csv_appender.header != header:
+            if csv_appender is not None:
+                csv_appender.close()
+            csv_appender = CSVAppender(csv_path,
+                                       header,
+                                       max_file_size=self._trades_csv_max_file_size,
+                                       rotate_daily=self._trades_csv_rotate_daily)
+            self._csv_appenders[csv_path] = csv_appender
+        return csv_appender
+
+    def _close_csv_appenders(self):
+        for csv_appender in self._csv_appenders.values():
+            csv_appender.close()
+        self._csv_appenders.clear()
 
     def _update_order_status(self,
                              event_tag: int,
@@ -469,18 +767,19 @@ class MarketsRecorder:
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
-
-                if order_record is not None:
-                    order_record.last_status = event_type.name
-                    order_record.last_update_timestamp = timestamp
-                    order_status: OrderStatus = OrderStatus(order_id=order_id,
-                                                            timestamp=timestamp,
-                                                            status=event_type.name)
-                    session.add(order_status)
-                    self.save_market_states(self._config_file_path, market, session=session)
+        def write_order_status(session: Session):
+            order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+
+            if order_record is not None:
+                order_record.last_status = event_type.name
+                order_record.last_update_timestamp = timestamp
+                order_status: OrderStatus = OrderStatus(order_id=order_id,
+                                                        timestamp=timestamp,
+                                                        status=event_type.name)
+                session.add(order_status)
+
+        self._write_queue.put(write_order_status)
+        self._mark_market_states_dirty(market)
 
     def _did_cancel_order(self,
                           event_tag: int,
@@ -516,15 +815,13 @@ class MarketsRecorder:
 
         timestamp: int = self.db_timestamp
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                rp_update: RangePositionUpdate = RangePositionUpdate(hb_id=evt.order_id,
-                                                                     timestamp=timestamp,
-                                                                     tx_hash=evt.exchange_order_id,
-                                                                     token_id=evt.token_id,
-                                                                     trade_fee=evt.trade_fee.to_json())
-                session.add(rp_update)
-                self.save_market_states(self._config_file_path, connector, session=session)
+        rp_update: RangePositionUpdate = RangePositionUpdate(hb_id=evt.order_id,
+                                                             timestamp=timestamp,
+                                                             tx_hash=evt.exchange_order_id,
+                                                             token_id=evt.token_id,
+                                                             trade_fee=evt.trade_fee.to_json())
+        self._write_queue.put(lambda session: session.add(rp_update))
+        self._mark_market_states_dirty(connector)
 
     def _did_close_position(self,
                             event_tag: int,
@@ -534,17 +831,15 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._did_close_position, event_tag, connector, evt)
             return
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                rp_fees: RangePositionCollectedFees = RangePositionCollectedFees(config_file_path=self._config_file_path,
-                                                                                 strategy=self._strategy_name,
-                                                                                 token_id=evt.token_id,
-                                                                                 token_0=evt.token_0,
-                                                                                 token_1=evt.token_1,
-                                                                                 claimed_fee_0=Decimal(evt.claimed_fee_0),
-                                                                                 claimed_fee_1=Decimal(evt.claimed_fee_1))
-                session.add(rp_fees)
-                self.save_market_states(self._config_file_path, connector, session=session)
+        rp_fees: RangePositionCollectedFees = RangePositionCollectedFees(config_file_path=self._config_file_path,
+                                                                         strategy=self._strategy_name,
+                                                                         token_id=evt.token_id,
+                                                                         token_0=evt.token_0,
+                                                                         token_1=evt.token_1,
+                                                                         claimed_fee_0=Decimal(evt.claimed_fee_0),
+                                                                         claimed_fee_1=Decimal(evt.claimed_fee_1))
+        self._write_queue.put(lambda session: session.add(rp_fees))
+        self._mark_market_states_dirty(connector)
 
     @staticmethod
     async def _sleep(delay):
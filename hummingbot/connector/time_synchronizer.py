@@ -2,26 +2,70 @@ import asyncio
 import logging
 import time
 from collections import deque
-from typing import Awaitable, Deque
+from dataclasses import dataclass
+from typing import Awaitable, Deque, Optional
 
 import numpy
 
 from hummingbot.logger import HummingbotLogger
 
 
+@dataclass(frozen=True)
+class DriftStatistics:
+    """
+    Snapshot of the drift measured by a `TimeSynchronizer` between its samples.
+
+    The drift of a sample is the difference between the offset of the sample and the offset predicted for the time of
+    the sample from the previous samples.
+    """
+    sample_age: Optional[float]
+    last_drift_ms: float
+    max_drift_ms: float
+    drift_speed: float
+    drift_rate: float
+    samples_count: int
+    update_requested: bool
+
+
 class TimeSynchronizer:
     """
     Used to synchronize the local time with the server's time.
     This class is useful when timestamp-based signatures are required by the exchange for authentication.
     Upon receiving a timestamped message from the server, use `update_server_time_offset_with_time_provider`
     to synchronize local time with the server's time.
+    The offset is calculated when a sample is added, so getting the time only adds the offset to the local counter.
+    Optionally, the drift of the local clock against the server's clock between samples can be corrected, using the
+    trend of the samples.
+    `is_update_required` tells when a new sample is worth requesting: when the last sample is older than
+    `max_sample_age` seconds, when the drift measured between the samples is expected to have moved the clocks apart
+    by `drift_tolerance_ms` since the last sample, or when an update was explicitly requested with `request_update`.
     """
 
     NaN = float("nan")
     _logger = None
 
-    def __init__(self):
+    def __init__(self,
+                 drift_correction: bool = False,
+                 max_sample_age: float = 300.0,
+                 min_sample_age: float = 10.0,
+                 drift_tolerance_ms: float = 50.0):
         self._time_offset_ms: Deque[float] = deque(maxlen=5)
+        # Local counter time (in milliseconds) when each sample was taken, used to estimate the drift
+        self._sample_local_times_ms: Deque[float] = deque(maxlen=5)
+        self._drift_correction: bool = drift_correction
+        self._calculated_offset_ms: Optional[float] = None
+        self._drift_reference_ms: float = 0.0
+        self._drift_rate: float = 0.0
+        self._max_sample_age: float = max_sample_age
+        self._min_sample_age: float = min_sample_age
+        self._drift_tolerance_ms: float = drift_tolerance_ms
+        self._last_sample_local_time_ms: Optional[float] = None
+        self._last_drift_ms: float = 0.0
+        self._max_drift_ms: float = 0.0
+        # Absolute drift measured between the last two samples, in milliseconds per second
+        self._drift_speed: float = 0.0
+        self._samples_count: int = 0
+        self._update_requested: bool = False
         self._lock = asyncio.Lock()
 
     @classmethod
@@ -32,27 +76,134 @@ class TimeSynchronizer:
 
     @property
     def time_offset_ms(self) -> float:
-        if not self._time_offset_ms:
-            offset = (self._time() - self._current_seconds_counter()) * 1e3
-        else:
-            median = numpy.median(self._time_offset_ms)
-            weighted_average = numpy.average(self._time_offset_ms, weights=range(1, len(self._time_offset_ms) * 2 + 1, 2))
-            offset = numpy.mean([median, weighted_average])
+        return self._time_offset_ms_at(self._current_seconds_counter())
+
+    @property
+    def drift_rate(self) -> float:
+        """
+        Returns the estimated drift of the server's clock against the local clock, in milliseconds per millisecond.
+        It is zero unless the drift correction is enabled and there are at least two samples.
+        """
+        return self._drift_rate
+
+    @property
+    def drift_statistics(self) -> DriftStatistics:
+        return DriftStatistics(
+            sample_age=self._sample_age(),
+            last_drift_ms=self._last_drift_ms,
+            max_drift_ms=self._max_drift_ms,
+            drift_speed=self._drift_speed,
+            drift_rate=self._drift_rate,
+            samples_count=self._samples_count,
+            update_requested=self._update_requested,
+        )
+
+    def request_update(self):
+        """
+        Flags the offset as outdated, for instance because the server rejected a request due to its timestamp, so that
+        the next call to `is_update_required` returns True.
+        """
+        self._update_requested = True
 
-        return offset
+    def is_update_required(self) -> bool:
+        """
+        Returns True if a new sample of the server's time should be taken before relying on the calculated offset.
+        """
+        sample_age = self._sample_age()
+        if sample_age is None or self._update_requested:
+            return True
+        if sample_age >= self._max_sample_age:
+            return True
+        return sample_age >= self._min_sample_age and self._drift_speed * sample_age >= self._drift_tolerance_ms
+
+    def add_time_offset_ms_sample(self, offset: float, local_time_ms: Optional[float] = None):
+        """
+        Adds a sample of the offset between the server's time and the local counter, and recalculates the offset.
 
-    def add_time_offset_ms_sample(self, offset: float):
+        :param offset: the offset in milliseconds
+        :param local_time_ms: the local counter time in milliseconds when the sample was taken (defaults to now)
+        """
+        if local_time_ms is None:
+            local_time_ms = self._current_seconds_counter() * 1e3
+        if self._calculated_offset_ms is not None:
+            self._measure_drift(offset, local_time_ms)
         self._time_offset_ms.append(offset)
+        self._sample_local_times_ms.append(local_time_ms)
+        self._last_sample_local_time_ms = local_time_ms
+        self._samples_count += 1
+        self._update_requested = False
+        self._calculate_offset()
 
     def clear_time_offset_ms_samples(self):
         self._time_offset_ms.clear()
+        self._sample_local_times_ms.clear()
+        self._last_sample_local_time_ms = None
+        self._drift_speed = 0.0
+        self._calculate_offset()
 
     def time(self) -> float:
         """
         Returns the current time in seconds calculated base on the deviation samples.
         :return: Calculated current time considering the registered deviations
         """
-        return self._current_seconds_counter() + self.time_offset_ms * 1e-3
+        seconds_counter = self._current_seconds_counter()
+        return seconds_counter + self._time_offset_ms_at(seconds_counter) * 1e-3
+
+    def time_ns(self) -> int:
+        """
+        Returns the current time in nanoseconds calculated base on the deviation samples, for the signatures that
+        require an integer timestamp.
+        """
+        seconds_counter = self._current_seconds_counter()
+        return int(seconds_counter * 1e9) + int(self._time_offset_ms_at(seconds_counter) * 1e6)
+
+    def _time_offset_ms_at(self, seconds_counter: float) -> float:
+        if self._calculated_offset_ms is None:
+            return (self._time() - self._current_seconds_counter()) * 1e3
+        if self._drift_rate:
+            return self._calculated_offset_ms + self._drift_rate * (seconds_counter * 1e3 - self._drift_reference_ms)
+        return self._calculated_offset_ms
+
+    def _sample_age(self) -> Optional[float]:
+        if self._last_sample_local_time_ms is None:
+            return None
+        return self._current_seconds_counter() - self._last_sample_local_time_ms * 1e-3
+
+    def _measure_drift(self, offset: float, local_time_ms: float):
+        drift_ms = offset - self._time_offset_ms_at(local_time_ms * 1e-3)
+        self._last_drift_ms = drift_ms
+        self._max_drift_ms = max(self._max_drift_ms, abs(drift_ms))
+        elapsed_seconds = (local_time_ms - self._last_sample_local_time_ms) * 1e-3
+        if elapsed_seconds > 0:
+            self._drift_speed = abs(drift_ms) / elapsed_seconds
+
+    def _calculate_offset(self):
+        if not self._time_offset_ms:
+            self._calculated_offset_ms = None
+            self._drift_rate = 0.0
+            return
+        median = numpy.median(self._time_offset_ms)
+        weighted_average = numpy.average(self._time_offset_ms, weights=range(1, len(self._time_offset_ms) * 2 + 1, 2))
+        self._calculated_offset_ms = numpy.mean([median, weighted_average])
+        if self._drift_correction:
+            self._calculate_drift()
+
+    def _calculate_drift(self):
+        # Least squares slope of the offsets over the local time of the samples. The offset calculated from the
+        # samples is taken as the offset at the local time calculated the same way from the times of the samples.
+        self._drift_rate = 0.0
+        if len(self._time_offset_ms) < 2 or any(local_time is None for local_time in self._sample_local_times_ms):
+            return
+        samples = list(zip(self._sample_local_times_ms, self._time_offset_ms))
+        mean_time = sum(local_time for local_time, _ in samples) / len(samples)
+        mean_offset = sum(offset for _, offset in samples) / len(samples)
+        variance = sum((local_time - mean_time) ** 2 for local_time, _ in samples)
+        if variance > 0:
+            covariance = sum((local_time - mean_time) * (offset - mean_offset) for local_time, offset in samples)
+            self._drift_rate = covariance / variance
+            self._drift_reference_ms = numpy.mean([
+                numpy.median(self._sample_local_times_ms),
+                numpy.average(self._sample_local_times_ms, weights=range(1, len(samples) * 2 + 1, 2))])
 
     async def update_server_time_offset_with_time_provider(self, time_provider: Awaitable):
         """
@@ -67,7 +218,7 @@ class TimeSynchronizer:
             local_after_ms: float = self._current_seconds_counter() * 1e3
             local_server_time_pre_image_ms: float = (local_before_ms + local_after_ms) / 2.0
             time_offset_ms: float = server_time_ms - local_server_time_pre_image_ms
-            self.add_time_offset_ms_sample(time_offset_ms)
+            self.add_time_offset_ms_sample(time_offset_ms, local_time_ms=local_server_time_pre_image_ms)
         except asyncio.CancelledError:
             raise
         except Exception:
@@ -3,9 +3,10 @@ import logging
 import time
 from abc import ABC, abstractmethod
 from decimal import Decimal
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from hummingbot.core.api_throttler.data_types import RateLimit, TaskLog
+from hummingbot.core.api_throttler.request_priority import PriorityLanes, RequestPriority
 from hummingbot.logger.logger import HummingbotLogger
 
 arc_logger = None
@@ -34,6 +35,8 @@ class AsyncRequestContextBase(ABC):
                  lock: asyncio.Lock,
                  safety_margin_pct: float,
                  retry_interval: float = 0.1,
+                 priority: RequestPriority = RequestPriority.DEFAULT,
+                 priority_lanes: Optional[PriorityLanes] = None,
                  ):
         """
         Asynchronous context associated with each API request.
@@ -42,6 +45,9 @@ class AsyncRequestContextBase(ABC):
         :param related_limits: List of linked rate limits with its corresponding weight associated with this API Request
         :param lock: A shared asyncio.Lock used between all instances of APIRequestContextBase
         :param retry_interval: Time between each limit check
+        :param priority: The priority class of this API Request
+        :param priority_lanes: Shared tracker of the waiting requests of each priority class. When not provided, the
+            requests are not prioritized
         """
         self._task_logs: List[TaskLog] = task_logs
         self._rate_limit: RateLimit = rate_limit
@@ -49,6 +55,8 @@ class AsyncRequestContextBase(ABC):
         self._lock: asyncio.Lock = lock
         self._safety_margin_pct: float = safety_margin_pct
         self._retry_interval: float = retry_interval
+        self._priority: RequestPriority = priority
+        self._priority_lanes: Optional[PriorityLanes] = priority_lanes
 
     def flush(self):
         """
@@ -66,14 +74,41 @@ class AsyncRequestContextBase(ABC):
     def within_capacity(self) -> bool:
         raise NotImplementedError
 
+    def _limit_ids(self) -> List[str]:
+        if self._rate_limit is None:
+            return []
+        return [self._rate_limit.limit_id] + [limit.limit_id for limit, _ in self._related_limits]
+
+    def _yields_to_higher_priority(self, limit_ids: List[str]) -> bool:
+        return (self._priority_lanes is not None
+                and self._priority_lanes.has_higher_priority_requests(limit_ids, self._priority))
+
+    def _enqueue(self, limit_ids: List[str]):
+        if self._priority_lanes is not None:
+            self._priority_lanes.enqueue(limit_ids, self._priority)
+
+    def _dequeue(self, limit_ids: List[str], wait_time: Optional[float]):
+        if self._priority_lanes is not None:
+            self._priority_lanes.dequeue(limit_ids, self._priority)
+            if wait_time is not None:
+                self._priority_lanes.record_wait_time(self._priority, wait_time)
+
     async def acquire(self):
-        while True:
-            async with self._lock:
-                self.flush()
+        limit_ids = self._limit_ids()
+        start_time = time.time()
+        wait_time = None
+        self._enqueue(limit_ids)
+        try:
+            while True:
+                async with self._lock:
+                    self.flush()
 
-                if self.within_capacity():
-                    break
-            await asyncio.sleep(self._retry_interval)
+                    if not self._yields_to_higher_priority(limit_ids) and self.within_capacity():
+                        break
+                await asyncio.sleep(self._retry_interval)
+            wait_time = time.time() - start_time
+        finally:
+            self._dequeue(limit_ids, wait_time)
         async with self._lock:
             now = time.time()
             # Each related limit is represented as it own individual TaskLog
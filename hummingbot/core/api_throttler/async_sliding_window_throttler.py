@@ -0,0 +1,205 @@
+import asyncio
+import time
+from collections import deque
+from decimal import Decimal
+from typing import Deque, Dict, List, Optional, Tuple
+
+from hummingbot.core.api_throttler.async_request_context_base import (
+    MAX_CAPACITY_REACHED_WARNING_INTERVAL,
+    AsyncRequestContextBase,
+)
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
+from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.api_throttler.request_priority import PriorityLanes, RequestPriority
+
+MIN_WAIT_INTERVAL = 0.001
+
+
+class RateLimitWindow:
+    """
+    Sliding window of the capacity used for a single RateLimit. The tasks are kept in arrival order, so expired tasks
+    are always at the left end and the capacity used is maintained as a running sum.
+    """
+
+    def __init__(self, rate_limit: RateLimit, safety_margin_pct: float):
+        self._timestamps: Deque[float] = deque()
+        self._weights: Deque[int] = deque()
+        self.used_capacity: int = 0
+        self.configure(rate_limit=rate_limit, safety_margin_pct=safety_margin_pct)
+
+    def configure(self, rate_limit: RateLimit, safety_margin_pct: float):
+        self.rate_limit: RateLimit = rate_limit
+        self.limit: int = int(rate_limit.limit)
+        self.window_length: float = rate_limit.time_interval * (1 + safety_margin_pct)
+
+    def expire(self, now: float):
+        while len(self._timestamps) > 0 and now - self._timestamps[0] > self.window_length:
+            self._timestamps.popleft()
+            self.used_capacity -= self._weights.popleft()
+
+    def has_capacity(self, weight: int) -> bool:
+        return self.used_capacity + weight <= self.limit
+
+    def release_time(self, weight: int) -> Optional[float]:
+        """
+        :return: the time at which enough capacity will be released for a task with the given weight, or None if the
+            task does not fit in the limit even with an empty window
+        """
+        if weight > self.limit:
+            return None
+        capacity_to_release = self.used_capacity + weight - self.limit
+        for timestamp, task_weight in zip(self._timestamps, self._weights):
+            capacity_to_release -= task_weight
+            if capacity_to_release <= 0:
+                return timestamp + self.window_length
+        return None
+
+    def record(self, now: float, weight: int):
+        self._timestamps.append(now)
+        self._weights.append(weight)
+        self.used_capacity += weight
+
+
+class AsyncSlidingWindowRequestContext(AsyncRequestContextBase):
+    """
+    An async context class ('async with' syntax) that waits for capacity in all the windows related to the request.
+    Checking and recording the capacity happens without awaiting, so no lock is required. When there is no capacity
+    the context sleeps until the time the blocking window releases enough of it, instead of polling.
+    """
+
+    def __init__(self,
+                 rate_limit: Optional[RateLimit],
+                 windows: List[Tuple[RateLimitWindow, int]],
+                 retry_interval: float = 0.1,
+                 priority: RequestPriority = RequestPriority.DEFAULT,
+                 priority_lanes: Optional[PriorityLanes] = None,
+                 ):
+        """
+        :param rate_limit: The RateLimit associated with this API Request
+        :param windows: The windows of the rate limit and its linked limits, with the weight to use in each of them
+        :param retry_interval: Time between checks when the time the capacity will be available can't be computed,
+            or while yielding to higher priority requests
+        :param priority: The priority class of this API Request
+        :param priority_lanes: Shared tracker of the waiting requests of each priority class
+        """
+        self._rate_limit: Optional[RateLimit] = rate_limit
+        self._windows: List[Tuple[RateLimitWindow, int]] = windows
+        self._retry_interval: float = retry_interval
+        self._priority: RequestPriority = priority
+        self._priority_lanes: Optional[PriorityLanes] = priority_lanes
+
+    def flush(self):
+        now = self._time()
+        for window, _ in self._windows:
+            window.expire(now)
+
+    def within_capacity(self) -> bool:
+        self.flush()
+        return self._wait_time(self._time()) <= 0
+
+    async def acquire(self):
+        limit_ids = self._limit_ids()
+        start_time = self._time()
+        queue_wait_time = None
+        self._enqueue(limit_ids)
+        try:
+            while True:
+                now = self._time()
+                if self._yields_to_higher_priority(limit_ids):
+                    await self._sleep(self._retry_interval)
+                    continue
+                for window, _ in self._windows:
+                    window.expire(now)
+                wait_time = self._wait_time(now)
+                if wait_time <= 0:
+                    break
+                await self._sleep(max(wait_time, MIN_WAIT_INTERVAL))
+            queue_wait_time = now - start_time
+        finally:
+            self._dequeue(limit_ids, queue_wait_time)
+        for window, weight in self._windows:
+            window.record(now, weight)
+
+    def _limit_ids(self) -> List[str]:
+        return [window.rate_limit.limit_id for window, _ in self._windows]
+
+    def _wait_time(self, now: float) -> float:
+        wait_time = 0.0
+        for window, weight in self._windows:
+            if not window.has_capacity(weight):
+                self._log_capacity_reached(window, now)
+                release_time = window.release_time(weight)
+                window_wait_time = self._retry_interval if release_time is None else release_time - now
+                wait_time = max(wait_time, window_wait_time, MIN_WAIT_INTERVAL)
+        return wait_time
+
+    def _log_capacity_reached(self, window: RateLimitWindow, now: float):
+        if AsyncRequestContextBase._last_max_cap_warning_ts < now - MAX_CAPACITY_REACHED_WARNING_INTERVAL:
+            rate_limit = window.rate_limit
+            msg = f"API rate limit on {rate_limit.limit_id} ({rate_limit.limit} calls per " \
+                  f"{rate_limit.time_interval}s) has almost reached. Limits used " \
+                  f"is {window.used_capacity} in the last " \
+                  f"{rate_limit.time_interval} seconds"
+            self.logger().notify(msg)
+            AsyncRequestContextBase._last_max_cap_warning_ts = now
+
+    def _time(self) -> float:
+        return time.time()
+
+    async def _sleep(self, delay: float):
+        await asyncio.sleep(delay)
+
+
+class AsyncSlidingWindowThrottler(AsyncThrottlerBase):
+    """
+    Drop-in alternative to AsyncThrottler. Instead of scanning a shared list of task logs on every capacity check, it
+    keeps one sliding window per limit id with a running sum of the capacity used, so checks are O(1) amortized.
+    Waiting requests sleep until capacity is expected to be released rather than polling every retry_interval.
+    """
+
+    def __init__(self,
+                 rate_limits: List[RateLimit],
+                 retry_interval: float = 0.1,
+                 safety_margin_pct: Optional[float] = 0.05,
+                 limits_share_percentage: Optional[Decimal] = None
+                 ):
+        super().__init__(
+            rate_limits=rate_limits,
+            retry_interval=retry_interval,
+            safety_margin_pct=safety_margin_pct,
+            limits_share_percentage=limits_share_percentage,
+        )
+        self._windows: Dict[str, RateLimitWindow] = {}
+
+    def execute_task(self,
+                     limit_id: str,
+                     priority: Optional[RequestPriority] = None) -> AsyncSlidingWindowRequestContext:
+        """
+        Creates an async context where code within the context (a task) can be run only when all rate
+        limits have capacity for the new task.
+        :param limit_id: the limit_id associated with the APi request
+        :param priority: the priority class of the request. Defaults to the one set with `request_priority`
+        :return: An async context (used with async with syntax)
+        """
+        rate_limit, related_rate_limits = self.get_related_limits(limit_id=limit_id)
+        windows = []
+        if rate_limit is not None:
+            windows.append((self._window_for(rate_limit), rate_limit.weight))
+            windows.extend((self._window_for(limit), weight) for limit, weight in related_rate_limits)
+        return AsyncSlidingWindowRequestContext(
+            rate_limit=rate_limit,
+            windows=windows,
+            retry_interval=self._retry_interval,
+            priority=self._request_priority(priority),
+            priority_lanes=self._priority_lanes,
+        )
+
+    def _window_for(self, rate_limit: RateLimit) -> RateLimitWindow:
+        window = self._windows.get(rate_limit.limit_id)
+        if window is None:
+            window = RateLimitWindow(rate_limit=rate_limit, safety_margin_pct=self._safety_margin_pct)
+            self._windows[rate_limit.limit_id] = window
+        elif window.rate_limit is not rate_limit:
+            # The limits have been redefined with set_rate_limits. The capacity already used is kept.
+            window.configure(rate_limit=rate_limit, safety_margin_pct=self._safety_margin_pct)
+        return window
@@ -1,6 +1,6 @@
 import time
 from decimal import Decimal
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from hummingbot.core.api_throttler.async_request_context_base import (
     MAX_CAPACITY_REACHED_WARNING_INTERVAL,
@@ -8,6 +8,7 @@ from hummingbot.core.api_throttler.async_request_context_base import (
 )
 from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
 from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.api_throttler.request_priority import RequestPriority
 
 
 class AsyncRequestContext(AsyncRequestContextBase):
@@ -51,7 +52,9 @@ class AsyncThrottler(AsyncThrottlerBase):
     """
     Handles call rate limits by providing async context (async with), it delays as needed to make sure calls stay
     within defined limits.
-    A task can have multiple call rates (weight), though tasks are still ordered in sequence as they come (FIFO).
+    A task can have multiple call rates (weight), though tasks are still ordered in sequence as they come (FIFO)
+    within each priority class. Tasks of a lower priority class yield the capacity while higher priority tasks sharing
+    any of their limits are waiting.
     (i.e)
         Pool 0 - rate limit is 100 calls per second
         Pool 1 - rate limit is 10 calls per second
@@ -59,11 +62,12 @@ class AsyncThrottler(AsyncThrottlerBase):
         this (whether it belongs to Pool 0 or Pool 1) will have to wait for new capacity (some of the Task A flushed out).
     """
 
-    def execute_task(self, limit_id: str) -> AsyncRequestContext:
+    def execute_task(self, limit_id: str, priority: Optional[RequestPriority] = None) -> AsyncRequestContext:
         """
         Creates an async context where code within the context (a task) can be run only when all rate
         limits have capacity for the new task.
         :param limit_id: the limit_id associated with the APi request
+        :param priority: the priority class of the request. Defaults to the one set with `request_priority`
         :return: An async context (used with async with syntax)
         """
         rate_limit, related_rate_limits = self.get_related_limits(limit_id=limit_id)
@@ -74,4 +78,6 @@ class AsyncThrottler(AsyncThrottlerBase):
             lock=self._lock,
             safety_margin_pct=self._safety_margin_pct,
             retry_interval=self._retry_interval,
+            priority=self._request_priority(priority),
+            priority_lanes=self._priority_lanes,
         )
@@ -8,6 +8,12 @@ from typing import Dict, List, Optional, Tuple
 
 from hummingbot.core.api_throttler.async_request_context_base import AsyncRequestContextBase
 from hummingbot.core.api_throttler.data_types import RateLimit, TaskLog
+from hummingbot.core.api_throttler.request_priority import (
+    PriorityLanes,
+    RequestPriority,
+    RequestWaitStats,
+    current_request_priority,
+)
 from hummingbot.logger.logger import HummingbotLogger
 
 
@@ -56,6 +62,9 @@ class AsyncThrottlerBase(ABC):
         # Shared asyncio.Lock instance to prevent multiple async ContextManager from accessing the _task_logs variable
         self._lock = asyncio.Lock()
 
+        # Waiting requests of each priority class, used to let lower priority requests yield capacity
+        self._priority_lanes = PriorityLanes()
+
     def set_rate_limits(self, rate_limits: List[RateLimit]):
         # Rate Limit Definitions
         self._rate_limits: List[RateLimit] = copy.deepcopy(rate_limits)
@@ -66,6 +75,16 @@ class AsyncThrottlerBase(ABC):
         # Dictionary of path_url to RateLimit
         self._id_to_limit_map: Dict[str, RateLimit] = {limit.limit_id: limit for limit in self._rate_limits}
 
+    @property
+    def queue_wait_stats(self) -> Dict[RequestPriority, RequestWaitStats]:
+        """
+        Time the requests of each priority class waited for capacity
+        """
+        return self._priority_lanes.wait_stats
+
+    def _request_priority(self, priority: Optional[RequestPriority]) -> RequestPriority:
+        return current_request_priority() if priority is None else priority
+
     def _client_config_map(self):
         from hummingbot.client.hummingbot_application import HummingbotApplication  # avoids circular import
 
@@ -86,5 +105,5 @@ class AsyncThrottlerBase(ABC):
         return rate_limit, related_limits
 
     @abstractmethod
-    def execute_task(self, limit_id: str) -> AsyncRequestContextBase:
+    def execute_task(self, limit_id: str, priority: Optional[RequestPriority] = None) -> AsyncRequestContextBase:
         raise NotImplementedError
@@ -0,0 +1,83 @@
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Dict, Iterable, List
+
+
+class RequestPriority(IntEnum):
+    """
+    Priority classes for the requests going through a throttler. Lower values have higher priority.
+    """
+    ORDER_CRITICAL = 0
+    USER_STREAM_FALLBACK = 1
+    DEFAULT = 2
+    BACKGROUND = 3
+
+
+_request_priority: ContextVar[RequestPriority] = ContextVar("request_priority", default=RequestPriority.DEFAULT)
+
+
+def current_request_priority() -> RequestPriority:
+    return _request_priority.get()
+
+
+@contextmanager
+def request_priority(priority: RequestPriority):
+    """
+    Sets the priority of the requests executed in the current context, and in the tasks created from it.
+    (i.e)
+        with request_priority(RequestPriority.BACKGROUND):
+            await self._update_trading_rules()
+    """
+    token = _request_priority.set(priority)
+    try:
+        yield
+    finally:
+        _request_priority.reset(token)
+
+
+@dataclass
+class RequestWaitStats:
+    requests: int = 0
+    total_wait_time: float = 0.0
+    max_wait_time: float = 0.0
+
+    @property
+    def average_wait_time(self) -> float:
+        return self.total_wait_time / self.requests if self.requests > 0 else 0.0
+
+
+class PriorityLanes:
+    """
+    Keeps track of the requests waiting for capacity on each limit, grouped by priority class, so that lower priority
+    requests can yield the capacity to higher priority ones. It also collects the queue wait time of each class.
+    """
+
+    def __init__(self):
+        self._waiting_requests: Dict[str, List[int]] = defaultdict(lambda: [0] * len(RequestPriority))
+        self.wait_stats: Dict[RequestPriority, RequestWaitStats] = {
+            priority: RequestWaitStats() for priority in RequestPriority
+        }
+
+    def enqueue(self, limit_ids: Iterable[str], priority: RequestPriority):
+        for limit_id in limit_ids:
+            self._waiting_requests[limit_id][priority] += 1
+
+    def dequeue(self, limit_ids: Iterable[str], priority: RequestPriority):
+        for limit_id in limit_ids:
+            self._waiting_requests[limit_id][priority] -= 1
+
+    def has_higher_priority_requests(self, limit_ids: Iterable[str], priority: RequestPriority) -> bool:
+        for limit_id in limit_ids:
+            waiting_requests = self._waiting_requests.get(limit_id)
+            if waiting_requests is not None and any(waiting_requests[:priority]):
+                return True
+        return False
+
+    def record_wait_time(self, priority: RequestPriority, wait_time: float):
+        stats = self.wait_stats[priority]
+        stats.requests += 1
+        stats.total_wait_time += wait_time
+        stats.max_wait_time = max(stats.max_wait_time, wait_time)
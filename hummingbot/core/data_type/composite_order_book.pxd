@@ -1,8 +1,17 @@
 # distutils: language=c++
 from hummingbot.core.data_type.order_book cimport OrderBook
+from hummingbot.core.data_type.order_book_query_result cimport OrderBookQueryResult
 
 cdef class CompositeOrderBook(OrderBook):
     cdef:
         OrderBook _traded_order_book
 
     cdef double c_get_price(self, bint is_buy) except? -1
+    cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume)
+    cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume)
+    cdef OrderBookQueryResult c_get_volume_for_price(self, bint is_buy, double price)
+    cdef OrderBookQueryResult c_get_quote_volume_for_price(self, bint is_buy, double price)
+    cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume)
+    cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount)
+    cdef list c_get_price_for_volumes(self, bint is_buy, object volumes)
+    cdef list c_get_vwap_for_volumes(self, bint is_buy, object volumes)
@@ -1,7 +1,10 @@
 # distutils: language=c++
 # distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
 
-from typing import Iterator
+from itertools import islice
+from typing import Iterator, Optional, Tuple
+
+import numpy as np
 
 from cython.operator cimport address as ref, dereference as deref, postincrement as inc
 from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
@@ -9,13 +12,17 @@ from libcpp.set cimport set
 from libcpp.vector cimport vector
 
 from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book_query_result import OrderBookQueryResult
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 
+NaN = float("nan")
+
 cdef class CompositeOrderBook(OrderBook):
     """
     Record orders that are bought during back testing and used to simulate order book consumption without modifying
     the actual order book.
-    Override the order book bid_entries, ask_entries methods to return the composite order book entries
+    Override the order book bid_entries, ask_entries methods to return the composite order book entries.
+    The depth queries are overridden as well, so they walk the composite entries instead of the raw C++ books.
     """
     def __init__(self, order_book: OrderBook = None):
         super().__init__()
@@ -72,6 +79,11 @@ cdef class CompositeOrderBook(OrderBook):
 
         self._traded_order_book.c_apply_diffs(cpp_bids, cpp_asks, timestamp)
 
+    def to_numpy(self, depth: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        bids_array = np.array(list(islice(self.bid_entries(), depth)), dtype=np.float64).reshape(-1, 3)
+        asks_array = np.array(list(islice(self.ask_entries(), depth)), dtype=np.float64).reshape(-1, 3)
+        return bids_array, asks_array
+
     def original_bid_entries(self) -> Iterator[OrderBookRow]:
         return super().bid_entries()
 
@@ -192,3 +204,148 @@ cdef class CompositeOrderBook(OrderBook):
                 return best_bid.price
         except Exception:
             raise
+
+    cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume):
+        cdef:
+            double cumulative_volume = 0
+            double result_price = NaN
+
+        if is_buy:
+            for order_book_row in self.ask_entries():
+                cumulative_volume += order_book_row.amount
+                if cumulative_volume >= volume:
+                    result_price = order_book_row.price
+                    break
+        else:
+            for order_book_row in self.bid_entries():
+                cumulative_volume += order_book_row.amount
+                if cumulative_volume >= volume:
+                    result_price = order_book_row.price
+                    break
+
+        return OrderBookQueryResult(NaN, volume, result_price, min(cumulative_volume, volume))
+
+    cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume):
+        cdef:
+            double total_cost = 0
+            double total_volume = 0
+            double result_vwap = NaN
+        if is_buy:
+            for order_book_row in self.ask_entries():
+                total_cost += order_book_row.amount * order_book_row.price
+                total_volume += order_book_row.amount
+                if total_volume >= volume:
+                    total_cost -= order_book_row.amount * order_book_row.price
+                    total_volume -= order_book_row.amount
+                    incremental_amount = volume - total_volume
+                    total_cost += incremental_amount * order_book_row.price
+                    total_volume += incremental_amount
+                    result_vwap = total_cost / total_volume
+                    break
+        else:
+            for order_book_row in self.bid_entries():
+                total_cost += order_book_row.amount * order_book_row.price
+                total_volume += order_book_row.amount
+                if total_volume >= volume:
+                    total_cost -= order_book_row.amount * order_book_row.price
+                    total_volume -= order_book_row.amount
+                    incremental_amount = volume - total_volume
+                    total_cost += incremental_amount * order_book_row.price
+                    total_volume += incremental_amount
+                    result_vwap = total_cost / total_volume
+                    break
+
+        return OrderBookQueryResult(NaN, volume, result_vwap, min(total_volume, volume))
+
+    cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume):
+        cdef:
+            double cumulative_volume = 0
+            double result_price = NaN
+
+        if is_buy:
+            for order_book_row in self.ask_entries():
+                cumulative_volume += order_book_row.amount * order_book_row.price
+                if cumulative_volume >= quote_volume:
+                    result_price = order_book_row.price
+                    break
+        else:
+            for order_book_row in self.bid_entries():
+                cumulative_volume += order_book_row.amount * order_book_row.price
+                if cumulative_volume >= quote_volume:
+                    result_price = order_book_row.price
+                    break
+
+        return OrderBookQueryResult(NaN, quote_volume, result_price, min(cumulative_volume, quote_volume))
+
+    cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount):
+        cdef:
+            double cumulative_volume = 0
+            double cumulative_base_amount = 0
+            double row_amount = 0
+
+        if is_buy:
+            for order_book_row in self.ask_entries():
+                row_amount = order_book_row.amount
+                if row_amount + cumulative_base_amount >= base_amount:
+                    row_amount = base_amount - cumulative_base_amount
+                cumulative_base_amount += row_amount
+                cumulative_volume += row_amount * order_book_row.price
+                if cumulative_base_amount >= base_amount:
+                    break
+        else:
+            for order_book_row in self.bid_entries():
+                row_amount = order_book_row.amount
+                if row_amount + cumulative_base_amount >= base_amount:
+                    row_amount = base_amount - cumulative_base_amount
+                cumulative_base_amount += row_amount
+                cumulative_volume += row_amount * order_book_row.price
+                if cumulative_base_amount >= base_amount:
+                    break
+
+        return OrderBookQueryResult(NaN, base_amount, NaN, cumulative_volume)
+
+    cdef OrderBookQueryResult c_get_volume_for_price(self, bint is_buy, double price):
+        cdef:
+            double cumulative_volume = 0
+            double result_price = NaN
+
+        if is_buy:
+            for order_book_row in self.ask_entries():
+                if order_book_row.price > price:
+                    break
+                cumulative_volume += order_book_row.amount
+                result_price = order_book_row.price
+        else:
+            for order_book_row in self.bid_entries():
+                if order_book_row.price < price:
+                    break
+                cumulative_volume += order_book_row.amount
+                result_price = order_book_row.price
+
+        return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
+
+    cdef OrderBookQueryResult c_get_quote_volume_for_price(self, bint is_buy, double price):
+        cdef:
+            double cumulative_volume = 0
+            double result_price = NaN
+
+        if is_buy:
+            for order_book_row in self.ask_entries():
+                if order_book_row.price > price:
+                    break
+                cumulative_volume += order_book_row.amount * order_book_row.price
+                result_price = order_book_row.price
+        else:
+            for order_book_row in self.bid_entries():
+                if order_book_row.price < price:
+                    break
+                cumulative_volume += order_book_row.amount * order_book_row.price
+                result_price = order_book_row.price
+
+        return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
+
+    cdef list c_get_price_for_volumes(self, bint is_buy, object volumes):
+        return [self.c_get_price_for_volume(is_buy, volume) for volume in volumes]
+
+    cdef list c_get_vwap_for_volumes(self, bint is_buy, object volumes):
+        return [self.c_get_vwap_for_volume(is_buy, volume) for volume in volumes]
@@ -20,16 +20,32 @@ cdef class OrderBook(PubSub):
     cdef double _last_applied_trade
     cdef double _last_trade_price_rest_updated
     cdef bint _dex
+    cdef bint _depth_index_enabled
+    cdef vector[double] _bid_index_keys
+    cdef vector[double] _bid_index_cum_base
+    cdef vector[double] _bid_index_cum_quote
+    cdef double _bid_index_dirty_key
+    cdef vector[double] _ask_index_keys
+    cdef vector[double] _ask_index_cum_base
+    cdef vector[double] _ask_index_cum_quote
+    cdef double _ask_index_dirty_key
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
     cdef c_apply_trade(self, object trade_event)
+    cdef c_invalidate_depth_index(self)
+    cdef c_update_depth_index(self, bint is_buy)
     cdef c_apply_numpy_diffs(self,
                              np.ndarray[np.float64_t, ndim=2] bids_array,
-                             np.ndarray[np.float64_t, ndim=2] asks_array)
+                             np.ndarray[np.float64_t, ndim=2] asks_array,
+                             int64_t update_id=*)
     cdef c_apply_numpy_snapshot(self,
                                 np.ndarray[np.float64_t, ndim=2] bids_array,
-                                np.ndarray[np.float64_t, ndim=2] asks_array)
+                                np.ndarray[np.float64_t, ndim=2] asks_array,
+                                int64_t update_id=*)
+    cdef int64_t c_numpy_rows_to_entries(self,
+                                         np.ndarray[np.float64_t, ndim=2] rows,
+                                         vector[OrderBookEntry] &entries)
     cdef double c_get_price(self, bint is_buy) except? -1
     cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume)
     cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume)
@@ -37,3 +53,5 @@ cdef class OrderBook(PubSub):
     cdef OrderBookQueryResult c_get_quote_volume_for_price(self, bint is_buy, double price)
     cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume)
     cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount)
+    cdef list c_get_price_for_volumes(self, bint is_buy, object volumes)
+    cdef list c_get_vwap_for_volumes(self, bint is_buy, object volumes)
@@ -18,9 +18,11 @@ from cython.operator cimport(
     address as ref,
     dereference as deref,
     postincrement as inc,
+    predecrement as dec,
 )
+from libc.math cimport INFINITY
 
-from hummingbot.core.data_type.order_book_message import OrderBookMessage
+from hummingbot.core.data_type.order_book_message import NumpyOrderBookMessage, OrderBookMessage
 from hummingbot.core.data_type.order_book_query_result import OrderBookQueryResult
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.data_type.OrderBookEntry cimport truncateOverlapEntries
@@ -36,6 +38,34 @@ ob_logger = None
 NaN = float("nan")
 
 
+cdef inline size_t c_bisect_left(vector[double] &values, double x):
+    cdef:
+        size_t low = 0
+        size_t high = values.size()
+        size_t middle
+    while low < high:
+        middle = (low + high) // 2
+        if values[middle] < x:
+            low = middle + 1
+        else:
+            high = middle
+    return low
+
+
+cdef inline size_t c_bisect_right(vector[double] &values, double x):
+    cdef:
+        size_t low = 0
+        size_t high = values.size()
+        size_t middle
+    while low < high:
+        middle = (low + high) // 2
+        if values[middle] <= x:
+            low = middle + 1
+        else:
+            high = middle
+    return low
+
+
 cdef class OrderBook(PubSub):
     ORDER_BOOK_TRADE_EVENT_TAG = OrderBookEvent.TradeEvent.value
 
@@ -55,6 +85,8 @@ cdef class OrderBook(PubSub):
         self._last_applied_trade = -1000.0
         self._last_trade_price_rest_updated = -1000
         self._dex = dex
+        self._depth_index_enabled = False
+        self._bid_index_dirty_key = self._ask_index_dirty_key = -INFINITY
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
@@ -65,6 +97,8 @@ cdef class OrderBook(PubSub):
             set[OrderBookEntry].iterator result
             OrderBookEntry top_bid
             OrderBookEntry top_ask
+            size_t bid_book_size
+            size_t ask_book_size
 
         # Apply the diffs. Diffs with 0 amounts mean deletion.
         for bid in bids:
@@ -73,15 +107,24 @@ cdef class OrderBook(PubSub):
                 self._bid_book.erase(result)
             if bid.getAmount() > 0:
                 self._bid_book.insert(bid)
+            if self._depth_index_enabled:
+                # Depth index levels above the changed price stay valid.
+                self._bid_index_dirty_key = min(self._bid_index_dirty_key, -bid.getPrice())
         for ask in asks:
             result = self._ask_book.find(ask)
             if result != ask_book_end:
                 self._ask_book.erase(result)
             if ask.getAmount() > 0:
                 self._ask_book.insert(ask)
+            if self._depth_index_enabled:
+                self._ask_index_dirty_key = min(self._ask_index_dirty_key, ask.getPrice())
 
         # If any overlapping entries between the bid and ask books, centralised: newer entries win, dex: see OrderBookEntry.cpp
+        bid_book_size = self._bid_book.size()
+        ask_book_size = self._ask_book.size()
         truncateOverlapEntries(self._bid_book, self._ask_book, self._dex)
+        if bid_book_size != self._bid_book.size() or ask_book_size != self._ask_book.size():
+            self.c_invalidate_depth_index()
 
         # Record the current best prices, for faster c_get_price() calls.
         bid_iterator = self._bid_book.rbegin()
@@ -135,6 +178,64 @@ cdef class OrderBook(PubSub):
 
         # Remember the last snapshot update ID.
         self._snapshot_uid = update_id
+        self.c_invalidate_depth_index()
+
+    cdef c_invalidate_depth_index(self):
+        self._bid_index_dirty_key = self._ask_index_dirty_key = -INFINITY
+
+    cdef c_update_depth_index(self, bint is_buy):
+        """
+        Brings the cumulative depth index of one side up to date. The index keeps, per level, the price key and the
+        cumulative base and quote volumes from the top of the book. Bid keys are negated prices, so both sides are
+        sorted ascending from the top of the book. Only the levels at or below the first changed price are rebuilt.
+        """
+        cdef:
+            vector[double] *keys = ref(self._ask_index_keys) if is_buy else ref(self._bid_index_keys)
+            vector[double] *cum_base = ref(self._ask_index_cum_base) if is_buy else ref(self._bid_index_cum_base)
+            vector[double] *cum_quote = ref(self._ask_index_cum_quote) if is_buy else ref(self._bid_index_cum_quote)
+            double dirty_key = self._ask_index_dirty_key if is_buy else self._bid_index_dirty_key
+            double base_total = 0
+            double quote_total = 0
+            double price
+            double amount
+            size_t valid_levels
+            set[OrderBookEntry].iterator it
+
+        if dirty_key == INFINITY:
+            return
+
+        valid_levels = c_bisect_left(deref(keys), dirty_key)
+        deref(keys).resize(valid_levels)
+        deref(cum_base).resize(valid_levels)
+        deref(cum_quote).resize(valid_levels)
+        if valid_levels > 0:
+            base_total = deref(cum_base)[valid_levels - 1]
+            quote_total = deref(cum_quote)[valid_levels - 1]
+
+        if is_buy:
+            it = self._ask_book.lower_bound(OrderBookEntry(dirty_key, 0, 0))
+            while it != self._ask_book.end():
+                price = deref(it).getPrice()
+                amount = deref(it).getAmount()
+                base_total += amount
+                quote_total += amount * price
+                deref(keys).push_back(price)
+                deref(cum_base).push_back(base_total)
+                deref(cum_quote).push_back(quote_total)
+                inc(it)
+            self._ask_index_dirty_key = INFINITY
+        else:
+            it = self._bid_book.upper_bound(OrderBookEntry(-dirty_key, 0, 0))
+            while it != self._bid_book.begin():
+                dec(it)
+                price = deref(it).getPrice()
+                amount = deref(it).getAmount()
+                base_total += amount
+                quote_total += amount * price
+                deref(keys).push_back(-price)
+                deref(cum_base).push_back(base_total)
+                deref(cum_quote).push_back(quote_total)
+            self._bid_index_dirty_key = INFINITY
 
     cdef c_apply_trade(self, object trade_event):
         self._last_trade_price = trade_event.price
@@ -161,6 +262,25 @@ cdef class OrderBook(PubSub):
     def last_trade_price_rest_updated(self, value: float):
         self._last_trade_price_rest_updated = value
 
+    @property
+    def depth_index_enabled(self) -> bool:
+        return self._depth_index_enabled
+
+    def enable_depth_index(self, enabled: bool = True):
+        """
+        Turns on (or off) the cumulative depth index. While enabled, the depth queries binary-search the index instead
+        of walking the book. The index is rebuilt lazily, on the first query after the book changes.
+        """
+        self._depth_index_enabled = enabled
+        self.c_invalidate_depth_index()
+        if not enabled:
+            self._bid_index_keys.clear()
+            self._bid_index_cum_base.clear()
+            self._bid_index_cum_quote.clear()
+            self._ask_index_keys.clear()
+            self._ask_index_cum_base.clear()
+            self._ask_index_cum_quote.clear()
+
     @property
     def snapshot_uid(self) -> int:
         return self._snapshot_uid
@@ -171,12 +291,50 @@ cdef class OrderBook(PubSub):
 
     @property
     def snapshot(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
-        bids_rows = list(self.bid_entries())
-        asks_rows = list(self.ask_entries())
-        bids_df = pd.DataFrame(data=bids_rows, columns=OrderBookRow._fields, dtype="float64")
-        asks_df = pd.DataFrame(data=asks_rows, columns=OrderBookRow._fields, dtype="float64")
+        return self.get_snapshot()
+
+    def get_snapshot(self, depth: Optional[int] = None) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Same as `snapshot`, but only the top `depth` levels of each side are included.
+        """
+        bids_array, asks_array = self.to_numpy(depth)
+        bids_df = pd.DataFrame(data=bids_array, columns=OrderBookRow._fields, dtype="float64")
+        asks_df = pd.DataFrame(data=asks_array, columns=OrderBookRow._fields, dtype="float64")
         return bids_df, asks_df
 
+    def to_numpy(self, depth: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Exports the top `depth` levels of each side (the whole book if depth is None) as two float64 arrays with 3
+        columns, [price, amount, update_id], best price first.
+        """
+        cdef:
+            size_t bids_count = self._bid_book.size()
+            size_t asks_count = self._ask_book.size()
+            size_t i
+            np.ndarray[np.float64_t, ndim=2] bids_array
+            np.ndarray[np.float64_t, ndim=2] asks_array
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+
+        if depth is not None:
+            bids_count = min(bids_count, max(depth, 0))
+            asks_count = min(asks_count, max(depth, 0))
+        bids_array = np.empty((bids_count, 3), dtype=np.float64)
+        asks_array = np.empty((asks_count, 3), dtype=np.float64)
+
+        for i in range(bids_count):
+            bids_array[i, 0] = deref(bid_it).getPrice()
+            bids_array[i, 1] = deref(bid_it).getAmount()
+            bids_array[i, 2] = deref(bid_it).getUpdateId()
+            inc(bid_it)
+        for i in range(asks_count):
+            asks_array[i, 0] = deref(ask_it).getPrice()
+            asks_array[i, 1] = deref(ask_it).getAmount()
+            asks_array[i, 2] = deref(ask_it).getUpdateId()
+            inc(ask_it)
+
+        return bids_array, asks_array
+
     def apply_diffs(self, bids: List[OrderBookRow], asks: List[OrderBookRow], update_id: int):
         cdef:
             vector[OrderBookEntry] cpp_bids
@@ -208,16 +366,18 @@ cdef class OrderBook(PubSub):
         """
         self.apply_numpy_diffs(bids_df.values, asks_df.values)
 
-    def apply_numpy_diffs(self, bids_array: np.ndarray, asks_array: np.ndarray):
+    def apply_numpy_diffs(self, bids_array: np.ndarray, asks_array: np.ndarray, update_id: Optional[int] = None):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id].
         All columns are of double type.
+        The last update id of the book defaults to the highest update id of the rows.
         """
-        self.c_apply_numpy_diffs(bids_array, asks_array)
+        self.c_apply_numpy_diffs(bids_array, asks_array, -1 if update_id is None else update_id)
 
     cdef c_apply_numpy_diffs(self,
                              np.ndarray[np.float64_t, ndim=2] bids_array,
-                             np.ndarray[np.float64_t, ndim=2] asks_array):
+                             np.ndarray[np.float64_t, ndim=2] asks_array,
+                             int64_t update_id=-1):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id].
         All columns are of double type.
@@ -225,26 +385,23 @@ cdef class OrderBook(PubSub):
         cdef:
             vector[OrderBookEntry] cpp_bids
             vector[OrderBookEntry] cpp_asks
-            int64_t last_update_id = 0
+            int64_t last_update_id = self.c_numpy_rows_to_entries(bids_array, cpp_bids)
 
-        for row in bids_array:
-            cpp_bids.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        for row in asks_array:
-            cpp_asks.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        self.c_apply_diffs(cpp_bids, cpp_asks, last_update_id)
+        last_update_id = max(last_update_id, self.c_numpy_rows_to_entries(asks_array, cpp_asks))
+        self.c_apply_diffs(cpp_bids, cpp_asks, last_update_id if update_id < 0 else update_id)
 
-    def apply_numpy_snapshot(self, bids_array: np.ndarray, asks_array: np.ndarray):
+    def apply_numpy_snapshot(self, bids_array: np.ndarray, asks_array: np.ndarray, update_id: Optional[int] = None):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id].
         All columns are of double type.
+        The snapshot update id of the book defaults to the highest update id of the rows.
         """
-        self.c_apply_numpy_snapshot(bids_array, asks_array)
+        self.c_apply_numpy_snapshot(bids_array, asks_array, -1 if update_id is None else update_id)
 
     cdef c_apply_numpy_snapshot(self,
                                 np.ndarray[np.float64_t, ndim=2] bids_array,
-                                np.ndarray[np.float64_t, ndim=2] asks_array):
+                                np.ndarray[np.float64_t, ndim=2] asks_array,
+                                int64_t update_id=-1):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id].
         All columns are of double type.
@@ -252,15 +409,47 @@ cdef class OrderBook(PubSub):
         cdef:
             vector[OrderBookEntry] cpp_bids
             vector[OrderBookEntry] cpp_asks
+            int64_t last_update_id = self.c_numpy_rows_to_entries(bids_array, cpp_bids)
+
+        last_update_id = max(last_update_id, self.c_numpy_rows_to_entries(asks_array, cpp_asks))
+        self.c_apply_snapshot(cpp_bids, cpp_asks, last_update_id if update_id < 0 else update_id)
+
+    cdef int64_t c_numpy_rows_to_entries(self,
+                                         np.ndarray[np.float64_t, ndim=2] rows,
+                                         vector[OrderBookEntry] &entries):
+        """
+        Appends the [price, amount, update_id] rows to the entries, and returns the highest update id of the rows.
+        """
+        cdef:
+            Py_ssize_t i
+            Py_ssize_t rows_count = rows.shape[0]
+            int64_t row_update_id
             int64_t last_update_id = 0
 
-        for row in bids_array:
-            cpp_bids.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        for row in asks_array:
-            cpp_asks.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        self.c_apply_snapshot(cpp_bids, cpp_asks, last_update_id)
+        entries.reserve(entries.size() + rows_count)
+        for i in range(rows_count):
+            row_update_id = <int64_t>rows[i, 2]
+            entries.push_back(OrderBookEntry(rows[i, 0], rows[i, 1], row_update_id))
+            last_update_id = max(last_update_id, row_update_id)
+        return last_update_id
+
+    def apply_diff_message(self, message: OrderBookMessage):
+        """
+        Applies a diff message, through its price and amount arrays when it is a `NumpyOrderBookMessage`.
+        """
+        if isinstance(message, NumpyOrderBookMessage):
+            self.apply_numpy_diffs(message.bids_array, message.asks_array, message.update_id)
+        else:
+            self.apply_diffs(message.bids, message.asks, message.update_id)
+
+    def apply_snapshot_message(self, message: OrderBookMessage):
+        """
+        Applies a snapshot message, through its price and amount arrays when it is a `NumpyOrderBookMessage`.
+        """
+        if isinstance(message, NumpyOrderBookMessage):
+            self.apply_numpy_snapshot(message.bids_array, message.asks_array, message.update_id)
+        else:
+            self.apply_snapshot(message.bids, message.asks, message.update_id)
 
     def bid_entries(self) -> Iterator[OrderBookRow]:
         cdef:
@@ -322,19 +511,38 @@ cdef class OrderBook(PubSub):
         cdef:
             double cumulative_volume = 0
             double result_price = NaN
-
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                cumulative_volume += order_book_row.amount
+            set[OrderBookEntry].iterator ask_it
+            set[OrderBookEntry].reverse_iterator bid_it
+            vector[double] *keys
+            vector[double] *cum_base
+            size_t level
+
+        if self._depth_index_enabled:
+            self.c_update_depth_index(is_buy)
+            keys = ref(self._ask_index_keys) if is_buy else ref(self._bid_index_keys)
+            cum_base = ref(self._ask_index_cum_base) if is_buy else ref(self._bid_index_cum_base)
+            level = c_bisect_left(deref(cum_base), volume)
+            if level < deref(cum_base).size():
+                result_price = deref(keys)[level] if is_buy else -deref(keys)[level]
+                cumulative_volume = deref(cum_base)[level]
+            elif level > 0:
+                cumulative_volume = deref(cum_base)[level - 1]
+        elif is_buy:
+            ask_it = self._ask_book.begin()
+            while ask_it != self._ask_book.end():
+                cumulative_volume += deref(ask_it).getAmount()
                 if cumulative_volume >= volume:
-                    result_price = order_book_row.price
+                    result_price = deref(ask_it).getPrice()
                     break
+                inc(ask_it)
         else:
-            for order_book_row in self.bid_entries():
-                cumulative_volume += order_book_row.amount
+            bid_it = self._bid_book.rbegin()
+            while bid_it != self._bid_book.rend():
+                cumulative_volume += deref(bid_it).getAmount()
                 if cumulative_volume >= volume:
-                    result_price = order_book_row.price
+                    result_price = deref(bid_it).getPrice()
                     break
+                inc(bid_it)
 
         return OrderBookQueryResult(NaN, volume, result_price, min(cumulative_volume, volume))
 
@@ -343,30 +551,55 @@ cdef class OrderBook(PubSub):
             double total_cost = 0
             double total_volume = 0
             double result_vwap = NaN
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                total_cost += order_book_row.amount * order_book_row.price
-                total_volume += order_book_row.amount
-                if total_volume >= volume:
-                    total_cost -= order_book_row.amount * order_book_row.price
-                    total_volume -= order_book_row.amount
-                    incremental_amount = volume - total_volume
-                    total_cost += incremental_amount * order_book_row.price
-                    total_volume += incremental_amount
+            double price
+            double amount
+            set[OrderBookEntry].iterator ask_it
+            set[OrderBookEntry].reverse_iterator bid_it
+            vector[double] *keys
+            vector[double] *cum_base
+            vector[double] *cum_quote
+            size_t level
+
+        if self._depth_index_enabled:
+            self.c_update_depth_index(is_buy)
+            keys = ref(self._ask_index_keys) if is_buy else ref(self._bid_index_keys)
+            cum_base = ref(self._ask_index_cum_base) if is_buy else ref(self._bid_index_cum_base)
+            cum_quote = ref(self._ask_index_cum_quote) if is_buy else ref(self._bid_index_cum_quote)
+            level = c_bisect_left(deref(cum_base), volume)
+            if level > 0:
+                total_volume = deref(cum_base)[level - 1]
+                total_cost = deref(cum_quote)[level - 1]
+            if level < deref(cum_base).size():
+                price = deref(keys)[level] if is_buy else -deref(keys)[level]
+                total_cost += (volume - total_volume) * price
+                total_volume = volume
+                result_vwap = total_cost / total_volume
+        elif is_buy:
+            ask_it = self._ask_book.begin()
+            while ask_it != self._ask_book.end():
+                price = deref(ask_it).getPrice()
+                amount = deref(ask_it).getAmount()
+                if total_volume + amount >= volume:
+                    total_cost += (volume - total_volume) * price
+                    total_volume = volume
                     result_vwap = total_cost / total_volume
                     break
+                total_cost += amount * price
+                total_volume += amount
+                inc(ask_it)
         else:
-            for order_book_row in self.bid_entries():
-                total_cost += order_book_row.amount * order_book_row.price
-                total_volume += order_book_row.amount
-                if total_volume >= volume:
-                    total_cost -= order_book_row.amount * order_book_row.price
-                    total_volume -= order_book_row.amount
-                    incremental_amount = volume - total_volume
-                    total_cost += incremental_amount * order_book_row.price
-                    total_volume += incremental_amount
+            bid_it = self._bid_book.rbegin()
+            while bid_it != self._bid_book.rend():
+                price = deref(bid_it).getPrice()
+                amount = deref(bid_it).getAmount()
+                if total_volume + amount >= volume:
+                    total_cost += (volume - total_volume) * price
+                    total_volume = volume
                     result_vwap = total_cost / total_volume
                     break
+                total_cost += amount * price
+                total_volume += amount
+                inc(bid_it)
 
         return OrderBookQueryResult(NaN, volume, result_vwap, min(total_volume, volume))
 
@@ -374,19 +607,38 @@ cdef class OrderBook(PubSub):
         cdef:
             double cumulative_volume = 0
             double result_price = NaN
-
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                cumulative_volume += order_book_row.amount * order_book_row.price
+            set[OrderBookEntry].iterator ask_it
+            set[OrderBookEntry].reverse_iterator bid_it
+            vector[double] *keys
+            vector[double] *cum_quote
+            size_t level
+
+        if self._depth_index_enabled:
+            self.c_update_depth_index(is_buy)
+            keys = ref(self._ask_index_keys) if is_buy else ref(self._bid_index_keys)
+            cum_quote = ref(self._ask_index_cum_quote) if is_buy else ref(self._bid_index_cum_quote)
+            level = c_bisect_left(deref(cum_quote), quote_volume)
+            if level < deref(cum_quote).size():
+                result_price = deref(keys)[level] if is_buy else -deref(keys)[level]
+                cumulative_volume = deref(cum_quote)[level]
+            elif level > 0:
+                cumulative_volume = deref(cum_quote)[level - 1]
+        elif is_buy:
+            ask_it = self._ask_book.begin()
+            while ask_it != self._ask_book.end():
+                cumulative_volume += deref(ask_it).getAmount() * deref(ask_it).getPrice()
                 if cumulative_volume >= quote_volume:
-                    result_price = order_book_row.price
+                    result_price = deref(ask_it).getPrice()
                     break
+                inc(ask_it)
         else:
-            for order_book_row in self.bid_entries():
-                cumulative_volume += order_book_row.amount * order_book_row.price
+            bid_it = self._bid_book.rbegin()
+            while bid_it != self._bid_book.rend():
+                cumulative_volume += deref(bid_it).getAmount() * deref(bid_it).getPrice()
                 if cumulative_volume >= quote_volume:
-                    result_price = order_book_row.price
+                    result_price = deref(bid_it).getPrice()
                     break
+                inc(bid_it)
 
         return OrderBookQueryResult(NaN, quote_volume, result_price, min(cumulative_volume, quote_volume))
 
@@ -395,25 +647,47 @@ cdef class OrderBook(PubSub):
             double cumulative_volume = 0
             double cumulative_base_amount = 0
             double row_amount = 0
-
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                row_amount = order_book_row.amount
+            set[OrderBookEntry].iterator ask_it
+            set[OrderBookEntry].reverse_iterator bid_it
+            vector[double] *keys
+            vector[double] *cum_base
+            vector[double] *cum_quote
+            size_t level
+
+        if self._depth_index_enabled:
+            self.c_update_depth_index(is_buy)
+            keys = ref(self._ask_index_keys) if is_buy else ref(self._bid_index_keys)
+            cum_base = ref(self._ask_index_cum_base) if is_buy else ref(self._bid_index_cum_base)
+            cum_quote = ref(self._ask_index_cum_quote) if is_buy else ref(self._bid_index_cum_quote)
+            level = c_bisect_left(deref(cum_base), base_amount)
+            if level > 0:
+                cumulative_base_amount = deref(cum_base)[level - 1]
+                cumulative_volume = deref(cum_quote)[level - 1]
+            if level < deref(cum_base).size():
+                row_amount = base_amount - cumulative_base_amount
+                cumulative_volume += row_amount * (deref(keys)[level] if is_buy else -deref(keys)[level])
+        elif is_buy:
+            ask_it = self._ask_book.begin()
+            while ask_it != self._ask_book.end():
+                row_amount = deref(ask_it).getAmount()
                 if row_amount + cumulative_base_amount >= base_amount:
                     row_amount = base_amount - cumulative_base_amount
                 cumulative_base_amount += row_amount
-                cumulative_volume += row_amount * order_book_row.price
+                cumulative_volume += row_amount * deref(ask_it).getPrice()
                 if cumulative_base_amount >= base_amount:
                     break
+                inc(ask_it)
         else:
-            for order_book_row in self.bid_entries():
-                row_amount = order_book_row.amount
+            bid_it = self._bid_book.rbegin()
+            while bid_it != self._bid_book.rend():
+                row_amount = deref(bid_it).getAmount()
                 if row_amount + cumulative_base_amount >= base_amount:
                     row_amount = base_amount - cumulative_base_amount
                 cumulative_base_amount += row_amount
-                cumulative_volume += row_amount * order_book_row.price
+                cumulative_volume += row_amount * deref(bid_it).getPrice()
                 if cumulative_base_amount >= base_amount:
                     break
+                inc(bid_it)
 
         return OrderBookQueryResult(NaN, base_amount, NaN, cumulative_volume)
 
@@ -421,19 +695,36 @@ cdef class OrderBook(PubSub):
         cdef:
             double cumulative_volume = 0
             double result_price = NaN
-
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                if order_book_row.price > price:
+            set[OrderBookEntry].iterator ask_it
+            set[OrderBookEntry].reverse_iterator bid_it
+            vector[double] *keys
+            vector[double] *cum_base
+            size_t levels
+
+        if self._depth_index_enabled:
+            self.c_update_depth_index(is_buy)
+            keys = ref(self._ask_index_keys) if is_buy else ref(self._bid_index_keys)
+            cum_base = ref(self._ask_index_cum_base) if is_buy else ref(self._bid_index_cum_base)
+            levels = c_bisect_right(deref(keys), price if is_buy else -price)
+            if levels > 0:
+                cumulative_volume = deref(cum_base)[levels - 1]
+                result_price = deref(keys)[levels - 1] if is_buy else -deref(keys)[levels - 1]
+        elif is_buy:
+            ask_it = self._ask_book.begin()
+            while ask_it != self._ask_book.end():
+                if deref(ask_it).getPrice() > price:
                     break
-                cumulative_volume += order_book_row.amount
-                result_price = order_book_row.price
+                cumulative_volume += deref(ask_it).getAmount()
+                result_price = deref(ask_it).getPrice()
+                inc(ask_it)
         else:
-            for order_book_row in self.bid_entries():
-                if order_book_row.price < price:
+            bid_it = self._bid_book.rbegin()
+            while bid_it != self._bid_book.rend():
+                if deref(bid_it).getPrice() < price:
                     break
-                cumulative_volume += order_book_row.amount
-                result_price = order_book_row.price
+                cumulative_volume += deref(bid_it).getAmount()
+                result_price = deref(bid_it).getPrice()
+                inc(bid_it)
 
         return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
 
@@ -441,28 +732,149 @@ cdef class OrderBook(PubSub):
         cdef:
             double cumulative_volume = 0
             double result_price = NaN
-
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                if order_book_row.price > price:
+            set[OrderBookEntry].iterator ask_it
+            set[OrderBookEntry].reverse_iterator bid_it
+            vector[double] *keys
+            vector[double] *cum_quote
+            size_t levels
+
+        if self._depth_index_enabled:
+            self.c_update_depth_index(is_buy)
+            keys = ref(self._ask_index_keys) if is_buy else ref(self._bid_index_keys)
+            cum_quote = ref(self._ask_index_cum_quote) if is_buy else ref(self._bid_index_cum_quote)
+            levels = c_bisect_right(deref(keys), price if is_buy else -price)
+            if levels > 0:
+                cumulative_volume = deref(cum_quote)[levels - 1]
+                result_price = deref(keys)[levels - 1] if is_buy else -deref(keys)[levels - 1]
+        elif is_buy:
+            ask_it = self._ask_book.begin()
+            while ask_it != self._ask_book.end():
+                if deref(ask_it).getPrice() > price:
                     break
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                result_price = order_book_row.price
+                cumulative_volume += deref(ask_it).getAmount() * deref(ask_it).getPrice()
+                result_price = deref(ask_it).getPrice()
+                inc(ask_it)
         else:
-            for order_book_row in self.bid_entries():
-                if order_book_row.price < price:
+            bid_it = self._bid_book.rbegin()
+            while bid_it != self._bid_book.rend():
+                if deref(bid_it).getPrice() < price:
                     break
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                result_price = order_book_row.price
+                cumulative_volume += deref(bid_it).getAmount() * deref(bid_it).getPrice()
+                result_price = deref(bid_it).getPrice()
+                inc(bid_it)
 
         return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
 
+    cdef list c_get_price_for_volumes(self, bint is_buy, object volumes):
+        """
+        Answers several price-for-volume queries with a single walk of the book. Results are returned in the same
+        order as the requested volumes.
+        """
+        cdef:
+            list sorted_indices = sorted(range(len(volumes)), key=volumes.__getitem__)
+            list results = [None] * len(volumes)
+            size_t next_index = 0
+            size_t queries_count = len(volumes)
+            double cumulative_volume = 0
+            double price
+            double volume
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+
+        if self._depth_index_enabled:
+            return [self.c_get_price_for_volume(is_buy, volume) for volume in volumes]
+
+        while next_index < queries_count:
+            if is_buy:
+                if ask_it == self._ask_book.end():
+                    break
+                price = deref(ask_it).getPrice()
+                cumulative_volume += deref(ask_it).getAmount()
+                inc(ask_it)
+            else:
+                if bid_it == self._bid_book.rend():
+                    break
+                price = deref(bid_it).getPrice()
+                cumulative_volume += deref(bid_it).getAmount()
+                inc(bid_it)
+            while next_index < queries_count:
+                volume = volumes[sorted_indices[next_index]]
+                if cumulative_volume < volume:
+                    break
+                results[sorted_indices[next_index]] = OrderBookQueryResult(NaN, volume, price, volume)
+                next_index += 1
+
+        while next_index < queries_count:
+            volume = volumes[sorted_indices[next_index]]
+            results[sorted_indices[next_index]] = OrderBookQueryResult(NaN, volume, NaN, min(cumulative_volume, volume))
+            next_index += 1
+
+        return results
+
+    cdef list c_get_vwap_for_volumes(self, bint is_buy, object volumes):
+        """
+        Answers several VWAP-for-volume queries with a single walk of the book. Results are returned in the same
+        order as the requested volumes.
+        """
+        cdef:
+            list sorted_indices = sorted(range(len(volumes)), key=volumes.__getitem__)
+            list results = [None] * len(volumes)
+            size_t next_index = 0
+            size_t queries_count = len(volumes)
+            double total_cost = 0
+            double total_volume = 0
+            double price
+            double amount
+            double volume
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+
+        if self._depth_index_enabled:
+            return [self.c_get_vwap_for_volume(is_buy, volume) for volume in volumes]
+
+        while next_index < queries_count:
+            if is_buy:
+                if ask_it == self._ask_book.end():
+                    break
+                price = deref(ask_it).getPrice()
+                amount = deref(ask_it).getAmount()
+                inc(ask_it)
+            else:
+                if bid_it == self._bid_book.rend():
+                    break
+                price = deref(bid_it).getPrice()
+                amount = deref(bid_it).getAmount()
+                inc(bid_it)
+            while next_index < queries_count:
+                volume = volumes[sorted_indices[next_index]]
+                if total_volume + amount < volume:
+                    break
+                results[sorted_indices[next_index]] = OrderBookQueryResult(
+                    NaN, volume, (total_cost + (volume - total_volume) * price) / volume, volume
+                )
+                next_index += 1
+            total_cost += amount * price
+            total_volume += amount
+
+        while next_index < queries_count:
+            volume = volumes[sorted_indices[next_index]]
+            results[sorted_indices[next_index]] = OrderBookQueryResult(NaN, volume, NaN, min(total_volume, volume))
+            next_index += 1
+
+        return results
+
     def get_price_for_volume(self, is_buy: bool, volume: float) -> OrderBookQueryResult:
         return self.c_get_price_for_volume(is_buy, volume)
 
     def get_vwap_for_volume(self, is_buy: bool, volume: float) -> OrderBookQueryResult:
         return self.c_get_vwap_for_volume(is_buy, volume)
 
+    def get_price_for_volumes(self, is_buy: bool, volumes: List[float]) -> List[OrderBookQueryResult]:
+        return self.c_get_price_for_volumes(is_buy, [float(volume) for volume in volumes])
+
+    def get_vwap_for_volumes(self, is_buy: bool, volumes: List[float]) -> List[OrderBookQueryResult]:
+        return self.c_get_vwap_for_volumes(is_buy, [float(volume) for volume in volumes])
+
     def get_price_for_quote_volume(self, is_buy: bool, quote_volume: float) -> OrderBookQueryResult:
         return self.c_get_price_for_quote_volume(is_buy, quote_volume)
 
@@ -478,6 +890,6 @@ cdef class OrderBook(PubSub):
     def restore_from_snapshot_and_diffs(self, snapshot: OrderBookMessage, diffs: List[OrderBookMessage]):
         replay_position = bisect.bisect_right(diffs, snapshot)
         replay_diffs = diffs[replay_position:]
-        self.apply_snapshot(snapshot.bids, snapshot.asks, snapshot.update_id)
+        self.apply_snapshot_message(snapshot)
         for diff in replay_diffs:
-            self.apply_diffs(diff.bids, diff.asks, diff.update_id)
+            self.apply_diff_message(diff)
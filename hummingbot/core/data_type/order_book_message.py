@@ -1,7 +1,9 @@
 from collections import namedtuple
 from enum import Enum
-from functools import total_ordering
-from typing import Dict, List, Optional
+from functools import cached_property, total_ordering
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
 
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 
@@ -95,3 +97,44 @@ class OrderBookMessage(namedtuple("_OrderBookMessage", "type, content, timestamp
             )
         )
         return eq
+
+
+class NumpyOrderBookMessage(OrderBookMessage):
+    """
+    Order book message that parses the price and amount columns of its bids and asks only once, into float64 arrays
+    with the [price, amount, update_id] columns expected by `OrderBook.apply_numpy_diffs` and
+    `OrderBook.apply_numpy_snapshot`. The order book and the tracker apply these arrays directly, without building the
+    `OrderBookRow` lists of the `bids` and `asks` properties.
+
+    The bids and asks of the content must be sequences whose first two entries are the price and the amount, as for
+    `OrderBookMessage`. Connectors opt in by creating their diff and snapshot messages with this class.
+    """
+
+    @cached_property
+    def bids_array(self) -> np.ndarray:
+        return self._rows_to_array(self.content["bids"])
+
+    @cached_property
+    def asks_array(self) -> np.ndarray:
+        return self._rows_to_array(self.content["asks"])
+
+    @property
+    def asks(self) -> List[OrderBookRow]:
+        update_id = self.update_id
+        return [OrderBookRow(price, amount, update_id) for price, amount in self.asks_array[:, :2].tolist()]
+
+    @property
+    def bids(self) -> List[OrderBookRow]:
+        update_id = self.update_id
+        return [OrderBookRow(price, amount, update_id) for price, amount in self.bids_array[:, :2].tolist()]
+
+    def _rows_to_array(self, rows: Sequence[Sequence[Any]]) -> np.ndarray:
+        array = np.empty((len(rows), 3), dtype=np.float64)
+        if len(rows) > 0:
+            try:
+                # Fast path, for rows of numbers or numeric strings of the same length
+                array[:, :2] = np.asarray(rows, dtype=np.float64)[:, :2]
+            except (TypeError, ValueError):
+                array[:, :2] = [row[:2] for row in rows]
+            array[:, 2] = self.update_id
+        return array
@@ -7,12 +7,13 @@ from typing import Deque, Dict, List, Optional, Tuple
 
 import pandas as pd
 
+from hummingbot.core.api_throttler.request_priority import RequestPriority, request_priority
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.event.events import OrderBookTradeEvent
-from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.logger import HummingbotLogger
 
 
@@ -23,6 +24,11 @@ class OrderBookTrackerDataSourceType(Enum):
 
 class OrderBookTracker:
     PAST_DIFF_WINDOW_SIZE: int = 32
+    # Snapshot requests are rate limited by the connector's throttler, this only caps the number of pending requests
+    MAX_CONCURRENT_SNAPSHOT_REQUESTS: int = 20
+    # The snapshot request of a trading pair that fails to initialize is retried with an exponential backoff
+    INIT_ORDER_BOOK_INITIAL_RETRY_DELAY: float = 1.0
+    INIT_ORDER_BOOK_MAX_RETRY_DELAY: float = 60.0
     _obt_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -36,6 +42,7 @@ class OrderBookTracker:
         self._data_source: OrderBookTrackerDataSource = data_source
         self._trading_pairs: List[str] = trading_pairs
         self._order_books_initialized: asyncio.Event = asyncio.Event()
+        self._trading_pairs_initialized: Dict[str, asyncio.Event] = defaultdict(asyncio.Event)
         self._tracking_tasks: Dict[str, asyncio.Task] = {}
         self._order_books: Dict[str, OrderBook] = {}
         self._tracking_message_queues: Dict[str, asyncio.Queue] = {}
@@ -68,6 +75,13 @@ class OrderBookTracker:
     def ready(self) -> bool:
         return self._order_books_initialized.is_set()
 
+    @property
+    def ready_trading_pairs(self) -> List[str]:
+        return [trading_pair for trading_pair in self._trading_pairs if self.is_trading_pair_ready(trading_pair)]
+
+    def is_trading_pair_ready(self, trading_pair: str) -> bool:
+        return trading_pair in self._trading_pairs_initialized and self._trading_pairs_initialized[trading_pair].is_set()
+
     @property
     def snapshot(self) -> Dict[str, Tuple[pd.DataFrame, pd.DataFrame]]:
         return {
@@ -138,10 +152,17 @@ class OrderBookTracker:
                 task.cancel()
             self._tracking_tasks.clear()
         self._order_books_initialized.clear()
+        for trading_pair_initialized in self._trading_pairs_initialized.values():
+            trading_pair_initialized.clear()
 
     async def wait_ready(self):
         await self._order_books_initialized.wait()
 
+    async def wait_trading_pair_ready(self, trading_pair: str):
+        if trading_pair not in self._trading_pairs:
+            raise ValueError(f"The order book for {trading_pair} is not being tracked.")
+        await self._trading_pairs_initialized[trading_pair].wait()
+
     async def _update_last_trade_prices_loop(self):
         '''
         Updates last trade price for all order books through REST API, it is to initiate last_trade_price and as
@@ -157,7 +178,8 @@ class OrderBookTracker:
                     args = {"trading_pairs": outdateds}
                     if self._domain is not None:
                         args["domain"] = self._domain
-                    last_prices = await self._data_source.get_last_traded_prices(**args)
+                    with request_priority(RequestPriority.BACKGROUND):
+                        last_prices = await self._data_source.get_last_traded_prices(**args)
                     for trading_pair, last_price in last_prices.items():
                         self._order_books[trading_pair].last_trade_price = last_price
                         self._order_books[trading_pair].last_trade_price_rest_updated = time.perf_counter()
@@ -174,17 +196,44 @@ class OrderBookTracker:
 
     async def _init_order_books(self):
         """
-        Initialize order books
+        Initialize order books. The snapshots are requested concurrently, and each trading pair starts being tracked
+        as soon as its own snapshot arrives. A trading pair failing to initialize is retried without delaying the
+        others, and the tracker is ready once all the trading pairs are initialized.
         """
-        for index, trading_pair in enumerate(self._trading_pairs):
-            self._order_books[trading_pair] = await self._initial_order_book_for_trading_pair(trading_pair)
-            self._tracking_message_queues[trading_pair] = asyncio.Queue()
-            self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
-            self.logger().info(f"Initialized order book for {trading_pair}. "
-                               f"{index + 1}/{len(self._trading_pairs)} completed.")
-            await self._sleep(delay=1)
+        requests_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_SNAPSHOT_REQUESTS)
+        await safe_gather(
+            *[
+                self._init_order_book(trading_pair=trading_pair, requests_semaphore=requests_semaphore)
+                for trading_pair in self._trading_pairs
+            ]
+        )
         self._order_books_initialized.set()
 
+    async def _init_order_book(self, trading_pair: str, requests_semaphore: asyncio.Semaphore):
+        retry_delay = self.INIT_ORDER_BOOK_INITIAL_RETRY_DELAY
+        while True:
+            try:
+                async with requests_semaphore:
+                    order_book = await self._initial_order_book_for_trading_pair(trading_pair)
+                break
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().network(
+                    f"Unexpected error initializing order book for {trading_pair}. Retrying in {retry_delay} seconds.",
+                    exc_info=True,
+                    app_warning_msg=f"Could not initialize the order book for {trading_pair}. Retrying."
+                )
+                await self._sleep(retry_delay)
+                retry_delay = min(retry_delay * 2, self.INIT_ORDER_BOOK_MAX_RETRY_DELAY)
+        self._order_books[trading_pair] = order_book
+        self._tracking_message_queues[trading_pair] = asyncio.Queue()
+        self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
+        self._trading_pairs_initialized[trading_pair].set()
+        initialized_count = sum(1 for pair in self._trading_pairs if self.is_trading_pair_ready(pair))
+        self.logger().info(f"Initialized order book for {trading_pair}. "
+                           f"{initialized_count}/{len(self._trading_pairs)} completed.")
+
     async def _order_book_diff_router(self):
         """
         Routes the real-time order book diff messages to the correct order book.
@@ -272,7 +321,7 @@ class OrderBookTracker:
                     message = await message_queue.get()
 
                 if message.type is OrderBookMessageType.DIFF:
-                    order_book.apply_diffs(message.bids, message.asks, message.update_id)
+                    order_book.apply_diff_message(message)
                     past_diffs_window.append(message)
                     diff_messages_accepted += 1
 
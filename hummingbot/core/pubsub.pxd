@@ -17,11 +17,16 @@ ctypedef pair[int64_t, EventListenersCollection] EventsPair
 cdef class PubSub:
     cdef:
         Events _events
+        dict _listener_arrays
+        bint _dispatch_stats_enabled
+        dict _dispatch_stats
         object __weakref__
 
     cdef c_log_exception(self, int64_t event_tag, object arg)
     cdef c_add_listener(self, int64_t event_tag, EventListener listener)
     cdef c_remove_listener(self, int64_t event_tag, EventListener listener)
     cdef c_remove_dead_listeners(self, int64_t event_tag)
+    cdef tuple c_get_listener_array(self, int64_t event_tag)
     cdef c_get_listeners(self, int64_t event_tag)
     cdef c_trigger_event(self, int64_t event_tag, object arg)
+    cdef c_record_listener_dispatch(self, object event_stats, EventListener listener, double elapsed)
@@ -12,10 +12,12 @@ from cython.operator cimport(
     address
 )
 from libcpp.vector cimport vector
+from dataclasses import dataclass, field
 from enum import Enum
 import logging
 import random
-from typing import List
+import time
+from typing import Dict, List
 
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.event.event_listener import EventListener
@@ -24,6 +26,23 @@ from hummingbot.core.event.event_listener cimport EventListener
 class_logger = None
 
 
+@dataclass
+class ListenerDispatchStats:
+    call_count: int = 0
+    total_time: float = 0.0
+
+
+@dataclass
+class EventDispatchStats:
+    """
+    Number of times an event was triggered and time spent in its listeners, in seconds. The listeners are identified
+    by the qualified name of the function they forward the events to, or of their class.
+    """
+    dispatch_count: int = 0
+    total_time: float = 0.0
+    listeners: Dict[str, ListenerDispatchStats] = field(default_factory=dict)
+
+
 cdef class PubSub:
     """
     PubSub with weak references. This avoids the lapsed listener problem by periodically performing GC on dead
@@ -39,8 +58,17 @@ cdef class PubSub:
        make sense to do the GC every time.
     2. c_remove_listener():
        Every time. This assumes c_remove_listener() is called infrequently.
-    3. c_get_listeners() and c_trigger_event():
-       Every time. Both functions take O(n) already.
+    3. c_get_listeners():
+       Every time. It takes O(n) already.
+    4. c_trigger_event():
+       Only when a dead listener is found while dispatching the event, since it is called very frequently.
+
+    The listeners of each event are dispatched from a tuple of their weak references, which is built on the first
+    dispatch after the listeners changed (copy-on-write). Listeners can then add or remove listeners while an event
+    is dispatched.
+
+    The number of dispatches and the time spent in the listeners of each event can be collected by enabling
+    dispatch_stats_enabled.
     """
 
     ADD_LISTENER_GC_PROBABILITY = 0.005
@@ -52,9 +80,23 @@ cdef class PubSub:
             class_logger = logging.getLogger(__name__)
         return class_logger
 
+    def __cinit__(self):
+        # Initialized in __cinit__ since subclasses (e.g. TimeIterator) do not always call PubSub.__init__
+        self._listener_arrays = {}
+        self._dispatch_stats_enabled = False
+        self._dispatch_stats = {}
+
     def __init__(self):
         self._events = Events()
 
+    @property
+    def dispatch_stats_enabled(self) -> bool:
+        return self._dispatch_stats_enabled
+
+    @dispatch_stats_enabled.setter
+    def dispatch_stats_enabled(self, enabled: bool):
+        self._dispatch_stats_enabled = enabled
+
     def add_listener(self, event_tag: Enum, listener: EventListener):
         self.c_add_listener(event_tag.value, listener)
 
@@ -67,6 +109,15 @@ cdef class PubSub:
     def trigger_event(self, event_tag: Enum, message: any):
         self.c_trigger_event(event_tag.value, message)
 
+    def get_dispatch_stats(self) -> Dict[int, EventDispatchStats]:
+        """
+        Returns the dispatch stats collected since they were enabled or reset, indexed by event tag value.
+        """
+        return dict(self._dispatch_stats)
+
+    def reset_dispatch_stats(self):
+        self._dispatch_stats = {}
+
     cdef c_log_exception(self, int64_t event_tag, object arg):
         self.logger().error(f"Unexpected error while processing event {event_tag}.", exc_info=True)
 
@@ -83,6 +134,7 @@ cdef class PubSub:
         else:
             new_listeners.insert(listener_wrapper)
             self._events.insert(EventsPair(event_tag, new_listeners))
+        self._listener_arrays.pop(event_tag, None)
 
         if random.random() < PubSub.ADD_LISTENER_GC_PROBABILITY:
             self.c_remove_dead_listeners(event_tag)
@@ -100,6 +152,7 @@ cdef class PubSub:
         lit = deref(listeners_ptr).find(listener_wrapper)
         if lit != deref(listeners_ptr).end():
             deref(listeners_ptr).erase(lit)
+            self._listener_arrays.pop(event_tag, None)
         self.c_remove_dead_listeners(event_tag)
 
     cdef c_remove_dead_listeners(self, int64_t event_tag):
@@ -118,48 +171,71 @@ cdef class PubSub:
             if <object>(PyWeakref_GetObject(listener_weakref)) is None:
                 lit_to_remove.push_back(lit)
             inc(lit)
+        if lit_to_remove.size() > 0:
+            self._listener_arrays.pop(event_tag, None)
         for lit in lit_to_remove:
             deref(listeners_ptr).erase(lit)
         if deref(listeners_ptr).size() < 1:
             self._events.erase(it)
 
+    cdef tuple c_get_listener_array(self, int64_t event_tag):
+        cdef:
+            tuple listener_array = self._listener_arrays.get(event_tag)
+            EventsIterator it
+            list listener_weakrefs
+
+        if listener_array is None:
+            it = self._events.find(event_tag)
+            if it == self._events.end():
+                return ()
+            listener_weakrefs = []
+            for pyref in deref(it).second:
+                listener_weakrefs.append(<object>pyref.get())
+            listener_array = tuple(listener_weakrefs)
+            self._listener_arrays[event_tag] = listener_array
+        return listener_array
+
     cdef c_get_listeners(self, int64_t event_tag):
         self.c_remove_dead_listeners(event_tag)
 
         cdef:
-            EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection *listeners_ptr
             object listener_weafref
             EventListener typed_listener
 
-        if it == self._events.end():
-            return []
-
         retval = []
-        listeners_ptr = address(deref(it).second)
-        for pyref in deref(listeners_ptr):
-            listener_weafref = <object>pyref.get()
+        for listener_weafref in self.c_get_listener_array(event_tag):
             typed_listener = <object>PyWeakref_GetObject(listener_weafref)
             retval.append(typed_listener)
         return retval
 
     cdef c_trigger_event(self, int64_t event_tag, object arg):
-        self.c_remove_dead_listeners(event_tag)
-
         cdef:
-            EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection listeners
+            # The listener array is never modified: listeners calling c_add_listener() or c_remove_listener() replace
+            # it, which leaves the current dispatch unaffected.
+            tuple listeners = self.c_get_listener_array(event_tag)
             object listener_weafref
+            object listener
             EventListener typed_listener
-        if it == self._events.end():
-            return
+            bint found_dead_listener = False
+            bint collect_stats = self._dispatch_stats_enabled and len(listeners) > 0
+            object event_stats = None
+            double start_time = 0
 
-        # It is extremely important that this set of listeners is a C++ copy - because listeners are allowed to call
-        # c_remove_listener(), which breaks the iterator if we're using the underlying set.
-        listeners = deref(it).second
-        for pyref in listeners:
-            listener_weafref = <object>pyref.get()
-            typed_listener = <object>PyWeakref_GetObject(listener_weafref)
+        if collect_stats:
+            event_stats = self._dispatch_stats.get(event_tag)
+            if event_stats is None:
+                event_stats = EventDispatchStats()
+                self._dispatch_stats[event_tag] = event_stats
+            event_stats.dispatch_count += 1
+
+        for listener_weafref in listeners:
+            listener = <object>PyWeakref_GetObject(listener_weafref)
+            if listener is None:
+                found_dead_listener = True
+                continue
+            typed_listener = listener
+            if collect_stats:
+                start_time = time.perf_counter()
             try:
                 typed_listener.c_set_event_info(event_tag, self)
                 typed_listener.c_call(arg)
@@ -167,3 +243,19 @@ cdef class PubSub:
                 self.c_log_exception(event_tag, arg)
             finally:
                 typed_listener.c_set_event_info(0, None)
+            if collect_stats:
+                self.c_record_listener_dispatch(event_stats, typed_listener, time.perf_counter() - start_time)
+
+        if found_dead_listener:
+            self.c_remove_dead_listeners(event_tag)
+
+    cdef c_record_listener_dispatch(self, object event_stats, EventListener listener, double elapsed):
+        forwarded_function = getattr(listener, "_to_function", None)
+        listener_name = getattr(forwarded_function, "__qualname__", type(listener).__qualname__)
+        listener_stats = event_stats.listeners.get(listener_name)
+        if listener_stats is None:
+            listener_stats = ListenerDispatchStats()
+            event_stats.listeners[listener_name] = listener_stats
+        listener_stats.call_count += 1
+        listener_stats.total_time += elapsed
+        event_stats.total_time += elapsed
@@ -20,7 +20,7 @@ from hummingbot.core.rate_oracle.sources.hyperliquid_rate_source import Hyperliq
 from hummingbot.core.rate_oracle.sources.kucoin_rate_source import KucoinRateSource
 from hummingbot.core.rate_oracle.sources.rate_source_base import RateSourceBase
 from hummingbot.core.rate_oracle.sources.tegro_rate_source import TegroRateSource
-from hummingbot.core.rate_oracle.utils import find_rate
+from hummingbot.core.rate_oracle.utils import RateConversionGraph, find_rate
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.logger import HummingbotLogger
 
@@ -44,7 +44,9 @@ class RateOracle(NetworkBase):
     """
     RateOracle provides conversion rates for any given pair token symbols in both async and sync fashions.
     It achieves this by query URL on a given source for prices and store them, either in cache or as an object member.
-    The find_rate is then used on these prices to find a rate on a given pair.
+    The find_rate is then used on these prices to find a rate on a given pair. The stored prices are indexed in a
+    conversion graph, which finds the rates of pairs that need one or more conversions without going through all the
+    prices.
     """
     _logger: Optional[HummingbotLogger] = None
     _shared_instance: "RateOracle" = None
@@ -65,6 +67,8 @@ class RateOracle(NetworkBase):
         super().__init__()
         self._source: RateSourceBase = source if source is not None else BinanceRateSource()
         self._prices: Dict[str, Decimal] = {}
+        self._conversion_graph: RateConversionGraph = RateConversionGraph()
+        self._conversion_graph.reset(self._prices)
         self._fetch_price_task: Optional[asyncio.Task] = None
         self._ready_event = asyncio.Event()
         self._quote_token = quote_token if quote_token is not None else "USD"
@@ -106,6 +110,7 @@ class RateOracle(NetworkBase):
         if new_token != self._quote_token:
             self._quote_token = new_token
             self._prices = {}
+            self._conversion_graph.reset(self._prices)
 
     @property
     def prices(self) -> Dict[str, Decimal]:
@@ -165,7 +170,7 @@ class RateOracle(NetworkBase):
         :param pair: A trading pair, e.g. BTC-USDT
         :return A conversion rate
         """
-        return find_rate(self._prices, pair)
+        return self._conversion_graph.find_rate(self._prices, pair)
 
     async def stored_or_live_rate(self, pair: str) -> Decimal:
         """
@@ -198,12 +203,14 @@ class RateOracle(NetworkBase):
         Update keys in self._prices with new prices
         """
         self._prices[pair] = price
+        self._conversion_graph.add_pair(pair)
 
     async def _fetch_price_loop(self):
         while True:
             try:
                 new_prices = await self._source.get_prices(quote_token=self._quote_token)
                 self._prices.update(new_prices)
+                self._conversion_graph.add_pairs(new_prices.keys())
 
                 if self._prices:
                     self._ready_event.set()
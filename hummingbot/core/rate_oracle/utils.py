@@ -1,5 +1,6 @@
+from collections import defaultdict, deque
 from decimal import Decimal
-from typing import Dict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
 from hummingbot.connector.utils import combine_to_hb_trading_pair, split_hb_trading_pair
 from hummingbot.core.gateway.utils import unwrap_token_symbol
@@ -35,3 +36,94 @@ def find_rate(prices: Dict[str, Decimal], pair: str) -> Decimal:
         common_denom_pair = combine_to_hb_trading_pair(base=quote, quote=link_quote)
         if common_denom_pair in prices:
             return proxy_price / prices[common_denom_pair]
+
+
+class RateConversionGraph:
+    '''
+    Index of the tokens linked by the trading pairs of a dictionary of prices, used to find the exchange rate of any
+    pair that has a route of one or more pairs between its tokens, e.g. HBOT-GBP from HBOT-USDT and USDT-GBP.
+    The shortest route between two tokens is cached, and the rate is calculated with the current prices of its pairs,
+    so the cache only changes when pairs are added to the prices.
+    '''
+
+    def __init__(self):
+        self._prices: Optional[Dict[str, Decimal]] = None
+        self._pairs: Set[str] = set()
+        # For each token, the tokens it can be converted to, with the pair of the prices and whether it is inverted
+        self._adjacency: Dict[str, Dict[str, Tuple[str, bool]]] = defaultdict(dict)
+        self._routes: Dict[Tuple[str, str], Optional[List[Tuple[str, bool]]]] = {}
+
+    def add_pair(self, pair: str):
+        if pair in self._pairs:
+            return
+        base, quote = split_hb_trading_pair(trading_pair=pair)
+        self._pairs.add(pair)
+        self._adjacency[base].setdefault(quote, (pair, False))
+        self._adjacency[quote].setdefault(base, (pair, True))
+        # A new pair can shorten the known routes or link tokens that had none
+        self._routes.clear()
+
+    def add_pairs(self, pairs: Iterable[str]):
+        for pair in pairs:
+            self.add_pair(pair)
+
+    def reset(self, prices: Optional[Dict[str, Decimal]] = None):
+        self._prices = prices
+        self._pairs.clear()
+        self._adjacency.clear()
+        self._routes.clear()
+        if prices is not None:
+            self.add_pairs(prices.keys())
+
+    def find_rate(self, prices: Dict[str, Decimal], pair: str) -> Optional[Decimal]:
+        '''
+        Finds the exchange rate of a given trading pair from the prices, through the shortest route of pairs between
+        its tokens. The graph follows the pairs added to the prices dictionary, and is rebuilt if another dictionary
+        is given.
+        :param prices: The dictionary of trading pairs and their prices
+        :param pair: The trading pair
+        '''
+        if pair in prices:
+            return prices[pair]
+        if prices is not self._prices:
+            self.reset(prices)
+        elif len(prices) != len(self._pairs):
+            self.add_pairs(prices.keys())
+        base, quote = split_hb_trading_pair(trading_pair=pair)
+        base = unwrap_token_symbol(base)
+        quote = unwrap_token_symbol(quote)
+        if base == quote:
+            return Decimal("1")
+        if (base, quote) not in self._routes:
+            self._routes[(base, quote)] = self._find_route(base, quote)
+        route = self._routes[(base, quote)]
+        if route is None:
+            return None
+        if any(route_pair not in prices for route_pair, _ in route):
+            # Some pairs were removed from the prices
+            self.reset(prices)
+            return self.find_rate(prices, pair)
+        rate = Decimal("1")
+        for route_pair, inverted in route:
+            rate = rate / prices[route_pair] if inverted else rate * prices[route_pair]
+        return rate
+
+    def _find_route(self, base: str, quote: str) -> Optional[List[Tuple[str, bool]]]:
+        # Breadth first search, to use the route with the fewest conversions
+        previous: Dict[str, Optional[Tuple[str, str, bool]]] = {base: None}
+        frontier = deque([base])
+        while frontier:
+            token = frontier.popleft()
+            for next_token, (pair, inverted) in self._adjacency.get(token, {}).items():
+                if next_token in previous:
+                    continue
+                previous[next_token] = (token, pair, inverted)
+                if next_token == quote:
+                    route = []
+                    while previous[next_token] is not None:
+                        next_token, pair, inverted = previous[next_token]
+                        route.append((pair, inverted))
+                    route.reverse()
+                    return route
+                frontier.append(next_token)
+        return None
@@ -0,0 +1,138 @@
+import csv
+import io
+import logging
+import os
+from datetime import datetime, timezone
+from shutil import move
+from typing import Any, Iterable, Optional, Sequence, TextIO, Tuple
+
+from hummingbot.logger import HummingbotLogger
+
+
+def csv_matches_header(file_path: str, header: Sequence[str]) -> bool:
+    """
+    Checks the header of a CSV file, reading only its first line.
+    """
+    with open(file_path, newline="") as f:
+        first_row = next(csv.reader(f), None)
+    return first_row is not None and tuple(first_row) == tuple(header)
+
+
+class CSVAppender:
+    """
+    Appends rows to a CSV file, keeping the file open between the appends.
+
+    The header of an existing file is validated once, when the file is opened. If it doesn't match, the existing file
+    is moved aside to {name}_old_{timestamp}.csv and a new file is started. The file can also be rotated when it
+    reaches max_file_size bytes, or when the (UTC) day changes, the rotated files being renamed to
+    {name}_{timestamp}.csv. The rows are flushed to the file at the end of each append, so no row is lost if the
+    process stops without closing the appender.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self,
+                 file_path: str,
+                 header: Sequence[str],
+                 max_file_size: Optional[int] = None,
+                 rotate_daily: bool = False):
+        """
+        :param file_path: The path of the CSV file
+        :param header: The column names, written as the first row of the file
+        :param max_file_size: The size in bytes at which the file is rotated. No size rotation if None
+        :param rotate_daily: Whether to rotate the file when the day changes
+        """
+        self._file_path: str = file_path
+        self._header: Tuple[str, ...] = tuple(header)
+        self._max_file_size: Optional[int] = max_file_size
+        self._rotate_daily: bool = rotate_daily
+        self._file: Optional[TextIO] = None
+        self._file_size: int = 0
+        self._file_date: Optional[str] = None
+        self._line_buffer: io.StringIO = io.StringIO()
+        self._line_writer = csv.writer(self._line_buffer, lineterminator="\n")
+
+    @property
+    def file_path(self) -> str:
+        return self._file_path
+
+    @property
+    def header(self) -> Tuple[str, ...]:
+        return self._header
+
+    @property
+    def is_open(self) -> bool:
+        return self._file is not None
+
+    def append(self, row: Iterable[Any]):
+        self.append_rows([row])
+
+    def append_rows(self, rows: Iterable[Iterable[Any]]):
+        for row in rows:
+            if self._file is None:
+                self._open()
+            elif self._needs_rotation():
+                self._rotate()
+            line = self._format_row(row)
+            self._file.write(line)
+            self._file_size += len(line.encode("utf-8"))
+        self.flush()
+
+    def flush(self):
+        if self._file is not None:
+            self._file.flush()
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _open(self):
+        if os.path.exists(self._file_path) and os.path.getsize(self._file_path) > 0:
+            if not csv_matches_header(self._file_path, self._header):
+                move(self._file_path, self._suffixed_path("old_" + self._now().strftime("%Y%m%d-%H%M%S")))
+        self._file = open(self._file_path, mode="a", newline="", encoding="utf-8")
+        self._file_size = os.path.getsize(self._file_path)
+        self._file_date = self._current_date()
+        if self._file_size == 0:
+            line = self._format_row(self._header)
+            self._file.write(line)
+            self._file_size += len(line.encode("utf-8"))
+
+    def _needs_rotation(self) -> bool:
+        return ((self._max_file_size is not None and self._file_size >= self._max_file_size)
+                or (self._rotate_daily and self._current_date() != self._file_date))
+
+    def _rotate(self):
+        self.close()
+        rotated_path = self._suffixed_path(self._now().strftime("%Y%m%d-%H%M%S"))
+        move(self._file_path, rotated_path)
+        self.logger().info(f"Rotated {self._file_path} to {rotated_path}.")
+        self._open()
+
+    def _format_row(self, row: Iterable[Any]) -> str:
+        self._line_buffer.seek(0)
+        self._line_buffer.truncate()
+        self._line_writer.writerow(row)
+        return self._line_buffer.getvalue()
+
+    def _suffixed_path(self, suffix: str) -> str:
+        base_path, extension = os.path.splitext(self._file_path)
+        path = f"{base_path}_{suffix}{extension}"
+        counter = 1
+        while os.path.exists(path):
+            path = f"{base_path}_{suffix}_{counter}{extension}"
+            counter += 1
+        return path
+
+    def _current_date(self) -> str:
+        return self._now().strftime("%Y-%m-%d")
+
+    @staticmethod
+    def _now() -> datetime:
+        return datetime.now(tz=timezone.utc)
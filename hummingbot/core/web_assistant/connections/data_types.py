@@ -7,6 +7,7 @@ import aiohttp
 import ujson
 
 if TYPE_CHECKING:
+    from hummingbot.core.web_assistant.connections.json_codec import JSONCodec
     from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
 
 
@@ -85,8 +86,9 @@ class RESTResponse:
     status: int
     headers: Optional[Mapping[str, str]]
 
-    def __init__(self, aiohttp_response: aiohttp.ClientResponse):
+    def __init__(self, aiohttp_response: aiohttp.ClientResponse, json_codec: Optional["JSONCodec"] = None):
         self._aiohttp_response = aiohttp_response
+        self._json_codec = json_codec
 
     @property
     def url(self) -> str:
@@ -109,7 +111,10 @@ class RESTResponse:
         return headers_
 
     async def json(self) -> Any:
-        json_ = await self._aiohttp_response.json()
+        if self._json_codec is None:
+            json_ = await self._aiohttp_response.json()
+        else:
+            json_ = await self._aiohttp_response.json(loads=self._json_codec.loads)
         return json_
 
     async def text(self) -> str:
@@ -0,0 +1,110 @@
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Type, Union
+
+import ujson
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class JSONCodec(ABC):
+    """Decodes the JSON payloads received by the `web_assistant` connections.
+
+    A codec is selected per `WebAssistantsFactory`, so that the REST responses and WebSocket messages of a connector
+    are decoded with the same library. `loads` must raise `ValueError` (or a subclass of it, like
+    `json.JSONDecodeError`) when the payload is not valid JSON.
+
+    Outgoing payloads are still encoded with the standard library, to keep the request bodies the exchanges sign and
+    receive byte for byte the same whatever the codec.
+
+    The codecs of the faster libraries fall back to the standard library for the payloads their library rejects
+    (e.g. NaN/Infinity), so every codec decodes the same payloads as `json`.
+    """
+    name: str = ""
+
+    @abstractmethod
+    def loads(self, data: Union[str, bytes]) -> Any:
+        ...
+
+
+class StdlibJSONCodec(JSONCodec):
+    name = "json"
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return json.loads(data)
+
+
+class UJSONCodec(JSONCodec):
+    name = "ujson"
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        try:
+            return ujson.loads(data)
+        except (ValueError, OverflowError):
+            return json.loads(data)
+
+
+class ORJSONCodec(JSONCodec):
+    """
+    Available when the optional orjson package is installed (e.g. `pip install hummingbot[orjson]`).
+    Note: orjson decodes the integers beyond 64 bits as floats.
+    """
+    name = "orjson"
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("The orjson JSON codec requires the orjson package to be installed.")
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        try:
+            return orjson.loads(data)
+        except (ValueError, OverflowError):
+            return json.loads(data)
+
+
+# Ordered from the fastest to the slowest decoder
+_CODEC_CLASSES: List[Type[JSONCodec]] = [ORJSONCodec, UJSONCodec, StdlibJSONCodec]
+
+_default_codec: Optional[JSONCodec] = None
+
+
+def available_json_codecs() -> Dict[str, JSONCodec]:
+    """
+    Returns the codecs whose library is installed, indexed by name, from the fastest to the slowest decoder.
+    """
+    codecs = {}
+    for codec_class in _CODEC_CLASSES:
+        try:
+            codecs[codec_class.name] = codec_class()
+        except ImportError:
+            pass
+    return codecs
+
+
+def get_json_codec(name: str) -> JSONCodec:
+    codecs = available_json_codecs()
+    if name not in codecs:
+        raise ValueError(f"The {name} JSON codec is not available. Available codecs: {', '.join(codecs)}.")
+    return codecs[name]
+
+
+def default_json_codec() -> JSONCodec:
+    """
+    Returns the codec used by the connections created without an explicit codec. It is the standard library `json`
+    module unless another codec was selected with `set_default_json_codec`.
+    """
+    global _default_codec
+    if _default_codec is None:
+        _default_codec = StdlibJSONCodec()
+    return _default_codec
+
+
+def set_default_json_codec(name: str):
+    """
+    Selects the codec of the connections created from now on without an explicit codec (e.g. "orjson").
+    """
+    global _default_codec
+    _default_codec = get_json_codec(name)
@@ -1,24 +1,29 @@
 import asyncio
 import time
-from json import JSONDecodeError
 from typing import Any, Dict, Mapping, Optional
 
 import aiohttp
 from aiohttp import WebSocketError, WSCloseCode
 
 from hummingbot.core.web_assistant.connections.data_types import WSRequest, WSResponse
+from hummingbot.core.web_assistant.connections.json_codec import JSONCodec, default_json_codec
 
 
 class WSConnection:
     _MAX_MSG_SIZE = 4 * 1024 * 1024  # default aiohttp: 4 * 1024 * 1024
 
-    def __init__(self, aiohttp_client_session: aiohttp.ClientSession):
+    def __init__(self, aiohttp_client_session: aiohttp.ClientSession, json_codec: Optional[JSONCodec] = None):
         self._client_session = aiohttp_client_session
+        self._json_codec = json_codec or default_json_codec()
         self._connection: Optional[aiohttp.ClientWebSocketResponse] = None
         self._connected = False
         self._message_timeout: Optional[float] = None
         self._last_recv_time = 0
 
+    @property
+    def json_codec(self) -> JSONCodec:
+        return self._json_codec
+
     @property
     def last_recv_time(self) -> float:
         return self._last_recv_time
@@ -141,14 +146,13 @@ class WSConnection:
     async def _send_binary(self, payload: bytes):
         await self._connection.send_bytes(payload)
 
-    @staticmethod
-    def _build_resp(msg: aiohttp.WSMessage) -> WSResponse:
+    def _build_resp(self, msg: aiohttp.WSMessage) -> WSResponse:
         if msg.type == aiohttp.WSMsgType.BINARY:
             data = msg.data
         else:
             try:
-                data = msg.json()
-            except JSONDecodeError:
+                data = msg.json(loads=self._json_codec.loads)
+            except ValueError:
                 data = msg.data
         response = WSResponse(data)
         return response
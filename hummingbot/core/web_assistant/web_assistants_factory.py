@@ -3,6 +3,7 @@ from typing import List, Optional
 from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.connections_factory import ConnectionsFactory
+from hummingbot.core.web_assistant.connections.json_codec import JSONCodec
 from hummingbot.core.web_assistant.rest_assistant import RESTAssistant
 from hummingbot.core.web_assistant.rest_post_processors import RESTPostProcessorBase
 from hummingbot.core.web_assistant.rest_pre_processors import RESTPreProcessorBase
@@ -19,6 +20,9 @@ class WebAssistantsFactory:
     lists. Consult the documentation of the relevant assistant and/or pre-/post-processor class for
     additional information.
 
+    The JSON payloads received by the assistants are decoded with `json_codec`, by default the standard library
+    `json` module (see `json_codec.default_json_codec`).
+
     todo: integrate AsyncThrottler
     """
     def __init__(
@@ -29,8 +33,9 @@ class WebAssistantsFactory:
         ws_pre_processors: Optional[List[WSPreProcessorBase]] = None,
         ws_post_processors: Optional[List[WSPostProcessorBase]] = None,
         auth: Optional[AuthBase] = None,
+        json_codec: Optional[JSONCodec] = None,
     ):
-        self._connections_factory = ConnectionsFactory()
+        self._connections_factory = ConnectionsFactory(json_codec=json_codec)
         self._rest_pre_processors = rest_pre_processors or []
         self._rest_post_processors = rest_post_processors or []
         self._ws_pre_processors = ws_pre_processors or []
@@ -46,6 +51,10 @@ class WebAssistantsFactory:
     def auth(self) -> Optional[AuthBase]:
         return self._auth
 
+    @property
+    def json_codec(self) -> JSONCodec:
+        return self._connections_factory.json_codec
+
     async def get_rest_assistant(self) -> RESTAssistant:
         connection = await self._connections_factory.get_rest_connection()
         assistant = RESTAssistant(
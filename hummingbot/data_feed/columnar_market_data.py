@@ -0,0 +1,307 @@
+import logging
+import os
+import time
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timezone
+from decimal import Decimal
+from os.path import join
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from hummingbot import data_path
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.logger import HummingbotLogger
+
+SNAPSHOTS = "snapshots"
+TRADES = "trades"
+
+SNAPSHOT_COLUMNS = ["timestamp", "mid_price", "best_bid", "best_ask",
+                    "bid_prices", "bid_amounts", "ask_prices", "ask_amounts"]
+TRADE_COLUMNS = ["timestamp", "price", "amount", "trade_type"]
+
+Number = Union[float, Decimal]
+
+
+def default_market_data_path() -> str:
+    return join(data_path(), "market_data")
+
+
+class ColumnarMarketDataWriter:
+    """
+    Appends order book snapshots (mid price, best bid/ask and the top levels of the book) and trades to columnar files,
+    partitioned by connector, trading pair and day:
+        {root_path}/{connector_name}/{trading_pair}/{YYYY-MM-DD}/{snapshots|trades}_{first_ms}_{last_ms}.npz
+
+    The records are buffered in memory and written in batches, when a buffer reaches max_buffered_rows or every
+    flush_interval seconds. The batches are written from a dedicated thread, in order, so that the disk writes do not
+    block the event loop. Each column is stored as a NumPy array, the book levels as 2D arrays of (rows, depth) padded
+    with NaN, so they can be loaded back without any parsing with ColumnarMarketDataReader.
+    Timestamps are in seconds.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self,
+                 root_path: Optional[str] = None,
+                 depth: int = 20,
+                 max_buffered_rows: int = 1000,
+                 flush_interval: float = 300.0):
+        self._root_path: str = root_path or default_market_data_path()
+        self._depth: int = depth
+        self._max_buffered_rows: int = max_buffered_rows
+        self._flush_interval: float = flush_interval
+        self._buffers: Dict[Tuple[str, str, str], List[tuple]] = defaultdict(list)
+        self._last_flush_time: float = self._time()
+        self._write_executor: Optional[ThreadPoolExecutor] = None
+        self._last_write: Optional[Future] = None
+
+    @property
+    def root_path(self) -> str:
+        return self._root_path
+
+    @property
+    def depth(self) -> int:
+        return self._depth
+
+    @property
+    def buffered_rows(self) -> int:
+        return sum(len(rows) for rows in self._buffers.values())
+
+    def append_snapshot(self,
+                        connector_name: str,
+                        trading_pair: str,
+                        timestamp: float,
+                        mid_price: Number,
+                        best_bid: Number,
+                        best_ask: Number,
+                        bids: np.ndarray,
+                        asks: np.ndarray):
+        """
+        :param bids: the bid levels of the book, as returned by OrderBook.to_numpy (price, amount[, update_id])
+        :param asks: the ask levels of the book, as returned by OrderBook.to_numpy (price, amount[, update_id])
+        """
+        bid_prices, bid_amounts = self._levels(bids)
+        ask_prices, ask_amounts = self._levels(asks)
+        self._append(SNAPSHOTS, connector_name, trading_pair, (
+            float(timestamp), float(mid_price), float(best_bid), float(best_ask),
+            bid_prices, bid_amounts, ask_prices, ask_amounts))
+
+    def append_trade(self,
+                     connector_name: str,
+                     trading_pair: str,
+                     timestamp: float,
+                     price: Number,
+                     amount: Number,
+                     trade_type: TradeType):
+        self._append(TRADES, connector_name, trading_pair, (
+            float(timestamp), float(price), float(amount), trade_type.value))
+
+    def flush(self, wait: bool = False):
+        """
+        Hands all the buffered records to the writer thread.
+
+        :param wait: if True, waits until all the records flushed so far are written
+        """
+        buffers = self._buffers
+        self._buffers = defaultdict(list)
+        self._last_flush_time = self._time()
+        if len(buffers) > 0:
+            if self._write_executor is None:
+                self._write_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="columnar-market-data")
+            self._last_write = self._write_executor.submit(self._write_buffers, buffers)
+        if wait and self._last_write is not None:
+            self._last_write.result()
+
+    def close(self):
+        """
+        Writes all the buffered records and stops the writer thread.
+        """
+        self.flush(wait=True)
+        if self._write_executor is not None:
+            self._write_executor.shutdown()
+            self._write_executor = None
+
+    def _write_buffers(self, buffers: Dict[Tuple[str, str, str], List[tuple]]):
+        for (kind, connector_name, trading_pair), rows in buffers.items():
+            try:
+                self._write_rows(kind, connector_name, trading_pair, rows)
+            except Exception:
+                self.logger().error(f"Unexpected error writing {kind} of {connector_name} {trading_pair}.",
+                                    exc_info=True)
+
+    def _append(self, kind: str, connector_name: str, trading_pair: str, row: tuple):
+        rows = self._buffers[(kind, connector_name, trading_pair)]
+        rows.append(row)
+        if len(rows) >= self._max_buffered_rows or self._time() - self._last_flush_time >= self._flush_interval:
+            self.flush()
+
+    def _levels(self, levels: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        prices = np.full(self._depth, np.nan)
+        amounts = np.full(self._depth, np.nan)
+        levels = np.asarray(levels, dtype=np.float64)
+        if levels.size > 0:
+            count = min(len(levels), self._depth)
+            prices[:count] = levels[:count, 0]
+            amounts[:count] = levels[:count, 1]
+        return prices, amounts
+
+    def _write_rows(self, kind: str, connector_name: str, trading_pair: str, rows: List[tuple]):
+        columns_names = SNAPSHOT_COLUMNS if kind == SNAPSHOTS else TRADE_COLUMNS
+        timestamps = np.array([row[0] for row in rows], dtype=np.float64)
+        dates = np.array([self._partition_date(ts) for ts in timestamps])
+        for date in np.unique(dates):
+            partition_rows = [row for row, row_date in zip(rows, dates) if row_date == date]
+            columns = {}
+            for i, column_name in enumerate(columns_names):
+                values = [row[i] for row in partition_rows]
+                columns[column_name] = np.stack(values) if isinstance(values[0], np.ndarray) else np.array(values)
+            partition_path = join(self._root_path, connector_name, trading_pair, date)
+            os.makedirs(partition_path, exist_ok=True)
+            file_name = f"{kind}_{int(columns['timestamp'].min() * 1e3)}_{int(columns['timestamp'].max() * 1e3)}"
+            file_path = self._unique_file_path(partition_path, file_name)
+            # Written to a temporary file first, so readers never see a partially written file
+            tmp_file_path = f"{file_path}.tmp"
+            with open(tmp_file_path, "wb") as f:
+                np.savez(f, **columns)
+            os.replace(tmp_file_path, file_path)
+
+    @staticmethod
+    def _unique_file_path(partition_path: str, file_name: str) -> str:
+        file_path = join(partition_path, f"{file_name}.npz")
+        suffix = 1
+        while os.path.exists(file_path):
+            file_path = join(partition_path, f"{file_name}_{suffix}.npz")
+            suffix += 1
+        return file_path
+
+    @staticmethod
+    def _partition_date(timestamp: float) -> str:
+        return datetime.fromtimestamp(timestamp, tz=timezone.utc).strftime("%Y-%m-%d")
+
+    @staticmethod
+    def _time() -> float:
+        return time.time()
+
+
+class ColumnarMarketDataReader:
+    """
+    Loads the market data written by ColumnarMarketDataWriter. Only the partitions and files overlapping the requested
+    time range are read, and the columns are returned as NumPy arrays sorted by timestamp.
+    """
+
+    def __init__(self, root_path: Optional[str] = None):
+        self._root_path: str = root_path or default_market_data_path()
+
+    @property
+    def root_path(self) -> str:
+        return self._root_path
+
+    def get_markets(self) -> List[Tuple[str, str]]:
+        """
+        :return: the (connector_name, trading_pair) pairs with recorded market data
+        """
+        markets = []
+        if os.path.isdir(self._root_path):
+            for connector_name in sorted(os.listdir(self._root_path)):
+                connector_path = join(self._root_path, connector_name)
+                if os.path.isdir(connector_path):
+                    markets.extend((connector_name, trading_pair) for trading_pair in sorted(os.listdir(connector_path))
+                                   if os.path.isdir(join(connector_path, trading_pair)))
+        return markets
+
+    def load_snapshots(self,
+                       connector_name: str,
+                       trading_pair: str,
+                       start_time: Optional[float] = None,
+                       end_time: Optional[float] = None) -> Dict[str, np.ndarray]:
+        return self._load(SNAPSHOTS, SNAPSHOT_COLUMNS, connector_name, trading_pair, start_time, end_time)
+
+    def load_trades(self,
+                    connector_name: str,
+                    trading_pair: str,
+                    start_time: Optional[float] = None,
+                    end_time: Optional[float] = None) -> Dict[str, np.ndarray]:
+        return self._load(TRADES, TRADE_COLUMNS, connector_name, trading_pair, start_time, end_time)
+
+    def load_snapshots_df(self,
+                          connector_name: str,
+                          trading_pair: str,
+                          start_time: Optional[float] = None,
+                          end_time: Optional[float] = None) -> pd.DataFrame:
+        """
+        :return: a dataframe with the timestamp, mid_price, best_bid and best_ask, and one column per level of the
+            book (bid_price_0, bid_amount_0, ..., ask_price_0, ask_amount_0, ...)
+        """
+        columns = self.load_snapshots(connector_name, trading_pair, start_time, end_time)
+        df_columns = {name: columns[name] for name in ["timestamp", "mid_price", "best_bid", "best_ask"]}
+        for side in ["bid", "ask"]:
+            prices = columns[f"{side}_prices"]
+            amounts = columns[f"{side}_amounts"]
+            for level in range(prices.shape[1]):
+                df_columns[f"{side}_price_{level}"] = prices[:, level]
+                df_columns[f"{side}_amount_{level}"] = amounts[:, level]
+        return pd.DataFrame(df_columns)
+
+    def load_trades_df(self,
+                       connector_name: str,
+                       trading_pair: str,
+                       start_time: Optional[float] = None,
+                       end_time: Optional[float] = None) -> pd.DataFrame:
+        return pd.DataFrame(self.load_trades(connector_name, trading_pair, start_time, end_time))
+
+    def _load(self,
+              kind: str,
+              columns_names: List[str],
+              connector_name: str,
+              trading_pair: str,
+              start_time: Optional[float],
+              end_time: Optional[float]) -> Dict[str, np.ndarray]:
+        start_ms = -np.inf if start_time is None else start_time * 1e3
+        end_ms = np.inf if end_time is None else end_time * 1e3
+        chunks: Dict[str, List[np.ndarray]] = {name: [] for name in columns_names}
+        for file_path in self._files_in_range(kind, connector_name, trading_pair, start_ms, end_ms):
+            with np.load(file_path) as data:
+                timestamps = data["timestamp"]
+                mask = (timestamps * 1e3 >= start_ms) & (timestamps * 1e3 <= end_ms)
+                for name in columns_names:
+                    chunks[name].append(data[name][mask])
+        if len(chunks["timestamp"]) == 0:
+            return self._empty_columns(kind)
+        columns = {name: np.concatenate(values) for name, values in chunks.items()}
+        order = np.argsort(columns["timestamp"], kind="stable")
+        return {name: values[order] for name, values in columns.items()}
+
+    def _files_in_range(self, kind: str, connector_name: str, trading_pair: str, start_ms: float, end_ms: float):
+        market_path = join(self._root_path, connector_name, trading_pair)
+        if not os.path.isdir(market_path):
+            return
+        start_date = "" if start_ms == -np.inf else ColumnarMarketDataWriter._partition_date(start_ms / 1e3)
+        end_date = "9999-12-31" if end_ms == np.inf else ColumnarMarketDataWriter._partition_date(end_ms / 1e3)
+        for date in sorted(os.listdir(market_path)):
+            if not start_date <= date <= end_date:
+                continue
+            partition_path = join(market_path, date)
+            for file_name in sorted(os.listdir(partition_path)):
+                if not (file_name.startswith(f"{kind}_") and file_name.endswith(".npz")):
+                    continue
+                first_ms, last_ms = (int(value) for value in file_name[len(kind) + 1:-len(".npz")].split("_")[:2])
+                # The timestamps in the file names are truncated to milliseconds
+                if last_ms + 1 > start_ms and first_ms <= end_ms:
+                    yield join(partition_path, file_name)
+
+    @staticmethod
+    def _empty_columns(kind: str) -> Dict[str, np.ndarray]:
+        if kind == SNAPSHOTS:
+            columns = {name: np.array([], dtype=np.float64) for name in SNAPSHOT_COLUMNS[:4]}
+            columns.update({name: np.empty((0, 0)) for name in SNAPSHOT_COLUMNS[4:]})
+        else:
+            columns = {name: np.array([], dtype=np.float64) for name in TRADE_COLUMNS}
+        return columns
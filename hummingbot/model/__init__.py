@@ -4,6 +4,7 @@ HummingbotBase = declarative_base()
 
 
 def get_declarative_base():
+    from .market_order_state import MarketOrderState  # noqa: F401
     from .market_state import MarketState  # noqa: F401
     from .metadata import Metadata  # noqa: F401
     from .order import Order  # noqa: F401
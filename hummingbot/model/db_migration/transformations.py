@@ -2,6 +2,7 @@ from sqlalchemy import Column, Integer, Text
 
 from hummingbot.model.db_migration.base_transformation import DatabaseTransformation
 from hummingbot.model.decimal_type_decorator import SqliteDecimal
+from hummingbot.model.market_order_state import MarketOrderState
 from hummingbot.model.sql_connection_manager import SQLConnectionManager
 
 
@@ -149,3 +150,20 @@ class AddTradeFeeInQuote(DatabaseTransformation):
     @property
     def to_version(self):
         return 20230516
+
+
+class AddMarketOrderStateTable(DatabaseTransformation):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+    def apply(self, db_handle: SQLConnectionManager) -> SQLConnectionManager:
+        MarketOrderState.__table__.create(db_handle.engine, checkfirst=True)
+        return db_handle
+
+    @property
+    def name(self):
+        return "AddMarketOrderStateTable"
+
+    @property
+    def to_version(self):
+        return 20261016
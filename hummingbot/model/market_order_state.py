@@ -0,0 +1,27 @@
+#!/usr/bin/env python
+
+from sqlalchemy import JSON, BigInteger, Column, Index, Integer, Text
+
+from . import HummingbotBase
+
+
+class MarketOrderState(HummingbotBase):
+    """
+    Saved tracking state of a single entry (usually an in-flight order) of a market. Storing each entry in its own row
+    allows checkpointing only the entries that changed, instead of rewriting the whole MarketState.
+    """
+    __tablename__ = "MarketOrderState"
+    __table_args__ = (Index("mos_config_market_key_index",
+                            "config_file_path", "market", "state_key", unique=True),)
+
+    id = Column(Integer, primary_key=True, nullable=False)
+    config_file_path = Column(Text, nullable=False)
+    market = Column(Text, nullable=False)
+    state_key = Column(Text, nullable=False)
+    timestamp = Column(BigInteger, nullable=False)
+    saved_state = Column(JSON, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"MarketOrderState(id='{self.id}', config_file_path='{self.config_file_path}', " \
+            f"market='{self.market}', state_key='{self.state_key}', timestamp={self.timestamp}, " \
+            f"saved_state={self.saved_state})"
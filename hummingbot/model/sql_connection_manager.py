@@ -27,7 +27,7 @@ class SQLConnectionManager(TransactionBase):
     _scm_trade_fills_instance: Optional["SQLConnectionManager"] = None
 
     LOCAL_DB_VERSION_KEY = "local_db_version"
-    LOCAL_DB_VERSION_VALUE = "20230516"
+    LOCAL_DB_VERSION_VALUE = "20261016"
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -119,14 +119,16 @@ class SQLConnectionManager(TransactionBase):
                                                                 value=self.LOCAL_DB_VERSION_VALUE)
                     session.add(version_info)
                     session.commit()
-                else:
-                    # There's no past db version to upgrade from at this moment. So we'll just update the version value
-                    # if needed.
-                    if local_db_version.value < self.LOCAL_DB_VERSION_VALUE:
-                        was_migration_successful = Migrator().migrate_db_to_version(
-                            client_config_map, self, int(local_db_version.value), int(self.LOCAL_DB_VERSION_VALUE)
-                        )
-                        if was_migration_successful:
-                            # Cannot use variable local_db_version because reference is not valid
-                            # since Migrator changed it
-                            self.get_local_db_version(session=session).value = self.LOCAL_DB_VERSION_VALUE
+                    return
+                local_db_version_value = local_db_version.value
+
+        # The Migrator replaces the database file, so the version is read and updated in separate sessions that are
+        # not holding a connection to the original file during the migration.
+        if local_db_version_value < self.LOCAL_DB_VERSION_VALUE:
+            was_migration_successful = Migrator().migrate_db_to_version(
+                client_config_map, self, int(local_db_version_value), int(self.LOCAL_DB_VERSION_VALUE)
+            )
+            if was_migration_successful:
+                with self.get_new_session() as session:
+                    with session.begin():
+                        self.get_local_db_version(session=session).value = self.LOCAL_DB_VERSION_VALUE
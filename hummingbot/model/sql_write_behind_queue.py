@@ -0,0 +1,152 @@
+import logging
+import queue
+import threading
+import time
+from typing import Callable, Hashable, List, Optional, Tuple, Union
+
+from sqlalchemy.orm import Session
+
+from hummingbot.logger import HummingbotLogger
+from hummingbot.model.transaction_base import TransactionBase
+
+WriteOperation = Callable[[Session], None]
+QueueItem = Union[Tuple[WriteOperation, Optional[Hashable]], threading.Event, None]
+
+
+class SQLWriteBehindQueue:
+    """
+    Applies database write operations from a dedicated writer thread, in the order they were queued.
+
+    The operations waiting in the queue are applied in batches, each batch in a single transaction. Operations queued
+    with a coalesce key replace the previous operation with the same key in the batch (e.g. only the last snapshot of a
+    state is written). When the queue is full, put blocks the caller until the writer catches up.
+    While the writer thread is not running, operations are applied immediately in the calling thread.
+    """
+    _logger: Optional[HummingbotLogger] = None
+
+    QUEUE_FULL_WARNING_INTERVAL = 10.0
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self, sql: TransactionBase, max_queue_size: int = 10000, max_batch_size: int = 500):
+        self._sql_manager: TransactionBase = sql
+        self._max_batch_size: int = max_batch_size
+        self._queue: "queue.Queue[QueueItem]" = queue.Queue(maxsize=max_queue_size)
+        self._writer_thread: Optional[threading.Thread] = None
+        self._last_queue_full_warning_ts: float = 0
+
+    @property
+    def is_running(self) -> bool:
+        return self._writer_thread is not None and self._writer_thread.is_alive()
+
+    @property
+    def pending_operations(self) -> int:
+        return self._queue.qsize()
+
+    def start(self):
+        if not self.is_running:
+            self._writer_thread = threading.Thread(target=self._writer_loop, name="sql-write-behind", daemon=True)
+            self._writer_thread.start()
+
+    def stop(self, timeout: Optional[float] = None):
+        """
+        Stops the writer thread once all the queued operations are written.
+        """
+        if self.is_running:
+            self._put(None)
+            self._writer_thread.join(timeout)
+        self._writer_thread = None
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Waits until all the operations queued before the call are written.
+
+        :return: False if the operations were not written before the timeout
+        """
+        if not self.is_running or threading.current_thread() is self._writer_thread:
+            return True
+        flushed = threading.Event()
+        if timeout is None:
+            self._put(flushed)
+        else:
+            deadline = time.monotonic() + timeout
+            try:
+                self._queue.put(flushed, timeout=timeout)
+            except queue.Full:
+                return False
+            timeout = max(deadline - time.monotonic(), 0)
+        return flushed.wait(timeout)
+
+    def put(self, operation: WriteOperation, coalesce_key: Optional[Hashable] = None):
+        """
+        Queues a write operation, that receives the session of the transaction where it is applied.
+        """
+        if self.is_running:
+            self._put((operation, coalesce_key))
+        else:
+            self._write_batch([operation])
+
+    def _put(self, item: QueueItem):
+        while True:
+            try:
+                self._queue.put(item, timeout=self.QUEUE_FULL_WARNING_INTERVAL)
+                return
+            except queue.Full:
+                now = time.time()
+                if now - self._last_queue_full_warning_ts >= self.QUEUE_FULL_WARNING_INTERVAL:
+                    self.logger().warning("The database write queue is full. Waiting for pending writes...")
+                    self._last_queue_full_warning_ts = now
+
+    def _writer_loop(self):
+        stopped = False
+        while not stopped:
+            items = [self._queue.get()]
+            while len(items) < self._max_batch_size:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            operations: List[WriteOperation] = []
+            coalesced_positions = {}
+            flush_events = []
+            for item in items:
+                if item is None:
+                    stopped = True
+                elif isinstance(item, threading.Event):
+                    flush_events.append(item)
+                else:
+                    operation, coalesce_key = item
+                    if coalesce_key is not None and coalesce_key in coalesced_positions:
+                        operations[coalesced_positions[coalesce_key]] = None
+                    if coalesce_key is not None:
+                        coalesced_positions[coalesce_key] = len(operations)
+                    operations.append(operation)
+            self._write_batch([operation for operation in operations if operation is not None])
+            for flush_event in flush_events:
+                flush_event.set()
+
+    def _write_batch(self, operations: List[WriteOperation]):
+        if len(operations) == 0:
+            return
+        try:
+            self._write(operations)
+        except Exception:
+            if len(operations) == 1:
+                self.logger().error("Unexpected error writing to the database.", exc_info=True)
+                return
+            # Retry the operations one by one so a failing operation doesn't discard the rest of the batch
+            for operation in operations:
+                try:
+                    self._write([operation])
+                except Exception:
+                    self.logger().error("Unexpected error writing to the database.", exc_info=True)
+
+    def _write(self, operations: List[WriteOperation]):
+        with self._sql_manager.get_new_session() as session:
+            with session.begin():
+                for operation in operations:
+                    operation(session)
@@ -73,6 +73,16 @@ class StrategyV2ConfigBase(BaseClientModel):
             prompt=lambda mi: "Enter the config update interval in seconds (e.g. 60): ",
         )
     )
+    use_shared_executors_scheduler: bool = Field(
+        default=False,
+        client_data=ClientFieldData(
+            prompt_on_new=False,
+            prompt=lambda mi: (
+                "Update all the executors from a single scheduler task instead of one task per executor "
+                "(True/False)? "
+            ),
+        )
+    )
 
     @validator("controllers_config", pre=True, always=True)
     def parse_controllers_config(cls, v):
@@ -194,7 +204,8 @@ class StrategyV2Base(ScriptStrategyBase):
         super().__init__(connectors, config)
         # Initialize the executor orchestrator
         self.config = config
-        self.executor_orchestrator = ExecutorOrchestrator(strategy=self)
+        self.executor_orchestrator = ExecutorOrchestrator(
+            strategy=self, use_shared_scheduler=config is not None and config.use_shared_executors_scheduler)
 
         self.executors_info: Dict[str, List[ExecutorInfo]] = {}
         self.positions_held: Dict[str, List] = {}
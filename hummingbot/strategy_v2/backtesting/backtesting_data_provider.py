@@ -1,7 +1,8 @@
 import logging
 from decimal import Decimal
-from typing import Dict
+from typing import Dict, Optional
 
+import numpy as np
 import pandas as pd
 
 from hummingbot.client.config.client_config_map import ClientConfigMap
@@ -12,6 +13,7 @@ from hummingbot.core.data_type.common import PriceType
 from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
 from hummingbot.data_feed.candles_feed.candles_factory import CandlesFactory
 from hummingbot.data_feed.candles_feed.data_types import CandlesConfig, HistoricalCandlesConfig
+from hummingbot.data_feed.columnar_market_data import ColumnarMarketDataReader
 from hummingbot.data_feed.market_data_provider import MarketDataProvider
 
 # Set up logging
@@ -33,16 +35,31 @@ class BacktestingDataProvider(MarketDataProvider):
         self.prices = {}
         self._time = None
         self.trading_rules = {}
-        self.conn_settings = AllConnectorSettings.get_connector_settings()
-        self.connectors = {name: self.get_connector(name) for name, settings in self.conn_settings.items()
-                           if settings.type in self.CONNECTOR_TYPES and name not in self.EXCLUDED_CONNECTORS and
-                           "testnet" not in name}
+        # The connectors are created on first use by get_connector, and then reused
+        self.connectors = dict(connectors)
+        # Order book snapshots recorded with the columnar market data storage, by connector and trading pair
+        self.recorded_market_data: Dict[str, Dict[str, np.ndarray]] = {}
+
+    def is_supported_connector(self, connector_name: str) -> bool:
+        conn_setting = self.conn_settings.get(connector_name)
+        return (conn_setting is not None and conn_setting.type in self.CONNECTOR_TYPES
+                and connector_name not in self.EXCLUDED_CONNECTORS and "testnet" not in connector_name)
 
     def get_connector(self, connector_name: str):
+        connector = self.connectors.get(connector_name)
+        if connector is None:
+            connector = self.create_connector(connector_name)
+            self.connectors[connector_name] = connector
+        return connector
+
+    def create_connector(self, connector_name: str) -> ConnectorBase:
         conn_setting = self.conn_settings.get(connector_name)
         if conn_setting is None:
             logger.error(f"Connector {connector_name} not found")
             raise ValueError(f"Connector {connector_name} not found")
+        if not self.is_supported_connector(connector_name):
+            logger.error(f"Connector {connector_name} is not supported for backtesting")
+            raise ValueError(f"Connector {connector_name} is not supported for backtesting")
 
         client_config_map = ClientConfigAdapter(ClientConfigMap())
         init_params = conn_setting.conn_init_parameters(
@@ -73,7 +90,7 @@ class BacktestingDataProvider(MarketDataProvider):
 
     async def initialize_trading_rules(self, connector_name: str):
         if len(self.trading_rules.get(connector_name, {})) == 0:
-            connector = self.connectors.get(connector_name)
+            connector = self.get_connector(connector_name)
             await connector._update_trading_rules()
             self.trading_rules[connector_name] = connector.trading_rules
 
@@ -113,6 +130,21 @@ class BacktestingDataProvider(MarketDataProvider):
         self.candles_feeds[key] = candles_df
         return candles_df
 
+    def load_recorded_market_data(self, connector_name: str, trading_pair: str,
+                                  reader: Optional[ColumnarMarketDataReader] = None) -> Dict[str, np.ndarray]:
+        """
+        Loads the order book snapshots recorded by the MarketsRecorder (columnar market data storage) in the
+        backtesting time range. Once loaded, get_price_by_type returns the recorded prices at the backtesting time.
+        :param connector_name: str
+        :param trading_pair: str
+        :param reader: ColumnarMarketDataReader, defaults to one reading from data/market_data
+        :return: The recorded snapshots columns.
+        """
+        reader = reader or ColumnarMarketDataReader()
+        snapshots = reader.load_snapshots(connector_name, trading_pair, self.start_time, self.end_time)
+        self.recorded_market_data[f"{connector_name}_{trading_pair}"] = snapshots
+        return snapshots
+
     def get_candles_df(self, connector_name: str, trading_pair: str, interval: str, max_records: int = 500):
         """
         Retrieves the candles for a trading pair from the specified connector.
@@ -133,7 +165,14 @@ class BacktestingDataProvider(MarketDataProvider):
         :param price_type: PriceType
         :return: Price.
         """
-        return self.prices.get(f"{connector_name}_{trading_pair}", Decimal("1"))
+        key = f"{connector_name}_{trading_pair}"
+        snapshots = self.recorded_market_data.get(key)
+        if snapshots is not None and self._time is not None:
+            index = np.searchsorted(snapshots["timestamp"], self._time, side="right") - 1
+            if index >= 0:
+                column = {PriceType.BestBid: "best_bid", PriceType.BestAsk: "best_ask"}.get(price_type, "mid_price")
+                return Decimal(str(snapshots[column][index]))
+        return self.prices.get(key, Decimal("1"))
 
     def quantize_order_amount(self, connector_name: str, trading_pair: str, amount: Decimal):
         """
@@ -1,8 +1,12 @@
+import asyncio
 import importlib
 import inspect
+import itertools
 import os
+from concurrent.futures import ProcessPoolExecutor
 from decimal import Decimal
-from typing import Dict, List, Optional, Union
+from functools import partial
+from typing import Any, Dict, List, Optional, Type, Union
 
 import numpy as np
 import pandas as pd
@@ -28,6 +32,25 @@ from hummingbot.strategy_v2.models.executor_actions import CreateExecutorAction,
 from hummingbot.strategy_v2.models.executors import CloseType
 from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
 
+# Engine used by each process of a parameter sweep, created once per process by _initialize_sweep_worker
+_sweep_worker_engine: Optional["BacktestingEngineBase"] = None
+
+
+def _initialize_sweep_worker(engine_class: Type["BacktestingEngineBase"], start: int, end: int,
+                             candles_feeds: Dict[str, pd.DataFrame], trading_rules: Dict):
+    global _sweep_worker_engine
+    _sweep_worker_engine = engine_class()
+    _sweep_worker_engine.backtesting_data_provider.update_backtesting_time(start, end)
+    _sweep_worker_engine.backtesting_data_provider.candles_feeds = candles_feeds
+    _sweep_worker_engine.backtesting_data_provider.trading_rules = trading_rules
+
+
+def _run_sweep_backtesting(controller_config: ControllerConfigBase, backtesting_resolution: str,
+                           trade_cost: float) -> Dict:
+    backtesting_result = asyncio.run(_sweep_worker_engine.run_backtesting_with_loaded_data(
+        controller_config, backtesting_resolution, trade_cost))
+    return {"executors": backtesting_result["executors"], "results": backtesting_result["results"]}
+
 
 class BacktestingEngineBase:
     def __init__(self):
@@ -77,15 +100,46 @@ class BacktestingEngineBase:
 
         return config_class(**config_data)
 
+    @staticmethod
+    def get_controller_configs_grid(base_config: ControllerConfigBase,
+                                    parameters_grid: Dict[str, List[Any]]) -> List[ControllerConfigBase]:
+        """
+        Creates a controller config for every combination of the parameter values, to be used in a parameter sweep.
+
+        Args:
+            base_config (ControllerConfigBase): The config used for the parameters that are not in the grid.
+            parameters_grid (Dict[str, List[Any]]): The values of each parameter.
+
+        Returns:
+            List[ControllerConfigBase]: The configs, identified by the base config id and the combination number.
+        """
+        parameter_names = list(parameters_grid.keys())
+        base_config_data = base_config.dict()
+        configs = []
+        for i, values in enumerate(itertools.product(*parameters_grid.values())):
+            config_data = {**base_config_data, **dict(zip(parameter_names, values)), "id": f"{base_config.id}_{i}"}
+            configs.append(type(base_config)(**config_data))
+        return configs
+
     async def run_backtesting(self,
                               controller_config: ControllerConfigBase,
                               start: int, end: int,
                               backtesting_resolution: str = "1m",
                               trade_cost=0.0006):
         # Load historical candles
-        controller_class = controller_config.get_controller_class()
         self.backtesting_data_provider.update_backtesting_time(start, end)
         await self.backtesting_data_provider.initialize_trading_rules(controller_config.connector_name)
+        return await self.run_backtesting_with_loaded_data(controller_config, backtesting_resolution, trade_cost)
+
+    async def run_backtesting_with_loaded_data(self,
+                                               controller_config: ControllerConfigBase,
+                                               backtesting_resolution: str = "1m",
+                                               trade_cost=0.0006):
+        """
+        Runs the backtesting once the backtesting time and the trading rules are set in the data provider. The candles
+        already loaded in the data provider are reused.
+        """
+        controller_class = controller_config.get_controller_class()
         self.controller = controller_class(config=controller_config, market_data_provider=self.backtesting_data_provider,
                                            actions_queue=None)
         self.backtesting_resolution = backtesting_resolution
@@ -99,19 +153,82 @@ class BacktestingEngineBase:
             "processed_data": self.controller.processed_data,
         }
 
-    async def initialize_backtesting_data_provider(self):
+    async def run_parameter_sweep(self,
+                                  controller_configs: List[ControllerConfigBase],
+                                  start: int, end: int,
+                                  backtesting_resolution: str = "1m",
+                                  trade_cost=0.0006,
+                                  max_workers: Optional[int] = None) -> pd.DataFrame:
+        """
+        Runs the backtesting of several controller configs in a process pool. The candles and trading rules are loaded
+        once in this process and sent to each worker process when it starts, then every config is simulated in
+        parallel.
+
+        Args:
+            controller_configs (List[ControllerConfigBase]): The configs to evaluate (see get_controller_configs_grid).
+            start (int): The start timestamp of the backtesting.
+            end (int): The end timestamp of the backtesting.
+            backtesting_resolution (str): The interval of the candles used to simulate the executors.
+            trade_cost (float): The cost per trade.
+            max_workers (Optional[int]): The number of worker processes. Defaults to the number of CPUs.
+
+        Returns:
+            pd.DataFrame: One row per config with the config id, the parameters that differ between the configs,
+            the results of summarize_results and the executors.
+        """
+        self.backtesting_data_provider.update_backtesting_time(start, end)
+        for controller_config in controller_configs:
+            await self.backtesting_data_provider.initialize_trading_rules(controller_config.connector_name)
+            await self.initialize_backtesting_data_provider(controller_config, backtesting_resolution)
+
+        loop = asyncio.get_running_loop()
+        with ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_initialize_sweep_worker,
+                initargs=(type(self), start, end, self.backtesting_data_provider.candles_feeds,
+                          self.backtesting_data_provider.trading_rules)) as pool:
+            sweep_results = await asyncio.gather(*[
+                loop.run_in_executor(pool, _run_sweep_backtesting, controller_config, backtesting_resolution,
+                                     trade_cost)
+                for controller_config in controller_configs])
+
+        parameters = self._get_swept_parameters(controller_configs)
+        rows = []
+        for controller_config, config_parameters, sweep_result in zip(controller_configs, parameters, sweep_results):
+            rows.append({
+                "config_id": controller_config.id,
+                **config_parameters,
+                **sweep_result["results"],
+                "executors": sweep_result["executors"],
+            })
+        return pd.DataFrame(rows)
+
+    @staticmethod
+    def _get_swept_parameters(controller_configs: List[ControllerConfigBase]) -> List[Dict[str, Any]]:
+        configs_data = [config.dict(exclude={"id"}) for config in controller_configs]
+        swept_parameters = [name for name in configs_data[0].keys()
+                            if any(repr(data.get(name)) != repr(configs_data[0][name]) for data in configs_data)] \
+            if len(configs_data) > 0 else []
+        return [{name: data.get(name) for name in swept_parameters} for data in configs_data]
+
+    async def initialize_backtesting_data_provider(self,
+                                                   controller_config: Optional[ControllerConfigBase] = None,
+                                                   backtesting_resolution: Optional[str] = None):
+        controller_config = controller_config or self.controller.config
         backtesting_config = CandlesConfig(
-            connector=self.controller.config.connector_name,
-            trading_pair=self.controller.config.trading_pair,
-            interval=self.backtesting_resolution
+            connector=controller_config.connector_name,
+            trading_pair=controller_config.trading_pair,
+            interval=backtesting_resolution or self.backtesting_resolution
         )
-        await self.controller.market_data_provider.initialize_candles_feed(backtesting_config)
-        for config in self.controller.config.candles_config:
-            await self.controller.market_data_provider.initialize_candles_feed(config)
+        await self.backtesting_data_provider.initialize_candles_feed(backtesting_config)
+        for config in controller_config.candles_config:
+            await self.backtesting_data_provider.initialize_candles_feed(config)
 
     async def simulate_execution(self, trade_cost: float) -> list:
         """
         Simulates market making strategy over historical data, considering trading costs.
+        The close step of each executor is computed when the executor is created, so on every step only the executors
+        that are closing are checked.
 
         Args:
             trade_cost (float): The cost per trade.
@@ -122,37 +239,48 @@ class BacktestingEngineBase:
         processed_features = self.prepare_market_data()
         self.active_executor_simulations: List[ExecutorSimulation] = []
         self.stopped_executors_info: List[ExecutorInfo] = []
-        for i, row in processed_features.iterrows():
-            await self.update_state(row)
+        self._timestamps: np.ndarray = processed_features["timestamp"].to_numpy()
+        self._active_close_indexes: np.ndarray = np.empty(0, dtype=np.int64)
+        for i, row in enumerate(processed_features.to_dict("records")):
+            await self.update_state(row, i)
             for action in self.controller.determine_executor_actions():
                 if isinstance(action, CreateExecutorAction):
-                    executor_simulation = self.simulate_executor(action.executor_config, processed_features.loc[i:], trade_cost)
+                    executor_simulation = self.simulate_executor(action.executor_config, processed_features.iloc[i:], trade_cost)
                     if executor_simulation.close_type != CloseType.FAILED:
                         self.manage_active_executors(executor_simulation)
                 elif isinstance(action, StopExecutorAction):
                     self.handle_stop_action(action, row["timestamp"])
 
-        return self.controller.executors_info
+        return list(self.controller.executors_info)
 
-    async def update_state(self, row):
+    async def update_state(self, row: Dict, index: int):
         key = f"{self.controller.config.connector_name}_{self.controller.config.trading_pair}"
         self.controller.market_data_provider.prices = {key: Decimal(row["close_bt"])}
         self.controller.market_data_provider._time = row["timestamp"]
-        self.controller.processed_data.update(row.to_dict())
-        self.update_executors_info(row["timestamp"])
-
-    def update_executors_info(self, timestamp: float):
-        active_executors_info = []
-        simulations_to_remove = []
-        for executor in self.active_executor_simulations:
-            executor_info = executor.get_executor_info_at_timestamp(timestamp)
-            if executor_info.status == RunnableStatus.TERMINATED:
-                self.stopped_executors_info.append(executor_info)
-                simulations_to_remove.append(executor.config.id)
-            else:
-                active_executors_info.append(executor_info)
-        self.active_executor_simulations = [es for es in self.active_executor_simulations if es.config.id not in simulations_to_remove]
-        self.controller.executors_info = active_executors_info + self.stopped_executors_info
+        self.controller.processed_data.update(row)
+        self.update_executors_info(row["timestamp"], index)
+
+    def update_executors_info(self, timestamp: float, index: int):
+        closed = self._active_close_indexes <= index
+        if closed.any():
+            for position in np.flatnonzero(closed):
+                executor = self.active_executor_simulations[position]
+                self.stopped_executors_info.append(executor.get_executor_info_at_timestamp(timestamp))
+            self.active_executor_simulations = [executor for executor, is_closed in
+                                                zip(self.active_executor_simulations, closed) if not is_closed]
+            self._active_close_indexes = self._active_close_indexes[~closed]
+        # The executors info is built only if the controller reads it on this step
+        self.controller.set_executors_info_builder(partial(self.build_executors_info, timestamp,
+                                                           list(self.active_executor_simulations),
+                                                           len(self.stopped_executors_info)))
+
+    def build_executors_info(self, timestamp: float, active_executor_simulations: List[ExecutorSimulation],
+                             stopped_executors_count: int) -> List[ExecutorInfo]:
+        """
+        Builds the executors info of a step from the executors that were active and stopped at the start of the step.
+        """
+        return [executor.get_executor_info_at_timestamp(timestamp) for executor in active_executor_simulations] + \
+            self.stopped_executors_info[:stopped_executors_count]
 
     async def update_processed_data(self, row: pd.Series):
         """
@@ -223,6 +351,9 @@ class BacktestingEngineBase:
         """
         if not simulation.executor_simulation.empty:
             self.active_executor_simulations.append(simulation)
+            # First step where the executor is reported as terminated
+            close_index = np.searchsorted(self._timestamps, simulation.close_timestamp, side="left")
+            self._active_close_indexes = np.append(self._active_close_indexes, close_index)
 
     def handle_stop_action(self, action: StopExecutorAction, timestamp: pd.Timestamp):
         """
@@ -233,15 +364,17 @@ class BacktestingEngineBase:
             active_executors (list): The list of active executors.
             timestamp (pd.Timestamp): The current timestamp.
         """
-        for executor in self.active_executor_simulations:
-            executor_info = executor.get_executor_info_at_timestamp(timestamp)
-            if executor_info.config.id == action.executor_id:
+        for position, executor in enumerate(self.active_executor_simulations):
+            if executor.config.id == action.executor_id:
+                executor_info = executor.get_executor_info_at_timestamp(timestamp)
                 executor_info.status = RunnableStatus.TERMINATED
                 executor_info.close_type = CloseType.EARLY_STOP
                 executor_info.is_active = False
                 executor_info.close_timestamp = timestamp
                 self.stopped_executors_info.append(executor_info)
-                self.active_executor_simulations.remove(executor)
+                self.active_executor_simulations.pop(position)
+                self._active_close_indexes = np.delete(self._active_close_indexes, position)
+                break
 
     @staticmethod
     def summarize_results(executors_info: List, total_amount_quote: float = 1000):
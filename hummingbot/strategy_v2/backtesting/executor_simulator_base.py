@@ -1,8 +1,9 @@
 from decimal import Decimal
-from typing import Union
+from typing import Dict, Optional, Union
 
+import numpy as np
 import pandas as pd
-from pydantic import BaseModel, validator
+from pydantic import BaseModel, PrivateAttr, validator
 
 from hummingbot.strategy_v2.executors.dca_executor.data_types import DCAExecutorConfig
 from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig
@@ -16,6 +17,8 @@ class ExecutorSimulation(BaseModel):
     executor_simulation: pd.DataFrame
     close_type: CloseType
 
+    _columns: Optional[Dict[str, np.ndarray]] = PrivateAttr(default=None)
+
     class Config:
         arbitrary_types_allowed = True  # Allow arbitrary types
 
@@ -25,10 +28,33 @@ class ExecutorSimulation(BaseModel):
             raise ValueError("executor_simulation must be a pandas DataFrame")
         return v
 
+    @property
+    def columns(self) -> Dict[str, np.ndarray]:
+        """
+        The columns of the simulation as NumPy arrays, computed once. The simulation is sorted by timestamp.
+        """
+        if self._columns is None:
+            self._columns = {column: self.executor_simulation[column].to_numpy() for column in
+                             self.executor_simulation.columns}
+        return self._columns
+
+    @property
+    def close_timestamp(self) -> float:
+        """
+        The timestamp of the last step of the simulation. The executor is active before it.
+        """
+        timestamps = self.columns["timestamp"]
+        return timestamps[-1] if len(timestamps) > 0 else -np.inf
+
+    def get_index_at_timestamp(self, timestamp: float) -> int:
+        """
+        :return: the index of the last step of the simulation up to the timestamp, or -1 if the simulation starts after
+        """
+        return int(np.searchsorted(self.columns["timestamp"], timestamp, side="right")) - 1
+
     def get_executor_info_at_timestamp(self, timestamp: float) -> ExecutorInfo:
-        # Filter the DataFrame up to the specified timestamp
-        df_up_to_timestamp = self.executor_simulation[self.executor_simulation['timestamp'] <= timestamp]
-        if df_up_to_timestamp.empty:
+        index = self.get_index_at_timestamp(timestamp)
+        if index < 0:
             return ExecutorInfo(
                 id=self.config.id,
                 timestamp=self.config.timestamp,
@@ -44,11 +70,13 @@ class ExecutorSimulation(BaseModel):
                 custom_info={}
             )
 
-        last_entry = df_up_to_timestamp.iloc[-1]
-        is_active = last_entry['timestamp'] < self.executor_simulation['timestamp'].max()
-        return ExecutorInfo(
+        last_entry = {column: values[index] for column, values in self.columns.items()}
+        is_active = bool(last_entry['timestamp'] < self.close_timestamp)
+        # The values already have the field types, so the info is built without the validation of the model, that is
+        # most of the cost of building it on every step of the backtesting
+        return ExecutorInfo.construct(
             id=self.config.id,
-            timestamp=self.config.timestamp,
+            timestamp=float(self.config.timestamp),
             type=self.config.type,
             close_timestamp=None if is_active else float(last_entry['timestamp']),
             close_type=None if is_active else self.close_type,
@@ -59,11 +87,11 @@ class ExecutorSimulation(BaseModel):
             cum_fees_quote=Decimal(last_entry['cum_fees_quote']),
             filled_amount_quote=Decimal(last_entry['filled_amount_quote']),
             is_active=is_active,
-            is_trading=last_entry['filled_amount_quote'] > 0 and is_active,
+            is_trading=bool(last_entry['filled_amount_quote'] > 0) and is_active,
             custom_info=self.get_custom_info(last_entry)
         )
 
-    def get_custom_info(self, last_entry: pd.Series) -> dict:
+    def get_custom_info(self, last_entry: Dict) -> dict:
         current_position_average_price = last_entry['current_position_average_price'] if "current_position_average_price" in last_entry else None
         return {
             "close_price": last_entry['close'],
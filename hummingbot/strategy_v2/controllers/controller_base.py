@@ -4,7 +4,7 @@ import asyncio
 import importlib
 import inspect
 from decimal import Decimal
-from typing import Callable, Dict, List, Set
+from typing import Callable, Dict, List, Optional, Set
 
 from pydantic import Field, validator
 
@@ -126,7 +126,8 @@ class ControllerBase(RunnableBase):
                  actions_queue: asyncio.Queue, update_interval: float = 1.0):
         super().__init__(update_interval=update_interval)
         self.config = config
-        self.executors_info: List[ExecutorInfo] = []
+        self._executors_info: List[ExecutorInfo] = []
+        self._executors_info_builder: Optional[Callable[[], List[ExecutorInfo]]] = None
         self.positions_held: List[Dict] = []
         self.market_data_provider: MarketDataProvider = market_data_provider
         self.actions_queue: asyncio.Queue = actions_queue
@@ -134,6 +135,29 @@ class ControllerBase(RunnableBase):
         self.executors_update_event = asyncio.Event()
         self.executors_info_queue = asyncio.Queue()
 
+    @property
+    def executors_info(self) -> List[ExecutorInfo]:
+        """
+        The info of the executors of the controller. If a builder was set with set_executors_info_builder, the list is
+        built the first time it's read.
+        """
+        if self._executors_info_builder is not None:
+            self._executors_info = self._executors_info_builder()
+            self._executors_info_builder = None
+        return self._executors_info
+
+    @executors_info.setter
+    def executors_info(self, executors_info: List[ExecutorInfo]):
+        self._executors_info = executors_info
+        self._executors_info_builder = None
+
+    def set_executors_info_builder(self, builder: Callable[[], List[ExecutorInfo]]):
+        """
+        Sets the function that builds the executors info when the controller reads them, instead of the list itself.
+        Used by the backtesting engine, where the controller doesn't read the executors info on every step.
+        """
+        self._executors_info_builder = builder
+
     def start(self):
         """
         Allow controllers to be restarted after being stopped.=
@@ -1,6 +1,6 @@
 from decimal import Decimal
 from functools import lru_cache
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
 from hummingbot.client.settings import AllConnectorSettings
 from hummingbot.connector.connector_base import ConnectorBase
@@ -49,13 +49,13 @@ class ExecutorBase(RunnableBase):
                            connector_name in connectors}
 
         # Event forwarders for different order events
-        self._create_buy_order_forwarder = SourceInfoEventForwarder(self.process_order_created_event)
-        self._create_sell_order_forwarder = SourceInfoEventForwarder(self.process_order_created_event)
-        self._fill_order_forwarder = SourceInfoEventForwarder(self.process_order_filled_event)
-        self._complete_buy_order_forwarder = SourceInfoEventForwarder(self.process_order_completed_event)
-        self._complete_sell_order_forwarder = SourceInfoEventForwarder(self.process_order_completed_event)
-        self._cancel_order_forwarder = SourceInfoEventForwarder(self.process_order_canceled_event)
-        self._failed_order_forwarder = SourceInfoEventForwarder(self.process_order_failed_event)
+        self._create_buy_order_forwarder = SourceInfoEventForwarder(self._notifying(self.process_order_created_event))
+        self._create_sell_order_forwarder = SourceInfoEventForwarder(self._notifying(self.process_order_created_event))
+        self._fill_order_forwarder = SourceInfoEventForwarder(self._notifying(self.process_order_filled_event))
+        self._complete_buy_order_forwarder = SourceInfoEventForwarder(self._notifying(self.process_order_completed_event))
+        self._complete_sell_order_forwarder = SourceInfoEventForwarder(self._notifying(self.process_order_completed_event))
+        self._cancel_order_forwarder = SourceInfoEventForwarder(self._notifying(self.process_order_canceled_event))
+        self._failed_order_forwarder = SourceInfoEventForwarder(self._notifying(self.process_order_failed_event))
 
         # Pairs of market events and their corresponding event forwarders
         self._event_pairs: List[Tuple[MarketEvent, SourceInfoEventForwarder]] = [
@@ -68,6 +68,15 @@ class ExecutorBase(RunnableBase):
             (MarketEvent.OrderFailure, self._failed_order_forwarder),
         ]
 
+    def _notifying(self, process_event: Callable) -> Callable:
+        """
+        Wraps an event processing method to mark the executor as requiring an update when the event is received.
+        """
+        def process_and_notify(event_tag: int, market: ConnectorBase, event):
+            self.notify_update()
+            process_event(event_tag, market, event)
+        return process_and_notify
+
     @property
     def status(self):
         """
@@ -233,6 +242,21 @@ class ExecutorBase(RunnableBase):
         """
         raise NotImplementedError
 
+    def get_order_books_state_key(self, markets: List[Tuple[str, str]]) -> Optional[Tuple]:
+        """
+        Returns a key that changes with every update of the order books of the specified markets, or None if any of
+        the connectors has no order book.
+
+        :param markets: The (connector name, trading pair) of the order books.
+        """
+        key = []
+        for connector_name, trading_pair in markets:
+            if self.is_amm_connector(connector_name):
+                return None
+            order_book = self.connectors[connector_name].get_order_book(trading_pair)
+            key.append((order_book.snapshot_uid, order_book.last_diff_uid, order_book.last_trade_price))
+        return tuple(key)
+
     def get_in_flight_order(self, connector_name: str, order_id: str):
         """
         Retrieves an in-flight order from the specified connector using the order ID.
@@ -31,6 +31,7 @@ from hummingbot.strategy_v2.models.executor_actions import (
 )
 from hummingbot.strategy_v2.models.executors import CloseType
 from hummingbot.strategy_v2.models.executors_info import ExecutorInfo, PerformanceReport
+from hummingbot.strategy_v2.runnable_scheduler import RunnableScheduler, TickStats
 
 
 class PositionSummary(BaseModel):
@@ -107,9 +108,27 @@ class ExecutorOrchestrator:
             cls._logger = logging.getLogger(__name__)
         return cls._logger
 
-    def __init__(self, strategy: ScriptStrategyBase, executors_update_interval: float = 1.0):
+    def __init__(self, strategy: ScriptStrategyBase, executors_update_interval: float = 1.0,
+                 use_shared_scheduler: bool = False, scheduler_batch_size: int = 50,
+                 max_executor_idle_interval: float = 10.0, executor_update_timeout: float = 10.0):
+        """
+        :param strategy: The strategy that owns the executors.
+        :param executors_update_interval: The interval at which the executors are updated, in seconds.
+        :param use_shared_scheduler: If True, all the executors are updated from a single scheduler task, instead of
+            running one control loop task per executor (the default).
+        :param scheduler_batch_size: The max number of executors updated concurrently by the scheduler.
+        :param max_executor_idle_interval: The max time an idle executor is skipped by the scheduler.
+        :param executor_update_timeout: The max time the scheduler waits for the update of an executor before
+            continuing with the others.
+        """
         self.strategy = strategy
         self.executors_update_interval = executors_update_interval
+        self.executors_scheduler = RunnableScheduler(
+            update_interval=executors_update_interval,
+            batch_size=scheduler_batch_size,
+            max_idle_interval=max_executor_idle_interval,
+            runnable_timeout=executor_update_timeout,
+        ) if use_shared_scheduler else None
         self.active_executors = {}
         self.archived_executors = {}
         self.positions_held = {}
@@ -243,6 +262,7 @@ class ExecutorOrchestrator:
         else:
             raise ValueError("Unsupported executor config type")
 
+        executor.set_scheduler(self.executors_scheduler)
         executor.start()
         self.active_executors[controller_id].append(executor)
         # MarketsRecorder.get_instance().store_or_update_executor(executor)
@@ -299,6 +319,21 @@ class ExecutorOrchestrator:
             report[controller_id] = [executor.executor_info for executor in executors_list if executor]
         return report
 
+    def get_executors_tick_stats(self) -> Dict[str, TickStats]:
+        """
+        Returns the tick statistics (number of updates, skipped updates and time spent) of the active executors, by
+        executor id.
+        """
+        if self.executors_scheduler is None:
+            return {}
+        report = {}
+        for executors_list in self.active_executors.values():
+            for executor in executors_list:
+                stats = self.executors_scheduler.get_tick_stats(executor)
+                if stats is not None:
+                    report[executor.config.id] = stats
+        return report
+
     def get_positions_report(self) -> Dict[str, List[PositionHeld]]:
         """
         Generate a report of all positions held.
@@ -1,7 +1,7 @@
 import asyncio
 import logging
 from decimal import Decimal
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.core.data_type.common import OrderType, PositionAction, PriceType, TradeType
@@ -292,6 +292,15 @@ class PositionExecutor(ExecutorBase):
                                                        PriceType.BestBid))
         return take_profit_price
 
+    def get_market_state_key(self) -> Optional[Tuple]:
+        """
+        While running, the executor only reacts to order book updates, to the time limit and to order events.
+        """
+        if self.status != RunnableStatus.RUNNING:
+            return None
+        order_books_key = self.get_order_books_state_key([(self.config.connector_name, self.config.trading_pair)])
+        return (order_books_key, bool(self.is_expired)) if order_books_key is not None else None
+
     async def control_task(self):
         """
         This method is responsible for controlling the task based on the status of the executor.
@@ -1,11 +1,15 @@
 import asyncio
 import logging
 from abc import ABC
+from typing import TYPE_CHECKING, Hashable, Optional
 
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.logger import HummingbotLogger
 from hummingbot.strategy_v2.models.base import RunnableStatus
 
+if TYPE_CHECKING:
+    from hummingbot.strategy_v2.runnable_scheduler import RunnableScheduler
+
 
 class RunnableBase(ABC):
     """
@@ -29,6 +33,8 @@ class RunnableBase(ABC):
         self.update_interval = update_interval
         self._status: RunnableStatus = RunnableStatus.NOT_STARTED
         self.terminated = asyncio.Event()
+        self._scheduler: Optional["RunnableScheduler"] = None
+        self._pending_update: bool = True
 
     @property
     def status(self):
@@ -39,6 +45,13 @@ class RunnableBase(ABC):
         """
         return self._status
 
+    def set_scheduler(self, scheduler: Optional["RunnableScheduler"]):
+        """
+        Sets a shared scheduler to run the control task, instead of running a control loop task for this component.
+        It has to be set before the component is started.
+        """
+        self._scheduler = scheduler
+
     def start(self):
         """
         Start the control loop of the smart component.
@@ -47,7 +60,10 @@ class RunnableBase(ABC):
         if self._status == RunnableStatus.NOT_STARTED:
             self.terminated.clear()
             self._status = RunnableStatus.RUNNING
-            safe_ensure_future(self.control_loop())
+            if self._scheduler is not None:
+                self._scheduler.add(self)
+            else:
+                safe_ensure_future(self.control_loop())
 
     def stop(self):
         """
@@ -73,6 +89,30 @@ class RunnableBase(ABC):
                 await asyncio.sleep(self.update_interval)
         self.on_stop()
 
+    @property
+    def has_pending_update(self) -> bool:
+        """
+        Whether something relevant for the component happened since the last time the control task was executed.
+        """
+        return self._pending_update
+
+    def notify_update(self):
+        """
+        Marks the component as requiring the execution of the control task, even if the market state did not change.
+        """
+        self._pending_update = True
+
+    def clear_pending_update(self):
+        self._pending_update = False
+
+    def get_market_state_key(self) -> Optional[Hashable]:
+        """
+        Returns a key that changes every time the market data used by the control task changes. When running in a
+        scheduler, the control task is skipped while the key and the pending update flag don't change.
+        Returning None (the default) means the control task has to be executed on every update.
+        """
+        return None
+
     def on_stop(self):
         """
         Method to be executed when the control loop is stopped.
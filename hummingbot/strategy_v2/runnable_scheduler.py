@@ -0,0 +1,193 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, Hashable, List, Optional
+
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.logger import HummingbotLogger
+
+if TYPE_CHECKING:
+    from hummingbot.strategy_v2.runnable_base import RunnableBase
+
+
+@dataclass
+class TickStats:
+    ticks: int = 0
+    skipped_ticks: int = 0
+    total_tick_time: float = 0.0
+    max_tick_time: float = 0.0
+    last_tick_time: float = 0.0
+
+    @property
+    def average_tick_time(self) -> float:
+        return self.total_tick_time / self.ticks if self.ticks > 0 else 0.0
+
+    def record(self, tick_time: float):
+        self.ticks += 1
+        self.total_tick_time += tick_time
+        self.max_tick_time = max(self.max_tick_time, tick_time)
+        self.last_tick_time = tick_time
+
+
+class ScheduledRunnable:
+    def __init__(self, runnable: "RunnableBase"):
+        self.runnable: "RunnableBase" = runnable
+        self.started: bool = False
+        self.next_tick_timestamp: float = 0.0
+        self.last_tick_timestamp: float = 0.0
+        self.market_state_key: Optional[Hashable] = None
+        self.stats: TickStats = TickStats()
+        self.tick_task: Optional[asyncio.Task] = None
+
+    @property
+    def is_ticking(self) -> bool:
+        return self.tick_task is not None and not self.tick_task.done()
+
+
+class RunnableScheduler:
+    """
+    Runs the control task of many runnables (e.g. executors) from a single task, instead of having one control loop
+    task per runnable. On every tick the runnables whose update interval elapsed are executed in batches, yielding to
+    the event loop between batches. Each runnable runs in its own task, and a batch waits for it up to runnable_timeout
+    seconds: a runnable that takes longer doesn't stall the other runnables, it keeps running and is not ticked again
+    until it finishes.
+    The on_start method of a runnable is executed on its first tick.
+    A runnable is skipped while its market state key did not change and it has no pending update (an order event),
+    up to max_idle_interval seconds. The time spent in the control task of each runnable is reported in tick_stats.
+    """
+    _logger = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self, update_interval: float = 1.0, batch_size: int = 50, max_idle_interval: float = 10.0,
+                 runnable_timeout: float = 10.0):
+        """
+        :param update_interval: The interval at which the scheduler checks which runnables have to be updated.
+        :param batch_size: The max number of control tasks executed concurrently before yielding to the event loop.
+        :param max_idle_interval: The max time a runnable can be skipped because it is idle.
+        :param runnable_timeout: The max time a batch waits for the control task of a runnable.
+        """
+        self._update_interval = update_interval
+        self._batch_size = batch_size
+        self._max_idle_interval = max_idle_interval
+        self._runnable_timeout = runnable_timeout
+        self._scheduled_runnables: Dict[int, ScheduledRunnable] = {}
+        self._scheduler_task: Optional[asyncio.Task] = None
+
+    @property
+    def runnables(self) -> List["RunnableBase"]:
+        return [scheduled.runnable for scheduled in self._scheduled_runnables.values()]
+
+    @property
+    def tick_stats(self) -> Dict[int, TickStats]:
+        """
+        Tick statistics of the scheduled runnables, by runnable id (id(runnable)).
+        """
+        return {runnable_id: scheduled.stats for runnable_id, scheduled in self._scheduled_runnables.items()}
+
+    def get_tick_stats(self, runnable: "RunnableBase") -> Optional[TickStats]:
+        scheduled = self._scheduled_runnables.get(id(runnable))
+        return scheduled.stats if scheduled is not None else None
+
+    def add(self, runnable: "RunnableBase"):
+        self._scheduled_runnables[id(runnable)] = ScheduledRunnable(runnable)
+        if self._scheduler_task is None or self._scheduler_task.done():
+            self._scheduler_task = safe_ensure_future(self._scheduler_loop())
+
+    def remove(self, runnable: "RunnableBase"):
+        self._scheduled_runnables.pop(id(runnable), None)
+
+    def stop(self):
+        if self._scheduler_task is not None:
+            self._scheduler_task.cancel()
+            self._scheduler_task = None
+
+    async def _scheduler_loop(self):
+        while len(self._scheduled_runnables) > 0:
+            start = self._time()
+            try:
+                await self.tick(start)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().error("Unexpected error while ticking the scheduled runnables.", exc_info=True)
+            await asyncio.sleep(max(self._update_interval - (self._time() - start), 0))
+
+    async def tick(self, timestamp: float):
+        due_runnables = []
+        for scheduled in list(self._scheduled_runnables.values()):
+            if scheduled.is_ticking:
+                # The control task of a previous tick is still running
+                if scheduled.next_tick_timestamp <= timestamp:
+                    scheduled.stats.skipped_ticks += 1
+            elif scheduled.runnable.terminated.is_set():
+                self._finalize(scheduled)
+            elif scheduled.next_tick_timestamp <= timestamp:
+                due_runnables.append(scheduled)
+        for i in range(0, len(due_runnables), self._batch_size):
+            batch = due_runnables[i:i + self._batch_size]
+            for scheduled in batch:
+                scheduled.tick_task = safe_ensure_future(self._tick_runnable(scheduled, timestamp))
+            await asyncio.wait([scheduled.tick_task for scheduled in batch], timeout=self._runnable_timeout)
+            for scheduled in batch:
+                if scheduled.is_ticking:
+                    self.logger().warning(
+                        f"The update of {scheduled.runnable} did not finish in {self._runnable_timeout} seconds. "
+                        f"It will not be updated again until it finishes.")
+            if i + self._batch_size < len(due_runnables):
+                await asyncio.sleep(0)
+
+    async def _tick_runnable(self, scheduled: ScheduledRunnable, timestamp: float):
+        runnable = scheduled.runnable
+        scheduled.next_tick_timestamp = timestamp + runnable.update_interval
+        start = time.perf_counter()
+        if not scheduled.started:
+            scheduled.started = True
+            try:
+                await runnable.on_start()
+            except Exception as e:
+                self.logger().error(e, exc_info=True)
+                self.remove(runnable)
+                return
+        if runnable.terminated.is_set():
+            return
+        try:
+            market_state_key = runnable.get_market_state_key()
+        except Exception:
+            # e.g. the order book of the trading pair is not available yet, the runnable is ticked unconditionally
+            self.logger().debug(f"Could not compute the market state key of {runnable}.", exc_info=True)
+            market_state_key = None
+        if self._is_idle(scheduled, market_state_key, timestamp):
+            scheduled.stats.skipped_ticks += 1
+            return
+        scheduled.market_state_key = market_state_key
+        scheduled.last_tick_timestamp = timestamp
+        runnable.clear_pending_update()
+        try:
+            await runnable.control_task()
+        except Exception as e:
+            self.logger().error(e, exc_info=True)
+        finally:
+            scheduled.stats.record(time.perf_counter() - start)
+
+    def _is_idle(self, scheduled: ScheduledRunnable, market_state_key: Optional[Hashable], timestamp: float) -> bool:
+        if market_state_key is None or scheduled.runnable.has_pending_update:
+            return False
+        return (market_state_key == scheduled.market_state_key
+                and timestamp - scheduled.last_tick_timestamp < self._max_idle_interval)
+
+    def _finalize(self, scheduled: ScheduledRunnable):
+        self.remove(scheduled.runnable)
+        try:
+            scheduled.runnable.on_stop()
+        except Exception as e:
+            self.logger().error(e, exc_info=True)
+
+    @staticmethod
+    def _time() -> float:
+        return time.time()
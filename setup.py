@@ -72,7 +72,7 @@ def main():
         "eth-abi",
         "eth-account",
         "eth-bloom",
-        "eth-keyfile",
+        "eth-keyfile>=0.6.0,<0.7.0",
         "eth-typing",
         "eth-utils",
         "flake8",
@@ -154,6 +154,7 @@ def main():
           packages=packages,
           package_data=package_data,
           install_requires=install_requires,
+          extras_require={"orjson": ["orjson"]},
           ext_modules=cythonize(cython_sources, compiler_directives=compiler_directives, **cython_kwargs),
           include_dirs=[
               np.get_include()
@@ -11,7 +11,9 @@ from unittest.mock import AsyncMock, MagicMock, patch
 from hummingbot.client.config.client_config_map import ClientConfigMap, DBSqliteMode
 from hummingbot.client.config.config_helpers import ClientConfigAdapter, read_system_configs_from_yml
 from hummingbot.client.hummingbot_application import HummingbotApplication
+from hummingbot.client.performance_accumulator import PerformanceAccumulator
 from hummingbot.connector.exchange.paper_trade import PaperTradeExchange
+from hummingbot.core.data_type.common import PositionAction
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
 from hummingbot.model.order import Order
 from hummingbot.model.sql_connection_manager import SQLConnectionManager
@@ -35,6 +37,10 @@ class HistoryCommandTest(unittest.TestCase):
 
     def tearDown(self) -> None:
         self.cli_mock_assistant.stop()
+        # The database file is deleted, so the next test must not reuse the shared connection manager
+        if SQLConnectionManager._scm_trade_fills_instance is not None:
+            SQLConnectionManager._scm_trade_fills_instance.engine.dispose()
+            SQLConnectionManager._scm_trade_fills_instance = None
         db_path = Path(SQLConnectionManager.create_db_path(db_name=self.mock_strategy_name))
         db_path.unlink(missing_ok=True)
         super().tearDown()
@@ -86,10 +92,95 @@ class HistoryCommandTest(unittest.TestCase):
                 leverage=1,
                 trade_fee=trade_fee.to_json(),
                 exchange_trade_id="someExchangeId",
+                position=PositionAction.NIL.value,
             )
         ]
         return trades
 
+    @patch("hummingbot.client.performance.RateOracle.get_instance")
+    @patch("hummingbot.client.command.history_command.HistoryCommand.get_current_balances")
+    def test_history_report_from_trade_stats_matches_report_from_trades(
+            self, get_current_balances_mock: AsyncMock, rate_oracle_mock: MagicMock):
+        get_current_balances_mock.return_value = {"BTC": Decimal("10"), "USDT": Decimal("100")}
+        rate_oracle_mock.return_value.stored_or_live_rate = AsyncMock(return_value=Decimal("1.5"))
+        start_time = time.time() - 10
+        trades = self.get_trades()
+        trades[0].timestamp = int(time.time() * 1e3)
+        accumulator = PerformanceAccumulator(f"{self.mock_strategy_name}.yml", int(start_time * 1e3))
+        accumulator.add_trade_fills(trades)
+
+        from_trades = self.async_run_with_timeout(
+            self.app.history_report(start_time=start_time, trades=trades, display_report=False))
+        from_trade_stats = self.async_run_with_timeout(
+            self.app.history_report(start_time=start_time,
+                                    trades=None,
+                                    display_report=False,
+                                    trade_stats=accumulator.trade_stats))
+
+        self.assertEqual(from_trades, from_trade_stats)
+
+    @patch("hummingbot.client.performance.RateOracle.get_instance")
+    @patch("hummingbot.client.command.history_command.HistoryCommand.get_current_balances")
+    def test_history_report_from_derivatives_trade_stats_reads_the_trades(
+            self, get_current_balances_mock: AsyncMock, rate_oracle_mock: MagicMock):
+        get_current_balances_mock.return_value = {"BTC": Decimal("10"), "USDT": Decimal("100")}
+        rate_oracle_mock.return_value.stored_or_live_rate = AsyncMock(return_value=Decimal("1.5"))
+        start_time = time.time() - 10
+        open_trade, close_trade = self.get_trades() + self.get_trades()
+        open_trade.position = PositionAction.OPEN.value
+        open_trade.timestamp = int(time.time() * 1e3)
+        close_trade.position = PositionAction.CLOSE.value
+        close_trade.timestamp = open_trade.timestamp + 1
+        close_trade.trade_type = "SELL"
+        close_trade.price = 2
+        close_trade.exchange_trade_id = "someOtherExchangeId"
+        trades = [open_trade, close_trade]
+        accumulator = PerformanceAccumulator(f"{self.mock_strategy_name}.yml", int(start_time * 1e3))
+        accumulator.add_trade_fills(trades)
+        self.assertTrue(accumulator.trade_stats[("binance", "BTC-USDT")].are_derivatives)
+
+        from_trades = self.async_run_with_timeout(
+            self.app.history_report(start_time=start_time, trades=trades, display_report=False))
+        self.app.markets_recorder = MagicMock()
+        self.app.markets_recorder.wait_for_pending_writes = AsyncMock()
+        with patch.object(self.app, "_get_trades_for_performance", return_value=trades) as get_trades_mock:
+            from_trade_stats = self.async_run_with_timeout(
+                self.app.history_report(start_time=start_time,
+                                        trades=None,
+                                        display_report=False,
+                                        trade_stats=accumulator.trade_stats))
+
+        self.app.markets_recorder.wait_for_pending_writes.assert_awaited_once()
+        get_trades_mock.assert_called_once_with(start_time)
+        self.assertEqual(from_trades, from_trade_stats)
+
+    @patch("hummingbot.client.hummingbot_application.HummingbotApplication.notify")
+    def test_history_waits_for_the_recorded_trades_before_reading_them(self, notify_mock):
+        self.app.strategy_file_name = f"{self.mock_strategy_name}.yml"
+        self.app.markets_recorder = MagicMock()
+        self.app.markets_recorder.performance_accumulator = None
+        self.app.markets_recorder.wait_for_pending_writes = AsyncMock()
+        self.app.trade_fill_db = MagicMock()
+
+        with patch.object(self.app, "_get_trades_from_session", return_value=[]) as get_trades_mock:
+            self.async_run_with_timeout(self.app._history(time.time(), verbose=False, precision=None))
+
+        self.app.markets_recorder.wait_for_pending_writes.assert_awaited_once()
+        get_trades_mock.assert_called_once()
+        notify_mock.assert_called_once_with("\n  No past trades to report.")
+
+    def test_get_trade_stats_only_for_the_period_of_the_performance_accumulator(self):
+        start_time = time.time()
+        self.app.strategy_file_name = f"{self.mock_strategy_name}.yml"
+        self.assertIsNone(self.app.get_trade_stats(start_time))
+
+        accumulator = PerformanceAccumulator(self.app.strategy_file_name, int(start_time * 1e3))
+        self.app.markets_recorder = MagicMock()
+        self.app.markets_recorder.performance_accumulator = accumulator
+
+        self.assertEqual({}, self.app.get_trade_stats(start_time))
+        self.assertIsNone(self.app.get_trade_stats(start_time - 60))
+
     @patch("hummingbot.client.command.history_command.HistoryCommand.get_current_balances")
     def test_history_report_raises_on_get_current_balances_network_timeout(self, get_current_balances_mock: AsyncMock):
         get_current_balances_mock.side_effect = self.get_async_sleep_fn(delay=0.02)
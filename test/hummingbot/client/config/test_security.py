@@ -1,8 +1,11 @@
 import asyncio
+import binascii
+import json
 import unittest
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from typing import Awaitable
+from unittest.mock import patch
 
 from hummingbot.client.config import config_crypt, config_helpers, security
 from hummingbot.client.config.config_crypt import ETHKeyFileSecretManger, store_password_verification, validate_password
@@ -77,6 +80,7 @@ class SecurityTest(unittest.TestCase):
         Security.__instance = None
         Security.secrets_manager = None
         Security._secure_configs = {}
+        Security._pending_config_files = {}
         Security._decryption_done = asyncio.Event()
 
     def test_password_process(self):
@@ -150,3 +154,54 @@ class SecurityTest(unittest.TestCase):
         binance_loaded_config = Security.decrypted_value(binance_config.connector)
 
         self.assertEqual(binance_config, binance_loaded_config)
+
+    def test_decrypt_all_derives_the_key_of_the_session_once(self):
+        password = "som-password"
+        secrets_manager = ETHKeyFileSecretManger(password)
+        store_password_verification(secrets_manager)
+
+        Security.login(secrets_manager)
+        self.async_run_with_timeout(Security.wait_til_decryption_done())
+        config_map = self.store_binance_config()
+        self.ev_loop.run_until_complete(asyncio.sleep(0.1))
+
+        Security.secrets_manager = ETHKeyFileSecretManger(password)
+        self.reset_decryption_done()
+        with patch("hummingbot.client.config.config_crypt._derive_key",
+                   wraps=config_crypt._derive_key) as derive_key_mock:
+            Security.decrypt_all()
+
+        # The API key and secret were encrypted in the same session
+        self.assertEqual(1, derive_key_mock.call_count)
+        self.assertEqual(api_keys_from_connector_config_map(config_map), Security.api_keys(self.connector))
+
+    def test_lazy_decryption_decrypts_connector_config_on_first_use(self):
+        password = "som-password"
+        secrets_manager = ETHKeyFileSecretManger(password)
+        store_password_verification(secrets_manager)
+
+        Security.login(secrets_manager)
+        self.async_run_with_timeout(Security.wait_til_decryption_done())
+        config_map = self.store_binance_config()
+        self.ev_loop.run_until_complete(asyncio.sleep(0.1))
+
+        self.reset_decryption_done()
+        Security.decrypt_all(lazy=True)
+        self.async_run_with_timeout(Security.wait_til_decryption_done())
+
+        self.assertTrue(Security.any_secure_configs())
+        self.assertNotIn(self.connector, Security._secure_configs)
+
+        self.assertEqual(api_keys_from_connector_config_map(config_map), Security.api_keys(self.connector))
+        self.assertIn(self.connector, Security._secure_configs)
+        self.assertEqual({self.connector}, set(Security.all_decrypted_values()))
+
+    def test_decrypt_values_encrypted_with_their_own_salt(self):
+        password = "som-password"
+        secrets_manager = ETHKeyFileSecretManger(password)
+        keyfile_json = config_crypt._create_v3_keyfile_json(b"someSecret", password.encode())
+        encrypted_value = binascii.hexlify(json.dumps(keyfile_json).encode()).decode()
+
+        self.assertEqual("someSecret", secrets_manager.decrypt_secret_value("binance_api_secret", encrypted_value))
+        with self.assertRaises(ValueError):
+            ETHKeyFileSecretManger("another-password").decrypt_secret_value("binance_api_secret", encrypted_value)
@@ -0,0 +1,60 @@
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from hummingbot.client.connector_manifest import ConnectorManifest, source_tree_hash
+
+
+class ConnectorManifestTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = TemporaryDirectory()
+        self.manifest_path = Path(self.temp_dir.name) / "connector_manifest.json"
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def test_source_tree_hash_changes_with_python_files(self):
+        tree = Path(self.temp_dir.name) / "connector"
+        (tree / "exchange" / "binance").mkdir(parents=True)
+        utils_file = tree / "exchange" / "binance" / "binance_utils.py"
+        utils_file.write_text("EXAMPLE_PAIR = 'ZRX-ETH'\n")
+        initial_hash = source_tree_hash(tree)
+
+        (tree / "exchange" / "binance" / "README.md").write_text("Not a Python file")
+        self.assertEqual(initial_hash, source_tree_hash(tree))
+
+        utils_file.write_text("EXAMPLE_PAIR = 'BTC-USDT'\n")
+        self.assertNotEqual(initial_hash, source_tree_hash(tree))
+
+    def test_saved_manifest_is_loaded_for_the_same_source_tree(self):
+        manifest = ConnectorManifest.load(self.manifest_path, "hash")
+        self.assertIsNone(manifest.get("binance"))
+        self.assertFalse(manifest.dirty)
+
+        manifest.add("binance", {"example_pair": "ZRX-ETH"})
+        self.assertTrue(manifest.dirty)
+        manifest.save()
+        self.assertFalse(manifest.dirty)
+
+        loaded_manifest = ConnectorManifest.load(self.manifest_path, "hash")
+        self.assertEqual({"example_pair": "ZRX-ETH"}, loaded_manifest.get("binance"))
+
+    def test_manifest_of_another_source_tree_is_discarded(self):
+        manifest = ConnectorManifest(self.manifest_path, "hash")
+        manifest.add("binance", {"example_pair": "ZRX-ETH"})
+        manifest.save()
+
+        loaded_manifest = ConnectorManifest.load(self.manifest_path, "other_hash")
+
+        self.assertIsNone(loaded_manifest.get("binance"))
+        self.assertEqual("other_hash", loaded_manifest.tree_hash)
+
+    def test_invalid_manifest_is_discarded(self):
+        self.manifest_path.write_text("{invalid json")
+
+        manifest = ConnectorManifest.load(self.manifest_path, "hash")
+
+        self.assertIsNone(manifest.get("binance"))
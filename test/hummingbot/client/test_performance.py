@@ -6,6 +6,7 @@ from typing import Awaitable
 from unittest.mock import MagicMock, patch
 
 from hummingbot.client.performance import PerformanceMetrics
+from hummingbot.client.performance_accumulator import MarketTradeStats
 from hummingbot.core.data_type.common import OrderType, PositionAction, TradeType
 from hummingbot.core.data_type.trade import Trade
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, DeductedFromReturnsTradeFee, TokenAmount
@@ -341,3 +342,51 @@ class PerformanceMetricsUnitTest(unittest.TestCase):
         performance_metric = PerformanceMetrics()
         returned_impact = performance_metric._process_deducted_fees_impact_in_quote_vol(dummy_trade)
         self.assertEqual(returned_impact, Decimal("-100.0"))
+
+    def test_performance_metrics_from_trade_stats_match_metrics_from_trades(self):
+        rate_oracle = RateOracle()
+        rate_oracle._prices[trading_pair] = Decimal("110")
+        rate_oracle._prices["BNB-USDT"] = Decimal("300")
+        RateOracle._shared_instance = rate_oracle
+
+        trades = [
+            TradeFill(
+                config_file_path="some-strategy.yml",
+                strategy="pure_market_making",
+                market="binance",
+                symbol=trading_pair,
+                base_asset=base,
+                quote_asset=quote,
+                timestamp=1000 + i,
+                order_id=f"someId{i}",
+                trade_type="BUY" if i % 2 == 0 else "SELL",
+                order_type="LIMIT",
+                price=Decimal("100") + i,
+                amount=Decimal("10") + i,
+                trade_fee=(DeductedFromReturnsTradeFee(percent=Decimal("0.001")) if i % 2 == 0
+                           else AddedToCostTradeFee(flat_fees=[TokenAmount("BNB", Decimal("0.01"))])).to_json(),
+                exchange_trade_id=f"someExchangeId{i}",
+                position=PositionAction.NIL.value,
+            )
+            for i in range(5)
+        ]
+        trade_stats = MarketTradeStats(quote=quote)
+        for trade in trades:
+            trade_stats.add_trade_fill(trade)
+        cur_bals = {base: Decimal("100"), quote: Decimal("10000")}
+
+        from_trades = self.async_run_with_timeout(PerformanceMetrics.create(trading_pair, trades, cur_bals))
+        from_stats = self.async_run_with_timeout(
+            PerformanceMetrics.create_from_trade_stats(trading_pair, trade_stats, cur_bals))
+
+        self.assertEqual(from_trades.num_trades, from_stats.num_trades)
+        self.assertEqual(from_trades.tot_vol_base, from_stats.tot_vol_base)
+        self.assertEqual(from_trades.tot_vol_quote, from_stats.tot_vol_quote)
+        self.assertEqual(from_trades.avg_tot_price, from_stats.avg_tot_price)
+        self.assertEqual(from_trades.start_price, from_stats.start_price)
+        self.assertEqual(from_trades.hold_value, from_stats.hold_value)
+        self.assertEqual(from_trades.trade_pnl, from_stats.trade_pnl)
+        self.assertEqual(dict(from_trades.fees), dict(from_stats.fees))
+        self.assertEqual(from_trades.fee_in_quote, from_stats.fee_in_quote)
+        self.assertEqual(from_trades.total_pnl, from_stats.total_pnl)
+        self.assertEqual(from_trades.return_pct, from_stats.return_pct)
@@ -0,0 +1,140 @@
+import unittest
+from decimal import Decimal
+
+from hummingbot.client.performance_accumulator import MarketTradeStats, PerformanceAccumulator
+from hummingbot.core.data_type.common import PositionAction
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, DeductedFromReturnsTradeFee, TokenAmount
+from hummingbot.model.order import Order  # noqa — Order needs to be defined for TradeFill
+from hummingbot.model.order_status import OrderStatus  # noqa — Order needs to be defined for TradeFill
+from hummingbot.model.trade_fill import TradeFill
+
+
+class PerformanceAccumulatorTest(unittest.TestCase):
+    config_file_path = "some-strategy.yml"
+
+    def _trade_fill(self, timestamp: int, trade_id: str, trade_type: str = "BUY", market: str = "binance",
+                    trading_pair: str = "HBOT-USDT", price: Decimal = Decimal("100"),
+                    amount: Decimal = Decimal("10"), trade_fee=None,
+                    position: str = PositionAction.NIL.value) -> TradeFill:
+        base, quote = trading_pair.split("-")
+        trade_fee = trade_fee or AddedToCostTradeFee(flat_fees=[TokenAmount(quote, Decimal("0"))])
+        return TradeFill(
+            config_file_path=self.config_file_path,
+            strategy="pure_market_making",
+            market=market,
+            symbol=trading_pair,
+            base_asset=base,
+            quote_asset=quote,
+            timestamp=timestamp,
+            order_id=f"OID-{trade_id}",
+            trade_type=trade_type,
+            order_type="LIMIT",
+            price=price,
+            amount=amount,
+            trade_fee=trade_fee.to_json(),
+            exchange_trade_id=trade_id,
+            position=position,
+        )
+
+    def test_trade_stats_sum_volumes_and_fees(self):
+        stats = MarketTradeStats(quote="USDT")
+        stats.add_trade_fill(self._trade_fill(
+            1000, "1", "BUY", price=Decimal("100"), amount=Decimal("2"),
+            trade_fee=AddedToCostTradeFee(percent=Decimal("0.01"), flat_fees=[TokenAmount("BNB", Decimal("0.1"))])))
+        stats.add_trade_fill(self._trade_fill(
+            2000, "2", "SELL", price=Decimal("110"), amount=Decimal("1"),
+            trade_fee=DeductedFromReturnsTradeFee(percent=Decimal("0.01"))))
+
+        self.assertEqual(1, stats.num_buys)
+        self.assertEqual(1, stats.num_sells)
+        self.assertEqual(2, stats.num_trades)
+        self.assertEqual(Decimal("2"), stats.b_vol_base)
+        self.assertEqual(Decimal("-1"), stats.s_vol_base)
+        self.assertEqual(Decimal("-200"), stats.b_vol_quote)
+        self.assertEqual(Decimal("110") - Decimal("1.1"), stats.s_vol_quote)
+        self.assertEqual(Decimal("100"), stats.start_price)
+        self.assertEqual(Decimal("110"), stats.last_price)
+        self.assertEqual(Decimal("3.1"), stats.fees["USDT"])
+        self.assertEqual(Decimal("0.1"), stats.fees["BNB"])
+        self.assertFalse(stats.are_derivatives)
+
+    def test_trade_stats_of_position_fills_are_derivatives(self):
+        stats = MarketTradeStats(quote="USDT")
+        stats.add_trade_fill(self._trade_fill(1000, "1", position=PositionAction.OPEN.value))
+
+        self.assertTrue(stats.are_derivatives)
+
+    def test_accumulator_groups_fills_by_market_and_trading_pair(self):
+        accumulator = PerformanceAccumulator(self.config_file_path, 1000)
+        accumulator.add_trade_fills([
+            self._trade_fill(1000, "1"),
+            self._trade_fill(1001, "2", market="kucoin"),
+            self._trade_fill(1002, "3", trading_pair="ETH-USDT"),
+            self._trade_fill(1003, "4", "SELL"),
+        ])
+
+        self.assertEqual({("binance", "HBOT-USDT"), ("kucoin", "HBOT-USDT"), ("binance", "ETH-USDT")},
+                         set(accumulator.trade_stats.keys()))
+        self.assertEqual(2, accumulator.trade_stats[("binance", "HBOT-USDT")].num_trades)
+        self.assertEqual(4, accumulator.num_trades)
+        self.assertEqual(1003, accumulator.last_timestamp)
+
+    def test_accumulator_ignores_fills_out_of_its_period_or_config(self):
+        accumulator = PerformanceAccumulator(self.config_file_path, 1000)
+        other_config_fill = self._trade_fill(1001, "2")
+        other_config_fill.config_file_path = "other-strategy.yml"
+
+        accumulator.add_trade_fills([self._trade_fill(999, "1"), other_config_fill])
+
+        self.assertEqual(0, accumulator.num_trades)
+        self.assertFalse(accumulator.dirty)
+
+    def test_accumulator_does_not_count_fills_twice(self):
+        accumulator = PerformanceAccumulator(self.config_file_path, 1000)
+        accumulator.add_trade_fills([self._trade_fill(1000, "1"), self._trade_fill(1001, "2")])
+
+        accumulator.add_trade_fills([self._trade_fill(1000, "1"),
+                                     self._trade_fill(1001, "2"),
+                                     self._trade_fill(1001, "3"),
+                                     self._trade_fill(1002, "4")])
+
+        self.assertEqual(4, accumulator.num_trades)
+
+    def test_accumulator_counts_fills_added_out_of_timestamp_order(self):
+        accumulator = PerformanceAccumulator(self.config_file_path, 1000)
+        accumulator.add_trade_fills([self._trade_fill(1002, "2", price=Decimal("102")),
+                                     self._trade_fill(1003, "3", market="kucoin")])
+
+        # A fill recovered later, older than the last one added
+        accumulator.add_trade_fill(self._trade_fill(1001, "1", price=Decimal("101")))
+        accumulator.add_trade_fill(self._trade_fill(1001, "1", price=Decimal("101")))
+
+        stats = accumulator.trade_stats[("binance", "HBOT-USDT")]
+        self.assertEqual(2, stats.num_trades)
+        self.assertEqual(Decimal("20"), stats.b_vol_base)
+        self.assertEqual(Decimal("101"), stats.start_price)
+        self.assertEqual(Decimal("102"), stats.last_price)
+        self.assertEqual(3, accumulator.num_trades)
+        self.assertEqual(1003, accumulator.last_timestamp)
+
+    def test_accumulator_serialization_round_trip(self):
+        accumulator = PerformanceAccumulator(self.config_file_path, 1000)
+        accumulator.add_trade_fills([
+            self._trade_fill(1000, "1", trade_fee=AddedToCostTradeFee(flat_fees=[TokenAmount("BNB", Decimal("0.1"))])),
+            self._trade_fill(1001, "2", "SELL", price=Decimal("101.5")),
+        ])
+        self.assertTrue(accumulator.dirty)
+
+        serialized = accumulator.to_json()
+        restored = PerformanceAccumulator.from_json(serialized)
+
+        self.assertFalse(accumulator.dirty)
+        self.assertFalse(restored.dirty)
+        self.assertTrue(restored.covers(self.config_file_path, 1000))
+        self.assertFalse(restored.covers(self.config_file_path, 2000))
+        self.assertEqual(1001, restored.last_timestamp)
+        self.assertEqual(accumulator.trade_stats, restored.trade_stats)
+
+        restored.add_trade_fill(self._trade_fill(1001, "2", "SELL", price=Decimal("101.5")))
+        restored.add_trade_fill(self._trade_fill(1000, "1"))
+        self.assertEqual(2, restored.num_trades)
@@ -1,8 +1,13 @@
+import json
 import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
 
 from pydantic import SecretStr
 
-from hummingbot.client.settings import ConnectorSetting, ConnectorType
+from hummingbot.client.settings import AllConnectorSettings, ConnectorSetting, ConnectorType, LazyConnectorConfigKeys
+from hummingbot.connector.exchange.binance import binance_utils
 from hummingbot.connector.exchange.binance.binance_utils import BinanceConfigMap
 from hummingbot.core.data_type.trade_fee import TradeFeeSchema
 
@@ -61,3 +66,48 @@ class SettingsTest(unittest.TestCase):
         }
 
         self.assertEqual(expected_params, params)
+
+    def test_connector_setting_loads_lazy_config_keys_on_use(self):
+        conn_settings = ConnectorSetting(
+            name="binance_us",
+            type=ConnectorType.Exchange,
+            example_pair="BTC-USDT",
+            centralised=True,
+            use_ethereum_wallet=False,
+            trade_fee_schema=TradeFeeSchema(),
+            config_keys=LazyConnectorConfigKeys(
+                utils_module="hummingbot.connector.exchange.binance.binance_utils", domain="binance_us"),
+            is_sub_domain=True,
+            parent_name="binance",
+            domain_parameter="us",
+            use_eth_gas_lookup=False,
+        )
+
+        self.assertIs(binance_utils.OTHER_DOMAINS_KEYS["binance_us"], conn_settings.config_keys)
+        paper_trade_settings = conn_settings._replace(name="binance_us_paper_trade")
+        self.assertIsInstance(paper_trade_settings[6], LazyConnectorConfigKeys)
+
+    def test_create_connector_settings_from_connector_manifest(self):
+        with TemporaryDirectory() as temp_dir:
+            manifest_path = Path(temp_dir) / "connector_manifest.json"
+            with patch("hummingbot.client.settings.default_connector_manifest_path", return_value=manifest_path):
+                settings = dict(AllConnectorSettings.create_connector_settings())
+                self.assertTrue(manifest_path.exists())
+
+                with patch.object(AllConnectorSettings, "_connector_manifest_entry") as manifest_entry_mock:
+                    settings_from_manifest = dict(AllConnectorSettings.create_connector_settings())
+                manifest_entry_mock.assert_not_called()
+
+            with open(manifest_path) as fd:
+                manifest = json.load(fd)
+
+        self.assertEqual("hummingbot.connector.exchange.binance.binance_utils",
+                         manifest["connectors"]["binance"]["utils_module"])
+        self.assertEqual(settings.keys(), settings_from_manifest.keys())
+        for name, connector_settings in settings.items():
+            self.assertEqual(connector_settings.type, settings_from_manifest[name].type)
+            self.assertEqual(connector_settings.example_pair, settings_from_manifest[name].example_pair)
+            self.assertEqual(connector_settings.trade_fee_schema, settings_from_manifest[name].trade_fee_schema)
+            self.assertEqual(connector_settings.domain_parameter, settings_from_manifest[name].domain_parameter)
+        self.assertIs(binance_utils.KEYS, settings_from_manifest["binance"].config_keys)
+        self.assertIs(binance_utils.OTHER_DOMAINS_KEYS["binance_us"], settings_from_manifest["binance_us"].config_keys)
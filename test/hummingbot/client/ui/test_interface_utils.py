@@ -6,6 +6,7 @@ from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
 
 import pandas as pd
 
+from hummingbot.client.performance_accumulator import MarketTradeStats
 from hummingbot.client.ui.interface_utils import (
     format_bytes,
     format_df_for_printout,
@@ -75,6 +76,8 @@ class InterfaceUtilsTest(unittest.TestCase):
         mock_app = mock_hb_app.main_application()
         mock_app.strategy_task.done.return_value = False
         mock_app.markets.return_values = {"a": MagicMock(ready=True)}
+        mock_app.get_trade_stats.return_value = None
+        mock_app.wait_for_recorded_trades = AsyncMock()
         mock_app._get_trades_from_session.return_value = [MagicMock(market="ExchangeA", symbol="HBOT-USDT")]
         mock_app.get_current_balances = AsyncMock()
         mock_perf.side_effect = [MagicMock(return_pct=Decimal("0.01"), total_pnl=Decimal("2")),
@@ -95,6 +98,8 @@ class InterfaceUtilsTest(unittest.TestCase):
         mock_app = mock_hb_app.main_application()
         mock_app.strategy_task.done.return_value = False
         mock_app.markets.return_values = {"a": MagicMock(ready=True)}
+        mock_app.get_trade_stats.return_value = None
+        mock_app.wait_for_recorded_trades = AsyncMock()
         mock_app._get_trades_from_session.return_value = [
             MagicMock(market="ExchangeA", symbol="HBOT-USDT"),
             MagicMock(market="ExchangeA", symbol="HBOT-BTC")
@@ -117,6 +122,8 @@ class InterfaceUtilsTest(unittest.TestCase):
         mock_app = mock_hb_app.main_application()
         mock_app.strategy_task.done.return_value = False
         mock_app.markets.return_values = {"a": MagicMock(ready=True)}
+        mock_app.get_trade_stats.return_value = None
+        mock_app.wait_for_recorded_trades = AsyncMock()
         mock_app._get_trades_from_session.return_value = [
             MagicMock(market="ExchangeA", symbol="HBOT-USDT"),
             MagicMock(market="ExchangeA", symbol="BTC-USDT")
@@ -131,6 +138,52 @@ class InterfaceUtilsTest(unittest.TestCase):
         self.assertEqual('Trades: 0, Total P&L: 0.00, Return %: 0.00%', mock_result.log.call_args_list[0].args[0])
         self.assertEqual('Trades: 2, Total P&L: 5.00 USDT, Return %: 1.50%', mock_result.log.call_args_list[1].args[0])
 
+    @patch("hummingbot.client.ui.interface_utils._sleep", new_callable=AsyncMock)
+    @patch("hummingbot.client.ui.interface_utils.PerformanceMetrics.create_from_trade_stats", new_callable=AsyncMock)
+    @patch("hummingbot.client.hummingbot_application.HummingbotApplication")
+    def test_start_trade_monitor_from_trade_stats(self, mock_hb_app, mock_perf, mock_sleep):
+        mock_result = MagicMock()
+        mock_app = mock_hb_app.main_application()
+        mock_app.strategy_task.done.return_value = False
+        mock_app.markets.return_values = {"a": MagicMock(ready=True)}
+        usdt_stats = MarketTradeStats(quote="USDT", num_buys=2, num_sells=1, num_nil_positions=3)
+        btc_stats = MarketTradeStats(quote="USDT", num_buys=1, num_nil_positions=1)
+        mock_app.get_trade_stats.return_value = {("ExchangeA", "HBOT-USDT"): usdt_stats,
+                                                 ("ExchangeA", "BTC-USDT"): btc_stats}
+        mock_app.get_current_balances = AsyncMock()
+        mock_perf.side_effect = [MagicMock(return_pct=Decimal("0.01"), total_pnl=Decimal("2")),
+                                 MagicMock(return_pct=Decimal("0.02"), total_pnl=Decimal("3"))]
+        mock_sleep.side_effect = asyncio.CancelledError()
+        with self.assertRaises(asyncio.CancelledError):
+            self.async_run_with_timeout(start_trade_monitor(mock_result))
+        self.assertEqual(2, mock_result.log.call_count)
+        self.assertEqual('Trades: 4, Total P&L: 5.00 USDT, Return %: 1.50%', mock_result.log.call_args_list[1].args[0])
+        mock_app.get_trade_stats.assert_called_once_with(mock_app.init_time)
+        self.assertEqual([("HBOT-USDT", usdt_stats), ("BTC-USDT", btc_stats)],
+                         [call.args[:2] for call in mock_perf.call_args_list])
+        mock_app._get_trades_from_session.assert_not_called()
+
+    @patch("hummingbot.client.ui.interface_utils._sleep", new_callable=AsyncMock)
+    @patch("hummingbot.client.ui.interface_utils.PerformanceMetrics.create", new_callable=AsyncMock)
+    @patch("hummingbot.client.hummingbot_application.HummingbotApplication")
+    def test_start_trade_monitor_with_derivatives_trade_stats_uses_trades(self, mock_hb_app, mock_perf, mock_sleep):
+        mock_result = MagicMock()
+        mock_app = mock_hb_app.main_application()
+        mock_app.strategy_task.done.return_value = False
+        mock_app.markets.return_values = {"a": MagicMock(ready=True)}
+        mock_app.get_trade_stats.return_value = {("ExchangeA", "HBOT-USDT"): MarketTradeStats(quote="USDT", num_buys=1)}
+        mock_app.wait_for_recorded_trades = AsyncMock()
+        mock_app._get_trades_from_session.return_value = [MagicMock(market="ExchangeA", symbol="HBOT-USDT")]
+        mock_app.get_current_balances = AsyncMock()
+        mock_perf.return_value = MagicMock(return_pct=Decimal("0.01"), total_pnl=Decimal("2"))
+        mock_sleep.side_effect = asyncio.CancelledError()
+        with self.assertRaises(asyncio.CancelledError):
+            self.async_run_with_timeout(start_trade_monitor(mock_result))
+        self.assertEqual(2, mock_result.log.call_count)
+        self.assertEqual('Trades: 1, Total P&L: 2.00 USDT, Return %: 1.00%', mock_result.log.call_args_list[1].args[0])
+        mock_app.wait_for_recorded_trades.assert_awaited_once()
+        mock_app._get_trades_from_session.assert_called_once()
+
     @patch("hummingbot.client.ui.interface_utils._sleep", new_callable=AsyncMock)
     @patch("hummingbot.client.hummingbot_application.HummingbotApplication")
     def test_start_trade_monitor_market_not_ready(self, mock_hb_app, mock_sleep):
@@ -151,6 +204,8 @@ class InterfaceUtilsTest(unittest.TestCase):
         mock_app = mock_hb_app.main_application()
         mock_app.strategy_task.done.return_value = False
         mock_app.markets.return_values = {"a": MagicMock(ready=True)}
+        mock_app.get_trade_stats.return_value = None
+        mock_app.wait_for_recorded_trades = AsyncMock()
         mock_app._get_trades_from_session.return_value = []
         mock_sleep.side_effect = asyncio.CancelledError()
         with self.assertRaises(asyncio.CancelledError):
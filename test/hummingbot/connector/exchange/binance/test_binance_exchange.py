@@ -16,7 +16,7 @@ from hummingbot.connector.test_support.exchange_connector_test import AbstractEx
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
 from hummingbot.core.data_type.common import OrderType, TradeType
-from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState
+from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
 from hummingbot.core.data_type.trade_fee import DeductedFromReturnsTradeFee, TokenAmount, TradeFeeBase
 from hummingbot.core.event.events import MarketOrderFailureEvent, OrderFilledEvent
 
@@ -731,6 +731,262 @@ class BinanceExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests
             asyncio.CancelledError,
             self.async_run_with_timeout, self.exchange._update_time_synchronizer())
 
+    def test_update_order_status_in_bulk_only_requests_orders_missing_from_open_orders(self):
+        self.exchange._set_current_timestamp(1640780000)
+        for order_id, exchange_order_id in [("OID1", "100234"), ("OID2", "100235")]:
+            self.exchange.start_tracking_order(
+                order_id=order_id,
+                exchange_order_id=exchange_order_id,
+                trading_pair=self.trading_pair,
+                order_type=OrderType.LIMIT,
+                trade_type=TradeType.BUY,
+                price=Decimal("10000"),
+                amount=Decimal("1"),
+            )
+        open_order = self.exchange.in_flight_orders["OID1"]
+        missing_order = self.exchange.in_flight_orders["OID2"]
+
+        fee = DeductedFromReturnsTradeFee(flat_fees=[TokenAmount(self.quote_asset, Decimal("0.1"))])
+        trade_updates = [
+            TradeUpdate(
+                trade_id="28457",
+                client_order_id=None,
+                exchange_order_id=open_order.exchange_order_id,
+                trading_pair=self.trading_pair,
+                fill_timestamp=1640780000,
+                fill_price=Decimal("10000"),
+                fill_base_amount=Decimal("0.5"),
+                fill_quote_amount=Decimal("5000"),
+                fee=fee,
+            ),
+            # Fill of an order not tracked by the connector
+            TradeUpdate(
+                trade_id="28458",
+                client_order_id=None,
+                exchange_order_id="999999",
+                trading_pair=self.trading_pair,
+                fill_timestamp=1640780000,
+                fill_price=Decimal("10000"),
+                fill_base_amount=Decimal("1"),
+                fill_quote_amount=Decimal("10000"),
+                fee=fee,
+            ),
+        ]
+        open_order_update = OrderUpdate(
+            trading_pair=self.trading_pair,
+            update_timestamp=1640780000,
+            new_state=OrderState.PARTIALLY_FILLED,
+            exchange_order_id=open_order.exchange_order_id,
+        )
+        missing_order_update = OrderUpdate(
+            trading_pair=self.trading_pair,
+            update_timestamp=1640780000,
+            new_state=OrderState.CANCELED,
+            client_order_id=missing_order.client_order_id,
+            exchange_order_id=missing_order.exchange_order_id,
+        )
+        self.exchange._request_recent_trade_updates = AsyncMock(return_value=trade_updates)
+        self.exchange._request_open_order_updates = AsyncMock(return_value=[open_order_update])
+        self.exchange._all_trade_updates_for_order = AsyncMock(return_value=[])
+        self.exchange._request_order_status = AsyncMock(return_value=missing_order_update)
+
+        self.async_run_with_timeout(self.exchange._update_order_status())
+        self.async_run_with_timeout(asyncio.sleep(0))
+
+        self.exchange._request_recent_trade_updates.assert_awaited_once_with(
+            trading_pairs=[self.trading_pair], start_timestamp=open_order.creation_timestamp)
+        self.exchange._request_open_order_updates.assert_awaited_once_with(trading_pairs=[self.trading_pair])
+        self.exchange._all_trade_updates_for_order.assert_awaited_once_with(order=missing_order)
+        self.exchange._request_order_status.assert_awaited_once_with(tracked_order=missing_order)
+
+        self.assertEqual(Decimal("0.5"), open_order.executed_amount_base)
+        self.assertEqual(OrderState.PARTIALLY_FILLED, open_order.current_state)
+        self.assertEqual(1, len(self.order_filled_logger.event_log))
+        self.assertTrue(missing_order.is_cancelled)
+        self.assertNotIn(missing_order.client_order_id, self.exchange.in_flight_orders)
+
+    def test_update_order_status_in_bulk_falls_back_to_each_order_when_bulk_request_fails(self):
+        self.exchange._set_current_timestamp(1640780000)
+        for order_id, exchange_order_id in [("OID1", "100234"), ("OID2", "100235")]:
+            self.exchange.start_tracking_order(
+                order_id=order_id,
+                exchange_order_id=exchange_order_id,
+                trading_pair=self.trading_pair,
+                order_type=OrderType.LIMIT,
+                trade_type=TradeType.BUY,
+                price=Decimal("10000"),
+                amount=Decimal("1"),
+            )
+        orders = list(self.exchange.in_flight_orders.values())
+        self.exchange._request_recent_trade_updates = AsyncMock(side_effect=IOError("Test error"))
+        self.exchange._request_open_order_updates = AsyncMock(return_value=[])
+        self.exchange._all_trade_updates_for_order = AsyncMock(return_value=[])
+        self.exchange._request_order_status = AsyncMock(side_effect=lambda tracked_order: OrderUpdate(
+            trading_pair=self.trading_pair,
+            update_timestamp=1640780000,
+            new_state=OrderState.OPEN,
+            client_order_id=tracked_order.client_order_id,
+            exchange_order_id=tracked_order.exchange_order_id,
+        ))
+
+        self.async_run_with_timeout(self.exchange._update_order_status())
+
+        self.assertEqual(orders, [call.kwargs["order"] for call in self.exchange._all_trade_updates_for_order.await_args_list])
+        self.assertEqual(orders, [call.kwargs["tracked_order"] for call in self.exchange._request_order_status.await_args_list])
+        self.assertTrue(self.is_logged(
+            "WARNING",
+            "Failed to fetch the open orders and recent fills in bulk. Updating orders one by one. Error: Test error"))
+
+    def test_update_order_status_with_one_order_per_trading_pair_does_not_request_in_bulk(self):
+        self.exchange._set_current_timestamp(1640780000)
+        self.exchange.start_tracking_order(
+            order_id="OID1",
+            exchange_order_id="100234",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            price=Decimal("10000"),
+            amount=Decimal("1"),
+        )
+        order = self.exchange.in_flight_orders["OID1"]
+        self.exchange._request_recent_trade_updates = AsyncMock(return_value=[])
+        self.exchange._request_open_order_updates = AsyncMock(return_value=[])
+        self.exchange._all_trade_updates_for_order = AsyncMock(return_value=[])
+        self.exchange._request_order_status = AsyncMock(return_value=OrderUpdate(
+            trading_pair=self.trading_pair,
+            update_timestamp=1640780000,
+            new_state=OrderState.OPEN,
+            client_order_id=order.client_order_id,
+            exchange_order_id=order.exchange_order_id,
+        ))
+
+        self.async_run_with_timeout(self.exchange._update_order_status())
+
+        self.exchange._request_recent_trade_updates.assert_not_awaited()
+        self.exchange._request_open_order_updates.assert_not_awaited()
+        self.exchange._all_trade_updates_for_order.assert_awaited_once_with(order=order)
+        self.exchange._request_order_status.assert_awaited_once_with(tracked_order=order)
+
+    @aioresponses()
+    def test_request_open_order_updates(self, mock_api):
+        url = web_utils.private_rest_url(CONSTANTS.OPEN_ORDERS_PATH_URL)
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+        open_order = {
+            "symbol": self.exchange_symbol_for_tokens(self.base_asset, self.quote_asset),
+            "orderId": 100234,
+            "orderListId": -1,
+            "clientOrderId": "OID1",
+            "price": "10000",
+            "origQty": "1",
+            "executedQty": "0.5",
+            "cummulativeQuoteQty": "5000",
+            "status": "PARTIALLY_FILLED",
+            "timeInForce": "GTC",
+            "type": "LIMIT",
+            "side": "BUY",
+            "stopPrice": "0.0",
+            "icebergQty": "0.0",
+            "time": 1640780000000,
+            "updateTime": 1640780001000,
+            "isWorking": True,
+            "origQuoteOrderQty": "0.000000"
+        }
+        mock_api.get(regex_url, body=json.dumps([open_order]))
+
+        order_updates = self.async_run_with_timeout(
+            self.exchange._request_open_order_updates(trading_pairs=[self.trading_pair]))
+
+        request = self._all_executed_requests(mock_api, url)[0]
+        self.validate_auth_credentials_present(request)
+        self.assertEqual(self.exchange_symbol_for_tokens(self.base_asset, self.quote_asset),
+                         request.kwargs["params"]["symbol"])
+        self.assertEqual(1, len(order_updates))
+        self.assertEqual("OID1", order_updates[0].client_order_id)
+        self.assertEqual("100234", order_updates[0].exchange_order_id)
+        self.assertEqual(self.trading_pair, order_updates[0].trading_pair)
+        self.assertEqual(1640780001, order_updates[0].update_timestamp)
+        self.assertEqual(OrderState.PARTIALLY_FILLED, order_updates[0].new_state)
+
+    @aioresponses()
+    def test_request_recent_trade_updates(self, mock_api):
+        url = web_utils.private_rest_url(CONSTANTS.MY_TRADES_PATH_URL)
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+        trade_fill = {
+            "symbol": self.exchange_symbol_for_tokens(self.base_asset, self.quote_asset),
+            "id": 28457,
+            "orderId": 100234,
+            "orderListId": -1,
+            "price": "10000",
+            "qty": "0.5",
+            "quoteQty": "5000",
+            "commission": "0.1",
+            "commissionAsset": self.quote_asset,
+            "time": 1640780001000,
+            "isBuyer": False,
+            "isMaker": False,
+            "isBestMatch": True
+        }
+        # Fills older than the oldest tracked order are ignored
+        old_trade_fill = dict(trade_fill, id=28000, orderId=99999, time=1640770000000)
+        mock_api.get(regex_url, body=json.dumps([old_trade_fill, trade_fill]))
+
+        trade_updates = self.async_run_with_timeout(
+            self.exchange._request_recent_trade_updates(trading_pairs=[self.trading_pair], start_timestamp=1640780000))
+
+        request = self._all_executed_requests(mock_api, url)[0]
+        self.validate_auth_credentials_present(request)
+        request_params = request.kwargs["params"]
+        self.assertEqual(self.exchange_symbol_for_tokens(self.base_asset, self.quote_asset), request_params["symbol"])
+        self.assertEqual(CONSTANTS.MY_TRADES_MAX_LIMIT, request_params["limit"])
+        self.assertEqual(1, len(trade_updates))
+        trade_update = trade_updates[0]
+        self.assertEqual("28457", trade_update.trade_id)
+        self.assertIsNone(trade_update.client_order_id)
+        self.assertEqual("100234", trade_update.exchange_order_id)
+        self.assertEqual(self.trading_pair, trade_update.trading_pair)
+        self.assertEqual(Decimal("0.5"), trade_update.fill_base_amount)
+        self.assertEqual(Decimal("5000"), trade_update.fill_quote_amount)
+        self.assertEqual(Decimal("10000"), trade_update.fill_price)
+        self.assertEqual(1640780001, trade_update.fill_timestamp)
+        self.assertEqual([TokenAmount(self.quote_asset, Decimal("0.1"))], trade_update.fee.flat_fees)
+
+    def test_update_order_status_with_bounded_concurrency(self):
+        self.exchange._set_current_timestamp(1640780000)
+        for i in range(5):
+            self.exchange.start_tracking_order(
+                order_id=f"OID{i}",
+                exchange_order_id=str(100234 + i),
+                trading_pair=self.trading_pair,
+                order_type=OrderType.LIMIT,
+                trade_type=TradeType.BUY,
+                price=Decimal("10000"),
+                amount=Decimal("1"),
+            )
+        concurrent_requests = []
+        running_requests = 0
+
+        async def request_order_status(tracked_order: InFlightOrder) -> OrderUpdate:
+            nonlocal running_requests
+            running_requests += 1
+            concurrent_requests.append(running_requests)
+            await asyncio.sleep(0.01)
+            running_requests -= 1
+            return OrderUpdate(
+                trading_pair=self.trading_pair,
+                update_timestamp=1640780000,
+                new_state=OrderState.OPEN,
+                client_order_id=tracked_order.client_order_id,
+                exchange_order_id=tracked_order.exchange_order_id,
+            )
+
+        self.exchange._request_order_status = request_order_status
+        self.exchange.ORDER_STATUS_UPDATE_MAX_CONCURRENCY = 2
+
+        self.async_run_with_timeout(self.exchange._update_orders())
+
+        self.assertEqual(5, len(concurrent_requests))
+        self.assertEqual(2, max(concurrent_requests))
+
     @aioresponses()
     def test_update_order_fills_from_trades_triggers_filled_event(self, mock_api):
         self.exchange._set_current_timestamp(1640780000)
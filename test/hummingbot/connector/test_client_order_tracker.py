@@ -1,7 +1,7 @@
 import asyncio
 import unittest
 from decimal import Decimal
-from typing import Awaitable, Dict
+from typing import Awaitable, Dict, Optional
 from unittest.mock import patch
 
 from hummingbot.client.config.client_config_map import ClientConfigMap
@@ -1132,3 +1132,65 @@ class ClientOrderTrackerUnitTest(unittest.TestCase):
         self.tracker.lost_order_count_limit = 2
 
         self.assertEqual(2, self.tracker.lost_order_count_limit)
+
+    def _create_order(self, client_order_id: str, exchange_order_id: Optional[str] = None) -> InFlightOrder:
+        return InFlightOrder(
+            client_order_id=client_order_id,
+            exchange_order_id=exchange_order_id,
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+            initial_state=OrderState.OPEN,
+        )
+
+    def test_fetch_order_by_exchange_order_id_set_after_tracking(self):
+        order = self._create_order("someClientOrderId")
+        self.tracker.start_tracking_order(order)
+
+        self.assertIsNone(self.tracker.fetch_order(exchange_order_id="someExchangeOrderId"))
+
+        # The connectors can set the exchange order id on the order directly
+        order.update_exchange_order_id("someExchangeOrderId")
+        self.assertIs(order, self.tracker.fetch_order(exchange_order_id="someExchangeOrderId"))
+
+        other_order = self._create_order("otherClientOrderId")
+        self.tracker.start_tracking_order(other_order)
+        self.tracker.update_exchange_order_id(other_order.client_order_id, "otherExchangeOrderId")
+        self.assertEqual("otherExchangeOrderId", other_order.exchange_order_id)
+        self.assertIs(other_order, self.tracker.fetch_order(exchange_order_id="otherExchangeOrderId"))
+
+    def test_orders_by_exchange_order_id_follow_the_order_collections(self):
+        self.tracker = ClientOrderTracker(connector=self.connector, lost_order_count_limit=0)
+        active_order = self._create_order("OID1", "EOID1")
+        done_order = self._create_order("OID2", "EOID2")
+        lost_order = self._create_order("OID3", "EOID3")
+        for order in [active_order, done_order, lost_order]:
+            self.tracker.start_tracking_order(order)
+        self.tracker.stop_tracking_order(done_order.client_order_id)
+        self.async_run_with_timeout(self.tracker.process_order_not_found(lost_order.client_order_id))
+
+        fillable_orders = self.tracker.all_fillable_orders_by_exchange_order_id
+        updatable_orders = self.tracker.all_updatable_orders_by_exchange_order_id
+
+        self.assertEqual({"EOID1": active_order, "EOID2": done_order, "EOID3": lost_order}, dict(fillable_orders))
+        self.assertEqual({"EOID1": active_order, "EOID3": lost_order}, dict(updatable_orders))
+        self.assertIs(done_order, fillable_orders.get("EOID2"))
+        self.assertIsNone(updatable_orders.get("EOID2"))
+        self.assertNotIn("EOID4", fillable_orders)
+        self.assertIs(done_order, self.tracker.fetch_order(exchange_order_id="EOID2"))
+        self.assertIsNone(self.tracker.fetch_order(exchange_order_id="EOID3"))
+        self.assertIs(lost_order, self.tracker.fetch_lost_order(exchange_order_id="EOID3"))
+        self.assertIsNone(self.tracker.fetch_lost_order(exchange_order_id="EOID1"))
+
+    def test_orders_no_longer_cached_are_not_found_by_exchange_order_id(self):
+        order = self._create_order("someClientOrderId", "someExchangeOrderId")
+        self.tracker.start_tracking_order(order)
+        self.tracker.stop_tracking_order(order.client_order_id)
+
+        del self.tracker._cached_orders[order.client_order_id]
+
+        self.assertIsNone(self.tracker.fetch_order(exchange_order_id="someExchangeOrderId"))
+        self.assertNotIn("someExchangeOrderId", self.tracker.all_fillable_orders_by_exchange_order_id)
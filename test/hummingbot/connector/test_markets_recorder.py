@@ -1,7 +1,10 @@
 import asyncio
+import os
+import tempfile
+import threading
 import time
 from decimal import Decimal
-from typing import Awaitable
+from typing import Awaitable, Optional
 from unittest import TestCase
 from unittest.mock import MagicMock, PropertyMock, patch
 
@@ -13,17 +16,23 @@ from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.connector.markets_recorder import MarketsRecorder
 from hummingbot.core.data_type.common import OrderType, PositionAction, PriceType, TradeType
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
 from hummingbot.core.event.events import (
     BuyOrderCompletedEvent,
     BuyOrderCreatedEvent,
     MarketEvent,
+    OrderBookEvent,
+    OrderBookTradeEvent,
     OrderFilledEvent,
     SellOrderCreatedEvent,
 )
+from hummingbot.data_feed.columnar_market_data import ColumnarMarketDataReader, ColumnarMarketDataWriter
 from hummingbot.logger import HummingbotLogger
 from hummingbot.model.executors import Executors
 from hummingbot.model.market_data import MarketData
+from hummingbot.model.market_order_state import MarketOrderState
+from hummingbot.model.market_state import MarketState
 from hummingbot.model.order import Order
 from hummingbot.model.position import Position
 from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
@@ -92,6 +101,30 @@ class MarketsRecorderTests(TestCase):
     def add_exchange_order_ids_from_market_recorder(self, current_exchange_order_ids):
         pass
 
+    def restore_tracking_states(self, saved_states):
+        self.restored_tracking_states = saved_states
+
+    def add_listener(self, event_tag, listener):
+        pass
+
+    def remove_listener(self, event_tag, listener):
+        pass
+
+    def get_saved_order_states(self, manager: Optional[SQLConnectionManager] = None):
+        with (manager or self.manager).get_new_session() as session:
+            return {order_state.state_key: order_state.saved_state
+                    for order_state in session.query(MarketOrderState).all()}
+
+    @patch("hummingbot.model.sql_connection_manager.create_engine")
+    def create_file_db_manager(self, engine_mock) -> SQLConnectionManager:
+        # The in memory database is not shared between threads, so the write-behind tests use a file database
+        db_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(db_dir.cleanup)
+        engine_mock.return_value = create_engine(f"sqlite:///{os.path.join(db_dir.name, 'test_DB.sqlite')}")
+        return SQLConnectionManager(
+            ClientConfigAdapter(ClientConfigMap()), SQLConnectionType.TRADE_FILLS, db_name="test_DB"
+        )
+
     def test_properties(self):
         recorder = MarketsRecorder(
             sql=self.manager,
@@ -442,6 +475,131 @@ class MarketsRecorderTests(TestCase):
         self.assertEqual(market_data[0].best_bid, Decimal("99"))
         self.assertEqual(market_data[0].mid_price, Decimal("100"))
 
+    @patch("hummingbot.connector.markets_recorder.MarketsRecorder._sleep")
+    def test_market_data_collection_keeps_exact_update_ids(self, sleep_mock):
+        sleep_mock.side_effect = [0.1, asyncio.CancelledError]
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=True,
+                market_data_collection_interval=1,
+                market_data_collection_depth=2,
+            ),
+        )
+        # Beyond 2^53 the update id can not be represented exactly as a float64
+        update_id = 2 ** 53 + 1
+        order_book = OrderBook(dex=False)
+        order_book.apply_snapshot([OrderBookRow(99, 1, update_id), OrderBookRow(98, 1, update_id)],
+                                  [OrderBookRow(101, 1, update_id), OrderBookRow(102, 1, update_id)],
+                                  update_id)
+
+        with patch.object(self, "get_price_by_type", return_value=Decimal("100")):
+            with patch.object(self, "get_order_book", return_value=order_book):
+                with self.assertRaises(asyncio.CancelledError):
+                    self.async_run_with_timeout(recorder._record_market_data())
+        with self.manager.get_new_session() as session:
+            market_data = session.query(MarketData).all()
+
+        self.assertEqual([[99, 1, update_id], [98, 1, update_id]], market_data[0].order_book["bid"])
+        self.assertEqual([[101, 1, update_id], [102, 1, update_id]], market_data[0].order_book["ask"])
+
+    @patch("hummingbot.connector.markets_recorder.MarketsRecorder._sleep")
+    def test_market_data_collection_with_columnar_storage(self, sleep_mock):
+        sleep_mock.side_effect = [0.1, asyncio.CancelledError]
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=True,
+                market_data_collection_interval=1,
+                market_data_collection_depth=2,
+                market_data_collection_storage="columnar",
+            ),
+        )
+        market_data_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(market_data_dir.cleanup)
+        recorder._market_data_writer = ColumnarMarketDataWriter(root_path=market_data_dir.name, depth=2)
+        order_book = OrderBook(dex=False)
+        order_book.apply_numpy_snapshot(np.array([[99, 1, 1], [98, 2, 1], [97, 3, 1]], dtype=np.float64),
+                                        np.array([[101, 1, 1], [102, 2, 1]], dtype=np.float64))
+        prices = {PriceType.MidPrice: Decimal("100"), PriceType.BestBid: Decimal("99"),
+                  PriceType.BestAsk: Decimal("101")}
+
+        with patch.object(self, "get_price_by_type", side_effect=lambda _, price_type: prices[price_type]):
+            with patch.object(self, "get_order_book", return_value=order_book):
+                with self.assertRaises(asyncio.CancelledError):
+                    self.async_run_with_timeout(recorder._record_market_data())
+        order_book.trigger_event(OrderBookEvent.TradeEvent, OrderBookTradeEvent(
+            trading_pair=self.trading_pair, timestamp=1700000000, type=TradeType.SELL, price=Decimal("99"),
+            amount=Decimal("0.5")))
+        recorder.stop()
+
+        reader = ColumnarMarketDataReader(root_path=market_data_dir.name)
+        snapshots = reader.load_snapshots(self.display_name, self.trading_pair)
+        # One snapshot per collection interval
+        self.assertEqual([100, 100], snapshots["mid_price"].tolist())
+        self.assertEqual([[99, 98], [99, 98]], snapshots["bid_prices"].tolist())
+        self.assertEqual([[101, 102], [101, 102]], snapshots["ask_prices"].tolist())
+        trades = reader.load_trades(self.display_name, self.trading_pair)
+        self.assertEqual([99], trades["price"].tolist())
+        self.assertEqual([TradeType.SELL.value], trades["trade_type"].tolist())
+        self.assertEqual([], order_book.get_listeners(OrderBookEvent.TradeEvent))
+        with self.manager.get_new_session() as session:
+            self.assertEqual(0, session.query(MarketData).count())
+
+    def test_append_to_csv_keeps_file_open_until_stop(self):
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=False,
+                market_data_collection_interval=60,
+                market_data_collection_depth=20,
+            ),
+        )
+        csv_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(csv_dir.cleanup)
+
+        with patch("hummingbot.connector.markets_recorder.data_path", return_value=csv_dir.name):
+            for i in range(3):
+                recorder.append_to_csv(TradeFill(
+                    config_file_path="test_config.yml",
+                    strategy=self.strategy_name,
+                    market=self.display_name,
+                    symbol=self.symbol,
+                    base_asset=self.base,
+                    quote_asset=self.quote,
+                    timestamp=1640001112223 + i,
+                    order_id=f"OID{i}",
+                    trade_type=TradeType.BUY.name,
+                    order_type=OrderType.LIMIT.name,
+                    price=Decimal(1000),
+                    amount=Decimal(1),
+                    leverage=1,
+                    trade_fee=AddedToCostTradeFee().to_json(),
+                    exchange_trade_id=f"EOID{i}",
+                    position=PositionAction.NIL.value))
+        csv_path = os.path.join(csv_dir.name, "trades_test_config.csv")
+        self.assertEqual(1, len(recorder._csv_appenders))
+        self.assertTrue(recorder._csv_appenders[csv_path].is_open)
+
+        recorder.stop()
+
+        self.assertEqual({}, recorder._csv_appenders)
+        with open(csv_path) as f:
+            lines = f.read().splitlines()
+        self.assertEqual(4, len(lines))
+        self.assertEqual(",".join(TradeFill.attribute_names_for_file_export() + ["age"]), lines[0])
+        self.assertTrue(lines[1].startswith("EOID0,test_config.yml,test_strategy,test_market,"))
+        self.assertTrue(lines[3].endswith(",n/a"))
+
     def test_store_position(self):
         recorder = MarketsRecorder(
             sql=self.manager,
@@ -495,3 +653,340 @@ class MarketsRecorderTests(TestCase):
             query = session.query(Executors)
             executors = query.all()
         self.assertEqual(1, len(executors))
+
+    def test_started_recorder_writes_order_events_from_write_behind_queue(self):
+        manager = self.create_file_db_manager()
+        recorder = MarketsRecorder(
+            sql=manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=False,
+                market_data_collection_interval=60,
+                market_data_collection_depth=20,
+            ),
+        )
+        recorder.start()
+        self.addCleanup(recorder.stop)
+
+        create_event = BuyOrderCreatedEvent(
+            timestamp=1642010000,
+            type=OrderType.LIMIT,
+            trading_pair=self.trading_pair,
+            amount=Decimal(1),
+            price=Decimal(1000),
+            order_id="OID1-1642010000000000",
+            creation_timestamp=1640001112.223,
+            exchange_order_id="EOID1",
+        )
+        fill_event = OrderFilledEvent(
+            timestamp=1642020000,
+            order_id=create_event.order_id,
+            trading_pair=create_event.trading_pair,
+            trade_type=TradeType.BUY,
+            order_type=create_event.type,
+            price=create_event.price,
+            amount=create_event.amount,
+            trade_fee=AddedToCostTradeFee(),
+            exchange_trade_id="TID1",
+        )
+        recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, create_event)
+        recorder._did_fill_order(MarketEvent.OrderFilled.value, self, fill_event)
+
+        self.assertTrue(recorder.flush(timeout=5))
+        self.assertEqual(0, recorder.pending_writes)
+        with manager.get_new_session() as session:
+            orders = session.query(Order).all()
+            self.assertEqual(1, len(orders))
+            self.assertEqual(MarketEvent.OrderFilled.name, orders[0].last_status)
+            self.assertEqual(2, len(orders[0].status))
+            self.assertEqual(1, len(orders[0].trade_fills))
+
+        # Reads wait for the queued writes
+        recorder._did_fill_order(MarketEvent.OrderFilled.value, self, OrderFilledEvent(
+            timestamp=1642030000,
+            order_id=create_event.order_id,
+            trading_pair=create_event.trading_pair,
+            trade_type=TradeType.BUY,
+            order_type=create_event.type,
+            price=create_event.price,
+            amount=create_event.amount,
+            trade_fee=AddedToCostTradeFee(),
+            exchange_trade_id="TID2",
+        ))
+        trades = recorder.get_trades_for_config(self.config_file_path)
+        self.assertEqual({"TID1", "TID2"}, {trade.exchange_trade_id for trade in trades})
+
+    def test_reads_wait_for_pending_writes_with_timeout(self):
+        manager = self.create_file_db_manager()
+        recorder = MarketsRecorder(
+            sql=manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=False,
+                market_data_collection_interval=60,
+                market_data_collection_depth=20,
+            ),
+        )
+        recorder.start()
+        self.addCleanup(recorder.stop)
+        writer_released = threading.Event()
+        self.addCleanup(writer_released.set)
+        recorder._write_queue.put(lambda session: writer_released.wait(5))
+
+        with patch.object(MarketsRecorder, "READ_FLUSH_TIMEOUT", 0.1), patch.object(MarketsRecorder, "logger") as logger:
+            start = time.time()
+            trades = recorder.get_trades_for_config(self.config_file_path)
+
+        self.assertEqual([], trades)
+        self.assertLess(time.time() - start, 2)
+        logger.return_value.warning.assert_called_once()
+
+    def test_wait_for_pending_writes_does_not_block_the_event_loop(self):
+        manager = self.create_file_db_manager()
+        recorder = MarketsRecorder(
+            sql=manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=False,
+                market_data_collection_interval=60,
+                market_data_collection_depth=20,
+            ),
+        )
+        recorder.start()
+        self.addCleanup(recorder.stop)
+        writer_released = threading.Event()
+        self.addCleanup(writer_released.set)
+        recorder._write_queue.put(lambda session: writer_released.wait(5))
+        create_event = BuyOrderCreatedEvent(
+            timestamp=1642010000,
+            type=OrderType.LIMIT,
+            trading_pair=self.trading_pair,
+            amount=Decimal(1),
+            price=Decimal(1000),
+            order_id="OID1-1642010000000000",
+            creation_timestamp=1640001112.223,
+            exchange_order_id="EOID1",
+        )
+        recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, create_event)
+        recorder._did_fill_order(MarketEvent.OrderFilled.value, self, OrderFilledEvent(
+            timestamp=1642020000,
+            order_id=create_event.order_id,
+            trading_pair=create_event.trading_pair,
+            trade_type=TradeType.BUY,
+            order_type=create_event.type,
+            price=create_event.price,
+            amount=create_event.amount,
+            trade_fee=AddedToCostTradeFee(),
+            exchange_trade_id="TID1",
+        ))
+
+        async def read_trades():
+            wait_task = asyncio.ensure_future(recorder.wait_for_pending_writes())
+            await asyncio.sleep(0.05)
+            # The event loop keeps running while the writes are pending, and the reads from the loop don't wait
+            self.assertFalse(wait_task.done())
+            self.assertEqual([], recorder.get_trades_for_config(self.config_file_path))
+            writer_released.set()
+            await wait_task
+            return recorder.get_trades_for_config(self.config_file_path)
+
+        trades = self.async_run_with_timeout(read_trades(), timeout=5)
+
+        self.assertEqual(["TID1"], [trade.exchange_trade_id for trade in trades])
+
+    def test_stop_writes_pending_records(self):
+        manager = self.create_file_db_manager()
+        recorder = MarketsRecorder(
+            sql=manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=False,
+                market_data_collection_interval=60,
+                market_data_collection_depth=20,
+            ),
+        )
+        recorder.start()
+
+        for i in range(20):
+            recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, BuyOrderCreatedEvent(
+                timestamp=1642010000 + i,
+                type=OrderType.LIMIT,
+                trading_pair=self.trading_pair,
+                amount=Decimal(1),
+                price=Decimal(1000),
+                order_id=f"OID{i}",
+                creation_timestamp=1640001112.223,
+                exchange_order_id=f"EOID{i}",
+            ))
+        recorder.stop()
+
+        with manager.get_new_session() as session:
+            self.assertEqual(20, session.query(Order).count())
+
+    def test_market_states_checkpoints_are_rate_limited(self):
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=False,
+                market_data_collection_interval=60,
+                market_data_collection_depth=20,
+            ),
+            market_states_checkpoint_interval=60,
+        )
+        self.tracking_states = {"OID1": {"state": "OPEN"}}
+        recorder._mark_market_states_dirty(self)
+        self.assertEqual({"OID1": {"state": "OPEN"}}, self.get_saved_order_states())
+
+        self.tracking_states = {"OID1": {"state": "PARTIALLY_FILLED"}}
+        recorder._mark_market_states_dirty(self)
+        recorder._mark_market_states_dirty(self)
+        self.assertEqual({"OID1": {"state": "OPEN"}}, self.get_saved_order_states())
+        self.assertIsNotNone(recorder._market_states_checkpoint_handle)
+
+        recorder.checkpoint_market_states()
+        self.assertEqual({"OID1": {"state": "PARTIALLY_FILLED"}}, self.get_saved_order_states())
+        self.assertIsNone(recorder._market_states_checkpoint_handle)
+
+    def test_market_states_checkpoint_writes_only_changed_orders(self):
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=False,
+                market_data_collection_interval=60,
+                market_data_collection_depth=20,
+            ),
+        )
+        with self.manager.get_new_session() as session:
+            with session.begin():
+                # Tracking states saved by a previous run
+                session.add(MarketState(config_file_path=self.config_file_path, market=self.display_name,
+                                        timestamp=1, saved_state={"OID0": {"state": "OPEN"}}))
+        recorder.restore_market_states(self.config_file_path, self)
+        self.assertEqual({"OID0": {"state": "OPEN"}}, self.restored_tracking_states)
+
+        self.tracking_states = {"OID1": {"state": "OPEN"}, "OID2": {"state": "OPEN"}}
+        recorder._dirty_markets[self.display_name] = self
+        recorder.checkpoint_market_states()
+        self.assertEqual(self.tracking_states, self.get_saved_order_states())
+
+        self.tracking_states = {"OID2": {"state": "FILLED"}, "OID3": {"state": "OPEN"}}
+        with patch.object(recorder, "_write_market_states_changes",
+                          wraps=recorder._write_market_states_changes) as write_changes_mock:
+            recorder._dirty_markets[self.display_name] = self
+            recorder.checkpoint_market_states()
+
+        _, _, _, changed_states, removed_keys, _ = write_changes_mock.call_args.args
+        self.assertEqual(self.tracking_states, changed_states)
+        self.assertEqual(["OID1"], removed_keys)
+        self.assertEqual(self.tracking_states, self.get_saved_order_states())
+
+        recorder.restore_market_states(self.config_file_path, self)
+        self.assertEqual(self.tracking_states, self.restored_tracking_states)
+
+        with patch.object(recorder, "_write_market_states_changes") as write_changes_mock:
+            recorder._dirty_markets[self.display_name] = self
+            recorder.checkpoint_market_states()
+        write_changes_mock.assert_not_called()
+
+    def test_stop_checkpoints_pending_market_states(self):
+        manager = self.create_file_db_manager()
+        recorder = MarketsRecorder(
+            sql=manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=False,
+                market_data_collection_interval=60,
+                market_data_collection_depth=20,
+            ),
+            market_states_checkpoint_interval=60,
+        )
+        recorder.start()
+
+        for i in range(5):
+            self.tracking_states = {"OID1": {"state": "OPEN", "executed_amount": i}}
+            recorder._mark_market_states_dirty(self)
+        recorder.stop()
+
+        self.assertEqual(self.tracking_states, self.get_saved_order_states(manager))
+
+    def test_fills_update_performance_accumulator_restored_by_next_recorder(self):
+        market_data_collection = MarketDataCollectionConfigMap(
+            market_data_collection_enabled=False,
+            market_data_collection_interval=60,
+            market_data_collection_depth=20,
+        )
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=market_data_collection,
+            performance_start_time=1642000000,
+        )
+
+        def fill_event(timestamp: float, trade_id: str, trade_type: TradeType) -> OrderFilledEvent:
+            return OrderFilledEvent(
+                timestamp=timestamp,
+                order_id=f"OID-{trade_id}",
+                trading_pair=self.trading_pair,
+                trade_type=trade_type,
+                order_type=OrderType.LIMIT,
+                price=Decimal(1000),
+                amount=Decimal(1),
+                trade_fee=AddedToCostTradeFee(),
+                exchange_trade_id=trade_id,
+            )
+
+        recorder._did_fill_order(MarketEvent.OrderFilled.value, self, fill_event(1642010000, "T1", TradeType.BUY))
+        recorder._did_fill_order(MarketEvent.OrderFilled.value, self, fill_event(1642020000, "T2", TradeType.SELL))
+
+        trade_stats = recorder.performance_accumulator.trade_stats[(self.display_name, self.trading_pair)]
+        self.assertEqual(1, trade_stats.num_buys)
+        self.assertEqual(1, trade_stats.num_sells)
+
+        recorder.stop()
+        # A fill recorded after the last checkpoint is added when the accumulator is restored
+        with patch.object(recorder, "_queue_performance_checkpoint"):
+            recorder._did_fill_order(MarketEvent.OrderFilled.value, self, fill_event(1642030000, "T3", TradeType.BUY))
+            # A fill recovered later, older than the last fill of the checkpoint
+            recorder._did_fill_order(MarketEvent.OrderFilled.value, self, fill_event(1642015000, "T4", TradeType.SELL))
+
+        restored_recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=market_data_collection,
+            performance_start_time=1642000000,
+        )
+        trade_stats = restored_recorder.performance_accumulator.trade_stats[(self.display_name, self.trading_pair)]
+        self.assertEqual(2, trade_stats.num_buys)
+        self.assertEqual(2, trade_stats.num_sells)
+
+        other_period_recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=market_data_collection,
+            performance_start_time=1642015000,
+        )
+        trade_stats = other_period_recorder.performance_accumulator.trade_stats[(self.display_name, self.trading_pair)]
+        self.assertEqual(1, trade_stats.num_buys)
+        self.assertEqual(2, trade_stats.num_sells)
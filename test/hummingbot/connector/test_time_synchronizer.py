@@ -75,3 +75,110 @@ class TimeSynchronizerTests(TestCase):
         calculated_offset = numpy.mean([calculated_median, calculated_weighted_average])
 
         self.assertEqual(calculated_offset + seconds_difference_when_calculating_current_time, synchronized_time)
+
+    @patch("hummingbot.connector.time_synchronizer.TimeSynchronizer._current_seconds_counter")
+    def test_offset_calculated_once_per_sample(self, seconds_counter_mock):
+        seconds_counter_mock.return_value = 100
+        time_provider = TimeSynchronizer()
+        time_provider.add_time_offset_ms_sample(1000, local_time_ms=0)
+
+        with patch("hummingbot.connector.time_synchronizer.numpy.median") as median_mock:
+            for _ in range(3):
+                self.assertEqual(101, time_provider.time())
+        median_mock.assert_not_called()
+
+        time_provider.add_time_offset_ms_sample(3000, local_time_ms=0)
+        self.assertAlmostEqual(102.25, time_provider.time())
+
+        time_provider.clear_time_offset_ms_samples()
+        with patch("hummingbot.connector.time_synchronizer.TimeSynchronizer._time") as time_mock:
+            time_mock.return_value = 1640000000
+            self.assertEqual(1640000000, time_provider.time())
+
+    @patch("hummingbot.connector.time_synchronizer.TimeSynchronizer._current_seconds_counter")
+    def test_time_ns(self, seconds_counter_mock):
+        seconds_counter_mock.return_value = 10.5
+        time_provider = TimeSynchronizer()
+        time_provider.add_time_offset_ms_sample(1640000000000, local_time_ms=0)
+
+        self.assertEqual(1640000010500000000, time_provider.time_ns())
+
+    @patch("hummingbot.connector.time_synchronizer.TimeSynchronizer._current_seconds_counter")
+    def test_drift_correction_between_samples(self, seconds_counter_mock):
+        time_provider = TimeSynchronizer(drift_correction=True)
+        # The server clock advances 1 ms more than the local clock every 10 seconds
+        for local_time_ms in [0, 10000, 20000, 30000, 40000]:
+            time_provider.add_time_offset_ms_sample(1000 + local_time_ms * 1e-4, local_time_ms=local_time_ms)
+
+        self.assertAlmostEqual(1e-4, time_provider.drift_rate)
+        seconds_counter_mock.return_value = 40
+        self.assertAlmostEqual(1004, time_provider.time_offset_ms)
+        seconds_counter_mock.return_value = 100
+        self.assertAlmostEqual(1010, time_provider.time_offset_ms)
+
+        without_drift_correction = TimeSynchronizer()
+        for local_time_ms in [0, 10000, 20000, 30000, 40000]:
+            without_drift_correction.add_time_offset_ms_sample(1000 + local_time_ms * 1e-4, local_time_ms=local_time_ms)
+        self.assertEqual(0, without_drift_correction.drift_rate)
+
+    @patch("hummingbot.connector.time_synchronizer.TimeSynchronizer._current_seconds_counter")
+    def test_update_required_without_samples_or_when_requested(self, seconds_counter_mock):
+        seconds_counter_mock.return_value = 100
+        time_provider = TimeSynchronizer()
+        self.assertTrue(time_provider.is_update_required())
+
+        time_provider.add_time_offset_ms_sample(1000, local_time_ms=100000)
+        self.assertFalse(time_provider.is_update_required())
+
+        time_provider.request_update()
+        self.assertTrue(time_provider.is_update_required())
+        self.assertTrue(time_provider.drift_statistics.update_requested)
+
+        time_provider.add_time_offset_ms_sample(1000, local_time_ms=100000)
+        self.assertFalse(time_provider.is_update_required())
+
+        time_provider.clear_time_offset_ms_samples()
+        self.assertTrue(time_provider.is_update_required())
+
+    @patch("hummingbot.connector.time_synchronizer.TimeSynchronizer._current_seconds_counter")
+    def test_update_required_when_sample_too_old(self, seconds_counter_mock):
+        time_provider = TimeSynchronizer(max_sample_age=60)
+        time_provider.add_time_offset_ms_sample(1000, local_time_ms=0)
+
+        seconds_counter_mock.return_value = 59
+        self.assertFalse(time_provider.is_update_required())
+        seconds_counter_mock.return_value = 60
+        self.assertTrue(time_provider.is_update_required())
+
+    @patch("hummingbot.connector.time_synchronizer.TimeSynchronizer._current_seconds_counter")
+    def test_update_required_when_expected_drift_exceeds_tolerance(self, seconds_counter_mock):
+        time_provider = TimeSynchronizer(max_sample_age=300, min_sample_age=10, drift_tolerance_ms=50)
+        time_provider.add_time_offset_ms_sample(1000, local_time_ms=0)
+        # The offset moved 20 ms in 10 seconds
+        time_provider.add_time_offset_ms_sample(1020, local_time_ms=10000)
+
+        statistics = time_provider.drift_statistics
+        self.assertEqual(20, statistics.last_drift_ms)
+        self.assertEqual(20, statistics.max_drift_ms)
+        self.assertEqual(2, statistics.drift_speed)
+        self.assertEqual(2, statistics.samples_count)
+
+        seconds_counter_mock.return_value = 15
+        self.assertEqual(5, time_provider.drift_statistics.sample_age)
+        self.assertFalse(time_provider.is_update_required())
+        seconds_counter_mock.return_value = 34
+        self.assertFalse(time_provider.is_update_required())
+        seconds_counter_mock.return_value = 35
+        self.assertTrue(time_provider.is_update_required())
+
+    @patch("hummingbot.connector.time_synchronizer.TimeSynchronizer._current_seconds_counter")
+    def test_stable_offset_only_updated_when_sample_too_old(self, seconds_counter_mock):
+        time_provider = TimeSynchronizer(max_sample_age=300)
+        for local_time_ms in [0, 10000, 20000]:
+            time_provider.add_time_offset_ms_sample(1000, local_time_ms=local_time_ms)
+
+        self.assertEqual(0, time_provider.drift_statistics.drift_speed)
+        seconds_counter_mock.return_value = 319
+        self.assertFalse(time_provider.is_update_required())
+        seconds_counter_mock.return_value = 320
+        self.assertTrue(time_provider.is_update_required())
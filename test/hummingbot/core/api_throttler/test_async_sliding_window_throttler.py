@@ -0,0 +1,168 @@
+import asyncio
+import time
+import unittest
+from decimal import Decimal
+from typing import List
+from unittest.mock import patch
+
+from hummingbot.core.api_throttler.async_sliding_window_throttler import (
+    AsyncSlidingWindowRequestContext,
+    AsyncSlidingWindowThrottler,
+    RateLimitWindow,
+)
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit
+from hummingbot.core.api_throttler.request_priority import RequestPriority
+
+TEST_PATH_URL = "/hummingbot"
+TEST_POOL_ID = "TEST"
+TEST_WEIGHTED_POOL_ID = "TEST_WEIGHTED"
+TEST_WEIGHTED_TASK_1_ID = "/weighted_task_1"
+TEST_WEIGHTED_TASK_2_ID = "/weighted_task_2"
+
+
+class AsyncSlidingWindowThrottlerUnitTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+
+        cls.rate_limits: List[RateLimit] = [
+            RateLimit(limit_id=TEST_POOL_ID, limit=1, time_interval=5.0),
+            RateLimit(limit_id=TEST_PATH_URL, limit=1, time_interval=5.0,
+                      linked_limits=[LinkedLimitWeightPair(TEST_POOL_ID)]),
+            RateLimit(limit_id=TEST_WEIGHTED_POOL_ID, limit=10, time_interval=5.0),
+            RateLimit(limit_id=TEST_WEIGHTED_TASK_1_ID,
+                      limit=1000,
+                      time_interval=5.0,
+                      linked_limits=[LinkedLimitWeightPair(TEST_WEIGHTED_POOL_ID, 5)]),
+            RateLimit(limit_id=TEST_WEIGHTED_TASK_2_ID,
+                      limit=1000,
+                      time_interval=5.0,
+                      linked_limits=[LinkedLimitWeightPair(TEST_WEIGHTED_POOL_ID, 1)]),
+        ]
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.throttler = AsyncSlidingWindowThrottler(rate_limits=self.rate_limits)
+
+    def async_run_with_timeout(self, coroutine, timeout: float = 1):
+        return self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    def test_window_expires_tasks_outside_the_window(self):
+        window = RateLimitWindow(rate_limit=RateLimit(limit_id="test", limit=3, time_interval=1), safety_margin_pct=0)
+        window.record(now=100.0, weight=1)
+        window.record(now=100.5, weight=2)
+        self.assertEqual(3, window.used_capacity)
+        self.assertFalse(window.has_capacity(1))
+
+        window.expire(now=101.1)
+        self.assertEqual(2, window.used_capacity)
+        self.assertTrue(window.has_capacity(1))
+
+        window.expire(now=101.6)
+        self.assertEqual(0, window.used_capacity)
+
+    def test_window_release_time(self):
+        window = RateLimitWindow(rate_limit=RateLimit(limit_id="test", limit=3, time_interval=1), safety_margin_pct=0.1)
+        window.record(now=100.0, weight=1)
+        window.record(now=100.5, weight=2)
+
+        self.assertAlmostEqual(101.1, window.release_time(1))
+        self.assertAlmostEqual(101.6, window.release_time(3))
+        self.assertIsNone(window.release_time(4))
+
+    def test_within_capacity_singular_task(self):
+        context = self.throttler.execute_task(limit_id=TEST_POOL_ID)
+        self.assertTrue(context.within_capacity())
+
+        self.async_run_with_timeout(context.acquire())
+        self.assertFalse(self.throttler.execute_task(limit_id=TEST_POOL_ID).within_capacity())
+
+    def test_within_capacity_linked_limits(self):
+        self.async_run_with_timeout(self.throttler.execute_task(limit_id=TEST_POOL_ID).acquire())
+
+        # The pool is shared with the path url limit
+        self.assertFalse(self.throttler.execute_task(limit_id=TEST_PATH_URL).within_capacity())
+
+    def test_within_capacity_pool_weighted_tasks(self):
+        self.async_run_with_timeout(self.throttler.execute_task(limit_id=TEST_WEIGHTED_TASK_1_ID).acquire())
+        self.async_run_with_timeout(self.throttler.execute_task(limit_id=TEST_WEIGHTED_TASK_2_ID).acquire())
+
+        # Another Task 1 (weight=5) will exceed the capacity (11/10), but Task 2 (weight=1) will not (7/10)
+        self.assertFalse(self.throttler.execute_task(limit_id=TEST_WEIGHTED_TASK_1_ID).within_capacity())
+        self.assertTrue(self.throttler.execute_task(limit_id=TEST_WEIGHTED_TASK_2_ID).within_capacity())
+
+    def test_within_capacity_for_unknown_limit_id(self):
+        throttler = AsyncSlidingWindowThrottler(rate_limits=[])
+        context = throttler.execute_task(limit_id="test_limit_id")
+        self.assertTrue(context.within_capacity())
+        self.async_run_with_timeout(context.acquire())
+
+    def test_acquire_awaits_when_exceed_capacity(self):
+        self.async_run_with_timeout(self.throttler.execute_task(limit_id=TEST_POOL_ID).acquire())
+
+        with self.assertRaises(asyncio.TimeoutError):
+            self.async_run_with_timeout(self.throttler.execute_task(limit_id=TEST_POOL_ID).acquire(), timeout=0.5)
+
+    def test_acquire_sleeps_until_capacity_is_released(self):
+        rate_limit = RateLimit(limit_id="test", limit=1, time_interval=10)
+        throttler = AsyncSlidingWindowThrottler(rate_limits=[rate_limit], safety_margin_pct=0)
+        now = time.time()
+        throttler._window_for(throttler._id_to_limit_map["test"]).record(now=now - 9.8, weight=1)
+
+        with patch.object(AsyncSlidingWindowRequestContext, "_sleep", side_effect=asyncio.sleep) as sleep_mock:
+            start = time.time()
+            self.async_run_with_timeout(throttler.execute_task(limit_id="test").acquire())
+            elapsed = time.time() - start
+
+        # A single sleep for the time left until the capacity is released, instead of polling
+        self.assertEqual(1, sleep_mock.call_count)
+        self.assertAlmostEqual(0.2, sleep_mock.call_args[0][0], delta=0.05)
+        self.assertLess(elapsed, 0.5)
+
+    def test_set_rate_limits_keeps_used_capacity(self):
+        self.async_run_with_timeout(self.throttler.execute_task(limit_id=TEST_WEIGHTED_TASK_1_ID).acquire())
+
+        new_limits = [RateLimit(limit_id=limit.limit_id, limit=limit.limit, time_interval=limit.time_interval,
+                                linked_limits=limit.linked_limits) for limit in self.rate_limits]
+        new_limits[2] = RateLimit(limit_id=TEST_WEIGHTED_POOL_ID, limit=5, time_interval=5.0)
+        self.throttler.set_rate_limits(new_limits)
+
+        self.assertFalse(self.throttler.execute_task(limit_id=TEST_WEIGHTED_TASK_2_ID).within_capacity())
+
+    def test_limits_share_percentage(self):
+        throttler = AsyncSlidingWindowThrottler(
+            rate_limits=[RateLimit(limit_id="test", limit=10, time_interval=5)],
+            limits_share_percentage=Decimal("20"))
+
+        for _ in range(2):
+            self.async_run_with_timeout(throttler.execute_task(limit_id="test").acquire())
+
+        context = throttler.execute_task(limit_id="test")
+        self.assertIsInstance(context, AsyncSlidingWindowRequestContext)
+        self.assertFalse(context.within_capacity())
+
+    def test_lower_priority_requests_yield_to_waiting_higher_priority_requests(self):
+        throttler = AsyncSlidingWindowThrottler(rate_limits=[RateLimit(limit_id="test", limit=1, time_interval=0.3)],
+                                                retry_interval=0.01)
+        acquisition_order = []
+
+        async def execute_request(priority: RequestPriority, delay: float):
+            await asyncio.sleep(delay)
+            async with throttler.execute_task(limit_id="test", priority=priority):
+                acquisition_order.append(priority)
+
+        async def execute_requests():
+            await execute_request(RequestPriority.BACKGROUND, 0)
+            await asyncio.gather(
+                execute_request(RequestPriority.BACKGROUND, 0),
+                execute_request(RequestPriority.ORDER_CRITICAL, 0.05),
+            )
+
+        self.async_run_with_timeout(execute_requests(), timeout=2)
+
+        self.assertEqual(
+            [RequestPriority.BACKGROUND, RequestPriority.ORDER_CRITICAL, RequestPriority.BACKGROUND],
+            acquisition_order)
+        self.assertEqual(1, throttler.queue_wait_stats[RequestPriority.ORDER_CRITICAL].requests)
+        self.assertEqual(2, throttler.queue_wait_stats[RequestPriority.BACKGROUND].requests)
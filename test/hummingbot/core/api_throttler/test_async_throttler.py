@@ -12,6 +12,7 @@ from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.core.api_throttler.async_throttler import AsyncRequestContext, AsyncThrottler
 from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit, TaskLog
+from hummingbot.core.api_throttler.request_priority import RequestPriority, request_priority
 from hummingbot.logger.struct_logger import METRICS_LOG_LEVEL
 
 TEST_PATH_URL = "/hummingbot"
@@ -275,3 +276,46 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
         time_mock.return_value = 1640000000.2100
         result = context.within_capacity()
         self.assertTrue(result)
+
+    def test_execute_task_uses_priority_from_context(self):
+        context = self.throttler.execute_task(limit_id=TEST_POOL_ID)
+        self.assertEqual(RequestPriority.DEFAULT, context._priority)
+
+        with request_priority(RequestPriority.BACKGROUND):
+            context = self.throttler.execute_task(limit_id=TEST_POOL_ID)
+        self.assertEqual(RequestPriority.BACKGROUND, context._priority)
+
+        with request_priority(RequestPriority.BACKGROUND):
+            context = self.throttler.execute_task(limit_id=TEST_POOL_ID, priority=RequestPriority.ORDER_CRITICAL)
+        self.assertEqual(RequestPriority.ORDER_CRITICAL, context._priority)
+
+    def test_lower_priority_requests_yield_to_waiting_higher_priority_requests(self):
+        throttler = AsyncThrottler(rate_limits=[RateLimit(limit_id="test", limit=1, time_interval=0.3)],
+                                   retry_interval=0.01)
+        acquisition_order = []
+
+        async def execute_request(priority: RequestPriority, delay: float):
+            await asyncio.sleep(delay)
+            async with throttler.execute_task(limit_id="test", priority=priority):
+                acquisition_order.append(priority)
+
+        async def execute_requests():
+            await execute_request(RequestPriority.BACKGROUND, 0)
+            # While the capacity is used, a background request starts waiting before an order critical one
+            await asyncio.gather(
+                execute_request(RequestPriority.BACKGROUND, 0),
+                execute_request(RequestPriority.ORDER_CRITICAL, 0.05),
+            )
+
+        self.ev_loop.run_until_complete(asyncio.wait_for(execute_requests(), 2))
+
+        self.assertEqual(
+            [RequestPriority.BACKGROUND, RequestPriority.ORDER_CRITICAL, RequestPriority.BACKGROUND],
+            acquisition_order)
+        stats = throttler.queue_wait_stats
+        self.assertEqual(2, stats[RequestPriority.BACKGROUND].requests)
+        self.assertEqual(1, stats[RequestPriority.ORDER_CRITICAL].requests)
+        self.assertGreater(stats[RequestPriority.BACKGROUND].max_wait_time,
+                           stats[RequestPriority.ORDER_CRITICAL].max_wait_time)
+        self.assertEqual(0, stats[RequestPriority.DEFAULT].requests)
+        self.assertEqual(0, stats[RequestPriority.DEFAULT].average_wait_time)
@@ -1,8 +1,14 @@
 #!/usr/bin/env python
 
 import logging
+import time
 import unittest
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import (
+    NumpyOrderBookMessage,
+    OrderBookMessage,
+    OrderBookMessageType,
+)
 import numpy as np
 
 
@@ -50,6 +56,167 @@ class OrderBookUnitTest(unittest.TestCase):
         self.assertEqual(best_bid, [50., 0.01, 6.])
         self.assertEqual(best_ask, 0)
 
+    def test_depth_queries(self):
+        order_book = OrderBook()
+        bids_array = np.array([[1, 1, 1], [2, 1, 2], [3, 1, 3]], dtype=np.float64)
+        asks_array = np.array([[4, 1, 1], [5, 1, 2], [6, 2, 3]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+
+        result = order_book.get_price_for_volume(True, 1.5)
+        self.assertEqual(5, result.result_price)
+        self.assertEqual(1.5, result.result_volume)
+        result = order_book.get_price_for_volume(False, 10)
+        self.assertTrue(np.isnan(result.result_price))
+        self.assertEqual(3, result.result_volume)
+
+        result = order_book.get_vwap_for_volume(True, 2.5)
+        self.assertAlmostEqual((4 + 5 + 0.5 * 6) / 2.5, result.result_price)
+        result = order_book.get_vwap_for_volume(False, 2)
+        self.assertAlmostEqual(2.5, result.result_price)
+
+        result = order_book.get_price_for_quote_volume(True, 9)
+        self.assertEqual(5, result.result_price)
+        result = order_book.get_quote_volume_for_base_amount(False, 1.5)
+        self.assertEqual(4, result.result_volume)
+
+        result = order_book.get_volume_for_price(True, 5)
+        self.assertEqual(2, result.result_volume)
+        self.assertEqual(5, result.result_price)
+        result = order_book.get_quote_volume_for_price(False, 2)
+        self.assertEqual(5, result.result_volume)
+
+    def test_batched_depth_queries(self):
+        order_book = OrderBook()
+        bids_array = np.array([[1, 1, 1], [2, 1, 2], [3, 1, 3]], dtype=np.float64)
+        asks_array = np.array([[4, 1, 1], [5, 1, 2], [6, 2, 3]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+        volumes = [3.5, 0.5, 10, 1]
+
+        for is_buy in (True, False):
+            batched_prices = order_book.get_price_for_volumes(is_buy, volumes)
+            batched_vwaps = order_book.get_vwap_for_volumes(is_buy, volumes)
+            for volume, price_result, vwap_result in zip(volumes, batched_prices, batched_vwaps):
+                expected_price = order_book.get_price_for_volume(is_buy, volume)
+                expected_vwap = order_book.get_vwap_for_volume(is_buy, volume)
+                np.testing.assert_equal(expected_price.result_price, price_result.result_price)
+                self.assertEqual(expected_price.result_volume, price_result.result_volume)
+                np.testing.assert_almost_equal(expected_vwap.result_price, vwap_result.result_price)
+                self.assertEqual(expected_vwap.result_volume, vwap_result.result_volume)
+
+    def test_depth_index_matches_book_walk(self):
+        rng = np.random.default_rng(42)
+        indexed_book = OrderBook()
+        indexed_book.enable_depth_index()
+        plain_book = OrderBook()
+        self.assertTrue(indexed_book.depth_index_enabled)
+        self.assertFalse(plain_book.depth_index_enabled)
+
+        bids_array = np.array([[100 - i, 1 + i % 3, 1] for i in range(50)], dtype=np.float64)
+        asks_array = np.array([[101 + i, 1 + i % 4, 1] for i in range(50)], dtype=np.float64)
+        for book in (indexed_book, plain_book):
+            book.apply_numpy_snapshot(bids_array, asks_array)
+
+        for update_id in range(2, 30):
+            bid_diffs = np.array([[float(rng.integers(60, 101)), float(rng.integers(0, 4)), update_id]
+                                  for _ in range(3)], dtype=np.float64)
+            ask_diffs = np.array([[float(rng.integers(101, 140)), float(rng.integers(0, 4)), update_id]
+                                  for _ in range(3)], dtype=np.float64)
+            for book in (indexed_book, plain_book):
+                book.apply_numpy_diffs(bid_diffs, ask_diffs)
+
+            for is_buy in (True, False):
+                for volume in (0.5, 3, 17.5, 60, 500):
+                    for method in ("get_price_for_volume", "get_vwap_for_volume", "get_quote_volume_for_base_amount"):
+                        expected = getattr(plain_book, method)(is_buy, volume)
+                        result = getattr(indexed_book, method)(is_buy, volume)
+                        np.testing.assert_almost_equal(expected.result_price, result.result_price)
+                        np.testing.assert_almost_equal(expected.result_volume, result.result_volume)
+                    expected = plain_book.get_price_for_quote_volume(is_buy, volume * 100)
+                    result = indexed_book.get_price_for_quote_volume(is_buy, volume * 100)
+                    np.testing.assert_almost_equal(expected.result_price, result.result_price)
+                    np.testing.assert_almost_equal(expected.result_volume, result.result_volume)
+                for price in (50, 80.5, 100, 101, 120, 200):
+                    for method in ("get_volume_for_price", "get_quote_volume_for_price"):
+                        expected = getattr(plain_book, method)(is_buy, price)
+                        result = getattr(indexed_book, method)(is_buy, price)
+                        np.testing.assert_almost_equal(expected.result_price, result.result_price)
+                        np.testing.assert_almost_equal(expected.result_volume, result.result_volume)
+
+    def test_to_numpy(self):
+        order_book = OrderBook()
+        bids_array = np.array([[1, 1, 1], [2, 1, 2], [3, 1, 3]], dtype=np.float64)
+        asks_array = np.array([[4, 1, 1], [5, 1, 2], [6, 2, 3]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+
+        bids, asks = order_book.to_numpy()
+        np.testing.assert_array_equal(bids_array[::-1], bids)
+        np.testing.assert_array_equal(asks_array, asks)
+
+        bids, asks = order_book.to_numpy(depth=2)
+        np.testing.assert_array_equal([[3, 1, 3], [2, 1, 2]], bids)
+        np.testing.assert_array_equal([[4, 1, 1], [5, 1, 2]], asks)
+
+        bids, asks = order_book.to_numpy(depth=0)
+        self.assertEqual((0, 3), bids.shape)
+        self.assertEqual((0, 3), asks.shape)
+
+    def test_get_snapshot_with_depth(self):
+        order_book = OrderBook()
+        bids_array = np.array([[1, 1, 1], [2, 1, 2], [3, 1, 3]], dtype=np.float64)
+        asks_array = np.array([[4, 1, 1], [5, 1, 2], [6, 2, 3]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+
+        bids, asks = order_book.get_snapshot(depth=1)
+        self.assertEqual([[3., 1., 3.]], bids.values.tolist())
+        self.assertEqual([[4., 1., 1.]], asks.values.tolist())
+        self.assertEqual(["price", "amount", "update_id"], list(bids.columns))
+
+        bids, asks = order_book.snapshot
+        self.assertEqual(3, len(bids))
+        self.assertEqual(3, len(asks))
+
+    def test_apply_numpy_diffs_with_update_id(self):
+        order_book = OrderBook()
+        bids_array = np.array([[1, 1, 1], [2, 1, 2]], dtype=np.float64)
+        asks_array = np.array([[4, 1, 1], [5, 1, 2]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array, 10)
+
+        self.assertEqual(10, order_book.snapshot_uid)
+
+        order_book.apply_numpy_diffs(np.empty((0, 3)), np.empty((0, 3)), 11)
+
+        self.assertEqual(11, order_book.last_diff_uid)
+
+        order_book.apply_numpy_diffs(np.array([[2, 0, 12]], dtype=np.float64), np.empty((0, 3)))
+
+        self.assertEqual(12, order_book.last_diff_uid)
+        self.assertEqual(1, order_book.get_price(False))
+
+    def test_apply_messages(self):
+        for message_class in [OrderBookMessage, NumpyOrderBookMessage]:
+            order_book = OrderBook()
+            snapshot = message_class(OrderBookMessageType.SNAPSHOT, {
+                "trading_pair": "COINALPHA-HBOT",
+                "update_id": 1,
+                "bids": [["1", "1"], ["2", "1"]],
+                "asks": [["4", "1"], ["5", "1"]],
+            }, timestamp=time.time())
+            diff = message_class(OrderBookMessageType.DIFF, {
+                "trading_pair": "COINALPHA-HBOT",
+                "update_id": 2,
+                "bids": [["2", "0"], ["3", "0.5"]],
+                "asks": [["4", "2"]],
+            }, timestamp=time.time())
+
+            order_book.apply_snapshot_message(snapshot)
+            order_book.apply_diff_message(diff)
+
+            bids, asks = order_book.to_numpy()
+            np.testing.assert_array_equal([[3, 0.5, 2], [1, 1, 1]], bids)
+            np.testing.assert_array_equal([[4, 2, 2], [5, 1, 1]], asks)
+            self.assertEqual(1, order_book.snapshot_uid)
+            self.assertEqual(2, order_book.last_diff_uid)
+
 
 def main():
     logging.basicConfig(level=logging.INFO)
@@ -1,7 +1,9 @@
 import time
 import unittest
 
-from hummingbot.core.data_type.order_book_message import OrderBookMessage, \
+import numpy as np
+
+from hummingbot.core.data_type.order_book_message import NumpyOrderBookMessage, OrderBookMessage, \
     OrderBookMessageType
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 
@@ -248,3 +250,36 @@ class OrderBookMessageTest(unittest.TestCase):
         self.assertTrue(diff1 < snapshot2)  # based on id
         self.assertTrue(trade1 < snapshot1)  # based on timestamp
         self.assertTrue(diff2 < trade1)  # if same ts, ob messages < trade messages
+
+    def test_numpy_message_parses_rows_into_arrays(self):
+        msg = NumpyOrderBookMessage(
+            message_type=OrderBookMessageType.DIFF,
+            content={
+                "update_id": 5,
+                "bids": [["10.5", "1.25"], ["10.4", "0"]],
+                "asks": [],
+            },
+            timestamp=time.time(),
+        )
+
+        np.testing.assert_array_equal([[10.5, 1.25, 5], [10.4, 0, 5]], msg.bids_array)
+        self.assertEqual(np.float64, msg.bids_array.dtype)
+        self.assertEqual((0, 3), msg.asks_array.shape)
+        self.assertIs(msg.bids_array, msg.bids_array)
+        self.assertEqual([OrderBookRow(10.5, 1.25, 5), OrderBookRow(10.4, 0, 5)], msg.bids)
+        self.assertEqual([], msg.asks)
+
+    def test_numpy_message_ignores_extra_row_entries(self):
+        msg = NumpyOrderBookMessage(
+            message_type=OrderBookMessageType.SNAPSHOT,
+            content={
+                "update_id": 7,
+                "bids": [["10.5", "1.25", "16988000000"]],
+                "asks": [["10.6", "2", "someId"], ["10.7", "3"]],
+            },
+            timestamp=time.time(),
+        )
+
+        np.testing.assert_array_equal([[10.5, 1.25, 7]], msg.bids_array)
+        np.testing.assert_array_equal([[10.6, 2, 7], [10.7, 3, 7]], msg.asks_array)
+        self.assertEqual(OrderBookMessage(OrderBookMessageType.SNAPSHOT, {"update_id": 7}), msg)
@@ -0,0 +1,152 @@
+import asyncio
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from unittest.mock import AsyncMock, MagicMock
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+
+
+class OrderBookTrackerTests(IsolatedAsyncioWrapperTestCase):
+    # logging.Level required to receive logs from the tracker
+    level = 0
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.trading_pairs = ["BTC-USDT", "ETH-USDT", "SOL-USDT"]
+        self.data_source = MagicMock()
+        self.tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=self.trading_pairs)
+        self.log_records = []
+        self.tracker.logger().setLevel(1)
+        self.tracker.logger().addHandler(self)
+
+    def tearDown(self) -> None:
+        self.tracker.stop()
+        self.tracker.logger().removeHandler(self)
+        super().tearDown()
+
+    def handle(self, record):
+        self.log_records.append(record)
+
+    def _is_logged(self, log_level: str, message: str) -> bool:
+        return any(record.levelname == log_level and record.getMessage() == message
+                   for record in self.log_records)
+
+    async def test_init_order_books_requests_snapshots_concurrently(self):
+        pending_requests = set()
+        max_pending_requests = 0
+        release_requests = asyncio.Event()
+
+        async def get_new_order_book(trading_pair: str) -> OrderBook:
+            nonlocal max_pending_requests
+            pending_requests.add(trading_pair)
+            max_pending_requests = max(max_pending_requests, len(pending_requests))
+            await release_requests.wait()
+            pending_requests.remove(trading_pair)
+            return OrderBook()
+
+        self.data_source.get_new_order_book = AsyncMock(side_effect=get_new_order_book)
+
+        init_task = asyncio.get_event_loop().create_task(self.tracker._init_order_books())
+        await asyncio.sleep(0.01)
+        self.assertEqual(len(self.trading_pairs), max_pending_requests)
+        self.assertFalse(self.tracker.ready)
+
+        release_requests.set()
+        await init_task
+
+        self.assertTrue(self.tracker.ready)
+        self.assertEqual(self.trading_pairs, self.tracker.ready_trading_pairs)
+        for trading_pair in self.trading_pairs:
+            self.assertIsInstance(self.tracker.order_books[trading_pair], OrderBook)
+            self.assertIn(trading_pair, self.tracker._tracking_tasks)
+
+    async def test_trading_pairs_are_ready_individually(self):
+        release_slow_pair = asyncio.Event()
+
+        async def get_new_order_book(trading_pair: str) -> OrderBook:
+            if trading_pair == "SOL-USDT":
+                await release_slow_pair.wait()
+            return OrderBook()
+
+        self.data_source.get_new_order_book = AsyncMock(side_effect=get_new_order_book)
+
+        init_task = asyncio.get_event_loop().create_task(self.tracker._init_order_books())
+        await self.tracker.wait_trading_pair_ready("BTC-USDT")
+
+        self.assertTrue(self.tracker.is_trading_pair_ready("ETH-USDT"))
+        self.assertFalse(self.tracker.is_trading_pair_ready("SOL-USDT"))
+        self.assertEqual(["BTC-USDT", "ETH-USDT"], self.tracker.ready_trading_pairs)
+        self.assertFalse(self.tracker.ready)
+
+        release_slow_pair.set()
+        await init_task
+
+        self.assertTrue(self.tracker.is_trading_pair_ready("SOL-USDT"))
+        self.assertTrue(self.tracker.ready)
+
+    async def test_concurrent_snapshot_requests_are_capped(self):
+        self.tracker.MAX_CONCURRENT_SNAPSHOT_REQUESTS = 2
+        pending_requests = 0
+        max_pending_requests = 0
+
+        async def get_new_order_book(trading_pair: str) -> OrderBook:
+            nonlocal pending_requests, max_pending_requests
+            pending_requests += 1
+            max_pending_requests = max(max_pending_requests, pending_requests)
+            await asyncio.sleep(0.01)
+            pending_requests -= 1
+            return OrderBook()
+
+        self.data_source.get_new_order_book = AsyncMock(side_effect=get_new_order_book)
+
+        await self.tracker._init_order_books()
+
+        self.assertEqual(2, max_pending_requests)
+        self.assertTrue(self.tracker.ready)
+
+    async def test_failed_trading_pair_does_not_block_the_others(self):
+        snapshot_request_allowed = asyncio.Event()
+
+        async def get_new_order_book(trading_pair: str) -> OrderBook:
+            if trading_pair == "ETH-USDT" and not snapshot_request_allowed.is_set():
+                raise IOError("Snapshot request failed")
+            return OrderBook()
+
+        async def sleep(delay: float):
+            await snapshot_request_allowed.wait()
+
+        self.data_source.get_new_order_book = AsyncMock(side_effect=get_new_order_book)
+        self.tracker._sleep = AsyncMock(side_effect=sleep)
+
+        init_task = asyncio.get_event_loop().create_task(self.tracker._init_order_books())
+        await asyncio.sleep(0.01)
+
+        self.assertFalse(self.tracker.ready)
+        self.assertEqual(["BTC-USDT", "SOL-USDT"], self.tracker.ready_trading_pairs)
+        self.assertNotIn("ETH-USDT", self.tracker.order_books)
+        self.assertTrue(self._is_logged(
+            "NETWORK", "Unexpected error initializing order book for ETH-USDT. Retrying in 1.0 seconds."))
+
+        snapshot_request_allowed.set()
+        await init_task
+
+        self.assertTrue(self.tracker.ready)
+        self.assertEqual(self.trading_pairs, self.tracker.ready_trading_pairs)
+        self.assertIsInstance(self.tracker.order_books["ETH-USDT"], OrderBook)
+
+    async def test_init_order_book_retries_with_backoff(self):
+        self.data_source.get_new_order_book = AsyncMock(side_effect=[IOError("Snapshot request failed")] * 8 + [OrderBook()])
+        self.tracker._sleep = AsyncMock()
+
+        await self.tracker._init_order_book("ETH-USDT", asyncio.Semaphore(1))
+
+        self.assertEqual(9, self.data_source.get_new_order_book.call_count)
+        self.assertEqual([1.0, 2.0, 4.0, 8.0, 16.0, 32.0, 60.0, 60.0],
+                         [call.args[0] for call in self.tracker._sleep.call_args_list])
+        self.assertTrue(self.tracker.is_trading_pair_ready("ETH-USDT"))
+        self.assertTrue(self._is_logged(
+            "NETWORK", "Unexpected error initializing order book for ETH-USDT. Retrying in 60.0 seconds."))
+
+    async def test_wait_trading_pair_ready_raises_for_untracked_pair(self):
+        with self.assertRaises(ValueError):
+            await self.tracker.wait_trading_pair_ready("XRP-USDT")
@@ -10,7 +10,7 @@ from hummingbot.connector.utils import combine_to_hb_trading_pair
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.core.rate_oracle.sources.coin_gecko_rate_source import CoinGeckoRateSource
 from hummingbot.core.rate_oracle.sources.rate_source_base import RateSourceBase
-from hummingbot.core.rate_oracle.utils import find_rate
+from hummingbot.core.rate_oracle.utils import RateConversionGraph, find_rate
 
 
 class DummyRateSource(RateSourceBase):
@@ -82,6 +82,51 @@ class RateOracleTest(unittest.TestCase):
         rate = find_rate(prices, "HBOT-GBP")
         self.assertEqual(rate, Decimal("75"))
 
+    def test_conversion_graph_find_rate(self):
+        prices = {"HBOT-USDT": Decimal("100"), "AAVE-USDT": Decimal("50"), "USDT-GBP": Decimal("0.75")}
+        graph = RateConversionGraph()
+
+        self.assertEqual(Decimal("100"), graph.find_rate(prices, "HBOT-USDT"))
+        self.assertIsNone(graph.find_rate(prices, "ZBOT-USDT"))
+        self.assertEqual(Decimal("0.01"), graph.find_rate(prices, "USDT-HBOT"))
+        self.assertEqual(Decimal("2"), graph.find_rate(prices, "HBOT-AAVE"))
+        self.assertEqual(Decimal("0.5"), graph.find_rate(prices, "AAVE-HBOT"))
+        self.assertEqual(Decimal("75"), graph.find_rate(prices, "HBOT-GBP"))
+        self.assertEqual(Decimal("1"), graph.find_rate(prices, "WETH-ETH"))
+
+    def test_conversion_graph_find_rate_with_several_conversions(self):
+        prices = {"HBOT-USDT": Decimal("100"), "USDT-GBP": Decimal("0.75"), "EUR-GBP": Decimal("0.8")}
+        graph = RateConversionGraph()
+
+        self.assertEqual(Decimal("93.75"), graph.find_rate(prices, "HBOT-EUR"))
+        self.assertEqual(Decimal("0.8") / Decimal("0.75") / Decimal("100"), graph.find_rate(prices, "EUR-HBOT"))
+
+    def test_conversion_graph_follows_prices_changes(self):
+        prices = {"HBOT-USDT": Decimal("100")}
+        graph = RateConversionGraph()
+
+        self.assertIsNone(graph.find_rate(prices, "HBOT-GBP"))
+
+        prices["USDT-GBP"] = Decimal("0.75")
+        self.assertEqual(Decimal("75"), graph.find_rate(prices, "HBOT-GBP"))
+
+        prices["HBOT-USDT"] = Decimal("200")
+        self.assertEqual(Decimal("150"), graph.find_rate(prices, "HBOT-GBP"))
+
+        other_prices = {"HBOT-USDT": Decimal("100")}
+        self.assertIsNone(graph.find_rate(other_prices, "HBOT-GBP"))
+
+    def test_set_price_updates_pair_rates(self):
+        rate_oracle = RateOracle(source=DummyRateSource(price_dict={}))
+        rate_oracle.set_price("HBOT-USDT", Decimal("100"))
+
+        self.assertIsNone(rate_oracle.get_pair_rate("HBOT-GBP"))
+
+        rate_oracle.set_price("GBP-USDT", Decimal("1.25"))
+
+        self.assertEqual(Decimal("80"), rate_oracle.get_pair_rate("HBOT-GBP"))
+        self.assertEqual(Decimal("80"), self.async_run_with_timeout(rate_oracle.stored_or_live_rate("HBOT-GBP")))
+
     def test_rate_oracle_single_instance_rate_source_reset_after_configuration_change(self):
         config_map = ClientConfigAdapter(ClientConfigMap())
         config_map.rate_oracle_source = "binance"
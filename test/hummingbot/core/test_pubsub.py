@@ -3,6 +3,7 @@ import gc
 import weakref
 
 from hummingbot.core.pubsub import PubSub
+from hummingbot.core.event.event_listener import EventListener
 from hummingbot.core.event.event_logger import EventLogger
 
 from test.mock.mock_events import MockEventType, MockEvent
@@ -89,6 +90,69 @@ class PubSubTest(unittest.TestCase):
         listeners = self.pubsub.get_listeners(self.event_tag_zero)
         self.assertEqual(0, len(listeners))
 
+    def test_lapsed_listener_remove_on_trigger_event(self):
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_zero)
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_one)
+        self.listener_zero = None  # remove strong reference
+        gc.collect()
+
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+
+        self.assertEqual([self.event], self.listener_one.event_log)
+        self.assertEqual(1, len(self.pubsub.get_listeners(self.event_tag_zero)))
+
+    def test_listeners_changes_during_trigger_event_apply_to_next_event(self):
+        pubsub = self.pubsub
+        listener_one = self.listener_one
+        added_listener = EventLogger()
+
+        class MutatingListener(EventListener):
+            def __call__(self, event_object):
+                pubsub.remove_listener(MockEventType.EVENT_ZERO, listener_one)
+                pubsub.add_listener(MockEventType.EVENT_ZERO, added_listener)
+
+        mutating_listener = MutatingListener()
+        self.pubsub.add_listener(self.event_tag_zero, mutating_listener)
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_one)
+
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+
+        self.assertEqual([self.event], self.listener_one.event_log)
+        self.assertEqual(0, len(added_listener.event_log))
+
+        second_event = MockEvent(payload=2)
+        self.pubsub.trigger_event(self.event_tag_zero, second_event)
+
+        self.assertEqual([self.event], self.listener_one.event_log)
+        self.assertEqual([second_event], added_listener.event_log)
+
+    def test_dispatch_stats_disabled_by_default(self):
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_zero)
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+
+        self.assertFalse(self.pubsub.dispatch_stats_enabled)
+        self.assertEqual({}, self.pubsub.get_dispatch_stats())
+
+    def test_dispatch_stats(self):
+        self.pubsub.dispatch_stats_enabled = True
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_zero)
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_one)
+
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+        self.pubsub.trigger_event(self.event_tag_one, self.event)
+
+        stats = self.pubsub.get_dispatch_stats()
+        self.assertEqual([self.event_tag_zero.value], list(stats.keys()))
+        event_stats = stats[self.event_tag_zero.value]
+        self.assertEqual(2, event_stats.dispatch_count)
+        listener_stats = event_stats.listeners[EventLogger.__qualname__]
+        self.assertEqual(4, listener_stats.call_count)
+        self.assertGreaterEqual(event_stats.total_time, listener_stats.total_time)
+
+        self.pubsub.reset_dispatch_stats()
+        self.assertEqual({}, self.pubsub.get_dispatch_stats())
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -6,7 +6,9 @@ from hummingbot.core.clock import (
     Clock,
     ClockMode
 )
+from hummingbot.core.event.event_logger import EventLogger
 from hummingbot.core.time_iterator import TimeIterator
+from test.mock.mock_events import MockEvent, MockEventType
 
 NaN = float("nan")
 
@@ -58,3 +60,21 @@ class TimeIteratorUnitTest(unittest.TestCase):
         # c_tick is called within Clock
         self.clock.backtest_til(self.start_timestamp + self.tick_size)
         self.assertEqual(self.start_timestamp + self.tick_size, self.time_iterator.current_timestamp)
+
+    def test_trigger_event_on_subclass(self):
+        # TimeIterator does not call PubSub.__init__, the listeners must work regardless
+        class TimeIteratorSubclass(TimeIterator):
+            def __init__(self):
+                super().__init__()
+
+        time_iterator = TimeIteratorSubclass()
+        listener = EventLogger()
+        event = MockEvent(payload=1)
+        time_iterator.add_listener(MockEventType.EVENT_ZERO, listener)
+
+        time_iterator.trigger_event(MockEventType.EVENT_ZERO, event)
+        time_iterator.remove_listener(MockEventType.EVENT_ZERO, listener)
+        time_iterator.trigger_event(MockEventType.EVENT_ZERO, event)
+
+        self.assertEqual([event], listener.event_log)
+        self.assertEqual(0, len(time_iterator.get_listeners(MockEventType.EVENT_ZERO)))
@@ -0,0 +1,95 @@
+import os
+import tempfile
+from datetime import datetime, timezone
+from unittest import TestCase
+from unittest.mock import patch
+
+from hummingbot.core.utils.csv_appender import CSVAppender, csv_matches_header
+
+
+class CSVAppenderTest(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        csv_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(csv_dir.cleanup)
+        self.csv_dir = csv_dir.name
+        self.file_path = os.path.join(self.csv_dir, "trades.csv")
+        self.header = ("timestamp", "price", "amount")
+
+    def read_lines(self, file_path=None):
+        with open(file_path or self.file_path) as f:
+            return f.read().splitlines()
+
+    def test_new_file_starts_with_header(self):
+        appender = CSVAppender(self.file_path, self.header)
+        appender.append((1, "100.5", None))
+        appender.append_rows([(2, "101", "0.1"), (3, "a,b", "1")])
+        appender.close()
+
+        self.assertEqual(["timestamp,price,amount", "1,100.5,", "2,101,0.1", '3,"a,b",1'], self.read_lines())
+        self.assertTrue(csv_matches_header(self.file_path, self.header))
+        self.assertFalse(appender.is_open)
+
+    def test_rows_are_appended_to_existing_file_with_same_header(self):
+        with open(self.file_path, "w") as f:
+            f.write("timestamp,price,amount\n1,100,1\n")
+
+        appender = CSVAppender(self.file_path, self.header)
+        appender.append((2, 101, 2))
+        appender.close()
+
+        self.assertEqual(["timestamp,price,amount", "1,100,1", "2,101,2"], self.read_lines())
+
+    def test_header_is_validated_once_and_mismatching_file_is_moved(self):
+        with open(self.file_path, "w") as f:
+            f.write("timestamp,price\n1,100\n")
+        appender = CSVAppender(self.file_path, self.header)
+
+        with patch("hummingbot.core.utils.csv_appender.csv_matches_header",
+                   wraps=csv_matches_header) as matches_header_mock:
+            for i in range(5):
+                appender.append((i, 100, 1))
+        appender.close()
+
+        matches_header_mock.assert_called_once()
+        old_files = [name for name in os.listdir(self.csv_dir) if name.startswith("trades_old_")]
+        self.assertEqual(1, len(old_files))
+        self.assertEqual(["timestamp,price", "1,100"], self.read_lines(os.path.join(self.csv_dir, old_files[0])))
+        self.assertEqual(6, len(self.read_lines()))
+
+    def test_rows_are_written_to_file_on_append(self):
+        appender = CSVAppender(self.file_path, self.header)
+        appender.append((1, 100, 1))
+        self.assertTrue(appender.is_open)
+        self.assertEqual(["timestamp,price,amount", "1,100,1"], self.read_lines())
+
+        appender.append_rows([(2, 101, 1), (3, 102, 1)])
+        self.assertEqual(["timestamp,price,amount", "1,100,1", "2,101,1", "3,102,1"], self.read_lines())
+        appender.close()
+
+    def test_rotation_by_size(self):
+        appender = CSVAppender(self.file_path, self.header, max_file_size=39)
+        for i in range(6):
+            appender.append((i, 100, 1))
+        appender.close()
+
+        rotated_files = sorted(name for name in os.listdir(self.csv_dir) if name != "trades.csv")
+        self.assertEqual(2, len(rotated_files))
+        for name in rotated_files:
+            lines = self.read_lines(os.path.join(self.csv_dir, name))
+            self.assertEqual("timestamp,price,amount", lines[0])
+            self.assertEqual(3, len(lines))
+        self.assertEqual(["timestamp,price,amount", "4,100,1", "5,100,1"], self.read_lines())
+
+    def test_rotation_by_date(self):
+        appender = CSVAppender(self.file_path, self.header, rotate_daily=True)
+        with patch.object(CSVAppender, "_now", return_value=datetime(2024, 1, 1, 23, 59, tzinfo=timezone.utc)):
+            appender.append((1, 100, 1))
+            appender.append((2, 100, 1))
+        with patch.object(CSVAppender, "_now", return_value=datetime(2024, 1, 2, 0, 1, tzinfo=timezone.utc)):
+            appender.append((3, 100, 1))
+        appender.close()
+
+        self.assertEqual(["timestamp,price,amount", "1,100,1", "2,100,1"],
+                         self.read_lines(os.path.join(self.csv_dir, "trades_20240102-000100.csv")))
+        self.assertEqual(["timestamp,price,amount", "3,100,1"], self.read_lines())
@@ -0,0 +1,111 @@
+"""
+Micro-benchmark of the decode throughput of the JSON codecs available to the `web_assistant` layer.
+
+The payloads reproduce messages recorded from exchange REST and WebSocket APIs, the kind of messages the connectors
+decode on their hot path (order book diffs and snapshots, trades, order updates).
+
+Run it with:
+
+    python -m test.hummingbot.core.web_assistant.connections.json_codec_benchmark [--iterations N]
+"""
+import argparse
+import json
+import timeit
+from typing import Dict, List, Tuple
+
+from hummingbot.core.web_assistant.connections.json_codec import JSONCodec, available_json_codecs
+
+BINANCE_DEPTH_DIFF = json.dumps({
+    "stream": "btcusdt@depth@100ms",
+    "data": {
+        "e": "depthUpdate", "E": 1700000000123, "s": "BTCUSDT", "U": 40538420410, "u": 40538420521,
+        "b": [[f"{37000 - i * 0.01:.2f}", f"{0.00123 * (i + 1):.5f}"] for i in range(60)],
+        "a": [[f"{37000.01 + i * 0.01:.2f}", f"{0.00321 * (i + 1):.5f}"] for i in range(60)],
+    },
+})
+
+BINANCE_SNAPSHOT = json.dumps({
+    "lastUpdateId": 40538420409,
+    "bids": [[f"{37000 - i * 0.01:.8f}", f"{0.0125 * (i % 17 + 1):.8f}"] for i in range(1000)],
+    "asks": [[f"{37000.01 + i * 0.01:.8f}", f"{0.0175 * (i % 13 + 1):.8f}"] for i in range(1000)],
+})
+
+BINANCE_TRADE = json.dumps({
+    "stream": "btcusdt@trade",
+    "data": {
+        "e": "trade", "E": 1700000000456, "s": "BTCUSDT", "t": 3290112345, "p": "37000.01000000",
+        "q": "0.00260000", "b": 23456789012, "a": 23456789034, "T": 1700000000455, "m": True, "M": True,
+    },
+})
+
+KUCOIN_LEVEL2 = json.dumps({
+    "type": "message",
+    "topic": "/market/level2:BTC-USDT",
+    "subject": "trade.l2update",
+    "data": {
+        "changes": {
+            "asks": [[f"{37000.1 + i * 0.1:.1f}", f"{0.01 * (i + 1):.8f}", str(16988000000 + i)] for i in range(10)],
+            "bids": [[f"{36999.9 - i * 0.1:.1f}", f"{0.02 * (i + 1):.8f}", str(16988000100 + i)] for i in range(10)],
+        },
+        "sequenceEnd": 16988000109,
+        "sequenceStart": 16988000000,
+        "symbol": "BTC-USDT",
+        "time": 1700000000789,
+    },
+})
+
+OKX_ORDER_UPDATE = json.dumps({
+    "arg": {"channel": "orders", "instType": "SPOT", "uid": "77982378738415879"},
+    "data": [{
+        "accFillSz": "0.001", "avgPx": "37000.1", "cTime": "1700000000123", "category": "normal", "ccy": "",
+        "clOrdId": "HBOTBUYBTUT5fc0ed3c2bcd1a47", "fee": "-0.0000010", "feeCcy": "BTC", "fillPx": "37000.1",
+        "fillSz": "0.001", "fillTime": "1700000000456", "instId": "BTC-USDT", "instType": "SPOT", "lever": "0",
+        "ordId": "612345678901234567", "ordType": "limit", "pnl": "0", "posSide": "", "px": "37000.1",
+        "rebate": "0", "rebateCcy": "USDT", "side": "buy", "state": "filled", "sz": "0.001", "tag": "",
+        "tdMode": "cash", "tradeId": "455312345", "uTime": "1700000000456",
+    }],
+})
+
+RECORDED_PAYLOADS: Dict[str, str] = {
+    "binance_depth_diff": BINANCE_DEPTH_DIFF,
+    "binance_snapshot": BINANCE_SNAPSHOT,
+    "binance_trade": BINANCE_TRADE,
+    "kucoin_level2": KUCOIN_LEVEL2,
+    "okx_order_update": OKX_ORDER_UPDATE,
+}
+
+
+def measure_decode_throughput(codec: JSONCodec, payload: str, iterations: int) -> float:
+    """
+    Returns the number of payloads decoded per second, taking the best of three runs.
+    """
+    best_time = min(timeit.repeat(lambda: codec.loads(payload), number=iterations, repeat=3))
+    return iterations / best_time
+
+
+def run_benchmark(iterations: int) -> List[Tuple[str, str, float]]:
+    results = []
+    for payload_name, payload in RECORDED_PAYLOADS.items():
+        for codec_name, codec in available_json_codecs().items():
+            # The codecs must agree on the decoded payload for the comparison to be meaningful
+            assert codec.loads(payload) == json.loads(payload)
+            results.append((payload_name, codec_name, measure_decode_throughput(codec, payload, iterations)))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compares the decode throughput of the available JSON codecs.")
+    parser.add_argument("--iterations", type=int, default=2000, help="Number of decodes per run.")
+    args = parser.parse_args()
+
+    results = run_benchmark(args.iterations)
+    baseline = {payload_name: throughput for payload_name, codec_name, throughput in results if codec_name == "json"}
+    print(f"{'payload':<20} {'size':>8} {'codec':<8} {'msgs/s':>12} {'vs json':>8}")
+    for payload_name, codec_name, throughput in results:
+        speedup = f"{throughput / baseline[payload_name]:.2f}x"
+        print(f"{payload_name:<20} {len(RECORDED_PAYLOADS[payload_name]):>8} {codec_name:<8} "
+              f"{throughput:>12,.0f} {speedup:>8}")
+
+
+if __name__ == "__main__":
+    main()
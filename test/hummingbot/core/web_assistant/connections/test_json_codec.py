@@ -0,0 +1,61 @@
+import json
+import unittest
+
+from hummingbot.core.web_assistant.connections.json_codec import (
+    JSONCodec,
+    StdlibJSONCodec,
+    UJSONCodec,
+    available_json_codecs,
+    default_json_codec,
+    get_json_codec,
+    set_default_json_codec,
+)
+
+
+class JSONCodecTest(unittest.TestCase):
+    payload = json.dumps({"e": "depthUpdate", "E": 1700000000123, "b": [["37000.01", "0.5"]], "m": True, "x": None})
+
+    def test_available_codecs_decode_as_stdlib(self):
+        codecs = available_json_codecs()
+
+        self.assertIn("json", codecs)
+        self.assertIn("ujson", codecs)
+        for codec in codecs.values():
+            self.assertEqual(json.loads(self.payload), codec.loads(self.payload))
+            self.assertEqual(json.loads(self.payload), codec.loads(self.payload.encode()))
+
+    def test_available_codecs_raise_value_error_on_invalid_payload(self):
+        for codec in available_json_codecs().values():
+            with self.assertRaises(ValueError):
+                codec.loads("pong")
+
+    def test_available_codecs_decode_payloads_rejected_by_their_library(self):
+        for codec in available_json_codecs().values():
+            for payload in ['{"p": NaN, "q": Infinity}', '[-Infinity]']:
+                self.assertEqual(json.dumps(json.loads(payload)), json.dumps(codec.loads(payload)))
+
+        big_integer_payload = '{"u": 123456789012345678901234567890}'
+        self.assertEqual(json.loads(big_integer_payload), UJSONCodec().loads(big_integer_payload))
+
+    def test_default_codec_is_stdlib(self):
+        codec = default_json_codec()
+
+        self.assertIsInstance(codec, StdlibJSONCodec)
+        self.assertIs(codec, default_json_codec())
+
+    def test_set_default_json_codec(self):
+        self.addCleanup(set_default_json_codec, "json")
+
+        set_default_json_codec("ujson")
+
+        self.assertIsInstance(default_json_codec(), UJSONCodec)
+        with self.assertRaises(ValueError):
+            set_default_json_codec("unknown")
+        self.assertIsInstance(default_json_codec(), JSONCodec)
+
+    def test_get_json_codec(self):
+        self.assertIsInstance(get_json_codec("json"), StdlibJSONCodec)
+        self.assertIsInstance(get_json_codec("ujson"), UJSONCodec)
+
+        with self.assertRaises(ValueError):
+            get_json_codec("unknown")
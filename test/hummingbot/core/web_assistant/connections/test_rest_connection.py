@@ -2,11 +2,13 @@ import asyncio
 import json
 import unittest
 from typing import Awaitable
+from unittest.mock import MagicMock
 
 import aiohttp
 from aioresponses import aioresponses
 
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest, RESTResponse
+from hummingbot.core.web_assistant.connections.json_codec import StdlibJSONCodec
 from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
 
 
@@ -39,3 +41,20 @@ class RESTConnectionTest(unittest.TestCase):
         j = self.async_run_with_timeout(ret.json())
 
         self.assertEqual(resp, j)
+
+    @aioresponses()
+    def test_rest_connection_decodes_with_json_codec(self, mocked_api):
+        url = "https://www.test.com/url"
+        resp = {"one": 1}
+        mocked_api.get(url, body=json.dumps(resp).encode())
+
+        client_session = aiohttp.ClientSession(loop=self.ev_loop)
+        json_codec = MagicMock(wraps=StdlibJSONCodec())
+        connection = RESTConnection(client_session, json_codec=json_codec)
+        request = RESTRequest(method=RESTMethod.GET, url=url)
+
+        ret = self.async_run_with_timeout(connection.call(request))
+        j = self.async_run_with_timeout(ret.json())
+
+        self.assertEqual(resp, j)
+        json_codec.loads.assert_called_once_with(json.dumps(resp))
@@ -1,14 +1,16 @@
 import asyncio
 import json
+import math
 import unittest
 from typing import Awaitable, List
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import aiohttp
 from aiohttp import WebSocketError
 
 from hummingbot.connector.test_support.network_mocking_assistant import NetworkMockingAssistant
 from hummingbot.core.web_assistant.connections.data_types import WSJSONRequest, WSResponse
+from hummingbot.core.web_assistant.connections.json_codec import ORJSONCodec, StdlibJSONCodec
 from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
 
 
@@ -284,3 +286,44 @@ class WSConnectionTest(unittest.TestCase):
         self.mocking_assistant.run_until_all_aiohttp_messages_delivered(ws_connect_mock.return_value)
 
         self.assertNotEqual(0, self.ws_connection.last_recv_time)
+
+    @patch("aiohttp.client.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_receive_decodes_with_json_codec(self, ws_connect_mock):
+        json_codec = MagicMock(wraps=StdlibJSONCodec())
+        self.ws_connection = WSConnection(self.client_session, json_codec=json_codec)
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        self.async_run_with_timeout(self.ws_connection.connect(self.ws_url))
+        data = {"one": 1}
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            ws_connect_mock.return_value, message=json.dumps(data)
+        )
+
+        response = self.async_run_with_timeout(self.ws_connection.receive())
+
+        self.assertEqual(data, response.data)
+        json_codec.loads.assert_called_once_with(json.dumps(data))
+
+    @patch("aiohttp.client.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_receive_plain_text(self, ws_connect_mock):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        self.async_run_with_timeout(self.ws_connection.connect(self.ws_url))
+        self.mocking_assistant.add_websocket_aiohttp_message(ws_connect_mock.return_value, message="pong")
+
+        response = self.async_run_with_timeout(self.ws_connection.receive())
+
+        self.assertEqual("pong", response.data)
+
+    @patch("aiohttp.client.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_receive_decodes_payload_rejected_by_codec_library(self, ws_connect_mock):
+        self.ws_connection = WSConnection(self.client_session, json_codec=ORJSONCodec())
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        self.async_run_with_timeout(self.ws_connection.connect(self.ws_url))
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            ws_connect_mock.return_value, message='{"price": NaN, "amount": 1}'
+        )
+
+        response = self.async_run_with_timeout(self.ws_connection.receive())
+
+        self.assertIsInstance(response.data, dict)
+        self.assertTrue(math.isnan(response.data["price"]))
+        self.assertEqual(1, response.data["amount"])
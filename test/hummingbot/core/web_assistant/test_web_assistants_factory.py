@@ -3,6 +3,7 @@ import unittest
 from typing import Awaitable
 
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.web_assistant.connections.json_codec import StdlibJSONCodec, UJSONCodec, default_json_codec
 from hummingbot.core.web_assistant.rest_assistant import RESTAssistant
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 from hummingbot.core.web_assistant.ws_assistant import WSAssistant
@@ -31,3 +32,20 @@ class WebAssistantsFactoryTest(unittest.TestCase):
         ws_assistant = self.async_run_with_timeout(factory.get_ws_assistant())
 
         self.assertIsInstance(ws_assistant, WSAssistant)
+
+    def test_json_codec_defaults_to_stdlib(self):
+        factory = WebAssistantsFactory(throttler=AsyncThrottler(rate_limits=[]))
+
+        self.assertIs(default_json_codec(), factory.json_codec)
+        self.assertIsInstance(factory.json_codec, StdlibJSONCodec)
+
+    def test_assistants_use_factory_json_codec(self):
+        json_codec = UJSONCodec()
+        factory = WebAssistantsFactory(throttler=AsyncThrottler(rate_limits=[]), json_codec=json_codec)
+
+        rest_assistant = self.async_run_with_timeout(factory.get_rest_assistant())
+        ws_assistant = self.async_run_with_timeout(factory.get_ws_assistant())
+
+        self.assertIs(json_codec, factory.json_codec)
+        self.assertIs(json_codec, rest_assistant._connection.json_codec)
+        self.assertIs(json_codec, ws_assistant._connection.json_codec)
@@ -0,0 +1,122 @@
+import os
+import tempfile
+import threading
+from unittest import TestCase
+from unittest.mock import patch
+
+import numpy as np
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.data_feed.columnar_market_data import ColumnarMarketDataReader, ColumnarMarketDataWriter
+
+
+class ColumnarMarketDataTests(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        market_data_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(market_data_dir.cleanup)
+        self.root_path = market_data_dir.name
+        self.writer = ColumnarMarketDataWriter(root_path=self.root_path, depth=3, max_buffered_rows=1000)
+        self.addCleanup(self.writer.close)
+        self.reader = ColumnarMarketDataReader(root_path=self.root_path)
+
+    def append_snapshot(self, timestamp: float, mid_price: float, trading_pair: str = "BTC-USDT"):
+        bids = np.array([[mid_price - 1, 1, 10], [mid_price - 2, 2, 10]])
+        asks = np.array([[mid_price + 1, 1, 10], [mid_price + 2, 2, 10], [mid_price + 3, 3, 10],
+                         [mid_price + 4, 4, 10]])
+        self.writer.append_snapshot("binance", trading_pair, timestamp, mid_price, mid_price - 1, mid_price + 1,
+                                    bids, asks)
+
+    def test_snapshots_roundtrip(self):
+        self.append_snapshot(1700000000, 100)
+        self.append_snapshot(1700000060.5, 101)
+        self.assertEqual(2, self.writer.buffered_rows)
+        self.writer.flush(wait=True)
+        self.assertEqual(0, self.writer.buffered_rows)
+
+        snapshots = self.reader.load_snapshots("binance", "BTC-USDT")
+
+        self.assertEqual([1700000000, 1700000060.5], snapshots["timestamp"].tolist())
+        self.assertEqual([100, 101], snapshots["mid_price"].tolist())
+        self.assertEqual([99, 100], snapshots["best_bid"].tolist())
+        self.assertEqual([101, 102], snapshots["best_ask"].tolist())
+        self.assertEqual((2, 3), snapshots["bid_prices"].shape)
+        self.assertEqual([99, 98], snapshots["bid_prices"][0, :2].tolist())
+        self.assertTrue(np.isnan(snapshots["bid_prices"][0, 2]))
+        self.assertEqual([102, 103, 104], snapshots["ask_prices"][1].tolist())
+        self.assertEqual([1, 2, 3], snapshots["ask_amounts"][1].tolist())
+
+        snapshots_df = self.reader.load_snapshots_df("binance", "BTC-USDT")
+        self.assertEqual([100, 101], snapshots_df["mid_price"].tolist())
+        self.assertEqual([102, 103], snapshots_df["ask_price_1"].tolist())
+        self.assertIn("bid_amount_2", snapshots_df.columns)
+
+    def test_trades_roundtrip(self):
+        self.writer.append_trade("binance", "BTC-USDT", 1700000001, 100, 0.5, TradeType.BUY)
+        self.writer.append_trade("binance", "BTC-USDT", 1700000002, 99, 1.5, TradeType.SELL)
+        self.writer.flush(wait=True)
+
+        trades_df = self.reader.load_trades_df("binance", "BTC-USDT")
+
+        self.assertEqual([1700000001, 1700000002], trades_df["timestamp"].tolist())
+        self.assertEqual([100, 99], trades_df["price"].tolist())
+        self.assertEqual([0.5, 1.5], trades_df["amount"].tolist())
+        self.assertEqual([TradeType.BUY.value, TradeType.SELL.value], trades_df["trade_type"].tolist())
+
+    def test_records_are_partitioned_by_market_and_day(self):
+        day_start = 1700006400  # 2023-11-15 00:00:00 UTC
+        self.append_snapshot(day_start - 60, 100)
+        self.append_snapshot(day_start + 60, 101)
+        self.append_snapshot(day_start + 60, 1, trading_pair="ETH-BTC")
+        self.writer.flush(wait=True)
+
+        self.assertEqual(["2023-11-14", "2023-11-15"],
+                         sorted(os.listdir(os.path.join(self.root_path, "binance", "BTC-USDT"))))
+        self.assertEqual([("binance", "BTC-USDT"), ("binance", "ETH-BTC")], self.reader.get_markets())
+        self.assertEqual([1], self.reader.load_snapshots("binance", "ETH-BTC")["mid_price"].tolist())
+
+    def test_load_time_range(self):
+        for i in range(10):
+            self.append_snapshot(1700000000 + i * 60, 100 + i)
+            if i % 3 == 2:
+                self.writer.flush(wait=True)
+        self.writer.flush(wait=True)
+
+        snapshots = self.reader.load_snapshots("binance", "BTC-USDT", start_time=1700000120, end_time=1700000300)
+
+        self.assertEqual([102, 103, 104, 105], snapshots["mid_price"].tolist())
+        empty = self.reader.load_snapshots("binance", "BTC-USDT", start_time=1800000000)
+        self.assertEqual(0, len(empty["timestamp"]))
+        self.assertEqual(0, len(self.reader.load_trades("binance", "SOL-USDT")["timestamp"]))
+
+    def test_flush_when_buffer_is_full_or_interval_elapsed(self):
+        writer = ColumnarMarketDataWriter(root_path=self.root_path, depth=3, max_buffered_rows=2, flush_interval=60)
+        writer.append_trade("binance", "BTC-USDT", 1700000001, 100, 1, TradeType.BUY)
+        self.assertEqual(1, writer.buffered_rows)
+        writer.append_trade("binance", "BTC-USDT", 1700000002, 100, 1, TradeType.BUY)
+        self.assertEqual(0, writer.buffered_rows)
+
+        writer.append_trade("binance", "BTC-USDT", 1700000003, 100, 1, TradeType.BUY)
+        with patch.object(ColumnarMarketDataWriter, "_time", return_value=writer._last_flush_time + 61):
+            writer.append_trade("binance", "ETH-USDT", 1700000004, 100, 1, TradeType.BUY)
+        self.assertEqual(0, writer.buffered_rows)
+        writer.close()
+
+        self.assertEqual(3, len(self.reader.load_trades("binance", "BTC-USDT")["timestamp"]))
+        self.assertEqual(1, len(self.reader.load_trades("binance", "ETH-USDT")["timestamp"]))
+
+    def test_records_are_written_from_writer_thread(self):
+        writer_threads = []
+        write_rows = self.writer._write_rows
+
+        def record_thread(*args):
+            writer_threads.append(threading.current_thread())
+            write_rows(*args)
+
+        self.writer._write_rows = record_thread
+        self.writer.append_trade("binance", "BTC-USDT", 1700000001, 100, 0.5, TradeType.BUY)
+        self.writer.close()
+
+        self.assertEqual(1, len(writer_threads))
+        self.assertIsNot(threading.current_thread(), writer_threads[0])
+        self.assertEqual([100], self.reader.load_trades("binance", "BTC-USDT")["price"].tolist())
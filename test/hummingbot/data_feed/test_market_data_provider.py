@@ -82,6 +82,15 @@ class TestMarketDataProvider(IsolatedAsyncioWrapperTestCase):
         self.assertIsInstance(snapshot[0], pd.DataFrame)
         self.assertIsInstance(snapshot[1], pd.DataFrame)
 
+    def test_get_order_book_snapshot_with_depth(self):
+        mock_order_book = MagicMock()
+        mock_order_book.get_snapshot.return_value = (pd.DataFrame(), pd.DataFrame())
+        self.mock_connector.get_order_book.return_value = mock_order_book
+        snapshot = self.provider.get_order_book_snapshot("mock_connector", "BTC-USDT", depth=10)
+        mock_order_book.get_snapshot.assert_called_once_with(10)
+        self.assertIsInstance(snapshot[0], pd.DataFrame)
+        self.assertIsInstance(snapshot[1], pd.DataFrame)
+
     def test_get_price_for_quote_volume(self):
         self.mock_connector.get_order_book.return_value = MagicMock(
             get_price_for_quote_volume=MagicMock(return_value=OrderBookQueryResult(100, 2, 100, 2)))
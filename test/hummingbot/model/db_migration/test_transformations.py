@@ -1,7 +1,13 @@
 from unittest import TestCase
 from unittest.mock import MagicMock
 
-from hummingbot.model.db_migration.transformations import AddTradeFeeInQuote, ConvertPriceAndAmountColumnsToBigint
+from sqlalchemy import create_engine, inspect
+
+from hummingbot.model.db_migration.transformations import (
+    AddMarketOrderStateTable,
+    AddTradeFeeInQuote,
+    ConvertPriceAndAmountColumnsToBigint,
+)
 
 
 class ConvertPriceAndAmountColumnsToBigintTests(TestCase):
@@ -41,3 +47,21 @@ class AddTradeFeeInQuoteTests(TestCase):
 
     def test_to_version(self):
         self.assertEqual(20230516, AddTradeFeeInQuote(self).to_version)
+
+
+class AddMarketOrderStateTableTests(TestCase):
+    def test_name(self):
+        self.assertEqual("AddMarketOrderStateTable", AddMarketOrderStateTable(self).name)
+
+    def test_to_version(self):
+        self.assertEqual(20261016, AddMarketOrderStateTable(self).to_version)
+
+    def test_apply_creates_market_order_state_table(self):
+        db_handle = MagicMock()
+        db_handle.engine = create_engine("sqlite:///:memory:")
+
+        AddMarketOrderStateTable(migrator=self).apply(db_handle)
+        # Applying it on a database that already has the table is a no-op
+        AddMarketOrderStateTable(migrator=self).apply(db_handle)
+
+        self.assertIn("MarketOrderState", inspect(db_handle.engine).get_table_names())
@@ -0,0 +1,46 @@
+import os
+import sqlite3
+import tempfile
+from unittest import TestCase
+
+from sqlalchemy import inspect
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
+
+
+class SQLConnectionManagerTests(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        db_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(db_dir.cleanup)
+        self.db_path = os.path.join(db_dir.name, "test_DB.sqlite")
+        self.client_config_map = ClientConfigAdapter(ClientConfigMap())
+
+    def _create_manager(self) -> SQLConnectionManager:
+        manager = SQLConnectionManager(self.client_config_map, SQLConnectionType.TRADE_FILLS, db_path=self.db_path)
+        self.addCleanup(manager.engine.dispose)
+        return manager
+
+    def test_new_database_is_created_with_current_version(self):
+        manager = self._create_manager()
+
+        with manager.get_new_session() as session:
+            self.assertEqual(manager.LOCAL_DB_VERSION_VALUE, manager.get_local_db_version(session=session).value)
+
+    def test_database_with_previous_version_is_migrated(self):
+        self._create_manager().engine.dispose()
+        with sqlite3.connect(self.db_path) as connection:
+            connection.execute('DROP TABLE "MarketOrderState"')
+            connection.execute('UPDATE "Metadata" SET value = ? WHERE key = ?',
+                               ("20230516", SQLConnectionManager.LOCAL_DB_VERSION_KEY))
+        connection.close()
+
+        manager = self._create_manager()
+
+        self.assertEqual(self.db_path, manager.db_path)
+        self.assertIn("MarketOrderState", inspect(manager.engine).get_table_names())
+        with manager.get_new_session() as session:
+            self.assertEqual(manager.LOCAL_DB_VERSION_VALUE, manager.get_local_db_version(session=session).value)
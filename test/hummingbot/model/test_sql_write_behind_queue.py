@@ -0,0 +1,139 @@
+import os
+import tempfile
+import threading
+from unittest import TestCase
+from unittest.mock import patch
+
+from sqlalchemy import create_engine
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.model.inventory_cost import InventoryCost
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
+from hummingbot.model.sql_write_behind_queue import SQLWriteBehindQueue
+
+
+class SQLWriteBehindQueueTests(TestCase):
+    level = 0
+
+    @patch("hummingbot.model.sql_connection_manager.create_engine")
+    def setUp(self, engine_mock) -> None:
+        super().setUp()
+        self.log_records = []
+        db_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(db_dir.cleanup)
+        engine_mock.return_value = create_engine(f"sqlite:///{os.path.join(db_dir.name, 'test_DB.sqlite')}")
+        self.manager = SQLConnectionManager(
+            ClientConfigAdapter(ClientConfigMap()), SQLConnectionType.TRADE_FILLS, db_name="test_DB"
+        )
+        self.write_queue = SQLWriteBehindQueue(self.manager, max_batch_size=10)
+        self.write_queue.logger().setLevel(1)
+        self.write_queue.logger().addHandler(self)
+        self.addCleanup(self.write_queue.logger().removeHandler, self)
+
+    def handle(self, record):
+        self.log_records.append(record)
+
+    def _is_logged(self, log_level: str, message: str) -> bool:
+        return any(record.levelname == log_level and record.getMessage() == message for record in self.log_records)
+
+    @staticmethod
+    def add_inventory_cost(base_asset: str):
+        def operation(session):
+            session.add(InventoryCost(base_asset=base_asset, quote_asset="HBOT", base_volume=1, quote_volume=1))
+        return operation
+
+    def get_base_assets(self):
+        with self.manager.get_new_session() as session:
+            return sorted(record.base_asset for record in session.query(InventoryCost).all())
+
+    def test_operations_are_written_inline_when_not_running(self):
+        self.write_queue.put(self.add_inventory_cost("COINALPHA"))
+
+        self.assertFalse(self.write_queue.is_running)
+        self.assertEqual(["COINALPHA"], self.get_base_assets())
+
+    def test_operations_are_written_by_writer_thread(self):
+        self.write_queue.start()
+        self.addCleanup(self.write_queue.stop)
+        writer_threads = []
+
+        def operation(session):
+            writer_threads.append(threading.current_thread())
+            self.add_inventory_cost("COINALPHA")(session)
+
+        self.write_queue.put(operation)
+        for i in range(25):
+            self.write_queue.put(self.add_inventory_cost(f"TOKEN{i}"))
+        self.assertTrue(self.write_queue.flush(timeout=5))
+
+        self.assertIsNot(threading.current_thread(), writer_threads[0])
+        self.assertEqual(26, len(self.get_base_assets()))
+        self.assertEqual(0, self.write_queue.pending_operations)
+
+    def test_coalesced_operations_write_only_last_one(self):
+        self.write_queue.start()
+        self.addCleanup(self.write_queue.stop)
+        writer_released = threading.Event()
+        self.write_queue.put(lambda session: writer_released.wait(5))
+
+        for base_asset in ["COINALPHA", "COINBETA", "COINGAMMA"]:
+            self.write_queue.put(self.add_inventory_cost(base_asset), coalesce_key="inventory")
+        self.write_queue.put(self.add_inventory_cost("COINDELTA"))
+        writer_released.set()
+        self.write_queue.flush(timeout=5)
+
+        self.assertEqual(["COINDELTA", "COINGAMMA"], self.get_base_assets())
+
+    def test_failing_operation_does_not_discard_batch(self):
+        self.write_queue.start()
+        self.addCleanup(self.write_queue.stop)
+        writer_released = threading.Event()
+        self.write_queue.put(lambda session: writer_released.wait(5))
+
+        def failing_operation(session):
+            raise ValueError("Test error")
+
+        self.write_queue.put(self.add_inventory_cost("COINALPHA"))
+        self.write_queue.put(failing_operation)
+        self.write_queue.put(self.add_inventory_cost("COINBETA"))
+        writer_released.set()
+        self.write_queue.flush(timeout=5)
+
+        self.assertEqual(["COINALPHA", "COINBETA"], self.get_base_assets())
+        self.assertTrue(self._is_logged("ERROR", "Unexpected error writing to the database."))
+
+    def test_stop_writes_pending_operations(self):
+        self.write_queue.start()
+        for i in range(25):
+            self.write_queue.put(self.add_inventory_cost(f"TOKEN{i}"))
+        self.write_queue.stop()
+
+        self.assertFalse(self.write_queue.is_running)
+        self.assertEqual(25, len(self.get_base_assets()))
+
+    def test_flush_returns_false_on_timeout(self):
+        self.write_queue = SQLWriteBehindQueue(self.manager, max_queue_size=2)
+        self.write_queue.start()
+        writer_released = threading.Event()
+        self.addCleanup(self.write_queue.stop)
+        self.addCleanup(writer_released.set)
+        writer_blocked = threading.Event()
+
+        def blocking_operation(session):
+            writer_blocked.set()
+            writer_released.wait(5)
+
+        self.write_queue.put(blocking_operation)
+        writer_blocked.wait(5)
+
+        self.assertFalse(self.write_queue.flush(timeout=0.1))
+
+        # The flush does not wait to queue its marker when the queue is full
+        self.write_queue.put(self.add_inventory_cost("COINALPHA"))
+        self.assertEqual(2, self.write_queue.pending_operations)
+        self.assertFalse(self.write_queue.flush(timeout=0.1))
+
+        writer_released.set()
+        self.assertTrue(self.write_queue.flush(timeout=5))
+        self.assertEqual(["COINALPHA"], self.get_base_assets())
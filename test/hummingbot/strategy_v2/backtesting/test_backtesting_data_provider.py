@@ -0,0 +1,81 @@
+import tempfile
+from decimal import Decimal
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import numpy as np
+
+from hummingbot.core.data_type.common import PriceType
+from hummingbot.data_feed.columnar_market_data import ColumnarMarketDataReader, ColumnarMarketDataWriter
+from hummingbot.strategy_v2.backtesting.backtesting_data_provider import BacktestingDataProvider
+
+
+class BacktestingDataProviderTest(IsolatedAsyncioWrapperTestCase):
+    def setUp(self):
+        super().setUp()
+        gateway_patcher = patch("hummingbot.data_feed.market_data_provider.GatewayHttpClient")
+        gateway_patcher.start()
+        self.addCleanup(gateway_patcher.stop)
+        connector_class_patcher = patch(
+            "hummingbot.strategy_v2.backtesting.backtesting_data_provider.get_connector_class")
+        self.get_connector_class_mock = connector_class_patcher.start()
+        self.addCleanup(connector_class_patcher.stop)
+        self.connector = MagicMock()
+        self.connector._update_trading_rules = AsyncMock()
+        self.connector.trading_rules = {"BTC-USDT": MagicMock()}
+        self.get_connector_class_mock.return_value = MagicMock(return_value=self.connector)
+
+        self.provider = BacktestingDataProvider(connectors={})
+
+    def test_connectors_are_not_created_on_init(self):
+        self.get_connector_class_mock.assert_not_called()
+        self.assertEqual({}, self.provider.connectors)
+
+    def test_get_connector_creates_connector_once(self):
+        connector = self.provider.get_connector("binance")
+
+        self.assertIs(self.connector, connector)
+        self.assertIs(connector, self.provider.get_connector("binance"))
+        self.get_connector_class_mock.assert_called_once_with("binance")
+        self.assertEqual({"binance": connector}, self.provider.connectors)
+
+    def test_get_connector_for_unsupported_connector_raises(self):
+        with self.assertRaises(ValueError):
+            self.provider.get_connector("non_existent_connector")
+        with self.assertRaises(ValueError):
+            self.provider.get_connector(BacktestingDataProvider.EXCLUDED_CONNECTORS[0])
+        self.get_connector_class_mock.assert_not_called()
+
+    async def test_initialize_trading_rules_creates_only_the_required_connector(self):
+        await self.provider.initialize_trading_rules("binance")
+        await self.provider.initialize_trading_rules("binance")
+
+        self.get_connector_class_mock.assert_called_once_with("binance")
+        self.connector._update_trading_rules.assert_awaited_once()
+        self.assertEqual(self.connector.trading_rules, self.provider.trading_rules["binance"])
+
+    def test_get_price_by_type_uses_recorded_market_data(self):
+        market_data_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(market_data_dir.cleanup)
+        writer = ColumnarMarketDataWriter(root_path=market_data_dir.name, depth=2)
+        for i, timestamp in enumerate([1000, 1060, 1120, 1180]):
+            writer.append_snapshot("binance", "BTC-USDT", timestamp, mid_price=100 + i, best_bid=99 + i,
+                                   best_ask=101 + i, bids=np.array([[99 + i, 1]]), asks=np.array([[101 + i, 1]]))
+        writer.close()
+        self.provider.update_backtesting_time(1050, 1150)
+
+        snapshots = self.provider.load_recorded_market_data(
+            "binance", "BTC-USDT", reader=ColumnarMarketDataReader(root_path=market_data_dir.name))
+
+        self.assertEqual([1060, 1120], snapshots["timestamp"].tolist())
+        self.provider._time = 1100
+        self.assertEqual(Decimal("101"), self.provider.get_price_by_type("binance", "BTC-USDT", PriceType.MidPrice))
+        self.assertEqual(Decimal("100"), self.provider.get_price_by_type("binance", "BTC-USDT", PriceType.BestBid))
+        self.assertEqual(Decimal("102"), self.provider.get_price_by_type("binance", "BTC-USDT", PriceType.BestAsk))
+        self.provider._time = 1130
+        self.assertEqual(Decimal("102"), self.provider.get_price_by_type("binance", "BTC-USDT", PriceType.MidPrice))
+        # Before the first recorded snapshot, or without recorded data, the prices set by the engine are used
+        self.provider._time = 1055
+        self.provider.prices = {"binance_BTC-USDT": Decimal("50"), "binance_ETH-USDT": Decimal("5")}
+        self.assertEqual(Decimal("50"), self.provider.get_price_by_type("binance", "BTC-USDT", PriceType.MidPrice))
+        self.assertEqual(Decimal("5"), self.provider.get_price_by_type("binance", "ETH-USDT", PriceType.MidPrice))
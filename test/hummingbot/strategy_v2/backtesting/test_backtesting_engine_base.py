@@ -0,0 +1,270 @@
+from decimal import Decimal
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from types import SimpleNamespace
+from typing import List
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.data_feed.candles_feed.data_types import CandlesConfig
+from hummingbot.strategy_v2.backtesting.backtesting_data_provider import BacktestingDataProvider
+from hummingbot.strategy_v2.backtesting.backtesting_engine_base import BacktestingEngineBase
+from hummingbot.strategy_v2.backtesting.executor_simulator_base import ExecutorSimulation
+from hummingbot.strategy_v2.controllers.controller_base import ControllerBase
+from hummingbot.strategy_v2.controllers.directional_trading_controller_base import (
+    DirectionalTradingControllerBase,
+    DirectionalTradingControllerConfigBase,
+)
+from hummingbot.strategy_v2.executors.position_executor.data_types import PositionExecutorConfig, TripleBarrierConfig
+from hummingbot.strategy_v2.models.base import RunnableStatus
+from hummingbot.strategy_v2.models.executor_actions import CreateExecutorAction, StopExecutorAction
+from hummingbot.strategy_v2.models.executors import CloseType
+from hummingbot.strategy_v2.models.executors_info import ExecutorInfo
+
+
+class LegacyBacktestingEngine(BacktestingEngineBase):
+    """
+    Step by step implementation that rebuilds the ExecutorInfo of every active executor on every step, used as
+    reference for the results of the engine.
+    """
+
+    async def simulate_execution(self, trade_cost: float) -> list:
+        processed_features = self.prepare_market_data()
+        self.active_executor_simulations = []
+        self.stopped_executors_info = []
+        for i, row in processed_features.iterrows():
+            self.controller.market_data_provider._time = row["timestamp"]
+            self.controller.processed_data.update(row.to_dict())
+            active_executors_info = []
+            for executor in list(self.active_executor_simulations):
+                executor_info = self._legacy_executor_info(executor, row["timestamp"])
+                if executor_info.status == RunnableStatus.TERMINATED:
+                    self.stopped_executors_info.append(executor_info)
+                    self.active_executor_simulations.remove(executor)
+                else:
+                    active_executors_info.append(executor_info)
+            self.controller.executors_info = active_executors_info + self.stopped_executors_info
+            for action in self.controller.determine_executor_actions():
+                if isinstance(action, CreateExecutorAction):
+                    simulation = self.simulate_executor(action.executor_config, processed_features.loc[i:], trade_cost)
+                    if not simulation.executor_simulation.empty:
+                        self.active_executor_simulations.append(simulation)
+                elif isinstance(action, StopExecutorAction):
+                    for executor in self.active_executor_simulations:
+                        if executor.config.id == action.executor_id:
+                            executor_info = self._legacy_executor_info(executor, row["timestamp"])
+                            executor_info.status = RunnableStatus.TERMINATED
+                            executor_info.close_type = CloseType.EARLY_STOP
+                            executor_info.is_active = False
+                            executor_info.close_timestamp = row["timestamp"]
+                            self.stopped_executors_info.append(executor_info)
+                            self.active_executor_simulations.remove(executor)
+                            break
+        return self.controller.executors_info
+
+    @staticmethod
+    def _legacy_executor_info(simulation: ExecutorSimulation, timestamp: float):
+        df = simulation.executor_simulation
+        last_entry = df[df["timestamp"] <= timestamp].iloc[-1]
+        is_active = last_entry["timestamp"] < df["timestamp"].max()
+        executor_info = simulation.get_executor_info_at_timestamp(timestamp)
+        assert executor_info.is_active == is_active
+        assert executor_info.net_pnl_quote == Decimal(last_entry["net_pnl_quote"])
+        return executor_info
+
+
+class FakeController:
+    """
+    Creates a market position executor every 4 steps while there are less than 3 active, and stops the oldest one
+    every 15 steps. The executors info is only read on those steps.
+    It isn't a ControllerBase subclass, so the controller classes of the module can still be found by the configs.
+    """
+    executors_info = ControllerBase.executors_info
+    set_executors_info_builder = ControllerBase.set_executors_info_builder
+
+    def __init__(self, candles: pd.DataFrame):
+        self.config = SimpleNamespace(connector_name="binance", trading_pair="ETH-USDT")
+        self.market_data_provider = MagicMock()
+        self.market_data_provider.get_candles_df.return_value = candles
+        self.processed_data = {}
+        self.executors_info = []
+        self.step = 0
+        self.reading_steps = set()
+
+    def determine_executor_actions(self):
+        self.step += 1
+        actions = []
+        if self.step % 4 == 0 or self.step % 15 == 0:
+            self.reading_steps.add(self.step)
+        if self.step % 4 == 0:
+            active = [executor for executor in self.executors_info if executor.is_active]
+            if len(active) < 3:
+                actions.append(CreateExecutorAction(executor_config=PositionExecutorConfig(
+                    id=f"executor-{self.step}",
+                    timestamp=self.processed_data["timestamp"], connector_name="binance", trading_pair="ETH-USDT",
+                    side=TradeType.BUY if self.step % 8 == 0 else TradeType.SELL, entry_price=Decimal(100),
+                    amount=Decimal(1),
+                    triple_barrier_config=TripleBarrierConfig(
+                        take_profit=Decimal("0.01"), stop_loss=Decimal("0.01"), time_limit=60 * 20,
+                        open_order_type=OrderType.MARKET))))
+        if self.step % 15 == 0:
+            active = [executor for executor in self.executors_info if executor.is_active]
+            if len(active) > 0:
+                actions.append(StopExecutorAction(executor_id=active[0].id))
+        return actions
+
+
+def get_candles(rows: int = 300) -> pd.DataFrame:
+    random = np.random.default_rng(42)
+    close = 100 * np.cumprod(1 + random.normal(0, 0.003, rows))
+    return pd.DataFrame({
+        "timestamp": 1_700_000_000 + 60 * np.arange(rows, dtype=float),
+        "open": close, "high": close * 1.002, "low": close * 0.998, "close": close,
+        "volume": np.ones(rows),
+    })
+
+
+class MomentumTestControllerConfig(DirectionalTradingControllerConfigBase):
+    controller_name = "momentum_test"
+    candles_config: List[CandlesConfig] = []
+    lookback: int = 5
+
+
+class MomentumTestController(DirectionalTradingControllerBase):
+    async def update_processed_data(self):
+        candles = self.market_data_provider.get_candles_df(self.config.connector_name, self.config.trading_pair, "1m")
+        features = candles.copy()
+        features["signal"] = np.sign(features["close"] - features["close"].shift(self.config.lookback)).fillna(0)
+        self.processed_data = {"signal": 0, "features": features}
+
+
+class StubBacktestingDataProvider(BacktestingDataProvider):
+    """
+    Data provider with generated candles, that doesn't create connectors.
+    """
+
+    def __init__(self):
+        self.candles_feeds = {}
+        self.connectors = {}
+        self.start_time = None
+        self.end_time = None
+        self.prices = {}
+        self._time = None
+        self.trading_rules = {}
+        self.recorded_market_data = {}
+        self.candles_requests = 0
+
+    def initialize_rate_sources(self, connector_pairs):
+        pass
+
+    async def initialize_trading_rules(self, connector_name: str):
+        self.trading_rules.setdefault(connector_name, {})
+
+    async def get_candles_feed(self, config: CandlesConfig):
+        key = self._generate_candle_feed_key(config)
+        if key not in self.candles_feeds:
+            self.candles_requests += 1
+            self.candles_feeds[key] = get_candles(500)
+        return self.candles_feeds[key]
+
+
+class StubBacktestingEngine(BacktestingEngineBase):
+    def __init__(self):
+        super().__init__()
+        self.backtesting_data_provider = StubBacktestingDataProvider()
+
+
+class BacktestingEngineBaseTest(IsolatedAsyncioWrapperTestCase):
+    @staticmethod
+    def get_candles(rows: int = 300) -> pd.DataFrame:
+        return get_candles(rows)
+
+    @patch("hummingbot.strategy_v2.backtesting.backtesting_engine_base.BacktestingDataProvider")
+    async def run_engine(self, engine_class, candles: pd.DataFrame, _):
+        engine = engine_class()
+        engine.controller = FakeController(candles)
+        engine.backtesting_resolution = "1m"
+        executors_info = await engine.simulate_execution(trade_cost=0.0006)
+        return engine, executors_info
+
+    async def test_simulate_execution_matches_step_by_step_simulation(self):
+        candles = self.get_candles()
+        _, expected = await self.run_engine(LegacyBacktestingEngine, candles)
+        engine, executors_info = await self.run_engine(BacktestingEngineBase, candles)
+
+        self.assertGreater(len(expected), 10)
+        self.assertIn(CloseType.EARLY_STOP, [executor.close_type for executor in expected])
+        self.assertEqual([executor.dict() for executor in expected], [executor.dict() for executor in executors_info])
+        self.assertIs(list, type(engine.controller.executors_info))
+        self.assertEqual(BacktestingEngineBase.summarize_results(expected),
+                         BacktestingEngineBase.summarize_results(executors_info))
+
+    async def test_simulate_execution_builds_executors_info_only_on_read(self):
+        with patch.object(BacktestingEngineBase, "build_executors_info", autospec=True,
+                          side_effect=BacktestingEngineBase.build_executors_info) as build_mock:
+            engine, executors_info = await self.run_engine(BacktestingEngineBase, self.get_candles())
+
+        self.assertGreater(len(executors_info), 10)
+        # One build on each step where the controller reads the executors info and one for the result of the last step
+        self.assertEqual(len(engine.controller.reading_steps | {engine.controller.step}), build_mock.call_count)
+        self.assertLess(build_mock.call_count, len(self.get_candles()) / 2)
+
+    def test_get_controller_configs_grid(self):
+        base_config = MomentumTestControllerConfig(id="momentum", trading_pair="ETH-USDT")
+        configs = BacktestingEngineBase.get_controller_configs_grid(
+            base_config, {"lookback": [3, 10], "take_profit": [Decimal("0.01"), Decimal("0.02"), None]})
+
+        self.assertEqual(6, len(configs))
+        self.assertEqual([f"momentum_{i}" for i in range(6)], [config.id for config in configs])
+        self.assertEqual((3, Decimal("0.01")), (configs[0].lookback, configs[0].take_profit))
+        self.assertEqual((10, None), (configs[5].lookback, configs[5].take_profit))
+        self.assertTrue(all(config.trading_pair == "ETH-USDT" for config in configs))
+
+    @patch("hummingbot.strategy_v2.backtesting.backtesting_engine_base.BacktestingDataProvider")
+    async def test_run_parameter_sweep(self, _):
+        start, end = 1_700_000_000 + 60 * 50, 1_700_000_000 + 60 * 450
+        configs = BacktestingEngineBase.get_controller_configs_grid(
+            MomentumTestControllerConfig(id="momentum", trading_pair="ETH-USDT", cooldown_time=60),
+            {"lookback": [3, 10, 20]})
+        engine = StubBacktestingEngine()
+
+        results = await engine.run_parameter_sweep(configs, start, end, max_workers=2)
+
+        self.assertEqual(1, engine.backtesting_data_provider.candles_requests)
+        self.assertEqual(["momentum_0", "momentum_1", "momentum_2"], list(results["config_id"]))
+        self.assertEqual([3, 10, 20], list(results["lookback"]))
+        self.assertNotIn("trading_pair", results.columns)
+        for config, (_, row) in zip(configs, results.iterrows()):
+            expected = await StubBacktestingEngine().run_backtesting(config, start, end)
+            self.assertEqual(expected["results"], {key: row[key] for key in expected["results"]})
+            self.assertEqual(len(expected["executors"]), len(row["executors"]))
+        self.assertGreater(results["total_executors"].sum(), 0)
+
+    def test_executor_info_at_timestamp(self):
+        config = PositionExecutorConfig(timestamp=10, connector_name="binance", trading_pair="ETH-USDT",
+                                        side=TradeType.BUY, entry_price=Decimal(100), amount=Decimal(1))
+        simulation = ExecutorSimulation(config=config, close_type=CloseType.TAKE_PROFIT, executor_simulation=pd.DataFrame({
+            "timestamp": [10.0, 20.0, 30.0],
+            "close": [100.0, 101.0, 102.0],
+            "net_pnl_pct": [0.0, 0.01, 0.02],
+            "net_pnl_quote": [0.0, 1.0, 2.0],
+            "cum_fees_quote": [0.1, 0.1, 0.1],
+            "filled_amount_quote": [100.0, 100.0, 200.0],
+        }))
+
+        self.assertEqual(RunnableStatus.TERMINATED, simulation.get_executor_info_at_timestamp(5).status)
+        executor_info = simulation.get_executor_info_at_timestamp(25)
+        # Built without validation, with the same values as a validated model
+        self.assertEqual(ExecutorInfo(**executor_info.dict()).dict(), executor_info.dict())
+        self.assertIs(True, executor_info.is_active)
+        self.assertIs(True, executor_info.is_trading)
+        self.assertEqual(Decimal(1), executor_info.net_pnl_quote)
+        self.assertEqual(101.0, executor_info.custom_info["close_price"])
+        executor_info = simulation.get_executor_info_at_timestamp(30)
+        self.assertEqual(ExecutorInfo(**executor_info.dict()).dict(), executor_info.dict())
+        self.assertFalse(executor_info.is_active)
+        self.assertEqual(CloseType.TAKE_PROFIT, executor_info.close_type)
+        self.assertEqual(30, executor_info.close_timestamp)
+        self.assertEqual(30, simulation.close_timestamp)
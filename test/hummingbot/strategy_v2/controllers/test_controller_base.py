@@ -112,3 +112,17 @@ class TestControllerBase(IsolatedAsyncioWrapperTestCase):
     def test_balance_requirements(self):
         # Test the balance_required method
         self.assertEqual(self.controller.get_balance_requirements(), [])
+
+    def test_executors_info_builder(self):
+        builder = MagicMock(return_value=["executor_info"])
+        self.controller.set_executors_info_builder(builder)
+        builder.assert_not_called()
+
+        self.assertEqual(["executor_info"], self.controller.executors_info)
+        self.assertEqual(["executor_info"], self.controller.executors_info)
+        builder.assert_called_once()
+
+        self.controller.set_executors_info_builder(builder)
+        self.controller.executors_info = []
+        self.assertEqual([], self.controller.executors_info)
+        builder.assert_called_once()
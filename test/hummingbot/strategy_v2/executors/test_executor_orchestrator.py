@@ -98,6 +98,39 @@ class TestExecutorOrchestrator(unittest.TestCase):
         self.orchestrator.execute_actions(actions)
         self.assertEqual(len(self.orchestrator.active_executors["test"]), 5)
 
+    @patch.object(PositionExecutor, "start")
+    def test_create_executor_without_shared_scheduler_by_default(self, position_start_mock: MagicMock):
+        position_executor_config = PositionExecutorConfig(
+            timestamp=1234, connector_name="binance",
+            trading_pair="ETH-USDT", side=TradeType.BUY, entry_price=Decimal(100), amount=Decimal(10))
+        self.orchestrator.execute_action(
+            CreateExecutorAction(executor_config=position_executor_config, controller_id="test"))
+
+        executor = self.orchestrator.active_executors["test"][0]
+        self.assertIsNone(self.orchestrator.executors_scheduler)
+        self.assertIsNone(executor._scheduler)
+        self.assertEqual({}, self.orchestrator.get_executors_tick_stats())
+
+    @patch.object(PositionExecutor, "start")
+    @patch.object(MarketsRecorder, "get_instance")
+    def test_create_executor_uses_shared_scheduler(self, markets_recorder_mock: MagicMock,
+                                                   position_start_mock: MagicMock):
+        markets_recorder_mock.return_value = MagicMock(spec=MarketsRecorder)
+        self.orchestrator = ExecutorOrchestrator(strategy=self.mock_strategy, use_shared_scheduler=True)
+        position_executor_config = PositionExecutorConfig(
+            timestamp=1234, connector_name="binance",
+            trading_pair="ETH-USDT", side=TradeType.BUY, entry_price=Decimal(100), amount=Decimal(10))
+        self.orchestrator.execute_action(
+            CreateExecutorAction(executor_config=position_executor_config, controller_id="test"))
+
+        executor = self.orchestrator.active_executors["test"][0]
+        self.assertIs(self.orchestrator.executors_scheduler, executor._scheduler)
+        self.assertEqual({}, self.orchestrator.get_executors_tick_stats())
+
+        self.orchestrator.executors_scheduler.add(executor)
+        self.orchestrator.executors_scheduler.stop()
+        self.assertEqual([executor.config.id], list(self.orchestrator.get_executors_tick_stats().keys()))
+
     def test_execute_actions_store_executor_active(self):
         position_executor = MagicMock(spec=PositionExecutor)
         position_executor.is_active = True
@@ -0,0 +1,170 @@
+import asyncio
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from test.logger_mixin_for_test import LoggerMixinForTest
+
+from hummingbot.strategy_v2.models.base import RunnableStatus
+from hummingbot.strategy_v2.runnable_base import RunnableBase
+from hummingbot.strategy_v2.runnable_scheduler import RunnableScheduler
+
+
+class CountingRunnable(RunnableBase):
+    def __init__(self, update_interval: float = 1.0):
+        super().__init__(update_interval=update_interval)
+        self.started = 0
+        self.stopped = 0
+        self.control_tasks = 0
+        self.market_state_key = None
+
+    async def on_start(self):
+        self.started += 1
+
+    def on_stop(self):
+        self.stopped += 1
+
+    async def control_task(self):
+        self.control_tasks += 1
+
+    def get_market_state_key(self):
+        return self.market_state_key
+
+
+class TestRunnableScheduler(IsolatedAsyncioWrapperTestCase, LoggerMixinForTest):
+    def setUp(self):
+        super().setUp()
+        self.scheduler = RunnableScheduler(update_interval=1.0, batch_size=2, max_idle_interval=10.0,
+                                           runnable_timeout=0.05)
+        self.set_loggers(loggers=[self.scheduler.logger()])
+
+    def tearDown(self):
+        self.scheduler.stop()
+        super().tearDown()
+
+    def add_runnables(self, count: int, update_interval: float = 1.0):
+        runnables = [CountingRunnable(update_interval=update_interval) for _ in range(count)]
+        for runnable in runnables:
+            runnable.set_scheduler(self.scheduler)
+            runnable.start()
+        self.scheduler.stop()
+        return runnables
+
+    async def test_start_registers_runnable_in_scheduler(self):
+        runnable = CountingRunnable()
+        runnable.set_scheduler(self.scheduler)
+        runnable.start()
+
+        self.assertEqual(RunnableStatus.RUNNING, runnable.status)
+        self.assertEqual([runnable], self.scheduler.runnables)
+        await asyncio.sleep(0.01)
+        self.assertEqual(1, runnable.started)
+        self.assertEqual(1, runnable.control_tasks)
+
+    async def test_tick_runs_due_runnables_in_batches(self):
+        runnables = self.add_runnables(5)
+
+        await self.scheduler.tick(1000)
+        await self.scheduler.tick(1000.5)
+
+        for runnable in runnables:
+            self.assertEqual(1, runnable.started)
+            self.assertEqual(1, runnable.control_tasks)
+            stats = self.scheduler.get_tick_stats(runnable)
+            self.assertEqual(1, stats.ticks)
+            self.assertGreaterEqual(stats.average_tick_time, 0)
+
+        await self.scheduler.tick(1001)
+        self.assertTrue(all(runnable.control_tasks == 2 for runnable in runnables))
+
+    async def test_idle_runnables_are_skipped_until_market_state_or_event(self):
+        runnable = self.add_runnables(1)[0]
+        runnable.market_state_key = (1, 1)
+
+        await self.scheduler.tick(1000)
+        await self.scheduler.tick(1001)
+        self.assertEqual(1, runnable.control_tasks)
+        self.assertEqual(1, self.scheduler.get_tick_stats(runnable).skipped_ticks)
+
+        runnable.notify_update()
+        await self.scheduler.tick(1002)
+        self.assertEqual(2, runnable.control_tasks)
+
+        runnable.market_state_key = (1, 2)
+        await self.scheduler.tick(1003)
+        self.assertEqual(3, runnable.control_tasks)
+
+        await self.scheduler.tick(1012)
+        self.assertEqual(3, runnable.control_tasks)
+        await self.scheduler.tick(1013)
+        self.assertEqual(4, runnable.control_tasks)
+
+    async def test_runnables_without_market_state_key_are_never_skipped(self):
+        runnable = self.add_runnables(1)[0]
+
+        for i in range(3):
+            await self.scheduler.tick(1000 + i)
+
+        self.assertEqual(3, runnable.control_tasks)
+        self.assertEqual(0, self.scheduler.get_tick_stats(runnable).skipped_ticks)
+
+    async def test_terminated_runnables_are_removed(self):
+        runnable = self.add_runnables(1)[0]
+        await self.scheduler.tick(1000)
+
+        runnable.stop()
+        await self.scheduler.tick(1001)
+
+        self.assertEqual(1, runnable.stopped)
+        self.assertEqual(1, runnable.control_tasks)
+        self.assertEqual([], self.scheduler.runnables)
+        self.assertIsNone(self.scheduler.get_tick_stats(runnable))
+
+    async def test_control_task_exception_is_logged(self):
+        runnable = self.add_runnables(1)[0]
+
+        async def raise_exception():
+            raise Exception("Test")
+
+        runnable.control_task = raise_exception
+        await self.scheduler.tick(1000)
+
+        self.assertTrue(self.is_logged("ERROR", "Test"))
+        self.assertEqual(1, self.scheduler.get_tick_stats(runnable).ticks)
+
+    async def test_runnables_are_ticked_when_market_state_key_raises(self):
+        runnables = self.add_runnables(2)
+
+        def raise_exception():
+            raise ValueError("No order book exists for 'ETH-USDT'.")
+
+        runnables[0].get_market_state_key = raise_exception
+        for i in range(3):
+            await self.scheduler.tick(1000 + i)
+
+        self.assertEqual(3, runnables[0].control_tasks)
+        self.assertEqual(3, runnables[1].control_tasks)
+        self.assertEqual(0, self.scheduler.get_tick_stats(runnables[0]).skipped_ticks)
+
+    async def test_slow_runnable_does_not_stall_the_others(self):
+        runnables = self.add_runnables(3)
+        release_slow_runnable = asyncio.Event()
+        slow_runnable = runnables[0]
+
+        async def slow_control_task():
+            slow_runnable.control_tasks += 1
+            await release_slow_runnable.wait()
+
+        slow_runnable.control_task = slow_control_task
+        await self.scheduler.tick(1000)
+        await self.scheduler.tick(1001)
+
+        self.assertEqual([1, 2, 2], [runnable.control_tasks for runnable in runnables])
+        self.assertEqual(1, self.scheduler.get_tick_stats(slow_runnable).skipped_ticks)
+        self.assertTrue(self.is_logged(
+            "WARNING", f"The update of {slow_runnable} did not finish in 0.05 seconds. "
+                       f"It will not be updated again until it finishes."))
+
+        release_slow_runnable.set()
+        await asyncio.sleep(0)
+        await self.scheduler.tick(1002)
+
+        self.assertEqual([2, 3, 3], [runnable.control_tasks for runnable in runnables])
+        self.assertEqual(2, self.scheduler.get_tick_stats(slow_runnable).ticks)